@@ -5,9 +5,10 @@ for language model and generate sequences using language model. Submodule
 `lmp.config` setup configuration for language model experiment. Submodule
 `lmp.dataset` setup dataset in language model format. Submodule `lmp.model`
 define language model architecture. Submodule `lmp.path` define path variables
-shared by all files in `lmp` module. Submodule `lmp.tokenizer` define tokenizer
-for language model dataset preprocessing. Submodule `lmp.util` provide utilites
-for language model training, evalutate and inference.
+shared by all files in `lmp` module. Submodule `lmp.server` serve language
+model over HTTP with dynamic request batching. Submodule `lmp.tokenizer` define
+tokenizer for language model dataset preprocessing. Submodule `lmp.util`
+provide utilites for language model training, evalutate and inference.
 
 Usage:
     import lmp
@@ -26,5 +27,6 @@ import lmp.config
 import lmp.dataset
 import lmp.model
 import lmp.path
+import lmp.server
 import lmp.tokenizer
 import lmp.util
@@ -47,12 +47,17 @@ class BaseConfig:
             Hidden dimension. Must be bigger than or equal to `1`.
         dataset:
             Name of the dataset to perform experiment. Must not be empty.
+            Multiple datasets can be mixed by sampling weights with
+            `mix:<dataset>=<weight>,...`. See `lmp.util.load_dataset`.
         dropout:
             Dropout rate. Must range from `0.0` to `1.0`.
         epoch:
             Number of training epochs. Must be bigger than or equal to `1`.
         experiment:
             Name of the experiment. Must not be empty.
+        is_compact:
+            Whether to store dataset sequences in compact format. See
+            `lmp.dataset.BaseDataset` for details. Must be `True` or `False`.
         is_uncased:
             Convert all upper case to lower case. Must be `True` or `False`.
         learning_rate:
@@ -63,6 +68,10 @@ class BaseConfig:
         max_seq_len
             Maximum input sequence length. Must be greater than `1` or equal to
             `-1`.'
+        max_tokens:
+            Maximum number of tokens (after padding) in each mini-batch. When
+            set, mini-batches are formed by token budget instead of
+            `batch_size`. Must be bigger than or equal to `1` or equal to `-1`.
         min_count:
             Filter out tokens occur less than `min_count`. Must be bigger than
             or equal to `1`.
@@ -78,6 +87,9 @@ class BaseConfig:
             Control random seed. Must be bigger than or equal to `1`.
         tokenizer_class:
             Tokenizer's class. Must not be empty.
+        val_ratio:
+            Ratio of dataset held out for validation. No validation when set to
+            `0.0`. Must range from `0.0` (inclusive) to `1.0` (exclusive).
 
     Raises:
         TypeError:
@@ -98,17 +110,20 @@ class BaseConfig:
             dropout: float = 0.1,
             epoch: int = 10,
             experiment: str = '',
+            is_compact: bool = False,
             is_uncased: bool = False,
             learning_rate: float = 1e-4,
             max_norm: float = 1.0,
             max_seq_len: int = 60,
+            max_tokens: int = -1,
             min_count: int = 1,
             model_class: str = 'lstm',
             num_linear_layers: int = 1,
             num_rnn_layers: int = 1,
             optimizer_class: str = 'adam',
             seed: int = 1,
-            tokenizer_class: str = 'char_dict'
+            tokenizer_class: str = 'char_dict',
+            val_ratio: float = 0.0
     ):
         # Type check.
         if not isinstance(batch_size, int):
@@ -135,6 +150,9 @@ class BaseConfig:
         if not isinstance(epoch, int):
             raise TypeError('`epoch` must be an instance of `int`.')
 
+        if not isinstance(is_compact, bool):
+            raise TypeError('`is_compact` must be an instance of `bool`.')
+
         if not isinstance(is_uncased, bool):
             raise TypeError('`is_uncased` must be an instance of `bool`.')
 
@@ -147,6 +165,9 @@ class BaseConfig:
         if not isinstance(max_seq_len, int):
             raise TypeError('`max_seq_len` must be an instance of `int`.')
 
+        if not isinstance(max_tokens, int):
+            raise TypeError('`max_tokens` must be an instance of `int`.')
+
         if not isinstance(min_count, int):
             raise TypeError('`min_count` must be an instance of `int`.')
 
@@ -169,6 +190,9 @@ class BaseConfig:
         if not isinstance(tokenizer_class, str):
             raise TypeError('`tokenizer_class` must be an instance of `str`.')
 
+        if not isinstance(val_ratio, float):
+            raise TypeError('`val_ratio` must be an instance of `float`.')
+
         # Value check.
         if batch_size < 1:
             raise ValueError(
@@ -209,6 +233,12 @@ class BaseConfig:
                 '`max_seq_len` must be greater than `1` or equal to `-1`.'
             )
 
+        if max_tokens < -1 or max_tokens == 0:
+            raise ValueError(
+                '`max_tokens` must be bigger than or equal to `1` or equal '
+                'to `-1`.'
+            )
+
         if min_count < 1:
             raise ValueError(
                 '`min_count` must be bigger than or equal to `1`.'
@@ -236,6 +266,12 @@ class BaseConfig:
         if not tokenizer_class:
             raise ValueError('`tokenizer_class` must not be empty.')
 
+        if not 0.0 <= val_ratio < 1.0:
+            raise ValueError(
+                '`val_ratio` must range from `0.0` (inclusive) to `1.0` '
+                '(exclusive).'
+            )
+
         # Ensure instance have exact type specified in type annotation.
         self.batch_size = int(batch_size)
         self.checkpoint_step = int(checkpoint_step)
@@ -245,10 +281,12 @@ class BaseConfig:
         self.dropout = float(dropout)
         self.epoch = int(epoch)
         self.experiment = str(experiment)
+        self.is_compact = bool(is_compact)
         self.is_uncased = bool(is_uncased)
         self.learning_rate = float(learning_rate)
         self.max_norm = float(max_norm)
         self.max_seq_len = int(max_seq_len)
+        self.max_tokens = int(max_tokens)
         self.min_count = int(min_count)
         self.model_class = str(model_class)
         self.num_linear_layers = int(num_linear_layers)
@@ -256,6 +294,7 @@ class BaseConfig:
         self.optimizer_class = str(optimizer_class)
         self.seed = int(seed)
         self.tokenizer_class = str(tokenizer_class)
+        self.val_ratio = float(val_ratio)
 
     @classmethod
     def load(cls, experiment: str):
@@ -307,10 +346,12 @@ class BaseConfig:
         yield 'dropout', self.dropout
         yield 'epoch', self.epoch
         yield 'experiment', self.experiment
+        yield 'is_compact', self.is_compact
         yield 'is_uncased', self.is_uncased
         yield 'learning_rate', self.learning_rate
         yield 'max_norm', self.max_norm
         yield 'max_seq_len', self.max_seq_len
+        yield 'max_tokens', self.max_tokens
         yield 'min_count', self.min_count
         yield 'model_class', self.model_class
         yield 'num_linear_layers', self.num_linear_layers
@@ -318,6 +359,7 @@ class BaseConfig:
         yield 'optimizer_class', self.optimizer_class
         yield 'seed', self.seed
         yield 'tokenizer_class', self.tokenizer_class
+        yield 'val_ratio', self.val_ratio
 
     def save(self) -> None:
         r"""Save configuration into JSON file.
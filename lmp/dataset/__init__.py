@@ -0,0 +1,33 @@
+r"""Language model dataset module.
+
+All dataset and sampler must import from this file.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.BaseDataset(...)
+    dataset = lmp.dataset.LineDataset(...)
+    dataset = lmp.dataset.MixtureDataset(...)
+    dataset = lmp.dataset.SubsetDataset(...)
+    batch_sampler = lmp.dataset.FixedSizeBatchSampler(...)
+    batch_sampler = lmp.dataset.TokenBudgetBatchSampler(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# self-made modules
+
+from lmp.dataset._base_batch_sampler import BaseBatchSampler
+from lmp.dataset._base_dataset import BaseDataset
+from lmp.dataset._base_dataset import CollateFn
+from lmp.dataset._base_dataset import CollateFnReturn
+from lmp.dataset._fixed_size_batch_sampler import FixedSizeBatchSampler
+from lmp.dataset._line_dataset import LineDataset
+from lmp.dataset._mixture_dataset import MixtureDataset
+from lmp.dataset._subset_dataset import SubsetDataset
+from lmp.dataset._token_budget_batch_sampler import TokenBudgetBatchSampler
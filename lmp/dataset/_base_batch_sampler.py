@@ -0,0 +1,196 @@
+r"""Resumable batch sampler base class.
+
+Usage:
+    from lmp.dataset import BaseBatchSampler
+
+    class CustomBatchSampler(BaseBatchSampler):
+        ...
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import abc
+
+from typing import Dict
+from typing import Generator
+from typing import List
+
+# 3rd-party modules
+
+import torch.utils.data
+
+
+class BaseBatchSampler(torch.utils.data.Sampler):
+    r"""Resumable and seedable batch sampler base class.
+
+    Mini-batches of each epoch only depend on `seed` and `epoch`. Together
+    with `cursor`, the number of mini-batches already sampled in current
+    epoch, they fully describe sampling position. Thus training can resume
+    from exact same position by `load_state_dict` without touching any
+    previous mini-batch.
+
+    `cursor` is advanced when each mini-batch is yielded, so saved state is
+    exact when `torch.utils.data.DataLoader` does not prefetch with workers.
+
+    All batch samplers must inherit this base class and implement `batches`
+    and `__len__`.
+
+    Args:
+        is_shuffle:
+            Whether to shuffle samples.
+        seed:
+            Random seed used for shuffling. Must be bigger than or equal to
+            `0`.
+
+    Attributes:
+        cursor:
+            Number of mini-batches already sampled in current epoch.
+        epoch:
+            Current epoch. Shuffling order depends on it.
+        is_shuffle:
+            Whether to shuffle samples.
+        seed:
+            Random seed used for shuffling.
+
+    Raises:
+        TypeError:
+            When `is_shuffle` is not an instance of `bool` or `seed` is not an
+            instance of `int`.
+        ValueError:
+            When `seed < 0`.
+    """
+
+    def __init__(self, is_shuffle: bool = True, seed: int = 1):
+        # Type check.
+        if not isinstance(is_shuffle, bool):
+            raise TypeError('`is_shuffle` must be an instance of `bool`.')
+
+        if not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `int`.')
+
+        # Value check.
+        if seed < 0:
+            raise ValueError('`seed` must be bigger than or equal to `0`.')
+
+        self.cursor = 0
+        self.epoch = 0
+        self.is_shuffle = is_shuffle
+        self.seed = seed
+
+    @abc.abstractmethod
+    def batches(self) -> List[List[int]]:
+        r"""Mini-batches of current epoch.
+
+        Must only depend on `seed` and `epoch`.
+
+        Returns:
+            Indices of each mini-batch.
+        """
+        raise NotImplementedError(
+            f'In class `{self.__class__.__name__}`: '
+            'method `batches` not implemented yet.'
+        )
+
+    def set_epoch(self, epoch: int) -> None:
+        r"""Set current epoch and start from its first mini-batch.
+
+        Args:
+            epoch:
+                Current epoch. Must be bigger than or equal to `0`.
+
+        Raises:
+            TypeError:
+                When `epoch` is not an instance of `int`.
+            ValueError:
+                When `epoch < 0`.
+        """
+        # Type check.
+        if not isinstance(epoch, int):
+            raise TypeError('`epoch` must be an instance of `int`.')
+
+        # Value check.
+        if epoch < 0:
+            raise ValueError('`epoch` must be bigger than or equal to `0`.')
+
+        self.cursor = 0
+        self.epoch = epoch
+
+    def state_dict(self) -> Dict[str, int]:
+        r"""Sampling position.
+
+        Returns:
+            Dictionary with keys `cursor`, `epoch` and `seed`.
+        """
+        return {
+            'cursor': self.cursor,
+            'epoch': self.epoch,
+            'seed': self.seed,
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, int]) -> None:
+        r"""Restore sampling position.
+
+        Args:
+            state_dict:
+                Sampling position returned by `state_dict`.
+
+        Raises:
+            TypeError:
+                When `state_dict` is not an instance of `Dict[str, int]`.
+            ValueError:
+                When `state_dict` does not contain keys `cursor`, `epoch` and
+                `seed` or one of the values is negative.
+        """
+        # Type check.
+        if not isinstance(state_dict, dict) or not all(map(
+                lambda value: isinstance(value, int),
+                state_dict.values()
+        )):
+            raise TypeError(
+                '`state_dict` must be an instance of `Dict[str, int]`.'
+            )
+
+        # Value check.
+        if set(state_dict) != {'cursor', 'epoch', 'seed'} or any(map(
+                lambda value: value < 0,
+                state_dict.values()
+        )):
+            raise ValueError(
+                '`state_dict` must contain non-negative `cursor`, `epoch` '
+                'and `seed`.'
+            )
+
+        self.cursor = state_dict['cursor']
+        self.epoch = state_dict['epoch']
+        self.seed = state_dict['seed']
+
+    def __iter__(self) -> Generator[List[int], None, None]:
+        r"""Iterate through remaining mini-batches of current epoch.
+
+        Mini-batches before `cursor` are skipped without being sampled. When
+        all mini-batches are sampled, `cursor` is reset so that the same epoch
+        can be iterated again.
+
+        Yields:
+            Indices of each mini-batch.
+        """
+        batches = self.batches()
+        while self.cursor < len(batches):
+            batch = batches[self.cursor]
+            self.cursor += 1
+            yield batch
+
+        self.cursor = 0
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        r"""Number of mini-batches in each epoch."""
+        raise NotImplementedError(
+            f'In class `{self.__class__.__name__}`: '
+            'method `__len__` not implemented yet.'
+        )
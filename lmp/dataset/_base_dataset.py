@@ -0,0 +1,352 @@
+r"""Language model dataset base class.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.BaseDataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from array import array
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+import lmp.tokenizer
+
+
+# Define types for type annotation.
+CollateFnReturn = Tuple[torch.Tensor, torch.Tensor]
+CollateFn = Callable[[Iterable[str]], CollateFnReturn]
+
+
+class BaseDataset(torch.utils.data.Dataset):
+    r"""Dataset class for generating language model samples.
+
+    When `is_compact == True`, all sequences are encoded in UTF-8 and stored
+    in single `bytes` buffer (or `memoryview` of memory mapped file, see
+    `from_buffer`) with an `array('q')` offsets table. Sequences are decoded
+    only when sampled, which avoid per-sequence `str` object overhead on large
+    corpora.
+
+    Attributes:
+        batch_sequences:
+            All sequences in the dataset. Only available when
+            `is_compact == False`.
+        buffer:
+            All sequences encoded in UTF-8 and concatenated together. Only
+            available when `is_compact == True`.
+        is_compact:
+            Whether sequences are stored in compact format.
+        offsets:
+            Byte offsets of each sequence in `buffer`. Sequence `i` is
+            `buffer[offsets[i]:offsets[i + 1]]`. Only available when
+            `is_compact == True`.
+
+    Raises:
+        TypeError:
+            When `batch_sequences` is not an instance of `Iterable[str]` or
+            `is_compact` is not an instance of `bool`.
+    """
+
+    def __init__(
+            self,
+            batch_sequences: Iterable[str],
+            is_compact: bool = False
+    ):
+        super().__init__()
+        # Type check.
+        if not isinstance(batch_sequences, Iterable):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Iterable[str]`.'
+            )
+
+        if not isinstance(is_compact, bool):
+            raise TypeError('`is_compact` must be an instance of `bool`.')
+
+        self.is_compact = is_compact
+
+        if is_compact:
+            self._init_compact(batch_sequences)
+            return
+
+        batch_sequences = list(batch_sequences)
+
+        if not all(map(
+                lambda sequence: isinstance(sequence, str),
+                batch_sequences
+        )):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Iterable[str]`.'
+            )
+
+        self.batch_sequences = batch_sequences
+
+    def _init_compact(self, batch_sequences: Iterable[str]) -> None:
+        r"""Encode and concatenate sequences in a single pass.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` is not an instance of `Iterable[str]`.
+        """
+        chunks = []
+        offsets = array('q', [0])
+        end = 0
+
+        for sequence in batch_sequences:
+            if not isinstance(sequence, str):
+                raise TypeError(
+                    '`batch_sequences` must be an instance of `Iterable[str]`.'
+                )
+
+            chunk = sequence.encode('utf-8')
+            chunks.append(chunk)
+            end += len(chunk)
+            offsets.append(end)
+
+        self.buffer = b''.join(chunks)
+        self.offsets = offsets
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, memoryview], offsets: array):
+        r"""Create compact dataset from pre-encoded buffer and offsets.
+
+        No copy or decoding is performed. This is used to load cached dataset
+        without constructing any `str` object. When `buffer` is a
+        `memoryview` of memory mapped file, only sampled sequences are read
+        from disk.
+
+        Args:
+            buffer:
+                Sequences encoded in UTF-8 and concatenated together. Must be
+                one-dimensional when given as `memoryview`.
+            offsets:
+                `array('q')` of byte offsets with length equal to number of
+                sequences plus `1`. Must start with `0` and end with
+                `len(buffer)`.
+
+        Raises:
+            TypeError:
+                When `buffer` is not an instance of `Union[bytes, memoryview]`
+                or `offsets` is not an instance of `array`.
+            ValueError:
+                When `offsets` does not match `buffer`.
+
+        Returns:
+            `BaseDataset` instance in compact format.
+        """
+        # Type check.
+        if not isinstance(buffer, (bytes, memoryview)):
+            raise TypeError(
+                '`buffer` must be an instance of `Union[bytes, memoryview]`.'
+            )
+
+        if not isinstance(offsets, array) or offsets.typecode != 'q':
+            raise TypeError("`offsets` must be an instance of `array('q')`.")
+
+        # Value check.
+        if isinstance(buffer, memoryview):
+            buffer = buffer.cast('B')
+
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(buffer):
+            raise ValueError('`offsets` must match `buffer`.')
+
+        dataset = cls([], is_compact=True)
+        dataset.buffer = buffer
+        dataset.offsets = offsets
+        return dataset
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each sample in the dataset.
+
+        Yields:
+            Each sequence in the dataset.
+        """
+        if self.is_compact:
+            for index in range(len(self)):
+                yield self._decode(index)
+            return
+
+        for sequence in self.batch_sequences:
+            yield sequence
+
+    def __len__(self) -> int:
+        r"""Dataset size."""
+        if self.is_compact:
+            return len(self.offsets) - 1
+        return len(self.batch_sequences)
+
+    def _decode(self, index: int) -> str:
+        r"""Decode sequence `index` from compact buffer."""
+        return str(
+            self.buffer[self.offsets[index]:self.offsets[index + 1]],
+            'utf-8'
+        )
+
+    def __getitem__(self, index: int) -> str:
+        r"""Sample single sequence using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        if not self.is_compact:
+            return self.batch_sequences[index]
+
+        # Follow `list` indexing semantic.
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('dataset index out of range')
+
+        return self._decode(index)
+
+    def __getitems__(self, indices: List[int]) -> List[str]:
+        r"""Sample batch of sequences using indices.
+
+        Used by `torch.utils.data.DataLoader` to fetch whole mini-batch with
+        single call.
+
+        Raises:
+            IndexError:
+                When one of the `indices` is out of range.
+            TypeError:
+                When one of the `indices` is not an instance of `int`.
+        """
+        return [self[index] for index in indices]
+
+    @staticmethod
+    def create_collate_fn(
+            tokenizer: lmp.tokenizer.BaseTokenizer,
+            max_seq_len: int = -1,
+            is_dynamic_pad: bool = False
+    ) -> CollateFn:
+        r"""Create `collate_fn` for `torch.utils.data.DataLoader`.
+
+        Use `tokenizer` to perform tokenization on each mini-batch. Each
+        mini-batch will be encoded into tokens' ids with length equal to
+        `max_seq_len`. If `max_seq_len == -1`, then `max_seq_len` will be
+        inferred from current mini-batch. If `is_dynamic_pad == True`, then
+        sequences are still truncated to `max_seq_len` but only padded to the
+        longest sequence in current mini-batch.
+
+        Attributes:
+            tokenizer:
+                Perform both tokenization and encoding.
+            max_seq_len:
+                Mini-batch's maximum encoded sequence length.
+            is_dynamic_pad:
+                Whether to drop padding columns beyond the longest sequence in
+                current mini-batch.
+
+        Raises:
+            TypeError:
+                When `tokenizer` is not an instance of
+                `lmp.tokenizer.BaseTokenizer`, `max_seq_len` is not an instance
+                of `int` or `is_dynamic_pad` is not an instance of `bool`.
+            ValueError:
+                When `0 <= max_seq_len <= 1` or `max_seq_len < -1`.
+
+        Returns:
+            A function used by `torch.utils.data.DataLoader`.
+        """
+        # Type check
+        if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+            raise TypeError(
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.'
+            )
+
+        if not isinstance(max_seq_len, int):
+            raise TypeError(
+                '`max_seq_len` must be an instance of `int`.'
+            )
+
+        if not isinstance(is_dynamic_pad, bool):
+            raise TypeError('`is_dynamic_pad` must be an instance of `bool`.')
+
+        # Value check.
+        if (0 <= max_seq_len <= 1) or (max_seq_len < -1):
+            raise ValueError(
+                '`max_seq_len` must be greater than `1` or equal to `-1`.'
+            )
+
+        def collate_fn(batch_sequences: Iterable[str]) -> CollateFnReturn:
+            r"""Function used by `torch.utils.data.DataLoader`.
+
+            Each sequence in `batch_sequences` will be first tokenized and
+            encoded by `tokenizer`, the returned batch of tokens' ids will
+            have exact same length. We construct training samples following
+            language model format.
+
+            Raises:
+                TypeError:
+                    When `batch_sequences` is not an instance of `Iterable[str]`.
+                ValueError:
+                    When `batch_sequences` is empty.
+
+            Returns:
+                x:
+                    Model input batch of token's ids with numeric type
+                    `torch.int64`.
+                y:
+                    Model predict target for each token id in `x` with numeric
+                    type `torch.int64`.
+            """
+            if not batch_sequences:
+                raise ValueError('`batch_sequences` must not be empty.')
+
+            try:
+                batch_token_ids = torch.LongTensor(
+                    tokenizer.batch_encode(
+                        batch_sequences,
+                        max_seq_len=max_seq_len
+                    )
+                )
+
+                # Drop trailing columns which are padding in all sequences.
+                if is_dynamic_pad:
+                    pad_token_id = tokenizer.convert_token_to_id(
+                        tokenizer.pad_token
+                    )
+                    is_not_pad = (batch_token_ids != pad_token_id).any(dim=0)
+                    seq_len = int(is_not_pad.nonzero().max()) + 1
+                    batch_token_ids = batch_token_ids[:, :seq_len]
+
+                # Construct sample following language model:
+                # `batch_sequences[0][0]` must predict `batch_sequences[0][1]`,
+                # `batch_sequences[0][1]` must predict `batch_sequences[0][2]`,
+                # ...
+                # `batch_sequences[n][m]` must predict `batch_sequences[n][m+1]`.
+                x = batch_token_ids[:, :-1]
+                y = batch_token_ids[:, 1:]
+
+                return x, y
+            except TypeError:
+                raise TypeError(
+                    '`batch_sequences` must be an instance of `Iterable[str]`.'
+                )
+
+        return collate_fn
@@ -0,0 +1,117 @@
+r"""Batch sampler with fixed number of sequences.
+
+Usage:
+    import lmp.dataset
+
+    batch_sampler = lmp.dataset.FixedSizeBatchSampler(...)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_sampler=batch_sampler,
+        collate_fn=collate_fn
+    )
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import List
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._base_batch_sampler import BaseBatchSampler
+
+
+class FixedSizeBatchSampler(BaseBatchSampler):
+    r"""Form mini-batches with `batch_size` sequences.
+
+    Resumable replacement of `torch.utils.data.DataLoader(shuffle=True)`.
+    Dataset is permuted for each epoch by `seed` and current epoch, so
+    sampling is reproducible. Last mini-batch may contain less than
+    `batch_size` sequences.
+
+    Args:
+        batch_size:
+            Number of sequences in each mini-batch. Must be bigger than or
+            equal to `1`.
+        dataset_size:
+            Number of sequences in the dataset. Must be bigger than or equal
+            to `0`.
+        is_shuffle:
+            Whether to shuffle samples.
+        seed:
+            Random seed used for shuffling. Must be bigger than or equal to
+            `0`.
+
+    Attributes:
+        batch_size:
+            Number of sequences in each mini-batch.
+        dataset_size:
+            Number of sequences in the dataset.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            batch_size: int,
+            dataset_size: int,
+            is_shuffle: bool = True,
+            seed: int = 1
+    ):
+        super().__init__(is_shuffle=is_shuffle, seed=seed)
+
+        # Type check.
+        if not isinstance(batch_size, int):
+            raise TypeError('`batch_size` must be an instance of `int`.')
+
+        if not isinstance(dataset_size, int):
+            raise TypeError('`dataset_size` must be an instance of `int`.')
+
+        # Value check.
+        if batch_size < 1:
+            raise ValueError(
+                '`batch_size` must be bigger than or equal to `1`.'
+            )
+
+        if dataset_size < 0:
+            raise ValueError(
+                '`dataset_size` must be bigger than or equal to `0`.'
+            )
+
+        self.batch_size = batch_size
+        self.dataset_size = dataset_size
+
+    def batches(self) -> List[List[int]]:
+        r"""Mini-batches of current epoch.
+
+        Returns:
+            Indices of each mini-batch.
+        """
+        indices = np.arange(self.dataset_size)
+        if self.is_shuffle:
+            rng = np.random.default_rng([self.seed, self.epoch])
+            indices = rng.permutation(indices)
+
+        indices = indices.tolist()
+        return [
+            indices[i:i + self.batch_size]
+            for i in range(0, self.dataset_size, self.batch_size)
+        ]
+
+    def __len__(self) -> int:
+        r"""Number of mini-batches in each epoch."""
+        return -(-self.dataset_size // self.batch_size)
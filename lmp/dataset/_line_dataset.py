@@ -0,0 +1,251 @@
+r"""Dataset reading lines of plain text or JSONL file on demand.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.LineDataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import mmap
+import os
+
+from typing import Generator
+from typing import Optional
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._base_dataset import BaseDataset
+
+
+class LineDataset(BaseDataset):
+    r"""Dataset where each non-empty line of a file is a sequence.
+
+    Only byte offsets of lines are kept in memory. File is memory mapped and
+    each line is decoded when sampled, so random access over multi-GB corpora
+    costs only `16` bytes per line. Trailing `\r` of each line is removed.
+
+    When `is_jsonl == True`, each line must be a JSON string or a JSON object
+    with string field `text`.
+
+    Args:
+        file_path:
+            Path of text file encoded in UTF-8.
+        is_jsonl:
+            Whether each line is a JSON value.
+        offsets:
+            Pre-built index returned by `LineDataset.build_index`. Index is
+            built from `file_path` when `offsets is None`.
+
+    Attributes:
+        file_path:
+            Path of text file.
+        is_jsonl:
+            Whether each line is a JSON value.
+        offsets:
+            Array with shape `(N, 2)` and numeric type `int64`. Sequence `i` is
+            bytes from `offsets[i][0]` to `offsets[i][1]` (exclusive).
+
+    Raises:
+        FileNotFoundError:
+            When `file_path` does not exist.
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `offsets` is not an array with shape `(N, 2)`.
+    """
+
+    # Number of bytes scanned at once when building index.
+    chunk_size = 1 << 26
+
+    def __init__(
+            self,
+            file_path: str,
+            is_jsonl: bool = False,
+            offsets: Optional[np.ndarray] = None
+    ):
+        # `BaseDataset.__init__` keeps all sequences in memory, which is
+        # exactly what this class avoid.
+        # pylint: disable=W0231
+
+        # Type check.
+        if not isinstance(file_path, str):
+            raise TypeError('`file_path` must be an instance of `str`.')
+
+        if not isinstance(is_jsonl, bool):
+            raise TypeError('`is_jsonl` must be an instance of `bool`.')
+
+        if offsets is not None and not isinstance(offsets, np.ndarray):
+            raise TypeError(
+                '`offsets` must be an instance of `Optional[np.ndarray]`.'
+            )
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f'File {file_path} does not exist.')
+
+        if offsets is None:
+            offsets = self.build_index(file_path)
+
+        # Value check.
+        if offsets.ndim != 2 or offsets.shape[1] != 2:
+            raise ValueError('`offsets` must have shape `(N, 2)`.')
+
+        self.file_path = file_path
+        self.is_compact = False
+        self.is_jsonl = is_jsonl
+        self.offsets = offsets.astype(np.int64)
+        self._mmap = None
+
+    @classmethod
+    def build_index(cls, file_path: str) -> np.ndarray:
+        r"""Scan file once to find byte offsets of all non-empty lines.
+
+        File is read in chunks of `chunk_size` bytes and newlines are located
+        by vectorized comparison, so memory usage does not grow with file
+        size except for the index itself.
+
+        Args:
+            file_path:
+                Path of text file.
+
+        Raises:
+            FileNotFoundError:
+                When `file_path` does not exist.
+            TypeError:
+                When `file_path` is not an instance of `str`.
+
+        Returns:
+            Array with shape `(N, 2)` and numeric type `int64`. Each row is
+            start (inclusive) and end (exclusive) byte offset of a line
+            without newline. Lines containing only `\r` are treated as empty.
+        """
+        # Type check.
+        if not isinstance(file_path, str):
+            raise TypeError('`file_path` must be an instance of `str`.')
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f'File {file_path} does not exist.')
+
+        newlines = [np.zeros(0, dtype=np.int64)]
+        file_size = 0
+        with open(file_path, 'rb') as input_file:
+            while True:
+                chunk = input_file.read(cls.chunk_size)
+                if not chunk:
+                    break
+
+                newlines.append(np.flatnonzero(
+                    np.frombuffer(chunk, dtype=np.uint8) == ord('\n')
+                ).astype(np.int64) + file_size)
+                file_size += len(chunk)
+
+        ends = np.concatenate(newlines)
+
+        # Last line may not end with newline.
+        if file_size and (not ends.size or ends[-1] != file_size - 1):
+            ends = np.append(ends, file_size)
+
+        starts = np.concatenate([[0], ends + 1])[:len(ends)].astype(np.int64)
+        offsets = np.stack([starts, ends], axis=1)
+
+        # Drop empty lines.
+        offsets = offsets[offsets[:, 1] > offsets[:, 0]]
+
+        # Lines with only `\r` are empty lines of CRLF files. Only such
+        # single byte lines are read again.
+        is_single = offsets[:, 1] - offsets[:, 0] == 1
+        if is_single.any():
+            with open(file_path, 'rb') as input_file, mmap.mmap(
+                    input_file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+            ) as file_map:
+                is_single[is_single] = np.frombuffer(
+                    file_map,
+                    dtype=np.uint8
+                )[offsets[is_single, 0]] == ord('\r')
+
+            offsets = offsets[~is_single]
+
+        return offsets
+
+    def __getstate__(self) -> dict:
+        r"""Drop memory map when pickled to `DataLoader` workers."""
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        return state
+
+    def _line(self, index: int) -> str:
+        r"""Decode line `index` from memory mapped file."""
+        if self._mmap is None:
+            with open(self.file_path, 'rb') as input_file:
+                self._mmap = mmap.mmap(
+                    input_file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+
+        start, end = self.offsets[index].tolist()
+        line = self._mmap[start:end].decode('utf-8').rstrip('\r')
+
+        if not self.is_jsonl:
+            return line
+
+        value = json.loads(line)
+        if isinstance(value, dict):
+            value = value.get('text')
+
+        if not isinstance(value, str):
+            raise ValueError(
+                f'Line {index} of {self.file_path} must be a JSON string or '
+                'a JSON object with string field `text`.'
+            )
+
+        return value
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each sample in the dataset.
+
+        Yields:
+            Each sequence in the dataset.
+        """
+        for index in range(len(self)):
+            yield self._line(index)
+
+    def __len__(self) -> int:
+        r"""Dataset size."""
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> str:
+        r"""Sample single sequence using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        # Follow `list` indexing semantic.
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('dataset index out of range')
+
+        return self._line(index)
@@ -0,0 +1,271 @@
+r"""Dataset mixing multiple datasets by sampling weights.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.MixtureDataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Dict
+from typing import Generator
+from typing import Optional
+from typing import Tuple
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._base_dataset import BaseDataset
+
+
+class MixtureDataset(BaseDataset):
+    r"""Mix named datasets with fixed proportions without copying sequences.
+
+    Index space `[0, num_samples)` is split into consecutive ranges, one for
+    each source, with sizes proportional to `weights`. Index inside a range
+    is mapped to a source sequence by striding from a random offset, so a
+    down-weighted source is subsampled uniformly and an up-weighted source is
+    repeated. Offsets only depend on `seed` and `epoch`, thus each epoch
+    samples different sequences of a down-weighted source while every epoch
+    can be reproduced. Keep `epoch` fixed when anything computed from
+    indices (for example held-out subset or sequence lengths) must stay
+    valid. Sequences are read from sources only when sampled, and
+    shuffling batch samplers (for example `lmp.dataset.FixedSizeBatchSampler`)
+    interleave all sources in each mini-batch.
+
+    Number of sampled sequences of each source is counted in `counters`.
+    Counters are only updated in the process performing sampling.
+
+    Args:
+        datasets:
+            Mapping from source name to dataset. Must not be empty and each
+            dataset must not be empty.
+        weights:
+            Mapping from source name to sampling weight. Must have the same
+            keys as `datasets` and each weight must be bigger than `0`.
+        num_samples:
+            Number of sequences in each epoch. Must be bigger than or equal to
+            `1` or equal to `-1`. Use total number of sequences of all sources
+            when `num_samples == -1`.
+        seed:
+            Random seed used for offsets. Must be bigger than or equal to `0`.
+
+    Attributes:
+        counters:
+            Number of sampled sequences of each source.
+        datasets:
+            Mapping from source name to dataset.
+        epoch:
+            Current epoch. Offsets depend on it.
+        names:
+            Source names in the order of index ranges.
+        num_samples:
+            Number of sequences in each epoch.
+        seed:
+            Random seed used for offsets.
+        weights:
+            Normalized sampling weight of each source.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            datasets: Dict[str, BaseDataset],
+            weights: Dict[str, float],
+            num_samples: int = -1,
+            seed: int = 1
+    ):
+        # Sequences are stored in each source dataset.
+        # pylint: disable=W0231
+
+        # Type check.
+        if not isinstance(datasets, dict) or not all(map(
+                lambda item: (
+                    isinstance(item[0], str) and
+                    isinstance(item[1], BaseDataset)
+                ),
+                datasets.items()
+        )):
+            raise TypeError(
+                '`datasets` must be an instance of '
+                '`Dict[str, lmp.dataset.BaseDataset]`.'
+            )
+
+        if not isinstance(weights, dict) or not all(map(
+                lambda weight: (
+                    isinstance(weight, (float, int)) and
+                    not isinstance(weight, bool)
+                ),
+                weights.values()
+        )):
+            raise TypeError(
+                '`weights` must be an instance of `Dict[str, float]`.'
+            )
+
+        if not isinstance(num_samples, int):
+            raise TypeError('`num_samples` must be an instance of `int`.')
+
+        if not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `int`.')
+
+        # Value check.
+        if not datasets or not all(map(len, datasets.values())):
+            raise ValueError(
+                '`datasets` must not be empty and each dataset must not be '
+                'empty.'
+            )
+
+        if set(weights) != set(datasets) or not all(map(
+                lambda weight: weight > 0,
+                weights.values()
+        )):
+            raise ValueError(
+                '`weights` must have the same keys as `datasets` and each '
+                'weight must be bigger than `0`.'
+            )
+
+        if num_samples < -1 or num_samples == 0:
+            raise ValueError(
+                '`num_samples` must be bigger than or equal to `1` or equal '
+                'to `-1`.'
+            )
+
+        if seed < 0:
+            raise ValueError('`seed` must be bigger than or equal to `0`.')
+
+        if num_samples == -1:
+            num_samples = sum(map(len, datasets.values()))
+
+        total_weight = sum(weights.values())
+
+        self.counters = {name: 0 for name in datasets}
+        self.datasets = datasets
+        self.is_compact = False
+        self.names = list(datasets)
+        self.num_samples = num_samples
+        self.weights = {
+            name: weights[name] / total_weight
+            for name in self.names
+        }
+
+        # Rounding cumulative proportions makes range sizes sum up to exactly
+        # `num_samples`. `self._bounds[k]` is the start of source `k`.
+        self._bounds = np.concatenate([[0], np.round(
+            np.cumsum([self.weights[name] for name in self.names])
+            * num_samples
+        )]).astype(np.int64)
+        self._bounds[-1] = num_samples
+
+        self.seed = seed
+        self.set_epoch(0)
+
+    def set_epoch(self, epoch: int, seed: Optional[int] = None) -> None:
+        r"""Set current epoch and draw offset of each source.
+
+        Args:
+            epoch:
+                Current epoch. Must be bigger than or equal to `0`.
+            seed:
+                Random seed used for offsets. Must be bigger than or equal to
+                `0`. Keep current seed when set to `None`.
+
+        Raises:
+            TypeError:
+                When `epoch` is not an instance of `int` or `seed` is not an
+                instance of `Optional[int]`.
+            ValueError:
+                When `epoch < 0` or `seed < 0`.
+        """
+        # Type check.
+        if not isinstance(epoch, int):
+            raise TypeError('`epoch` must be an instance of `int`.')
+
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError('`seed` must be an instance of `Optional[int]`.')
+
+        # Value check.
+        if epoch < 0:
+            raise ValueError('`epoch` must be bigger than or equal to `0`.')
+
+        if seed is not None and seed < 0:
+            raise ValueError('`seed` must be bigger than or equal to `0`.')
+
+        if seed is not None:
+            self.seed = seed
+
+        self.epoch = epoch
+
+        rng = np.random.RandomState([self.seed, epoch])
+        self._offsets = [
+            int(rng.randint(len(self.datasets[name])))
+            for name in self.names
+        ]
+
+    def _locate(self, index: int) -> Tuple[str, int]:
+        r"""Map `index` to source name and index in that source."""
+        source = int(np.searchsorted(self._bounds, index, side='right')) - 1
+        name = self.names[source]
+        start = int(self._bounds[source])
+        size = int(self._bounds[source + 1]) - start
+        num_sequences = len(self.datasets[name])
+        return name, (
+            self._offsets[source] +
+            (index - start) * num_sequences // size
+        ) % num_sequences
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each sample in the dataset.
+
+        Iteration (for example tokenizer training) is not counted in
+        `counters`.
+
+        Yields:
+            Each sequence in the dataset.
+        """
+        for index in range(len(self)):
+            name, source_index = self._locate(index)
+            yield self.datasets[name][source_index]
+
+    def __len__(self) -> int:
+        r"""Dataset size."""
+        return self.num_samples
+
+    def __getitem__(self, index: int) -> str:
+        r"""Sample single sequence using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        # Follow `list` indexing semantic.
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('dataset index out of range')
+
+        name, source_index = self._locate(index)
+        self.counters[name] += 1
+        return self.datasets[name][source_index]
@@ -0,0 +1,127 @@
+r"""Dataset selecting subset of another dataset by indices.
+
+Usage:
+    import lmp.dataset
+
+    dataset = lmp.dataset.SubsetDataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Generator
+from typing import Iterable
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._base_dataset import BaseDataset
+
+
+class SubsetDataset(BaseDataset):
+    r"""View of selected sequences of another dataset.
+
+    Only `indices` are stored, sequences are read from `dataset` when sampled.
+    Used to apply filtered index (for example deduplicated or pruned index)
+    without copying sequences.
+
+    Args:
+        dataset:
+            Dataset to select from.
+        indices:
+            Indices of selected sequences in `dataset`. Each index must be in
+            range `[0, len(dataset))`.
+
+    Attributes:
+        dataset:
+            Dataset to select from.
+        indices:
+            Array of selected indices with numeric type `int64`.
+
+    Raises:
+        TypeError:
+            When `dataset` is not an instance of `lmp.dataset.BaseDataset` or
+            `indices` is not an instance of `Iterable[int]`.
+        ValueError:
+            When one of the `indices` is out of range.
+    """
+
+    def __init__(self, dataset: BaseDataset, indices: Iterable[int]):
+        # Sequences are stored in `dataset`.
+        # pylint: disable=W0231
+
+        # Type check.
+        if not isinstance(dataset, BaseDataset):
+            raise TypeError(
+                '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+            )
+
+        if not isinstance(indices, Iterable):
+            raise TypeError(
+                '`indices` must be an instance of `Iterable[int]`.'
+            )
+
+        if not isinstance(indices, np.ndarray):
+            indices = np.array(list(indices))
+
+        if indices.ndim != 1 or (
+                indices.size and indices.dtype.kind not in 'iu'
+        ):
+            raise TypeError(
+                '`indices` must be an instance of `Iterable[int]`.'
+            )
+
+        # Value check.
+        if indices.size and (
+                indices.min() < 0 or
+                indices.max() >= len(dataset)
+        ):
+            raise ValueError(
+                '`indices` must be in range `[0, len(dataset))`.'
+            )
+
+        self.dataset = dataset
+        self.indices = indices.astype(np.int64)
+        self.is_compact = False
+
+    def __iter__(self) -> Generator[str, None, None]:
+        r"""Iterate through each sample in the dataset.
+
+        Yields:
+            Each sequence in the dataset.
+        """
+        for index in self.indices.tolist():
+            yield self.dataset[index]
+
+    def __len__(self) -> int:
+        r"""Dataset size."""
+        return len(self.indices)
+
+    def __getitem__(self, index: int) -> str:
+        r"""Sample single sequence using index.
+
+        Raises:
+            IndexError:
+                When `index >= len(self)`.
+            TypeError:
+                When `index` is not an instance of `int`.
+        """
+        # Type check.
+        if not isinstance(index, int):
+            raise TypeError('`index` must be an instance of `int`.')
+
+        # Follow `list` indexing semantic.
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('dataset index out of range')
+
+        return self.dataset[int(self.indices[index])]
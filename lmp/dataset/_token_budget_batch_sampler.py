@@ -0,0 +1,180 @@
+r"""Batch sampler bounded by number of tokens.
+
+Usage:
+    import lmp.dataset
+
+    batch_sampler = lmp.dataset.TokenBudgetBatchSampler(...)
+    data_loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_sampler=batch_sampler,
+        collate_fn=collate_fn
+    )
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Iterable
+from typing import List
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset._base_batch_sampler import BaseBatchSampler
+
+
+class TokenBudgetBatchSampler(BaseBatchSampler):
+    r"""Form mini-batches by maximum number of tokens instead of sequences.
+
+    Sequences are grouped with others of similar length so that each
+    mini-batch contains as many sequences as possible while
+    `number of sequences * longest sequence length <= max_tokens`. Sequence
+    lengths are capped by `max_seq_len` to match truncation performed by
+    `lmp.dataset.BaseDataset.create_collate_fn`. A sequence longer than
+    `max_tokens` is put in a mini-batch by itself.
+
+    Sequences with the same length are shuffled before grouping, and the order
+    of mini-batches is shuffled for each epoch. Both depend only on `seed` and
+    current epoch, so sampling is reproducible.
+
+    Args:
+        batch_lengths:
+            Encoded length (including `[bos]` and `[eos]`) of each sequence in
+            the dataset. Each length must be bigger than or equal to `1`.
+        max_tokens:
+            Maximum number of tokens (after padding) in each mini-batch. Must
+            be bigger than or equal to `1`.
+        is_shuffle:
+            Whether to shuffle mini-batches.
+        max_seq_len:
+            Truncation length used by `collate_fn`. Must be greater than `1` or
+            equal to `-1`.
+        seed:
+            Random seed used for shuffling. Must be bigger than or equal to
+            `0`.
+
+    Attributes:
+        batch_lengths:
+            Encoded length of each sequence capped by `max_seq_len`.
+        max_tokens:
+            Maximum number of tokens in each mini-batch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            batch_lengths: Iterable[int],
+            max_tokens: int,
+            is_shuffle: bool = True,
+            max_seq_len: int = -1,
+            seed: int = 1
+    ):
+        super().__init__(is_shuffle=is_shuffle, seed=seed)
+
+        # Type check.
+        if not isinstance(batch_lengths, Iterable):
+            raise TypeError(
+                '`batch_lengths` must be an instance of `Iterable[int]`.'
+            )
+
+        if not isinstance(max_tokens, int):
+            raise TypeError('`max_tokens` must be an instance of `int`.')
+
+        if not isinstance(max_seq_len, int):
+            raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+        batch_lengths = np.array(list(batch_lengths))
+
+        if batch_lengths.size and batch_lengths.dtype.kind not in 'iu':
+            raise TypeError(
+                '`batch_lengths` must be an instance of `Iterable[int]`.'
+            )
+
+        # Value check.
+        if batch_lengths.size and batch_lengths.min() < 1:
+            raise ValueError(
+                '`batch_lengths` must be bigger than or equal to `1`.'
+            )
+
+        if max_tokens < 1:
+            raise ValueError(
+                '`max_tokens` must be bigger than or equal to `1`.'
+            )
+
+        if (0 <= max_seq_len <= 1) or (max_seq_len < -1):
+            raise ValueError(
+                '`max_seq_len` must be greater than `1` or equal to `-1`.'
+            )
+
+        if max_seq_len != -1:
+            batch_lengths = np.minimum(batch_lengths, max_seq_len)
+
+        self.batch_lengths = batch_lengths.astype(np.int64)
+        self.max_tokens = max_tokens
+
+        # Number of mini-batches does not depend on shuffling since grouping
+        # only depends on sorted lengths.
+        self._num_batches = len(self._group(np.argsort(
+            self.batch_lengths,
+            kind='stable'
+        )))
+
+    def _group(self, sorted_indices: np.ndarray) -> List[List[int]]:
+        r"""Greedily group indices sorted by ascending length."""
+        batches = []
+        batch = []
+        for index in sorted_indices.tolist():
+            # Lengths are ascending, so current sequence is the longest.
+            if batch and (len(batch) + 1) * self.batch_lengths[index] > \
+                    self.max_tokens:
+                batches.append(batch)
+                batch = []
+            batch.append(index)
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def batches(self) -> List[List[int]]:
+        r"""Mini-batches of current epoch.
+
+        Returns:
+            Indices of each mini-batch.
+        """
+        rng = np.random.default_rng([self.seed, self.epoch])
+
+        # Shuffle before stable sort so that sequences with same length are
+        # grouped differently in each epoch.
+        indices = np.arange(len(self.batch_lengths))
+        if self.is_shuffle:
+            indices = rng.permutation(indices)
+
+        indices = indices[np.argsort(
+            self.batch_lengths[indices],
+            kind='stable'
+        )]
+        batches = self._group(indices)
+
+        if self.is_shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        return batches
+
+    def __len__(self) -> int:
+        r"""Number of mini-batches in each epoch."""
+        return self._num_batches
@@ -9,8 +9,10 @@ Usage:
     model = lmp.model.BaseRNNModel(...)
     model = lmp.model.GRUModel(...)
     model = lmp.model.LSTMModel(...)
+    cache = lmp.model.PrefixStateCache(...)
     model = lmp.model.ResGRUModel(...)
     model = lmp.model.ResLSTMModel(...)
+    state = lmp.model.RNNState(...)
 """
 
 # built-in modules
@@ -27,7 +29,9 @@ from lmp.model._base_res_rnn_model import BaseResRNNModel
 from lmp.model._base_rnn_model import BaseRNNModel
 from lmp.model._gru_model import GRUModel
 from lmp.model._lstm_model import LSTMModel
+from lmp.model._prefix_state_cache import PrefixStateCache
 from lmp.model._res_gru_block import ResGRUBlock
 from lmp.model._res_gru_model import ResGRUModel
 from lmp.model._res_lstm_block import ResLSTMBlock
 from lmp.model._res_lstm_model import ResLSTMModel
+from lmp.model._rnn_state import RNNState
@@ -5,6 +5,8 @@ Usage:
 
     block = lmp.model.BaseResRNNBlock(...)
     logits = block(...)
+    hidden = block.init_state(...)
+    logits, hidden = block.forward_step(...)
 """
 
 # built-in modules
@@ -14,10 +16,19 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
 # 3rd-party modules
 
 import torch
 import torch.nn
+import torch.nn.utils.rnn
+
+# self-made modules
+
+from lmp.model._rnn_state import init_hidden
 
 
 class BaseResRNNBlock(torch.nn.Module):
@@ -25,6 +36,9 @@ class BaseResRNNBlock(torch.nn.Module):
 
     out = dropout(ReLU(RNN(x))) + x
 
+    Input can be packed sequences, in which case padding tokens are skipped by
+    RNN layer and output is packed in the same way.
+
     Args:
         d_hid:
             Residual RNN layer hidden dimension.
@@ -65,15 +79,84 @@ class BaseResRNNBlock(torch.nn.Module):
         self.dropout = torch.nn.Dropout(dropout)
         self.act_fn = torch.nn.ReLU()
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
+    def forward(
+            self,
+            x: Union[torch.Tensor, torch.nn.utils.rnn.PackedSequence]
+    ) -> Union[torch.Tensor, torch.nn.utils.rnn.PackedSequence]:
         r"""Perform forward pass.
 
         Args:
             x:
-                Batch of hidden vectors with numeric type `torch.float32`.
+                Batch of hidden vectors with numeric type `torch.float32`, or
+                packed hidden vectors.
 
         Returns:
-            Residual blocks output tensors.
+            Residual blocks output tensors. Packed if `x` is packed.
         """
         ht, _ = self.rnn_layer(x)
+
+        # Packed hidden vectors of each token are stored in `data` with the
+        # same order, thus residual connection is applied directly.
+        if isinstance(x, torch.nn.utils.rnn.PackedSequence):
+            return x._replace(data=self.dropout(self.act_fn(ht.data)) + x.data)
+
         return self.dropout(self.act_fn(ht)) + x
+
+    def init_state(
+            self,
+            batch_size: int
+    ) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        r"""Create zero initial hidden state.
+
+        Args:
+            batch_size:
+                Batch size of hidden state. Must be bigger than or equal to
+                `1`.
+
+        Raises:
+            TypeError:
+                When `batch_size` is not an instance of `int`.
+            ValueError:
+                When `batch_size < 1`.
+
+        Returns:
+            Zero hidden state with shape `(1, B, H)`, or tuple `(h, c)` of
+            such tensors for LSTM.
+        """
+        return init_hidden(batch_size=batch_size, rnn_layer=self.rnn_layer)
+
+    def forward_step(
+            self,
+            x: Union[torch.Tensor, torch.nn.utils.rnn.PackedSequence],
+            hidden: Optional[Union[
+                torch.Tensor,
+                Tuple[torch.Tensor, torch.Tensor]
+            ]] = None
+    ) -> Tuple[
+        Union[torch.Tensor, torch.nn.utils.rnn.PackedSequence],
+        Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]
+    ]:
+        r"""Perform forward pass continued from previous hidden state.
+
+        Args:
+            x:
+                Batch of hidden vectors with shape `(B, S, H)` and numeric
+                type `torch.float32`, or packed hidden vectors.
+            hidden:
+                Hidden state returned by `init_state` or previous call of
+                `forward_step`. Start from zero hidden state when set to
+                `None`.
+
+        Returns:
+            Residual blocks output tensors (packed if `x` is packed) and
+            updated hidden state.
+        """
+        ht, hidden = self.rnn_layer(x, hidden)
+
+        if isinstance(x, torch.nn.utils.rnn.PackedSequence):
+            return (
+                x._replace(data=self.dropout(self.act_fn(ht.data)) + x.data),
+                hidden
+            )
+
+        return self.dropout(self.act_fn(ht)) + x, hidden
@@ -6,6 +6,9 @@ Usage:
     model = lmp.model.BaseRNNModel(...)
     logits = model(...)
     pred = model.predict(...)
+    log_probs = model.predict_log_probs(...)
+    state = model.init_state(...)
+    logits, state = model.forward_step(...)
 """
 
 # built-in modules
@@ -15,10 +18,21 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from typing import Optional
+from typing import Tuple
+
 # 3rd-party modules
 
 import torch
 import torch.nn
+import torch.nn.functional
+
+# self-made modules
+
+from lmp.model._packed_sequence import pack_sequences
+from lmp.model._packed_sequence import unpack_real_tokens
+from lmp.model._rnn_state import RNNState
+from lmp.model._rnn_state import init_hidden
 
 
 class BaseRNNModel(torch.nn.Module):
@@ -203,16 +217,58 @@ class BaseRNNModel(torch.nn.Module):
         proj_hid_to_emb.append(torch.nn.Dropout(dropout))
         self.proj_hid_to_emb = torch.nn.Sequential(*proj_hid_to_emb)
 
-    def forward(self, batch_sequences: torch.Tensor) -> torch.Tensor:
+    def forward(
+            self,
+            batch_sequences: torch.Tensor,
+            batch_lengths: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
         r"""Perform forward pass.
 
+        When `batch_lengths` is given, padding tokens after each sequence are
+        skipped by RNN layer(s) using packed sequences, and only logits of
+        non-padding tokens are calculated.
+
         Args:
             batch_sequences:
                 Batch of sequences which have been encoded by
                 `lmp.tokenizer.BaseTokenizer` with numeric type `torch.int64`.
+            batch_lengths:
+                Number of non-padding tokens of each sequence with shape `(B)`.
+                Each length must range from `1` to `S`.
+
+        Raises:
+            TypeError:
+                When `batch_lengths` is not an instance of `Tensor`.
+            ValueError:
+                When `batch_lengths` does not have shape `(B)` or one of the
+                lengths is out of range.
 
         Returns:
-            Logits for each token in sequences with numeric type `torch.float32`.
+            Logits for each token in sequences with numeric type
+            `torch.float32` and shape `(B, S, V)`. When `batch_lengths` is
+            given, logits of non-padding tokens only with shape `(N, V)`, where
+            `N = batch_lengths.sum()`, ordered by sequence first then by
+            position.
+        """
+        logits, _ = self._forward_with_state(
+            batch_sequences=batch_sequences,
+            batch_lengths=batch_lengths
+        )
+        return logits
+
+    def _forward_with_state(
+            self,
+            batch_sequences: torch.Tensor,
+            state: Optional[RNNState] = None,
+            batch_lengths: Optional[torch.Tensor] = None,
+            positions: Optional[torch.Tensor] = None
+    ) -> Tuple[torch.Tensor, RNNState]:
+        r"""Forward pass shared by all methods performing prediction.
+
+        Start from zero hidden state when `state` is `None`. When `positions`
+        with shape `(B, P)` is given, only hidden vectors at `positions` are
+        projected back to vocabulary. See `forward_step` for other arguments
+        and return values.
         """
         # 將 batch_sequences 中的所有 token_id 經過 embedding matrix
         # 轉換成 embedding vectors (共有 (B, S) 個維度為 E 的向量)
@@ -224,18 +280,135 @@ class BaseRNNModel(torch.nn.Module):
         # ht 維度: (B, S, H)
         ht = self.proj_emb_to_hid(batch_sequences)
 
-        # 將每個 embedding vectors 依序輸入 RNN 得到輸出 hidden vectors
+        # 從前一個 hidden state 開始，將 hidden vectors 依序輸入 RNN
         # ht 維度: (B, S, H)
-        ht, _ = self.rnn_layer(ht)
+        hidden = None if state is None else state.hidden[0]
+        if batch_lengths is None:
+            ht, hidden = self.rnn_layer(ht, hidden)
+        else:
+            # Padding tokens are skipped and dropped.
+            # ht 維度: (N, H)
+            ht, hidden = self.rnn_layer(
+                pack_sequences(batch_lengths=batch_lengths, ht=ht),
+                hidden
+            )
+            ht = unpack_real_tokens(
+                batch_lengths=batch_lengths,
+                packed=ht,
+                seq_len=batch_sequences.size(1)
+            )
+
+        # 只選取需要預測的位置
+        # ht 維度: (B, P, H)
+        if positions is not None:
+            positions = positions.to(ht.device).unsqueeze(-1)
+            ht = ht.gather(1, positions.expand(-1, -1, ht.size(-1)))
 
         # 將每個 hidden vectors 轉換維度至 embedding dimension
-        # ht 維度: (B, S, E)
+        # ht 維度: (B, S, E), (N, E) or (B, P, E)
         ht = self.proj_hid_to_emb(ht)
 
         # 與轉置後的 embedding matrix 進行矩陣乘法取得預測文字
         # 重複使用 embedding matrix 的目的為節省參數數量
-        # return 維度: (B, S, V)
-        return ht.matmul(self.emb_layer.weight.transpose(0, 1))
+        # logits 維度: (B, S, V), (N, V) or (B, P, V)
+        logits = ht.matmul(self.emb_layer.weight.transpose(0, 1))
+
+        return logits, RNNState([hidden])
+
+    def init_state(self, batch_size: int) -> RNNState:
+        r"""Create zero initial hidden state.
+
+        Args:
+            batch_size:
+                Batch size of hidden state. Must be bigger than or equal to
+                `1`.
+
+        Raises:
+            TypeError:
+                When `batch_size` is not an instance of `int`.
+            ValueError:
+                When `batch_size < 1`.
+
+        Returns:
+            Zero hidden state of each RNN layer on the same device as model.
+        """
+        return RNNState([
+            init_hidden(batch_size=batch_size, rnn_layer=self.rnn_layer)
+        ])
+
+    def forward_step(
+            self,
+            batch_sequences: torch.Tensor,
+            state: Optional[RNNState] = None,
+            batch_lengths: Optional[torch.Tensor] = None
+    ) -> Tuple[torch.Tensor, RNNState]:
+        r"""Perform forward pass continued from previous hidden state.
+
+        Feeding a sequence in several calls with returned hidden state gives
+        the same logits as feeding the whole sequence in one call of
+        `forward`. Thus autoregressive generation only needs to feed newly
+        generated tokens. When `batch_lengths` is given, padding tokens after
+        each sequence are skipped, and returned hidden state of each sequence
+        is the one after its last non-padding token.
+
+        Args:
+            batch_sequences:
+                Batch of sequences which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with shape `(B, S)` and numeric
+                type `torch.int64`.
+            state:
+                Hidden state returned by `init_state` or previous call of
+                `forward_step`. Start from zero hidden state when set to
+                `None`.
+            batch_lengths:
+                Number of non-padding tokens of each sequence with shape `(B)`.
+                Each length must range from `1` to `S`.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` or `batch_lengths` is not an instance
+                of `Tensor` or `state` is not an instance of
+                `lmp.model.RNNState`.
+            ValueError:
+                When `batch_sequences` does not have shape `(B, S)`, batch
+                size of `state` is not `B`, `batch_lengths` does not have
+                shape `(B)` or one of the lengths is out of range.
+
+        Returns:
+            Logits for each token in sequences with shape `(B, S, V)` and
+            numeric type `torch.float32`, and hidden state after the last
+            token. When `batch_lengths` is given, logits of non-padding tokens
+            only with shape `(N, V)`, where `N = batch_lengths.sum()`, ordered
+            by sequence first then by position.
+        """
+        # Type check.
+        if not isinstance(batch_sequences, torch.Tensor):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Tensor`.'
+            )
+
+        if state is not None and not isinstance(state, RNNState):
+            raise TypeError(
+                '`state` must be an instance of `lmp.model.RNNState`.'
+            )
+
+        # Value check.
+        if batch_sequences.dim() != 2:
+            raise ValueError('`batch_sequences` must have shape `(B, S)`.')
+
+        if state is None:
+            state = self.init_state(batch_size=batch_sequences.size(0))
+
+        if state.batch_size != batch_sequences.size(0):
+            raise ValueError(
+                '`state` must have the same batch size as `batch_sequences`.'
+            )
+
+        return self._forward_with_state(
+            batch_sequences=batch_sequences,
+            state=state,
+            batch_lengths=batch_lengths
+        )
 
     def predict(self, batch_sequences: torch.Tensor) -> torch.Tensor:
         r"""Convert model output logits into prediction.
@@ -259,3 +432,76 @@ class BaseRNNModel(torch.nn.Module):
             )
 
         return torch.nn.functional.softmax(self(batch_sequences), dim=-1)
+
+    def predict_log_probs(
+            self,
+            batch_sequences: torch.Tensor,
+            positions: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        r"""Calculate log-probabilities of next token at selected positions.
+
+        Only hidden vectors at `positions` are projected through embedding
+        matrix, thus inference which only needs prediction of the last token
+        saves `S` times of vocabulary projection. Log-probabilities are
+        calculated by `log_softmax` directly, which is more precise than taking
+        `log` of `predict` output.
+
+        Args:
+            batch_sequences:
+                Batch of sequences which have been encoded by
+                `lmp.tokenizer.BaseTokenizer` with shape `(B, S)` and numeric
+                type `torch.int64`.
+            positions:
+                Positions to predict with shape `(P)` (shared by all sequences)
+                or `(B, P)` and numeric type `torch.int64`. Each position must
+                range from `-S` to `S - 1`, where negative positions count from
+                the end. Predict all positions when set to `None`.
+
+        Raises:
+            TypeError:
+                When `batch_sequences` or `positions` is not an instance of
+                `Tensor`.
+            ValueError:
+                When `positions` does not have shape `(P)` or `(B, P)` or one
+                of the positions is out of range.
+
+        Returns:
+            Log-probabilities with shape `(B, S, V)`, or `(B, P, V)` when
+            `positions` is given, and numeric type `torch.float32`.
+        """
+        # Type check.
+        if not isinstance(batch_sequences, torch.Tensor):
+            raise TypeError(
+                '`batch_sequences` must be an instance of `Tensor`.'
+            )
+
+        if positions is not None and not isinstance(positions, torch.Tensor):
+            raise TypeError('`positions` must be an instance of `Tensor`.')
+
+        batch_size, seq_len = batch_sequences.size()
+
+        # Value check.
+        if positions is not None and (
+                positions.dim() not in (1, 2) or
+                positions.dim() == 2 and positions.size(0) != batch_size or
+                positions.numel() and (
+                    positions.min() < -seq_len or
+                    positions.max() >= seq_len
+                )
+        ):
+            raise ValueError(
+                '`positions` must have shape `(P)` or `(B, P)` and each '
+                'position must range from `-S` to `S - 1`.'
+            )
+
+        # Positions of each sequence with shape `(B, P)`.
+        if positions is not None:
+            positions = (positions % seq_len).expand(batch_size, -1)
+
+        logits, _ = self._forward_with_state(
+            batch_sequences=batch_sequences,
+            positions=positions
+        )
+
+        # return 維度: (B, S, V) or (B, P, V)
+        return torch.nn.functional.log_softmax(logits, dim=-1)
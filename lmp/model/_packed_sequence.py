@@ -0,0 +1,106 @@
+r"""Helper functions for skipping padding tokens in RNN layers.
+
+Usage:
+    from lmp.model._packed_sequence import pack_sequences
+    from lmp.model._packed_sequence import unpack_real_tokens
+
+    packed = pack_sequences(...)
+    ht = unpack_real_tokens(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# 3rd-party modules
+
+import torch
+import torch.nn.utils.rnn
+
+
+def pack_sequences(
+        batch_lengths: torch.Tensor,
+        ht: torch.Tensor
+) -> torch.nn.utils.rnn.PackedSequence:
+    r"""Pack padded hidden vectors so that RNN layers skip padding tokens.
+
+    Args:
+        batch_lengths:
+            Number of non-padding tokens of each sequence with shape `(B)`.
+            Each length must range from `1` to `S`.
+        ht:
+            Batch of padded hidden vectors with shape `(B, S, H)`.
+
+    Raises:
+        TypeError:
+            When `batch_lengths` is not an instance of `Tensor`.
+        ValueError:
+            When `batch_lengths` does not have shape `(B)` or one of the
+            lengths is out of range.
+
+    Returns:
+        Packed hidden vectors.
+    """
+    # Type check.
+    if not isinstance(batch_lengths, torch.Tensor):
+        raise TypeError('`batch_lengths` must be an instance of `Tensor`.')
+
+    # `pack_padded_sequence` requires lengths on CPU.
+    batch_lengths = batch_lengths.cpu()
+
+    # Value check.
+    if (
+            batch_lengths.size() != ht.size()[:1] or
+            batch_lengths.min() < 1 or
+            batch_lengths.max() > ht.size(1)
+    ):
+        raise ValueError(
+            '`batch_lengths` must have shape `(B)` and each length must '
+            'range from `1` to `S`.'
+        )
+
+    return torch.nn.utils.rnn.pack_padded_sequence(
+        ht,
+        batch_lengths,
+        batch_first=True,
+        enforce_sorted=False
+    )
+
+
+def unpack_real_tokens(
+        batch_lengths: torch.Tensor,
+        packed: torch.nn.utils.rnn.PackedSequence,
+        seq_len: int
+) -> torch.Tensor:
+    r"""Gather hidden vectors of non-padding tokens only.
+
+    Args:
+        batch_lengths:
+            Number of non-padding tokens of each sequence with shape `(B)`.
+        packed:
+            Packed RNN output.
+        seq_len:
+            Padded sequence length `S`.
+
+    Returns:
+        Hidden vectors with shape `(N, H)` where `N = batch_lengths.sum()`,
+        ordered by sequence first then by position. Same order as selecting
+        non-padding tokens with boolean mask `x != pad_token_id`.
+    """
+    # ht.size = (B, S, H)
+    ht, _ = torch.nn.utils.rnn.pad_packed_sequence(
+        packed,
+        batch_first=True,
+        total_length=seq_len
+    )
+
+    # mask.size = (B, S)
+    mask = (
+        torch.arange(seq_len, device=batch_lengths.device)[None, :] <
+        batch_lengths[:, None]
+    )
+
+    return ht[mask.to(ht.device)]
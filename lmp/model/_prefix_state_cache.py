@@ -0,0 +1,322 @@
+r"""Cache of RNN hidden states after token id prefixes.
+
+Usage:
+    import lmp.model
+
+    cache = lmp.model.PrefixStateCache(...)
+    cache.insert(...)
+    length, entry = cache.lookup(...)
+    metrics = cache.metrics()
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model._rnn_state import RNNState
+
+
+class _TrieNode:
+    r"""Node of token id trie.
+
+    Attributes:
+        children:
+            Child node of each next token id.
+        entry:
+            Cached logits and hidden state after the prefix ending at this
+            node, or `None` if the prefix is not cached.
+        parent:
+            Parent node, or `None` for root.
+        token_id:
+            Token id of the edge from parent.
+    """
+
+    __slots__ = ('children', 'entry', 'parent', 'token_id')
+
+    def __init__(self, parent: Optional['_TrieNode'], token_id: int):
+        self.children = {}
+        self.entry = None
+        self.parent = parent
+        self.token_id = token_id
+
+
+class PrefixStateCache:
+    r"""Cache of RNN hidden states after token id prefixes.
+
+    Since hidden state of RNN language model after a prefix has fixed size no
+    matter how long the prefix is, prompts sharing a common prefix can resume
+    from the hidden state after that prefix and only encode the remainder.
+    Each cache entry stores logits of the last token of a prefix (with shape
+    `(V)`) and hidden state after it (with batch size `1`). Prefixes are
+    stored in a token id trie, thus the longest cached prefix of a prompt is
+    found in `O(S)` time.
+
+    Prefixes are cached every `stride` tokens (and at the end of each prompt)
+    by `lmp.util.encode_prompts`, so prompts sharing only a template header
+    can still share hidden states. Least recently used entries are evicted
+    when total size of cached tensors exceeds `max_bytes` or number of entries
+    exceeds `max_entries`.
+
+    Cached tensors must be created by the same model. Cache must be cleared
+    when model parameters change.
+
+    Args:
+        max_bytes:
+            Memory budget of cached tensors in bytes. Must be bigger than or
+            equal to `1`.
+        max_entries:
+            Maximum number of cached prefixes. Must be bigger than or equal to
+            `1`, or equal to `-1` for no limit.
+        stride:
+            Cache hidden state every `stride` tokens of a prompt. Must be
+            bigger than or equal to `1`.
+
+    Attributes:
+        max_bytes:
+            Memory budget of cached tensors in bytes.
+        max_entries:
+            Maximum number of cached prefixes.
+        stride:
+            Cache hidden state every `stride` tokens of a prompt.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int,
+            max_entries: int = -1,
+            stride: int = 16
+    ):
+        # Type check.
+        if not isinstance(max_bytes, int):
+            raise TypeError('`max_bytes` must be an instance of `int`.')
+
+        if not isinstance(max_entries, int):
+            raise TypeError('`max_entries` must be an instance of `int`.')
+
+        if not isinstance(stride, int):
+            raise TypeError('`stride` must be an instance of `int`.')
+
+        # Value check.
+        if max_bytes < 1:
+            raise ValueError(
+                '`max_bytes` must be bigger than or equal to `1`.'
+            )
+
+        if max_entries < 1 and max_entries != -1:
+            raise ValueError(
+                '`max_entries` must be bigger than or equal to `1` or equal '
+                'to `-1`.'
+            )
+
+        if stride < 1:
+            raise ValueError('`stride` must be bigger than or equal to `1`.')
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stride = stride
+
+        self.clear()
+
+    def clear(self) -> None:
+        r"""Remove all cached prefixes and reset metrics."""
+        self._root = _TrieNode(parent=None, token_id=-1)
+
+        # Trie nodes of cached prefixes in least recently used order.
+        self._lru = collections.OrderedDict()
+        self._num_bytes = 0
+
+        # Metrics.
+        self._num_evictions = 0
+        self._num_hit_tokens = 0
+        self._num_hits = 0
+        self._num_lookup_tokens = 0
+        self._num_lookups = 0
+
+    def __len__(self) -> int:
+        r"""Number of cached prefixes."""
+        return len(self._lru)
+
+    def lookup(
+            self,
+            token_ids: List[int]
+    ) -> Tuple[int, Optional[Tuple[torch.Tensor, RNNState]]]:
+        r"""Find the longest cached prefix of `token_ids`.
+
+        Found entry is marked as most recently used.
+
+        Args:
+            token_ids:
+                Encoded prompt.
+
+        Returns:
+            Length of the longest cached prefix and its cached logits with
+            shape `(V)` and hidden state with batch size `1`. Length is `0`
+            and entry is `None` when no prefix is cached.
+        """
+        node = self._root
+        length = 0
+        found = None
+        for index, token_id in enumerate(token_ids):
+            node = node.children.get(token_id)
+            if node is None:
+                break
+
+            if node.entry is not None:
+                length = index + 1
+                found = node
+
+        self._num_lookups += 1
+        self._num_lookup_tokens += len(token_ids)
+
+        if found is None:
+            return 0, None
+
+        self._num_hits += 1
+        self._num_hit_tokens += length
+        self._lru.move_to_end(found)
+
+        return length, found.entry
+
+    def insert(
+            self,
+            token_ids: List[int],
+            logits: torch.Tensor,
+            state: RNNState
+    ) -> None:
+        r"""Cache logits and hidden state after `token_ids`.
+
+        Least recently used entries are evicted to fit the memory budget.
+        Entry larger than `max_bytes` is not cached.
+
+        Args:
+            token_ids:
+                Encoded prefix. Must not be empty.
+            logits:
+                Logits of the last token of prefix with shape `(V)`.
+            state:
+                Hidden state after prefix with batch size `1`.
+
+        Raises:
+            TypeError:
+                When `logits` is not an instance of `Tensor` or `state` is
+                not an instance of `lmp.model.RNNState`.
+            ValueError:
+                When `token_ids` is empty, `logits` does not have shape `(V)`
+                or batch size of `state` is not `1`.
+        """
+        # Type check.
+        if not isinstance(logits, torch.Tensor):
+            raise TypeError('`logits` must be an instance of `Tensor`.')
+
+        if not isinstance(state, RNNState):
+            raise TypeError(
+                '`state` must be an instance of `lmp.model.RNNState`.'
+            )
+
+        # Value check.
+        if not token_ids:
+            raise ValueError('`token_ids` must not be empty.')
+
+        if logits.dim() != 1:
+            raise ValueError('`logits` must have shape `(V)`.')
+
+        if state.batch_size != 1:
+            raise ValueError('`state` must have batch size `1`.')
+
+        num_bytes = self._entry_bytes((logits, state))
+        if num_bytes > self.max_bytes:
+            return
+
+        node = self._root
+        for token_id in token_ids:
+            child = node.children.get(token_id)
+            if child is None:
+                child = _TrieNode(parent=node, token_id=token_id)
+                node.children[token_id] = child
+            node = child
+
+        if node.entry is not None:
+            self._num_bytes -= self._entry_bytes(node.entry)
+
+        # Detach from computation graph and from tensors shared with batch.
+        node.entry = (
+            logits.detach().clone(),
+            state.apply(lambda t: t.detach().clone())
+        )
+        self._num_bytes += num_bytes
+        self._lru[node] = None
+        self._lru.move_to_end(node)
+
+        while (
+                self._num_bytes > self.max_bytes or
+                self.max_entries != -1 and len(self._lru) > self.max_entries
+        ):
+            self._evict()
+
+    def _evict(self) -> None:
+        r"""Remove least recently used entry and prune empty trie nodes."""
+        node, _ = self._lru.popitem(last=False)
+        self._num_bytes -= self._entry_bytes(node.entry)
+        self._num_evictions += 1
+        node.entry = None
+
+        while (
+                node.parent is not None and
+                node.entry is None and
+                not node.children
+        ):
+            del node.parent.children[node.token_id]
+            node = node.parent
+
+    @staticmethod
+    def _entry_bytes(entry: Tuple[torch.Tensor, RNNState]) -> int:
+        r"""Size of cached tensors in bytes."""
+        logits, state = entry
+        return sum(
+            t.numel() * t.element_size()
+            for t in [logits] + state.tensors()
+        )
+
+    def metrics(self) -> Dict[str, float]:
+        r"""Cache usage and hit rate metrics.
+
+        Returns:
+            Metrics including number of cached prefixes and their size in
+            bytes, number of lookups, hits and evictions, hit rate of lookups
+            and ratio of prompt tokens which are not encoded thanks to cache.
+        """
+        return {
+            'num_entries': len(self._lru),
+            'num_bytes': self._num_bytes,
+            'num_lookups': self._num_lookups,
+            'num_hits': self._num_hits,
+            'num_evictions': self._num_evictions,
+            'hit_rate': self._num_hits / max(1, self._num_lookups),
+            'token_hit_rate': (
+                self._num_hit_tokens / max(1, self._num_lookup_tokens)
+            ),
+        }
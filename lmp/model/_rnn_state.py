@@ -0,0 +1,295 @@
+r"""Hidden state of RNN language models.
+
+Usage:
+    import lmp
+
+    state = model.init_state(...)
+    logits, state = model.forward_step(...)
+    state = state[indices]
+    state = lmp.model.RNNState.cat(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+
+class RNNState:
+    r"""Hidden state of RNN language models.
+
+    Hidden state of each RNN module is stored in the same format as
+    `torch.nn.RNN`, `torch.nn.GRU` and `torch.nn.LSTM`, i.e. a tensor with
+    shape `(L, B, H)` or a tuple `(h, c)` of such tensors for LSTM, where `L`
+    is number of layers in that module. Batch dimension is always the second
+    dimension, thus states can be indexed, reordered and concatenated along
+    batch dimension (for example in beam search or dynamic batching).
+
+    Args:
+        hidden:
+            Hidden state of each RNN module. Must not be empty.
+
+    Attributes:
+        hidden:
+            Hidden state of each RNN module.
+
+    Raises:
+        TypeError:
+            When `hidden` is not an instance of
+            `List[Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]]`.
+        ValueError:
+            When `hidden` is empty or batch sizes of hidden states are not the
+            same.
+    """
+
+    def __init__(
+            self,
+            hidden: List[Union[
+                torch.Tensor,
+                Tuple[torch.Tensor, torch.Tensor]
+            ]]
+    ):
+        # Type check.
+        if not isinstance(hidden, list) or not all(map(
+                lambda h: (
+                    isinstance(h, torch.Tensor) and h.dim() == 3 or
+                    isinstance(h, tuple) and len(h) == 2 and all(map(
+                        lambda t: isinstance(t, torch.Tensor) and t.dim() == 3,
+                        h
+                    ))
+                ),
+                hidden
+        )):
+            raise TypeError(
+                '`hidden` must be an instance of '
+                '`List[Union[torch.Tensor, Tuple[torch.Tensor, '
+                'torch.Tensor]]]`.'
+            )
+
+        # Value check.
+        if not hidden:
+            raise ValueError('`hidden` must not be empty.')
+
+        self.hidden = hidden
+
+        if len(set(t.size(1) for t in self.tensors())) != 1:
+            raise ValueError(
+                'Batch sizes of hidden states in `hidden` must be the same.'
+            )
+
+    def tensors(self) -> List[torch.Tensor]:
+        r"""Flatten hidden states into list of tensors.
+
+        Returns:
+            All hidden state tensors with shape `(L, B, H)`.
+        """
+        tensors = []
+        for h in self.hidden:
+            if isinstance(h, tuple):
+                tensors.extend(h)
+            else:
+                tensors.append(h)
+        return tensors
+
+    def apply(
+            self,
+            fn: Callable[[torch.Tensor], torch.Tensor]
+    ) -> 'RNNState':
+        r"""Apply `fn` to every hidden state tensor.
+
+        Args:
+            fn:
+                Function maps a tensor with shape `(L, B, H)` to another
+                tensor with shape `(L, B', H)`.
+
+        Returns:
+            New hidden state.
+        """
+        return RNNState([
+            tuple(map(fn, h)) if isinstance(h, tuple) else fn(h)
+            for h in self.hidden
+        ])
+
+    def structure(self) -> Tuple[Tuple[int, ...], ...]:
+        r"""Number of layers of each hidden state tensor in each RNN module.
+
+        Hidden states created by the same model have the same structure.
+
+        Returns:
+            Number of layers `L` of each hidden state tensor, grouped by RNN
+            module.
+        """
+        return tuple(
+            tuple(t.size(0) for t in h) if isinstance(h, tuple)
+            else (h.size(0),)
+            for h in self.hidden
+        )
+
+    @property
+    def batch_size(self) -> int:
+        r"""Batch size of hidden state."""
+        return self.tensors()[0].size(1)
+
+    def __len__(self) -> int:
+        r"""Batch size of hidden state."""
+        return self.batch_size
+
+    def __getitem__(
+            self,
+            index: Union[int, slice, torch.Tensor]
+    ) -> 'RNNState':
+        r"""Select hidden state along batch dimension.
+
+        Batch dimension is kept when `index` is an `int`.
+
+        Args:
+            index:
+                Batch index, slice, boolean mask or indices. Indices can be
+                repeated and in any order, which is used to reorder and
+                expand hidden states.
+
+        Raises:
+            TypeError:
+                When `index` is not an instance of `int`, `slice` or
+                `Tensor`.
+
+        Returns:
+            Selected hidden state.
+        """
+        # Type check.
+        if (
+                not isinstance(index, (int, slice, torch.Tensor)) or
+                isinstance(index, bool)
+        ):
+            raise TypeError(
+                '`index` must be an instance of `Union[int, slice, Tensor]`.'
+            )
+
+        if isinstance(index, int):
+            if index < 0:
+                index += self.batch_size
+            index = slice(index, index + 1)
+
+        if isinstance(index, torch.Tensor):
+            if index.dtype == torch.bool:
+                index = index.nonzero().reshape(-1)
+
+            return self.apply(
+                lambda t: t.index_select(1, index.to(t.device))
+            )
+
+        return self.apply(lambda t: t[:, index])
+
+    def to(self, device: torch.device) -> 'RNNState':
+        r"""Move hidden state to `device`.
+
+        Args:
+            device:
+                Target device.
+
+        Returns:
+            Hidden state on `device`.
+        """
+        return self.apply(lambda t: t.to(device))
+
+    @staticmethod
+    def cat(states: List['RNNState']) -> 'RNNState':
+        r"""Concatenate hidden states along batch dimension.
+
+        Args:
+            states:
+                Hidden states of the same model. Must not be empty.
+
+        Raises:
+            TypeError:
+                When `states` is not an instance of `List[RNNState]`.
+            ValueError:
+                When `states` is empty or hidden states are not created by the
+                same model.
+
+        Returns:
+            Concatenated hidden state.
+        """
+        # Type check.
+        if not isinstance(states, list) or not all(map(
+                lambda state: isinstance(state, RNNState),
+                states
+        )):
+            raise TypeError(
+                '`states` must be an instance of `List[RNNState]`.'
+            )
+
+        # Value check.
+        if not states:
+            raise ValueError('`states` must not be empty.')
+
+        if len(set(state.structure() for state in states)) != 1:
+            raise ValueError('`states` must be created by the same model.')
+
+        hidden = []
+        for layer_hidden in zip(*[state.hidden for state in states]):
+            if isinstance(layer_hidden[0], tuple):
+                hidden.append(tuple(
+                    torch.cat(tensors, dim=1)
+                    for tensors in zip(*layer_hidden)
+                ))
+            else:
+                hidden.append(torch.cat(layer_hidden, dim=1))
+
+        return RNNState(hidden)
+
+
+def init_hidden(
+        batch_size: int,
+        rnn_layer: torch.nn.RNNBase
+) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+    r"""Create zero initial hidden state of `rnn_layer`.
+
+    Args:
+        batch_size:
+            Batch size of hidden state. Must be bigger than or equal to `1`.
+        rnn_layer:
+            RNN module.
+
+    Raises:
+        TypeError:
+            When `batch_size` is not an instance of `int`.
+        ValueError:
+            When `batch_size < 1`.
+
+    Returns:
+        Zero tensor with shape `(L, B, H)` on the same device as `rnn_layer`,
+        or tuple `(h, c)` of such tensors if `rnn_layer` is LSTM.
+    """
+    # Type check.
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    weight = next(rnn_layer.parameters())
+    h = torch.zeros(
+        rnn_layer.num_layers,
+        batch_size,
+        rnn_layer.hidden_size,
+        dtype=weight.dtype,
+        device=weight.device
+    )
+
+    if isinstance(rnn_layer, torch.nn.LSTM):
+        return (h, torch.zeros_like(h))
+
+    return h
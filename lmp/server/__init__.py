@@ -0,0 +1,22 @@
+r"""Inference server module.
+
+All server utilities must import from this file.
+
+Usage:
+    import lmp.server
+
+    batcher = lmp.server.DynamicBatcher(...)
+    server = lmp.server.InferenceServer(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# self-made modules
+
+from lmp.server._dynamic_batcher import DynamicBatcher
+from lmp.server._inference_server import InferenceServer
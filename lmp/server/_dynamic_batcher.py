@@ -0,0 +1,300 @@
+r"""Coalesce concurrent requests into batches.
+
+Usage:
+    import lmp.server
+
+    batcher = lmp.server.DynamicBatcher(...)
+    batcher.start()
+    result = await batcher.submit(...)
+    metrics = batcher.metrics()
+    await batcher.stop()
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import collections
+import concurrent.futures
+import time
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# 3rd-party modules
+
+import numpy as np
+
+
+class DynamicBatcher:
+    r"""Coalesce concurrent requests into batches.
+
+    Requests are queued by `submit`. A background task waits for the first
+    queued request, then keeps collecting requests until either
+    `max_batch_size` requests are collected or `max_wait` seconds have passed
+    since the first one arrived. Collected requests are passed to `handler`
+    together, which runs in `executor` so that the event loop keeps accepting
+    requests while a batch is running. Batches are run one at a time.
+
+    Args:
+        handler:
+            Function maps a list of requests to a list of results with the
+            same length and order.
+        max_batch_size:
+            Maximum number of requests in a batch. Must be bigger than or
+            equal to `1`.
+        max_wait:
+            Maximum seconds to wait for more requests after the first request
+            of a batch arrives. Must be bigger than or equal to `0.0`.
+        executor:
+            Executor which runs `handler`. Use `None` to run `handler` in
+            a dedicated thread.
+        num_latencies:
+            Number of most recent request latencies kept for metrics. Must be
+            bigger than or equal to `1`.
+
+    Attributes:
+        handler:
+            Function maps a list of requests to a list of results.
+        max_batch_size:
+            Maximum number of requests in a batch.
+        max_wait:
+            Maximum seconds to wait for more requests.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            handler: Callable[[List[Any]], List[Any]],
+            max_batch_size: int,
+            max_wait: float,
+            executor: Optional[concurrent.futures.Executor] = None,
+            num_latencies: int = 1000
+    ):
+        # Type check.
+        if not callable(handler):
+            raise TypeError(
+                '`handler` must be an instance of '
+                '`Callable[[List[Any]], List[Any]]`.'
+            )
+
+        if not isinstance(max_batch_size, int):
+            raise TypeError('`max_batch_size` must be an instance of `int`.')
+
+        if not isinstance(max_wait, float):
+            raise TypeError('`max_wait` must be an instance of `float`.')
+
+        if executor is not None and not isinstance(
+                executor,
+                concurrent.futures.Executor
+        ):
+            raise TypeError(
+                '`executor` must be an instance of '
+                '`Optional[concurrent.futures.Executor]`.'
+            )
+
+        if not isinstance(num_latencies, int):
+            raise TypeError('`num_latencies` must be an instance of `int`.')
+
+        # Value check.
+        if max_batch_size < 1:
+            raise ValueError(
+                '`max_batch_size` must be bigger than or equal to `1`.'
+            )
+
+        if not max_wait >= 0.0:
+            raise ValueError(
+                '`max_wait` must be bigger than or equal to `0.0`.'
+            )
+
+        if num_latencies < 1:
+            raise ValueError(
+                '`num_latencies` must be bigger than or equal to `1`.'
+            )
+
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._executor = executor
+
+        self._queue = None
+        self._task = None
+
+        # Metrics.
+        self._latencies = collections.deque(maxlen=num_latencies)
+        self._max_queue_depth = 0
+        self._num_batches = 0
+        self._num_errors = 0
+        self._num_requests = 0
+
+    def start(self) -> None:
+        r"""Start collecting and running batches in current event loop.
+
+        Must be called inside a running event loop.
+        """
+        if self._task is not None:
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        r"""Stop running batches.
+
+        Requests which are still queued are cancelled.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+        self._task = None
+
+    async def submit(self, request: Any) -> Any:
+        r"""Queue `request` and wait for its result.
+
+        Args:
+            request:
+                Request passed to `handler` as an element of a batch.
+
+        Raises:
+            RuntimeError:
+                When batcher is not started.
+
+        Returns:
+            Result of `request` returned by `handler`. Exception raised by
+            `handler` is re-raised.
+        """
+        if self._task is None:
+            raise RuntimeError('Batcher must be started before `submit`.')
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        self._max_queue_depth = max(
+            self._max_queue_depth,
+            self._queue.qsize()
+        )
+
+        try:
+            return await future
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+
+    async def _collect(self) -> List[Any]:
+        r"""Collect a batch of queued requests and their futures."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Take already queued requests without waiting.
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        r"""Collect and run batches until stopped."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._collect()
+
+            # Skip requests whose clients are no longer waiting.
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            requests = [request for request, _ in batch]
+            self._num_batches += 1
+            self._num_requests += len(requests)
+
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    self.handler,
+                    requests
+                )
+                if len(results) != len(requests):
+                    raise RuntimeError(
+                        '`handler` must return one result for each request.'
+                    )
+            except Exception as err:  # pylint: disable=broad-except
+                self._num_errors += len(requests)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(err)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def metrics(self) -> Dict[str, float]:
+        r"""Queue depth, batch size and request latency metrics.
+
+        Latency of a request is measured from `submit` to its result, and
+        percentiles are computed over most recent `num_latencies` requests.
+
+        Returns:
+            Metrics including current and maximum queue depth, number of
+            requests, batches and failed requests, mean batch size and
+            latency percentiles in seconds.
+        """
+        latencies = np.array(self._latencies)
+        metrics = {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'max_queue_depth': self._max_queue_depth,
+            'num_requests': self._num_requests,
+            'num_batches': self._num_batches,
+            'num_errors': self._num_errors,
+            'mean_batch_size': (
+                self._num_requests / max(1, self._num_batches)
+            ),
+        }
+
+        for percentile in [50, 95, 99]:
+            metrics['latency_p{}'.format(percentile)] = (
+                float(np.percentile(latencies, percentile))
+                if latencies.size else 0.0
+            )
+
+        return metrics
@@ -0,0 +1,626 @@
+r"""HTTP inference server with dynamic request batching.
+
+Usage:
+    import lmp.server
+
+    server = lmp.server.InferenceServer(...)
+    asyncio.run(server.serve(...))
+
+Endpoints:
+    POST /generate
+        Request `{"begin_of_sequence": str, "beam_width": int,
+        "max_seq_len": int}` where `beam_width` and `max_seq_len` are
+        optional. Response `{"generated_sequences": List[str]}`.
+    POST /score
+        Request `{"sequence": str}` where `sequence` is not empty. Response
+        `{"perplexity": float}`.
+    GET /metrics
+        Response metrics of each endpoint and prefix cache. See
+        `lmp.server.DynamicBatcher.metrics` and
+        `lmp.model.PrefixStateCache.metrics`.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import concurrent.futures
+import http
+import json
+import math
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+import lmp.dataset
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+from lmp.server._dynamic_batcher import DynamicBatcher
+
+
+class InferenceServer:
+    r"""HTTP inference server with dynamic request batching.
+
+    Tokenizer and model are loaded once and kept resident. Concurrent
+    generation and scoring requests are coalesced into batches by
+    `lmp.server.DynamicBatcher`, and batches run one at a time in a single
+    worker thread, thus model is never used by two batches at once.
+    Generation requests in a batch are grouped by `beam_width` and
+    `max_seq_len`, and each group is generated by
+    `lmp.util.batch_generate_sequence`.
+
+    Each HTTP connection serves exactly one request.
+
+    Args:
+        device:
+            Model running device.
+        max_batch_size:
+            Maximum number of requests in a batch. Must be bigger than or
+            equal to `1`.
+        max_wait:
+            Maximum seconds to wait for more requests after the first request
+            of a batch arrives. Must be bigger than or equal to `0.0`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        default_beam_width:
+            Beam width of generation requests without `beam_width`. Must be
+            bigger than or equal to `1`.
+        default_max_seq_len:
+            Maximum output length of generation requests without
+            `max_seq_len`. Must be bigger than or equal to `2`.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes shared by all
+            generation requests. Set to `None` to disable caching.
+        max_body_size:
+            Maximum number of bytes of HTTP request body. Larger requests are
+            answered with status `413`. Must be bigger than or equal to `0`.
+
+    Attributes:
+        default_beam_width:
+            Beam width of generation requests without `beam_width`.
+        default_max_seq_len:
+            Maximum output length of generation requests without
+            `max_seq_len`.
+        device:
+            Model running device.
+        generate_batcher:
+            Batcher of generation requests.
+        max_body_size:
+            Maximum number of bytes of HTTP request body.
+        model:
+            Language model.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes.
+        score_batcher:
+            Batcher of scoring requests.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+    """
+
+    def __init__(
+            self,
+            device: torch.device,
+            max_batch_size: int,
+            max_wait: float,
+            model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+            tokenizer: lmp.tokenizer.BaseTokenizer,
+            default_beam_width: int = 4,
+            default_max_seq_len: int = 64,
+            prefix_cache: Optional[lmp.model.PrefixStateCache] = None,
+            max_body_size: int = 1048576
+    ):
+        # Type check.
+        if not isinstance(device, torch.device):
+            raise TypeError('`device` must be an instance of `torch.device`.')
+
+        if not isinstance(model, (
+                lmp.model.BaseRNNModel,
+                lmp.model.BaseResRNNModel
+        )):
+            raise TypeError(
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+            )
+
+        if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+            raise TypeError(
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.'
+            )
+
+        if not isinstance(default_beam_width, int):
+            raise TypeError(
+                '`default_beam_width` must be an instance of `int`.'
+            )
+
+        if not isinstance(default_max_seq_len, int):
+            raise TypeError(
+                '`default_max_seq_len` must be an instance of `int`.'
+            )
+
+        if prefix_cache is not None and not isinstance(
+                prefix_cache,
+                lmp.model.PrefixStateCache
+        ):
+            raise TypeError(
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.model.PrefixStateCache]`.'
+            )
+
+        if not isinstance(max_body_size, int):
+            raise TypeError('`max_body_size` must be an instance of `int`.')
+
+        # Value check.
+        if default_beam_width < 1:
+            raise ValueError(
+                '`default_beam_width` must be bigger than or equal to `1`.'
+            )
+
+        if default_max_seq_len < 2:
+            raise ValueError(
+                '`default_max_seq_len` must be bigger than or equal to `2`.'
+            )
+
+        if max_body_size < 0:
+            raise ValueError(
+                '`max_body_size` must be bigger than or equal to `0`.'
+            )
+
+        self.default_beam_width = default_beam_width
+        self.default_max_seq_len = default_max_seq_len
+        self.device = device
+        self.max_body_size = max_body_size
+        self.model = model
+        self.prefix_cache = prefix_cache
+        self.tokenizer = tokenizer
+
+        # Both batchers share the same worker thread.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # `max_batch_size` and `max_wait` are checked by `DynamicBatcher`.
+        self.generate_batcher = DynamicBatcher(
+            executor=executor,
+            handler=self.batch_generate,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait
+        )
+        self.score_batcher = DynamicBatcher(
+            executor=executor,
+            handler=self.batch_score,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait
+        )
+
+    def batch_generate(
+            self,
+            requests: List[Tuple[str, int, int]]
+    ) -> List[List[str]]:
+        r"""Generate sequences for a batch of generation requests.
+
+        Args:
+            requests:
+                Begining of sequence, beam width and maximum output length of
+                each request.
+
+        Returns:
+            Generated sequences of each request.
+        """
+        # Group requests by generation parameters.
+        groups = {}
+        for index, (begin_of_sequence, beam_width, max_seq_len) in enumerate(
+                requests
+        ):
+            groups.setdefault((beam_width, max_seq_len), []).append(
+                (index, begin_of_sequence)
+            )
+
+        results = [None] * len(requests)
+        for (beam_width, max_seq_len), group in groups.items():
+            batch_generated = lmp.util.batch_generate_sequence(
+                beam_width=beam_width,
+                begin_of_sequences=[
+                    begin_of_sequence
+                    for _, begin_of_sequence in group
+                ],
+                device=self.device,
+                max_seq_len=max_seq_len,
+                model=self.model,
+                prefix_cache=self.prefix_cache,
+                tokenizer=self.tokenizer
+            )
+
+            for (index, _), generated in zip(group, batch_generated):
+                results[index] = generated
+
+        return results
+
+    @torch.no_grad()
+    def batch_score(self, requests: List[str]) -> List[float]:
+        r"""Calculate perplexity of a batch of sequences.
+
+        Perplexity is calculated in the same way as
+        `lmp.util.perplexity_eval`, i.e. `[eos]` is not predicted. Sequences
+        without any token to predict (e.g. whitespace only sequences) get
+        `nan` instead of failing the whole batch.
+
+        Args:
+            requests:
+                Sequences to be scored.
+
+        Returns:
+            Perplexity of each sequence.
+        """
+        self.model.eval()
+
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=self.tokenizer,
+            max_seq_len=-1,
+            is_dynamic_pad=True
+        )
+
+        # Exclude `[eos]` from targets, thus exclude last input token.
+        # x.size = (B, S)
+        # y.size = (B, S)
+        x, y = collate_fn(requests)
+        pad_token_id = self.model.emb_layer.padding_idx
+        batch_lengths = (y != pad_token_id).sum(dim=1) - 1
+
+        # Only score sequences with at least one token to predict.
+        is_valid = batch_lengths > 0
+        results = [math.nan] * len(requests)
+        if not is_valid.any():
+            return results
+
+        x = x[is_valid]
+        y = y[is_valid]
+        batch_lengths = batch_lengths[is_valid]
+        mask = (
+            torch.arange(y.size(1)).unsqueeze(0) <
+            batch_lengths.unsqueeze(1)
+        )
+        x = x.to(self.device)
+        y = y[mask].to(self.device)
+
+        # Padding tokens are skipped by model.
+        # pred_y_logits.size = (N, V)
+        pred_y_logits = self.model(x, batch_lengths=batch_lengths)
+
+        # Sum negative log-likelihood of tokens in each sequence.
+        # nll.size = (B)
+        nll = torch.zeros(x.size(0), device=self.device).index_add_(
+            0,
+            torch.repeat_interleave(
+                torch.arange(x.size(0)),
+                batch_lengths
+            ).to(self.device),
+            torch.nn.functional.cross_entropy(
+                pred_y_logits,
+                y,
+                reduction='none'
+            )
+        )
+
+        perplexities = (nll / batch_lengths.to(self.device)).exp().tolist()
+        for index, perplexity in zip(
+                is_valid.nonzero(as_tuple=True)[0].tolist(),
+                perplexities
+        ):
+            results[index] = perplexity
+
+        return results
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        r"""Metrics of each endpoint.
+
+        Returns:
+            Metrics of generation and scoring batchers, and metrics of prefix
+            cache if enabled.
+        """
+        metrics = {
+            'generate': self.generate_batcher.metrics(),
+            'score': self.score_batcher.metrics(),
+        }
+
+        if self.prefix_cache is not None:
+            metrics['prefix_cache'] = self.prefix_cache.metrics()
+
+        return metrics
+
+    async def generate(
+            self,
+            begin_of_sequence: str,
+            beam_width: Optional[int] = None,
+            max_seq_len: Optional[int] = None
+    ) -> List[str]:
+        r"""Queue a generation request and wait for its result.
+
+        Args:
+            begin_of_sequence:
+                Begining of sequence which model will auto-complete.
+            beam_width:
+                Number of candidate sequences to output. Must be bigger than
+                or equal to `1`. Use `None` to use `default_beam_width`.
+            max_seq_len:
+                Maximum of output sequences length. Must be bigger than or
+                equal to `2`. Use `None` to use `default_max_seq_len`.
+
+        Raises:
+            TypeError:
+                When one of the arguments are not an instance of their type
+                annotation respectively.
+            ValueError:
+                When one of the arguments do not follow their constraints.
+                See docstring for arguments constraints.
+
+        Returns:
+            Generated sequences.
+        """
+        if beam_width is None:
+            beam_width = self.default_beam_width
+
+        if max_seq_len is None:
+            max_seq_len = self.default_max_seq_len
+
+        # Type check.
+        if not isinstance(begin_of_sequence, str):
+            raise TypeError(
+                '`begin_of_sequence` must be an instance of `str`.'
+            )
+
+        if not isinstance(beam_width, int) or isinstance(beam_width, bool):
+            raise TypeError('`beam_width` must be an instance of `int`.')
+
+        if not isinstance(max_seq_len, int) or isinstance(max_seq_len, bool):
+            raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+        # Value check.
+        if beam_width < 1:
+            raise ValueError(
+                '`beam_width` must be bigger than or equal to `1`.'
+            )
+
+        if max_seq_len < 2:
+            raise ValueError(
+                '`max_seq_len` must be bigger than or equal to `2`.'
+            )
+
+        return await self.generate_batcher.submit(
+            (begin_of_sequence, beam_width, max_seq_len)
+        )
+
+    async def score(self, sequence: str) -> float:
+        r"""Queue a scoring request and wait for its result.
+
+        Args:
+            sequence:
+                Sequence to be scored.
+
+        Raises:
+            TypeError:
+                When `sequence` is not an instance of `str`.
+            ValueError:
+                When `sequence` is empty or has no token to predict.
+
+        Returns:
+            Perplexity of `sequence`.
+        """
+        # Type check.
+        if not isinstance(sequence, str):
+            raise TypeError('`sequence` must be an instance of `str`.')
+
+        # Value check.
+        if not sequence:
+            raise ValueError('`sequence` must not be empty.')
+
+        # Reject before queueing, so other requests in the same batch are not
+        # affected. Encoded sequence includes `[bos]` and `[eos]`.
+        if len(self.tokenizer.encode(sequence, max_seq_len=-1)) <= 2:
+            raise ValueError('`sequence` must have at least one token.')
+
+        return await self.score_batcher.submit(sequence)
+
+    async def handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        r"""Serve one HTTP request.
+
+        Args:
+            reader:
+                Stream of HTTP request.
+            writer:
+                Stream of HTTP response.
+        """
+        try:
+            status, body = await self._dispatch(reader)
+        except (TypeError, ValueError) as err:
+            status, body = http.HTTPStatus.BAD_REQUEST, {'error': str(err)}
+        except Exception as err:  # pylint: disable=broad-except
+            status, body = (
+                http.HTTPStatus.INTERNAL_SERVER_ERROR,
+                {'error': str(err)}
+            )
+
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            '\r\n'.join([
+                'HTTP/1.1 {} {}'.format(status.value, status.phrase),
+                'Content-Type: application/json; charset=utf-8',
+                'Content-Length: {}'.format(len(data)),
+                'Connection: close',
+                '',
+                '',
+            ]).encode('ascii') + data
+        )
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(
+            self,
+            reader: asyncio.StreamReader
+    ) -> Tuple[http.HTTPStatus, Any]:
+        r"""Parse HTTP request and route it to endpoint."""
+        request_line = (await reader.readline()).decode('ascii').split()
+        if len(request_line) != 3:
+            raise ValueError('Malformed HTTP request line.')
+
+        method, path, _ = request_line
+
+        # Parse headers.
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            content_length = int(headers.get('content-length', '0'))
+        except ValueError as err:
+            raise ValueError('Malformed `Content-Length` header.') from err
+
+        if content_length < 0:
+            raise ValueError('Malformed `Content-Length` header.')
+
+        # Reject before reading, thus large body is never buffered.
+        if content_length > self.max_body_size:
+            return (
+                http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                {'error': 'Request body too large.'}
+            )
+
+        try:
+            body = await reader.readexactly(content_length)
+        except asyncio.IncompleteReadError as err:
+            raise ValueError('Incomplete HTTP request body.') from err
+
+        if path == '/metrics' and method == 'GET':
+            return http.HTTPStatus.OK, self.metrics()
+
+        if path not in ['/generate', '/score']:
+            return http.HTTPStatus.NOT_FOUND, {'error': 'Not found.'}
+
+        if method != 'POST':
+            return (
+                http.HTTPStatus.METHOD_NOT_ALLOWED,
+                {'error': 'Method not allowed.'}
+            )
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as err:
+            raise ValueError('Malformed JSON body.') from err
+
+        if not isinstance(payload, dict):
+            raise TypeError('Request body must be a JSON object.')
+
+        if path == '/generate':
+            return http.HTTPStatus.OK, {
+                'generated_sequences': await self.generate(
+                    begin_of_sequence=payload.get('begin_of_sequence'),
+                    beam_width=payload.get('beam_width'),
+                    max_seq_len=payload.get('max_seq_len')
+                ),
+            }
+
+        return http.HTTPStatus.OK, {
+            'perplexity': await self.score(sequence=payload.get('sequence')),
+        }
+
+    async def start(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 8000,
+            unix_socket: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        r"""Start batchers and listen on TCP address or Unix socket.
+
+        Args:
+            host:
+                TCP host to listen on.
+            port:
+                TCP port to listen on. Use `0` to pick a free port.
+            unix_socket:
+                Path of Unix socket to listen on. When given, `host` and
+                `port` are ignored.
+
+        Returns:
+            Listening server.
+        """
+        self.generate_batcher.start()
+        self.score_batcher.start()
+
+        if unix_socket is not None:
+            return await asyncio.start_unix_server(
+                self.handle,
+                path=unix_socket
+            )
+
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+    async def stop(self) -> None:
+        r"""Stop batchers."""
+        await self.generate_batcher.stop()
+        await self.score_batcher.stop()
+
+    async def serve(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 8000,
+            unix_socket: Optional[str] = None
+    ) -> None:
+        r"""Serve requests until cancelled.
+
+        Args:
+            host:
+                TCP host to listen on.
+            port:
+                TCP port to listen on.
+            unix_socket:
+                Path of Unix socket to listen on. When given, `host` and
+                `port` are ignored.
+        """
+        server = await self.start(
+            host=host,
+            port=port,
+            unix_socket=unix_socket
+        )
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
@@ -24,22 +24,48 @@ from __future__ import unicode_literals
 
 # self-made modules
 
+from lmp.util._benchmark_generation import benchmark_generate_sequence
 from lmp.util._config import load_config
 from lmp.util._dataset import load_dataset
+from lmp.util._dedup_dataset import dedup_dataset
+from lmp.util._encode_prompts import encode_prompts
 from lmp.util._dataset import load_dataset_by_config
+from lmp.util._dataset import split_dataset
 from lmp.util._perplexity_eval import perplexity_eval
 from lmp.util._perplexity_eval import batch_perplexity_eval
+from lmp.util._perplexity_eval import corpus_perplexity_eval
+from lmp.util._generate_sequence import batch_generate_sequence
+from lmp.util._generate_sequence import batch_generate_sequence_by_config
 from lmp.util._generate_sequence import generate_sequence
 from lmp.util._generate_sequence import generate_sequence_by_config
 from lmp.util._model import load_model
 from lmp.util._model import load_model_by_config
 from lmp.util._optimizer import load_optimizer
 from lmp.util._optimizer import load_optimizer_by_config
+from lmp.util._profile_dataset import cached_sequence_lengths
+from lmp.util._profile_dataset import profile_dataset
+from lmp.util._profile_dataset import profile_dataset_by_config
+from lmp.util._profile_dataset import suggest_batch_size
+from lmp.util._profile_dataset import suggest_max_seq_len
+from lmp.util._sample_sequence import sample_sequence
+from lmp.util._sample_sequence import sample_sequence_by_config
+from lmp.util._score_dataset import prune_by_scores
+from lmp.util._score_dataset import score_dataset
 from lmp.util._seed import set_seed
 from lmp.util._seed import set_seed_by_config
+from lmp.util._sequence_lengths import sequence_lengths
+from lmp.util._speculative_sequence import speculative_generate_sequence
+from lmp.util._speculative_sequence import (
+    speculative_generate_sequence_by_config
+)
+from lmp.util._stream_sequence import async_stream_sequence
+from lmp.util._stream_sequence import stream_sequence
+from lmp.util._stream_sequence import stream_sequence_by_config
 from lmp.util._tokenizer import load_tokenizer
 from lmp.util._tokenizer import load_tokenizer_by_config
 from lmp.util._train_model import train_model
 from lmp.util._train_model import train_model_by_config
 from lmp.util._train_tokenizer import train_tokenizer
 from lmp.util._train_tokenizer import train_tokenizer_by_config
+from lmp.util._validate_model import encode_validation_batches
+from lmp.util._validate_model import validate_model
@@ -0,0 +1,238 @@
+r"""Helper function for benchmarking sequence generation.
+
+Usage:
+    import lmp.util
+
+    metrics = lmp.util.benchmark_generate_sequence(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._generate_sequence import _beam_search
+
+# Latency percentiles recorded in metrics.
+_PERCENTILES = (50, 95, 99)
+
+
+def benchmark_generate_sequence(
+        batch_size: int,
+        beam_width: int,
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_repeats: int,
+        output_len: int,
+        prompt_len: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> Dict[str, float]:
+    r"""Measure latency and throughput of beam search generation.
+
+    `batch_size` prompts, each with `prompt_len` tokens (excluding `[bos]`)
+    drawn from non-special tokens of `tokenizer`, are generated together by
+    beam search of `lmp.util.batch_generate_sequence` until each of them has
+    at most `output_len` new tokens. Beam search stops early once all beams
+    have generated `[eos]`, thus throughput is calculated from number of
+    tokens actually generated in the best sequence of each prompt (including
+    `[eos]`). Prompts are fixed, so results of different settings are
+    comparable.
+
+    Generation runs once for warm up, then `num_repeats` times for
+    measurement. Time to first token is measured by a separate run which
+    only generates one token per prompt, thus it includes prompt encoding
+    and the first decoding step.
+
+    Args:
+        batch_size:
+            Number of prompts generated together. Must be bigger than or equal
+            to `1`.
+        beam_width:
+            Number of beams of each prompt. Must be bigger than or equal to
+            `1`.
+        device:
+            Model running device.
+        model:
+            Language model.
+        num_repeats:
+            Number of measured runs. Must be bigger than or equal to `1`.
+        output_len:
+            Number of generated tokens of each prompt. Must be bigger than or
+            equal to `1`.
+        prompt_len:
+            Number of tokens of each prompt excluding `[bos]`. Must be bigger
+            than or equal to `0`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Latency percentiles `latency_p50`, `latency_p95` and `latency_p99`
+        and time to first token percentiles `ttft_p50`, `ttft_p95` and
+        `ttft_p99` in seconds, average number of generated tokens of each
+        run `tokens_per_run`, and generated tokens per second
+        `tokens_per_second`.
+    """
+    # Type check.
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if not isinstance(beam_width, int):
+        raise TypeError('`beam_width` must be an instance of `int`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(num_repeats, int):
+        raise TypeError('`num_repeats` must be an instance of `int`.')
+
+    if not isinstance(output_len, int):
+        raise TypeError('`output_len` must be an instance of `int`.')
+
+    if not isinstance(prompt_len, int):
+        raise TypeError('`prompt_len` must be an instance of `int`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    if beam_width < 1:
+        raise ValueError('`beam_width` must be bigger than or equal to `1`.')
+
+    if num_repeats < 1:
+        raise ValueError('`num_repeats` must be bigger than or equal to `1`.')
+
+    if output_len < 1:
+        raise ValueError('`output_len` must be bigger than or equal to `1`.')
+
+    if prompt_len < 0:
+        raise ValueError('`prompt_len` must be bigger than or equal to `0`.')
+
+    special_token_ids = set(tokenizer.convert_tokens_to_ids([
+        tokenizer.bos_token,
+        tokenizer.eos_token,
+        tokenizer.pad_token,
+        tokenizer.unk_token,
+    ]))
+    token_ids = [
+        token_id
+        for token_id in range(tokenizer.vocab_size)
+        if token_id not in special_token_ids
+    ]
+
+    if prompt_len > 0 and not token_ids:
+        raise ValueError('`tokenizer` must have non-special tokens.')
+
+    # Fixed pseudo random prompts starting with `[bos]`.
+    bos_token_id = tokenizer.convert_token_to_id(tokenizer.bos_token)
+    generator = torch.Generator()
+    generator.manual_seed(0)
+    prompts = [
+        [bos_token_id] + [
+            token_ids[index]
+            for index in torch.randint(
+                max(1, len(token_ids)),
+                (prompt_len,),
+                generator=generator
+            ).tolist()
+        ]
+        for _ in range(batch_size)
+    ]
+
+    # Evaluation mode.
+    model.eval()
+
+    def generate(num_tokens: int) -> Tuple[float, int]:
+        r"""Generate at most `num_tokens` tokens of each prompt.
+
+        Returns:
+            Elapsed seconds and number of generated tokens in the best
+            sequence of all prompts.
+        """
+        start = time.perf_counter()
+        batch_sequences = _beam_search(
+            beam_width=beam_width,
+            device=device,
+            max_seq_len=prompt_len + 1 + num_tokens,
+            model=model,
+            prefix_cache=None,
+            prompts=prompts,
+            tokenizer=tokenizer
+        )
+
+        # Wait for asynchronous CUDA kernels.
+        if device.type == 'cuda':
+            torch.cuda.synchronize(device)
+
+        elapsed = time.perf_counter() - start
+
+        return elapsed, sum(
+            len(sequences[0]) - len(prompt)
+            for prompt, sequences in zip(prompts, batch_sequences)
+        )
+
+    # Warm up.
+    generate(num_tokens=output_len)
+
+    ttfts = np.array([
+        generate(num_tokens=1)[0]
+        for _ in range(num_repeats)
+    ])
+    latencies, num_generated = map(np.array, zip(*[
+        generate(num_tokens=output_len)
+        for _ in range(num_repeats)
+    ]))
+
+    metrics = {}
+    for name, values in [('latency', latencies), ('ttft', ttfts)]:
+        for percentile in _PERCENTILES:
+            metrics[f'{name}_p{percentile}'] = float(
+                np.percentile(values, percentile)
+            )
+
+    metrics['tokens_per_run'] = float(num_generated.mean())
+    metrics['tokens_per_second'] = float(
+        num_generated.sum() / max(latencies.sum(), 1e-9)
+    )
+
+    return metrics
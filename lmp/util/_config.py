@@ -31,9 +31,10 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
         args:
             Standard input argument parser object with attributes `batch_size`,
             `checkpoint_step`, `d_emb`, `d_hid`, `dataset`, `dropout`, `epoch`,
-            `experiment`, `is_uncased`, `learning_rate`, `max_norm`,
-            `max_seq_len`, `min_count`, `model_class`, `num_linear_layers`,
-            `num_rnn_layers`, `optimizer_class`, `seed` and `tokenizer_class`.
+            `experiment`, `is_compact`, `is_uncased`, `learning_rate`,
+            `max_norm`, `max_seq_len`, `max_tokens`, `min_count`,
+            `model_class`, `num_linear_layers`, `num_rnn_layers`,
+            `optimizer_class`, `seed`, `tokenizer_class` and `val_ratio`.
 
     Raises:
         TypeError:
@@ -54,6 +55,9 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
         if args.epoch != config.epoch:
             config.epoch = args.epoch
 
+        # Storage format does not affect training result.
+        config.is_compact = args.is_compact
+
     # Create new configuration object.
     else:
         config = lmp.config.BaseConfig(
@@ -65,17 +69,20 @@ def load_config(args: argparse.Namespace) -> lmp.config.BaseConfig:
             dropout=args.dropout,
             epoch=args.epoch,
             experiment=args.experiment,
+            is_compact=args.is_compact,
             is_uncased=args.is_uncased,
             learning_rate=args.learning_rate,
             max_norm=args.max_norm,
             max_seq_len=args.max_seq_len,
+            max_tokens=args.max_tokens,
             min_count=args.min_count,
             model_class=args.model_class,
             num_linear_layers=args.num_linear_layers,
             num_rnn_layers=args.num_rnn_layers,
             optimizer_class=args.optimizer_class,
             seed=args.seed,
-            tokenizer_class=args.tokenizer_class
+            tokenizer_class=args.tokenizer_class,
+            val_ratio=args.val_ratio
         )
 
     return config
@@ -5,6 +5,7 @@ Usage:
 
     dataset = lmp.util.load_dataset(...)
     dataset = lmp.util.load_dataset_by_config(...)
+    train_dataset, val_dataset = lmp.util.split_dataset(...)
 """
 
 # built-in modules
@@ -14,10 +15,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import hashlib
+import json
 import os
 
+from array import array
+from typing import List
+from typing import Optional
+from typing import Tuple
+
 # 3rd-party modules
 
+import numpy as np
 import pandas as pd
 
 # self-made modules
@@ -27,20 +36,300 @@ import lmp.dataset
 import lmp.path
 
 
-def load_dataset(dataset: str) -> lmp.dataset.BaseDataset:
+# Version of line index. Increase it whenever `LineDataset.build_index`
+# changes which lines are indexed, so that stale line indices are rebuilt.
+_LINE_INDEX_VERSION = 1
+
+
+def _cache_dir(dataset: str) -> str:
+    r"""Directory storing columnar cache of `dataset`."""
+    return os.path.join(lmp.path.DATA_PATH, 'cache', dataset)
+
+
+def _source_key(file_path: str) -> dict:
+    r"""Identify source file version by its size and modification time."""
+    stat = os.stat(file_path)
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+    }
+
+
+def _load_cache(
+        dataset: str,
+        file_path: str,
+        is_compact: bool
+) -> Optional[lmp.dataset.BaseDataset]:
+    r"""Load cached sequences of `dataset` if cache is still valid.
+
+    Cache consist of three files:
+        meta.json:
+            Size and modification time of source file when cache was built.
+        offsets.npy:
+            Byte offsets of each sequence with numeric type `int64`. Sequence
+            `i` is `sequences[offsets[i]:offsets[i + 1]]`.
+        sequences.npy:
+            All sequences encoded in UTF-8 and concatenated into single
+            `uint8` array.
+
+    Both arrays are memory mapped so no parsing is performed. When
+    `is_compact == True`, memory mapped buffer is used as is, thus sequences
+    are only read from disk and decoded when sampled. Otherwise each sequence
+    is decoded directly from memory mapped buffer into `str`.
+
+    Returns:
+        Cached dataset. `None` if cache does not exist or is out of date.
+    """
+    cache_dir = _cache_dir(dataset)
+    meta_path = os.path.join(cache_dir, 'meta.json')
+
+    if not os.path.exists(meta_path):
+        return None
+
+    with open(meta_path, 'r', encoding='utf-8') as input_file:
+        meta = json.load(input_file)
+
+    if meta != _source_key(file_path):
+        return None
+
+    offsets = np.load(os.path.join(cache_dir, 'offsets.npy'), mmap_mode='r')
+    sequences = np.load(
+        os.path.join(cache_dir, 'sequences.npy'),
+        mmap_mode='r'
+    )
+    # Zero-copy view of memory mapped file.
+    buffer = memoryview(sequences)
+
+    if is_compact:
+        compact_offsets = array('q')
+        compact_offsets.frombytes(offsets.astype(np.int64).tobytes())
+        return lmp.dataset.BaseDataset.from_buffer(buffer, compact_offsets)
+
+    offsets = offsets.tolist()
+
+    return lmp.dataset.BaseDataset([
+        str(buffer[start:end], 'utf-8')
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ])
+
+
+def _save_cache(
+        batch_sequences: List[str],
+        dataset: str,
+        file_path: str
+) -> None:
+    r"""Save sequences of `dataset` as columnar cache.
+
+    See `_load_cache` for cache format. Meta file is written last so partially
+    written cache will never be treated as valid.
+    """
+    cache_dir = _cache_dir(dataset)
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    encoded = [sequence.encode('utf-8') for sequence in batch_sequences]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(sequence) for sequence in encoded], out=offsets[1:])
+
+    np.save(os.path.join(cache_dir, 'offsets.npy'), offsets)
+    np.save(
+        os.path.join(cache_dir, 'sequences.npy'),
+        np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    )
+
+    with open(meta_path, 'w', encoding='utf-8') as output_file:
+        json.dump(_source_key(file_path), output_file)
+
+
+def _load_csv_column(
+        column: str,
+        dataset: str,
+        file_path: str,
+        is_compact: bool,
+        is_dropna: bool
+) -> lmp.dataset.BaseDataset:
+    r"""Load single column of CSV file through columnar cache.
+
+    CSV file is parsed only when cache of `dataset` does not exist or source
+    file has been modified since cache was built.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f'File {file_path} does not exist.')
+
+    dataset_obj = _load_cache(
+        dataset=dataset,
+        file_path=file_path,
+        is_compact=is_compact
+    )
+    if dataset_obj is not None:
+        return dataset_obj
+
+    series = pd.read_csv(file_path)[column]
+    if is_dropna:
+        series = series.dropna()
+
+    # Type check performed by `BaseDataset` must pass before caching.
+    batch_sequences = lmp.dataset.BaseDataset(
+        series.to_list()
+    ).batch_sequences
+    _save_cache(
+        batch_sequences=batch_sequences,
+        dataset=dataset,
+        file_path=file_path
+    )
+
+    return lmp.dataset.BaseDataset(batch_sequences, is_compact=is_compact)
+
+
+def _load_line_file(
+        dataset: str,
+        is_jsonl: bool
+) -> lmp.dataset.LineDataset:
+    r"""Load text or JSONL file through cached line index.
+
+    Index is saved as `index.npy` under `data/cache/` and rebuilt only when
+    size or modification time of source file or `_LINE_INDEX_VERSION`
+    changes.
+    """
+    file_path = os.path.join(lmp.path.DATA_PATH, dataset)
+
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f'File {file_path} does not exist.')
+
+    # Different files may share the same name, so cache folder is keyed by
+    # absolute path.
+    cache_name = '{}-{}'.format(
+        os.path.basename(file_path),
+        hashlib.sha1(
+            os.path.abspath(file_path).encode('utf-8')
+        ).hexdigest()[:8]
+    )
+    cache_dir = _cache_dir(cache_name)
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    index_path = os.path.join(cache_dir, 'index.npy')
+    meta = dict(_source_key(file_path), version=_LINE_INDEX_VERSION)
+
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as input_file:
+            if json.load(input_file) == meta:
+                return lmp.dataset.LineDataset(
+                    file_path=file_path,
+                    is_jsonl=is_jsonl,
+                    offsets=np.load(index_path)
+                )
+
+        os.remove(meta_path)
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    offsets = lmp.dataset.LineDataset.build_index(file_path)
+    np.save(index_path, offsets)
+
+    # Meta file is written last so partially written index will never be
+    # treated as valid.
+    with open(meta_path, 'w', encoding='utf-8') as output_file:
+        json.dump(meta, output_file)
+
+    return lmp.dataset.LineDataset(
+        file_path=file_path,
+        is_jsonl=is_jsonl,
+        offsets=offsets
+    )
+
+
+def _load_mixture(
+        dataset: str,
+        is_compact: bool
+) -> lmp.dataset.MixtureDataset:
+    r"""Load each source of `mix:<dataset>=<weight>,...` and mix them."""
+    datasets = {}
+    weights = {}
+
+    for source in dataset[len('mix:'):].split(','):
+        name, _, weight = source.rpartition('=')
+
+        try:
+            weight = float(weight)
+        except ValueError:
+            name = ''
+
+        if not name or name in datasets or name.startswith('mix:'):
+            raise ValueError(
+                f'dataset `{dataset}` must be in format '
+                '`mix:<dataset>=<weight>,...` with distinct non-mixture '
+                'datasets.'
+            )
+
+        datasets[name] = load_dataset(dataset=name, is_compact=is_compact)
+        weights[name] = weight
+
+    return lmp.dataset.MixtureDataset(datasets=datasets, weights=weights)
+
+
+def _load_subset(
+        dataset: str,
+        is_compact: bool
+) -> lmp.dataset.SubsetDataset:
+    r"""Load `<dataset>@<index>.npy` as subset of `<dataset>`."""
+    name, _, index_file = dataset.rpartition('@')
+    file_path = os.path.join(lmp.path.DATA_PATH, index_file)
+
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f'File {file_path} does not exist.')
+
+    return lmp.dataset.SubsetDataset(
+        dataset=load_dataset(dataset=name, is_compact=is_compact),
+        indices=np.load(file_path)
+    )
+
+
+def load_dataset(
+        dataset: str,
+        is_compact: bool = False
+) -> lmp.dataset.BaseDataset:
     r"""Load dataset from downloaded files.
 
     Supported options:
         --dataset news_collection_desc
         --dataset news_collection_title
+        --dataset <file>.jsonl
+        --dataset <file>.txt
+        --dataset mix:<dataset>=<weight>,...
+        --dataset <dataset>@<index>.npy
+
+    Parsed datasets are cached under `data/cache/` in columnar format. Cache
+    is rebuilt whenever size or modification time of source file changes.
+
+    `.txt` and `.jsonl` files are resolved relative to `data/` and loaded as
+    `lmp.dataset.LineDataset`, where each non-empty line is a sequence. Only
+    the line index is cached and kept in memory, so `is_compact` is ignored.
+
+    `mix:` loads each listed dataset and mixes them as
+    `lmp.dataset.MixtureDataset` with given sampling weights, for example
+    `mix:news_collection_title=0.8,corpus.txt=0.2`.
+
+    `@` selects sequences of dataset by index file resolved relative to
+    `data/` (for example output of `run_dedup.py`) as
+    `lmp.dataset.SubsetDataset`. Indexed datasets can be mixed but mixture
+    cannot be indexed.
 
     Args:
         dataset:
             Name of the dataset to perform experiment.
+        is_compact:
+            Whether to store sequences in compact format. See
+            `lmp.dataset.BaseDataset` for details.
 
     Raises:
         TypeError:
-            When `dataset` is not an instance of `str`.
+            When `dataset` is not an instance of `str` or `is_compact` is not
+            an instance of `bool`.
         ValueError:
             If `dataset` does not support.
         FileNotFoundError
@@ -53,25 +342,38 @@ def load_dataset(dataset: str) -> lmp.dataset.BaseDataset:
     if not isinstance(dataset, str):
         raise TypeError('`dataset` must be an instance of `str`.')
 
+    if not isinstance(is_compact, bool):
+        raise TypeError('`is_compact` must be an instance of `bool`.')
+
     if dataset == 'news_collection_desc':
-        file_path = os.path.join(lmp.path.DATA_PATH, 'news_collection.csv')
+        return _load_csv_column(
+            column='desc',
+            dataset=dataset,
+            file_path=os.path.join(lmp.path.DATA_PATH, 'news_collection.csv'),
+            is_compact=is_compact,
+            is_dropna=True
+        )
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f'File {file_path} does not exist.')
+    if dataset == 'news_collection_title':
+        return _load_csv_column(
+            column='title',
+            dataset=dataset,
+            file_path=os.path.join(lmp.path.DATA_PATH, 'news_collection.csv'),
+            is_compact=is_compact,
+            is_dropna=False
+        )
 
-        df = pd.read_csv(file_path)
-        batch_sequences = df['desc'].dropna().to_list()
-        return lmp.dataset.BaseDataset(batch_sequences)
+    if dataset.startswith('mix:'):
+        return _load_mixture(dataset=dataset, is_compact=is_compact)
 
-    if dataset == 'news_collection_title':
-        file_path = os.path.join(lmp.path.DATA_PATH, 'news_collection.csv')
+    if dataset.endswith('.npy') and '@' in dataset:
+        return _load_subset(dataset=dataset, is_compact=is_compact)
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f'File {file_path} does not exist.')
+    if dataset.endswith('.jsonl'):
+        return _load_line_file(dataset=dataset, is_jsonl=True)
 
-        df = pd.read_csv(file_path)
-        batch_sequences = df['title'].to_list()
-        return lmp.dataset.BaseDataset(batch_sequences)
+    if dataset.endswith('.txt'):
+        return _load_line_file(dataset=dataset, is_jsonl=False)
 
     raise ValueError(
         f'dataset `{dataset}` does not support.\nSupported options:' +
@@ -80,6 +382,10 @@ def load_dataset(dataset: str) -> lmp.dataset.BaseDataset:
             [
                 'news_collection_desc',
                 'news_collection_title',
+                '<file>.jsonl',
+                '<file>.txt',
+                'mix:<dataset>=<weight>,...',
+                '<dataset>@<index>.npy',
             ]
         )))
     )
@@ -92,7 +398,7 @@ def load_dataset_by_config(
 
     Args:
         config:
-            Configuration object with attribute `dataset`.
+            Configuration object with attributes `dataset` and `is_compact`.
 
     Raise:
         TypeError:
@@ -107,4 +413,76 @@ def load_dataset_by_config(
             '`config` must be an instance of `lmp.config.BaseConfig`.'
         )
 
-    return load_dataset(dataset=config.dataset)
+    return load_dataset(
+        dataset=config.dataset,
+        is_compact=config.is_compact
+    )
+
+
+def split_dataset(
+        dataset: lmp.dataset.BaseDataset,
+        seed: int,
+        val_ratio: float
+) -> Tuple[lmp.dataset.SubsetDataset, lmp.dataset.SubsetDataset]:
+    r"""Randomly split dataset into training and validation subsets.
+
+    Split only depends on `seed` and dataset size, thus resumed training holds
+    out exactly the same validation sequences. At least one sequence is held
+    out for each subset. Indices in each subset are kept in ascending order so
+    that sequential reading of `dataset` is preserved.
+
+    Args:
+        dataset:
+            Dataset to be split. Must contain at least `2` sequences.
+        seed:
+            Random seed of split. Must be bigger than or equal to `0`.
+        val_ratio:
+            Ratio of sequences held out for validation. Must be bigger than
+            `0.0` and smaller than `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Training subset and validation subset.
+    """
+    # Type check.
+    if not isinstance(dataset, lmp.dataset.BaseDataset):
+        raise TypeError(
+            '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+        )
+
+    if not isinstance(seed, int):
+        raise TypeError('`seed` must be an instance of `int`.')
+
+    if not isinstance(val_ratio, float):
+        raise TypeError('`val_ratio` must be an instance of `float`.')
+
+    # Value check.
+    if len(dataset) < 2:
+        raise ValueError('`dataset` must contain at least `2` sequences.')
+
+    if seed < 0:
+        raise ValueError('`seed` must be bigger than or equal to `0`.')
+
+    if not 0.0 < val_ratio < 1.0:
+        raise ValueError('`val_ratio` must be in range `(0.0, 1.0)`.')
+
+    num_val = min(len(dataset) - 1, max(1, round(len(dataset) * val_ratio)))
+    indices = np.random.default_rng(seed).permutation(len(dataset))
+
+    return (
+        lmp.dataset.SubsetDataset(
+            dataset=dataset,
+            indices=np.sort(indices[num_val:])
+        ),
+        lmp.dataset.SubsetDataset(
+            dataset=dataset,
+            indices=np.sort(indices[:num_val])
+        ),
+    )
@@ -0,0 +1,300 @@
+r"""Helper function for removing near-duplicate sequences.
+
+Usage:
+    import lmp.util
+
+    indices = lmp.util.dedup_dataset(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import multiprocessing
+import zlib
+
+from typing import Generator
+from typing import Iterable
+from typing import List
+
+# 3rd-party modules
+
+import numpy as np
+
+from tqdm import tqdm
+
+# self-made modules
+
+import lmp.dataset
+import lmp.tokenizer
+
+# Mersenne prime used by universal hashing. Product of two numbers smaller
+# than `_PRIME` fits in `int64`.
+_PRIME = (1 << 31) - 1
+
+# Number of sequences hashed together. Bounded to keep `(num_perm, shingles)`
+# matrix small.
+_CHUNK_SIZE = 256
+
+# State shared by all sequences in a worker process.
+_WORKER_STATE = {}
+
+
+def _init_worker(
+        coefs: np.ndarray,
+        shingle_size: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> None:
+    r"""Send hashing parameters to worker process only once."""
+    _WORKER_STATE['coefs'] = coefs
+    _WORKER_STATE['shingle_size'] = shingle_size
+    _WORKER_STATE['tokenizer'] = tokenizer
+
+
+def _minhash(batch_sequences: List[str]) -> np.ndarray:
+    r"""Compute MinHash signatures of normalized character shingles.
+
+    Shingle hashes of all sequences are concatenated so that all permutations
+    of all sequences are computed by single vectorized operation.
+
+    Returns:
+        Signatures with shape `(len(batch_sequences), num_perm)`.
+    """
+    shingle_size = _WORKER_STATE['shingle_size']
+    tokenizer = _WORKER_STATE['tokenizer']
+    a, b = _WORKER_STATE['coefs']
+
+    hashes = []
+    starts = []
+    for sequence in batch_sequences:
+        sequence = tokenizer.normalize(sequence)
+        starts.append(len(hashes))
+
+        # Sequences shorter than `shingle_size` is a single shingle.
+        hashes.extend({
+            zlib.crc32(sequence[i:i + shingle_size].encode('utf-8')) % _PRIME
+            for i in range(max(1, len(sequence) - shingle_size + 1))
+        })
+
+    # Universal hashing simulates random permutations.
+    # values.size = (num_perm, number of shingles)
+    hashes = np.array(hashes, dtype=np.int64)
+    values = (a[:, None] * hashes[None, :] + b[:, None]) % _PRIME
+
+    return np.minimum.reduceat(values, starts, axis=1).T
+
+
+def _chunks(dataset: Iterable[str]) -> Generator[List[str], None, None]:
+    r"""Split dataset into chunks of `_CHUNK_SIZE` sequences."""
+    chunk = []
+    for sequence in dataset:
+        chunk.append(sequence)
+        if len(chunk) == _CHUNK_SIZE:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _connected_components(
+        num_nodes: int,
+        u: np.ndarray,
+        v: np.ndarray
+) -> np.ndarray:
+    r"""Label each node by the smallest node in its connected component.
+
+    Roots are hooked onto smaller roots along edges `(u, v)` followed by
+    pointer jumping, until both ends of every edge share the same root.
+    """
+    parent = np.arange(num_nodes)
+    while True:
+        pu = parent[u]
+        pv = parent[v]
+        mask = pu != pv
+        if not mask.any():
+            return parent
+
+        np.minimum.at(
+            parent,
+            np.maximum(pu, pv)[mask],
+            np.minimum(pu, pv)[mask]
+        )
+
+        # Pointer jumping until every node points to its root.
+        while True:
+            grand_parent = parent[parent]
+            if np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+
+
+def dedup_dataset(
+        dataset: lmp.dataset.BaseDataset,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        num_bands: int = 16,
+        num_perm: int = 128,
+        num_workers: int = 1,
+        seed: int = 1,
+        shingle_size: int = 5,
+        threshold: float = 0.8
+) -> List[int]:
+    r"""Find indices of dataset with near-duplicate sequences removed.
+
+    Each sequence is normalized by `tokenizer.normalize` and split into
+    character shingles of length `shingle_size`. Jaccard similarity between
+    shingle sets is estimated by MinHash signatures of length `num_perm`,
+    computed by `num_workers` processes. Signatures are split into
+    `num_bands` bands, and sequences sharing any identical band become
+    candidates. Candidates with estimated similarity bigger than or equal to
+    `threshold` are near-duplicates. Only the first sequence of each
+    near-duplicate cluster is kept.
+
+    Args:
+        dataset:
+            Dataset to be deduplicated.
+        tokenizer:
+            Tokenizer used to normalize sequences.
+        num_bands:
+            Number of LSH bands. Must be bigger than or equal to `1` and
+            `num_perm` must be divisible by `num_bands`.
+        num_perm:
+            Length of MinHash signature. Must be bigger than or equal to `1`.
+        num_workers:
+            Number of processes computing signatures. Must be bigger than or
+            equal to `1`.
+        seed:
+            Random seed for hashing. Must be bigger than or equal to `0`.
+        shingle_size:
+            Number of characters in each shingle. Must be bigger than or equal
+            to `1`.
+        threshold:
+            Minimum estimated Jaccard similarity of near-duplicates. Must be
+            bigger than `0.0` and smaller than or equal to `1.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Ascending indices of kept sequences.
+    """
+    # Type check.
+    if not isinstance(dataset, lmp.dataset.BaseDataset):
+        raise TypeError(
+            '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+        )
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if not isinstance(num_bands, int):
+        raise TypeError('`num_bands` must be an instance of `int`.')
+
+    if not isinstance(num_perm, int):
+        raise TypeError('`num_perm` must be an instance of `int`.')
+
+    if not isinstance(num_workers, int):
+        raise TypeError('`num_workers` must be an instance of `int`.')
+
+    if not isinstance(seed, int):
+        raise TypeError('`seed` must be an instance of `int`.')
+
+    if not isinstance(shingle_size, int):
+        raise TypeError('`shingle_size` must be an instance of `int`.')
+
+    if not isinstance(threshold, float):
+        raise TypeError('`threshold` must be an instance of `float`.')
+
+    # Value check.
+    if num_bands < 1:
+        raise ValueError('`num_bands` must be bigger than or equal to `1`.')
+
+    if num_perm < 1:
+        raise ValueError('`num_perm` must be bigger than or equal to `1`.')
+
+    if num_perm % num_bands:
+        raise ValueError('`num_perm` must be divisible by `num_bands`.')
+
+    if num_workers < 1:
+        raise ValueError('`num_workers` must be bigger than or equal to `1`.')
+
+    if seed < 0:
+        raise ValueError('`seed` must be bigger than or equal to `0`.')
+
+    if shingle_size < 1:
+        raise ValueError(
+            '`shingle_size` must be bigger than or equal to `1`.'
+        )
+
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError('`threshold` must be in range `(0.0, 1.0]`.')
+
+    if len(dataset) == 0:
+        return []
+
+    # Coefficients `(a, b)` of each simulated permutation `(a * x + b) % p`.
+    rng = np.random.default_rng(seed)
+    coefs = np.stack([
+        rng.integers(1, _PRIME, size=num_perm, dtype=np.int64),
+        rng.integers(0, _PRIME, size=num_perm, dtype=np.int64),
+    ])
+    init_args = (coefs, shingle_size, tokenizer)
+    chunks = tqdm(
+        _chunks(dataset),
+        desc='Computing MinHash signatures',
+        total=math.ceil(len(dataset) / _CHUNK_SIZE)
+    )
+
+    if num_workers == 1:
+        _init_worker(*init_args)
+        signatures = np.concatenate(list(map(_minhash, chunks)))
+    else:
+        with multiprocessing.Pool(
+                processes=num_workers,
+                initializer=_init_worker,
+                initargs=init_args
+        ) as pool:
+            signatures = np.concatenate(list(pool.imap(_minhash, chunks)))
+
+    # Sequences sharing identical band are candidates. Each candidate is
+    # paired with the first sequence having the same band.
+    rows = num_perm // num_bands
+    all_u = []
+    all_v = []
+    for band in range(num_bands):
+        _, first, inverse = np.unique(
+            signatures[:, band * rows:(band + 1) * rows],
+            axis=0,
+            return_index=True,
+            return_inverse=True
+        )
+        u = np.arange(len(signatures))
+        v = first[inverse.reshape(-1)]
+        mask = u != v
+        u = u[mask]
+        v = v[mask]
+
+        # Filter false positive candidates by estimated Jaccard similarity.
+        similarity = (signatures[u] == signatures[v]).mean(axis=1)
+        mask = similarity >= threshold
+        all_u.append(u[mask])
+        all_v.append(v[mask])
+
+    parent = _connected_components(
+        num_nodes=len(signatures),
+        u=np.concatenate(all_u),
+        v=np.concatenate(all_v)
+    )
+
+    return np.flatnonzero(parent == np.arange(len(parent))).tolist()
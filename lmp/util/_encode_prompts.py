@@ -0,0 +1,192 @@
+r"""Helper function for encoding prompts before generation.
+
+Usage:
+    import lmp.util
+
+    logits, state = lmp.util.encode_prompts(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+
+
+@torch.no_grad()
+def encode_prompts(
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prefix_cache: Optional[lmp.model.PrefixStateCache],
+        prompts: List[List[int]]
+) -> Tuple[torch.Tensor, lmp.model.RNNState]:
+    r"""Encode prompts and return states to start generation from.
+
+    Prompts with different lengths are right-padded and packed, thus they are
+    encoded together and padding never reaches hidden states. When
+    `prefix_cache` is given, each prompt resumes from hidden state after its
+    longest cached prefix and only its remainder is encoded. Remainders are
+    encoded in chunks ending at multiples of `prefix_cache.stride` tokens, and
+    hidden state at the end of each chunk is cached for later prompts.
+
+    Args:
+        device:
+            Model running device.
+        model:
+            Language model.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode all prompts from scratch.
+        prompts:
+            Encoded prompts. Must not be empty and each prompt must not be
+            empty.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `prompts` is empty or one of the prompts is empty.
+
+    Returns:
+        Logits of the last token of each prompt with shape `(P, V)` and hidden
+        state after each prompt with batch size `P`.
+    """
+    # Type check.
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            lmp.model.PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.model.PrefixStateCache]`.'
+        )
+
+    if not isinstance(prompts, list) or not all(map(
+            lambda prompt: isinstance(prompt, list) and all(map(
+                lambda token_id: isinstance(token_id, int),
+                prompt
+            )),
+            prompts
+    )):
+        raise TypeError('`prompts` must be an instance of `List[List[int]]`.')
+
+    # Value check.
+    if not prompts or not all(prompts):
+        raise ValueError('`prompts` and each prompt must not be empty.')
+
+    # Evaluation mode.
+    model.eval()
+
+    pad_token_id = model.emb_layer.padding_idx
+
+    if prefix_cache is None:
+        # Padded prompts with shape (P, S).
+        max_length = max(map(len, prompts))
+        batch_prompts = torch.LongTensor([
+            prompt + [pad_token_id] * (max_length - len(prompt))
+            for prompt in prompts
+        ]).to(device)
+        prompt_lengths = torch.LongTensor(list(map(len, prompts)))
+
+        # Model prediction of non-padding tokens has shape (N, V).
+        logits, state = model.forward_step(
+            batch_prompts,
+            batch_lengths=prompt_lengths
+        )
+
+        # Only last token's prediction of each prompt is needed.
+        return logits[(prompt_lengths.cumsum(dim=0) - 1).to(device)], state
+
+    # Resume from the longest cached prefix of each prompt.
+    positions = []
+    batch_logits = []
+    batch_state = []
+    for prompt in prompts:
+        length, entry = prefix_cache.lookup(prompt)
+        positions.append(length)
+
+        if entry is None:
+            batch_logits.append(None)
+            batch_state.append(model.init_state(batch_size=1))
+        else:
+            batch_logits.append(entry[0])
+            batch_state.append(entry[1])
+
+    # Encode remainder of all prompts chunk by chunk.
+    while True:
+        active = [
+            index
+            for index, prompt in enumerate(prompts)
+            if positions[index] < len(prompt)
+        ]
+        if not active:
+            break
+
+        # Each chunk ends at the next multiple of `stride` or at the end of
+        # prompt.
+        chunks = []
+        for index in active:
+            start = positions[index]
+            end = min(
+                len(prompts[index]),
+                (start // prefix_cache.stride + 1) * prefix_cache.stride
+            )
+            chunks.append(prompts[index][start:end])
+
+        # Padded chunks with shape (A, C).
+        max_length = max(map(len, chunks))
+        batch_chunks = torch.LongTensor([
+            chunk + [pad_token_id] * (max_length - len(chunk))
+            for chunk in chunks
+        ]).to(device)
+        chunk_lengths = torch.LongTensor(list(map(len, chunks)))
+
+        # Model prediction of non-padding tokens has shape (N, V).
+        logits, state = model.forward_step(
+            batch_chunks,
+            lmp.model.RNNState.cat([batch_state[index] for index in active]),
+            batch_lengths=chunk_lengths
+        )
+        logits = logits[(chunk_lengths.cumsum(dim=0) - 1).to(device)]
+
+        for row, (index, chunk) in enumerate(zip(active, chunks)):
+            positions[index] += len(chunk)
+            batch_logits[index] = logits[row]
+            batch_state[index] = state[row]
+            prefix_cache.insert(
+                token_ids=prompts[index][:positions[index]],
+                logits=batch_logits[index],
+                state=batch_state[index]
+            )
+
+    return (
+        torch.stack(batch_logits).to(device),
+        lmp.model.RNNState.cat(batch_state).to(device)
+    )
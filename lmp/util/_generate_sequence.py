@@ -3,6 +3,8 @@ r"""Helper function for sequences generation.
 Usage:
     import lmp.util
 
+    generated = lmp.util.batch_generate_sequence(...)
+    generated = lmp.util.batch_generate_sequence_by_config(...)
     generated = lmp.util.generate_sequence(...)
     generated = lmp.util.generate_sequence_by_config(...)
 """
@@ -13,12 +15,17 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+
+import math
+
 from typing import List
+from typing import Optional
 from typing import Union
 
 # 3rd-party modules
 
 import torch
+import torch.nn.functional
 
 # self-made modules
 
@@ -26,8 +33,9 @@ import lmp.config
 import lmp.model
 import lmp.tokenizer
 
+from lmp.util._encode_prompts import encode_prompts
+
 
-@torch.no_grad()
 def generate_sequence(
         beam_width: int,
         begin_of_sequence: str,
@@ -38,6 +46,8 @@ def generate_sequence(
 ) -> List[str]:
     r"""Sequences generation using beam search.
 
+    See `lmp.util.batch_generate_sequence` for details.
+
     Args:
         beam_width:
             Number of candidate sequences to output. Must be bigger than or
@@ -66,11 +76,84 @@ def generate_sequence(
         Generated sequences.
     """
     # Type check.
+    if not isinstance(begin_of_sequence, str):
+        raise TypeError('`begin_of_sequence` must be an instance of `str`.')
+
+    return batch_generate_sequence(
+        beam_width=beam_width,
+        begin_of_sequences=[begin_of_sequence],
+        device=device,
+        max_seq_len=max_seq_len,
+        model=model,
+        tokenizer=tokenizer
+    )[0]
+
+
+@torch.no_grad()
+def batch_generate_sequence(
+        beam_width: int,
+        begin_of_sequences: List[str],
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Sequences generation for multiple prompts using beam search.
+
+    Prompts with different lengths are packed and encoded together only
+    once by `lmp.util.encode_prompts`, resuming from the longest cached
+    prefix of each prompt when `prefix_cache` is given. Then beams of all
+    prompts are advanced together by feeding only their newly generated
+    tokens with cached RNN hidden states, thus each step is a single model
+    call and costs the same regardless of sequence length. All candidates of
+    all beams of each prompt are compared at once in each step. Beams which
+    generate `[eos]` are finished and kept as candidates, and generation
+    stops early when all beams are finished.
+
+    Args:
+        beam_width:
+            Number of candidate sequences to output for each prompt. Must be
+            bigger than or equal to `1`.
+        begin_of_sequences:
+            Begining of sequences which model will auto-complete. Must not be
+            empty.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode all prompts from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequences of each prompt, sorted by negative log-likelihood
+        in ascending order.
+    """
+    # Type check.
     if not isinstance(beam_width, int):
         raise TypeError('`beam_width` must be an instance of `int`.')
 
-    if not isinstance(begin_of_sequence, str):
-        raise TypeError('`begin_of_sequence` must be an instance of `str`.')
+    if not isinstance(begin_of_sequences, list) or not all(map(
+            lambda sequence: isinstance(sequence, str),
+            begin_of_sequences
+    )):
+        raise TypeError(
+            '`begin_of_sequences` must be an instance of `List[str]`.'
+        )
 
     if not isinstance(device, torch.device):
         raise TypeError('`device` must be an instance of `torch.device`.')
@@ -93,95 +176,236 @@ def generate_sequence(
             '`lmp.tokenizer.BaseTokenizer`.'
         )
 
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            lmp.model.PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.model.PrefixStateCache]`.'
+        )
+
     # Value check.
     if beam_width < 1:
         raise ValueError('`beam_width` must be bigger than or equal to `1`.')
 
+    if not begin_of_sequences:
+        raise ValueError('`begin_of_sequences` must not be empty.')
+
     if max_seq_len < 2:
         raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
 
     # Evaluation mode.
     model.eval()
 
-    # Encode sequence and convert into tensor. Remove `[eos]`` since we are
-    # using begin of sentence.
-    cur_seq = tokenizer.encode(begin_of_sequence, max_seq_len=-1)
-    cur_seq = torch.LongTensor(cur_seq)[:-1].to(device)
-
-    # Get begin sequence length.
-    seq_len = cur_seq.size(-1)
-
-    # Generated sequence.
-    # Start shape (1, S).
-    # Final shape (B, S).
-    cur_seq = cur_seq.reshape(1, seq_len)
-
-    # Accumulated negative log-likelihood. Using log can change consecutive
-    # probability multiplication into sum of log probability which can
-    # avoid computational underflow. Initialized to zero with shape (B).
-    accum_prob = torch.zeros(beam_width).to(device)
-
-    for _ in range(max_seq_len - seq_len):
-        # Model prediction has shape (B, S, V).
-        pred_y = model.predict(cur_seq)
-
-        # Record all beams prediction.
-        # Each beam will predict `beam_width` different results.
-        # So we totally have `beam_width * beam_width` different results.
-        top_k_in_all_beams = []
-        for out_beam in range(cur_seq.size(0)):
-            # Get `beam_width` different prediction from beam `out_beam`.
-            # `top_k_prob_in_beam` has shape (B) and
-            # `top_k_index_in_beam` has shape (B).
-            top_k_prob_in_beam, top_k_index_in_beam = \
-                pred_y[out_beam, -1].topk(
-                    k=beam_width,
-                    dim=-1
-                )
-
-            # Record each beam's negative log-likelihood and concate
-            # next token id based on prediction.
-            for in_beam in range(beam_width):
-                # Accumulate negative log-likelihood. Since log out
-                # negative value when input is in range 0~1, we negate it
-                # to be postive.
-                prob = accum_prob[out_beam] - \
-                    top_k_prob_in_beam[in_beam].log()
-                prob = prob.unsqueeze(0)
-
-                # Concate next predicted token id.
-                seq = torch.cat([
-                    cur_seq[out_beam],
-                    top_k_index_in_beam[in_beam].unsqueeze(0)
-                ], dim=-1).unsqueeze(0)
-
-                # Record result.
-                top_k_in_all_beams.append({
-                    'prob': prob,
-                    'seq': seq
-                })
-
-        # Compare each recorded result in all beams. First concate tensor
-        # then use `topk` to get the `beam_width` highest prediction in all
-        # beams.
-        _, top_k_index_in_all_beams = torch.cat([
-            beam['prob']
-            for beam in top_k_in_all_beams
-        ]).topk(k=beam_width, dim=0)
-
-        # Update `cur_seq` which is the `beam_width` highest results.
-        cur_seq = torch.cat([
-            top_k_in_all_beams[index]['seq']
-            for index in top_k_index_in_all_beams
-        ], dim=0)
-
-        # Update accumlated negative log-likelihood.
-        accum_prob = torch.cat([
-            top_k_in_all_beams[index]['prob']
-            for index in top_k_index_in_all_beams
-        ], dim=0)
-
-    return tokenizer.batch_decode(cur_seq.tolist())
+    # Encode sequences. Remove `[eos]` since we are using begin of sentence.
+    prompts = [
+        tokenizer.encode(sequence, max_seq_len=-1)[:-1]
+        for sequence in begin_of_sequences
+    ]
+
+    return [
+        tokenizer.batch_decode(sequences)
+        for sequences in _beam_search(
+            beam_width=beam_width,
+            device=device,
+            max_seq_len=max_seq_len,
+            model=model,
+            prefix_cache=prefix_cache,
+            prompts=prompts,
+            tokenizer=tokenizer
+        )
+    ]
+
+
+@torch.no_grad()
+def _beam_search(
+        beam_width: int,
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prefix_cache: Optional[lmp.model.PrefixStateCache],
+        prompts: List[List[int]],
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> List[List[List[int]]]:
+    r"""Beam search of multiple encoded prompts.
+
+    See `batch_generate_sequence` for details. Arguments are not checked.
+
+    Args:
+        beam_width:
+            Number of candidate sequences to output for each prompt.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum of output sequences length.
+        model:
+            Language model in evaluation mode.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes.
+        prompts:
+            Encoded prompts without `[eos]`.
+        tokenizer:
+            Tokenizer which encoded `prompts`.
+
+    Returns:
+        Token ids of generated sequences of each prompt including prompt,
+        sorted by negative log-likelihood in ascending order. Generation of
+        a sequence ends with `[eos]` or at `max_seq_len`.
+    """
+    eos_token_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+    pad_token_id = model.emb_layer.padding_idx
+
+    num_prompts = len(prompts)
+
+    # Length of each prompt with shape (P).
+    prompt_lengths = torch.LongTensor([len(prompt) for prompt in prompts])
+
+    # Number of tokens each prompt can generate with shape (P).
+    max_new_tokens = (max_seq_len - prompt_lengths).clamp(min=0).to(device)
+    num_steps = int(max_new_tokens.max())
+
+    # Accumulated negative log-likelihood of each beam. Using log can change
+    # consecutive probability multiplication into sum of log probability
+    # which can avoid computational underflow. Start with single beam for
+    # each prompt, shape (P, B).
+    accum_nll = torch.zeros(num_prompts, 1).to(device)
+
+    # Finished beams have generated `[eos]` or reached `max_seq_len`.
+    # Shape (P, B).
+    is_finished = (max_new_tokens == 0).unsqueeze(-1)
+
+    # Generated token and source beam of each beam in each step. Sequences
+    # are never copied, instead they are traced back from the last step.
+    backpointers = []
+    tokens = []
+
+    # Encode all prompts only once. Beams then only feed their newly
+    # generated tokens with their own hidden states, thus each step costs
+    # the same no matter how long the sequences are.
+    if num_steps > 0:
+        # Only last token's prediction of each prompt is needed.
+        # Model prediction has shape (P, 1, V).
+        logits, state = encode_prompts(
+            device=device,
+            model=model,
+            prefix_cache=prefix_cache,
+            prompts=prompts
+        )
+        logits = logits.unsqueeze(1)
+
+    for step in range(num_steps):
+        num_beams = accum_nll.size(-1)
+
+        # Only last token's prediction is needed.
+        # Log-probabilities have shape (P, B, V).
+        log_probs = torch.nn.functional.log_softmax(logits[:, -1], dim=-1)
+        vocab_size = log_probs.size(-1)
+        log_probs = log_probs.reshape(num_prompts, num_beams, vocab_size)
+
+        # Finished beams can only be extended by `[pad]` without any cost, so
+        # they keep their scores and compete with unfinished beams.
+        log_probs[is_finished] = -math.inf
+        log_probs[is_finished, pad_token_id] = 0.0
+
+        # Select `beam_width` candidates with lowest negative log-likelihood
+        # from all `B x V` candidates of each prompt at once.
+        # Shape (P, B).
+        accum_nll, index = (
+            accum_nll.unsqueeze(-1) - log_probs
+        ).reshape(num_prompts, -1).topk(
+            k=min(beam_width, num_beams * vocab_size),
+            dim=-1,
+            largest=False
+        )
+
+        backpointer = index // vocab_size
+        token = index % vocab_size
+
+        backpointers.append(backpointer)
+        tokens.append(token)
+
+        # Candidates with infinite negative log-likelihood are impossible.
+        # They are kept only for aligning beams of all prompts, and are
+        # dropped in the end.
+        is_finished = (
+            is_finished.gather(1, backpointer) |
+            (token == eos_token_id) |
+            torch.isinf(accum_nll) |
+            (step + 1 >= max_new_tokens).unsqueeze(-1)
+        )
+
+        # Early stopping when all beams are finished.
+        if is_finished.all():
+            break
+
+        # Reorder hidden states by source beams and feed generated tokens.
+        # Model prediction has shape (P x B, 1, V).
+        beam_index = backpointer + num_beams * torch.arange(
+            num_prompts
+        ).to(device).unsqueeze(-1)
+        logits, state = model.forward_step(
+            token.reshape(-1, 1),
+            state[beam_index.reshape(-1)]
+        )
+
+    # Generated tokens with shape (P, B, T).
+    generated = []
+    if tokens:
+        generated = _backtrace(backpointers=backpointers, tokens=tokens)
+        generated = generated.tolist()
+
+    accum_nll = accum_nll.tolist()
+    max_new_tokens = max_new_tokens.tolist()
+
+    batch_sequences = []
+    for prompt_index, prompt in enumerate(prompts):
+        sequences = []
+        for beam_index, nll in enumerate(accum_nll[prompt_index]):
+            # Drop impossible candidates.
+            if math.isinf(nll):
+                continue
+
+            seq = []
+            if generated:
+                seq = generated[prompt_index][beam_index]
+
+            # Remove `[pad]` after `[eos]` or `max_seq_len`.
+            seq = seq[:max_new_tokens[prompt_index]]
+            if eos_token_id in seq:
+                seq = seq[:seq.index(eos_token_id) + 1]
+
+            sequences.append(prompt + seq)
+
+        batch_sequences.append(sequences)
+
+    return batch_sequences
+
+
+def _backtrace(
+        backpointers: List[torch.Tensor],
+        tokens: List[torch.Tensor]
+) -> torch.Tensor:
+    r"""Trace generated tokens of each beam back to the first step.
+
+    Args:
+        backpointers:
+            Source beam of each beam of each prompt in each step.
+        tokens:
+            Generated token of each beam of each prompt in each step.
+
+    Returns:
+        Generated tokens of each beam in the last step with shape
+        `(P, B, T)`, where `T` is number of steps.
+    """
+    beam = torch.arange(tokens[-1].size(-1)).to(tokens[-1].device)
+    beam = beam.expand_as(tokens[-1])
+    generated = []
+    for backpointer, token in zip(reversed(backpointers), reversed(tokens)):
+        generated.append(token.gather(1, beam))
+        beam = backpointer.gather(1, beam)
+
+    return torch.stack(generated[::-1], dim=-1)
 
 
 def generate_sequence_by_config(
@@ -235,3 +459,62 @@ def generate_sequence_by_config(
         model=model,
         tokenizer=tokenizer
     )
+
+
+def batch_generate_sequence_by_config(
+        beam_width: int,
+        begin_of_sequences: List[str],
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Helper function for sequences generation for multiple prompts.
+
+    Args:
+        beam_width:
+            Number of candidate sequences to output for each prompt. Must be
+            bigger than or equal to `1`.
+        begin_of_sequences:
+            Begining of sequences which model will auto-complete. Must not be
+            empty.
+        config:
+            Configuration object with attributes `device`.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode all prompts from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequences of each prompt.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return batch_generate_sequence(
+        beam_width=beam_width,
+        begin_of_sequences=begin_of_sequences,
+        device=config.device,
+        max_seq_len=max_seq_len,
+        model=model,
+        prefix_cache=prefix_cache,
+        tokenizer=tokenizer
+    )
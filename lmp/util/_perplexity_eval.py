@@ -4,6 +4,7 @@ Usage:
     import lmp.util
 
     perplexities = lmp.util.batch_perplexity_eval(...)
+    summary = lmp.util.corpus_perplexity_eval(...)
     perplexity = lmp.util.perplexity_eval(...)
 """
 
@@ -13,13 +14,24 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+
+import collections
+import csv
+import math
+import struct
+
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # 3rd-party modules
 
 import torch
+import torch.nn.functional
 
 from tqdm import tqdm
 
@@ -28,16 +40,28 @@ from tqdm import tqdm
 import lmp.model
 import lmp.tokenizer
 
+# Number of batches sorted by length together in `batch_perplexity_eval`.
+_NUM_POOL_BATCHES = 16
+
 
 @torch.no_grad()
 def perplexity_eval(
         device: torch.device,
         model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
         sequence: str,
-        tokenizer: lmp.tokenizer.BaseTokenizer
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        window_size: int = -1
 ) -> float:
     r"""Helper function for calculating perplexity.
 
+    By default the whole sequence is fed to model in one call, thus
+    log-probabilities with shape `(1, S, V)` are kept in memory. When
+    `window_size` is given and sequence is longer than `window_size`, the
+    sequence is fed in consecutive windows of `window_size` tokens instead.
+    Hidden state after each window is carried to the next one and
+    negative log-likelihood is accumulated, so memory does not grow with
+    sequence length and result is the same as feeding the whole sequence.
+
     Args:
         device:
             Model running device.
@@ -47,14 +71,22 @@ def perplexity_eval(
             Sequence for evaluation. Must not be empty.
         tokenizer:
             Tokenizer for encoding sequence.
+        window_size:
+            Number of tokens fed to model in each call. Must be bigger than
+            or equal to `1`, or equal to `-1` for feeding the whole sequence
+            at once.
 
     Raises:
         TypeError:
             When one of the arguments are not an instance of their type
             annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
 
     Return:
-        Perplexity of `sequence`.
+        Perplexity of `sequence`. `nan` when `sequence` has no token after
+        encoding (for example only whitespaces).
     """
     # Type check.
     if not isinstance(device, torch.device):
@@ -77,10 +109,19 @@ def perplexity_eval(
             '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
         )
 
+    if not isinstance(window_size, int):
+        raise TypeError('`window_size` must be an instance of `int`.')
+
     # Value check.
     if not sequence:
         raise ValueError('`sequence` must not be empty.')
 
+    if window_size < 1 and window_size != -1:
+        raise ValueError(
+            '`window_size` must be bigger than or equal to `1` or equal to '
+            '`-1`.'
+        )
+
     # Evalation mode.
     model.eval()
 
@@ -95,25 +136,35 @@ def perplexity_eval(
     # `y.shape = (S)`.
     y = sequence[1:-1]
 
+    # Nothing to predict when sequence has no token after encoding.
+    if not y:
+        return math.nan
+
+    if window_size != -1 and x.size(0) > window_size:
+        return _window_perplexity(
+            model=model,
+            window_size=window_size,
+            x=x,
+            y=torch.LongTensor(y).to(device)
+        )
+
     # Reshape into `(1, S)` to fit model.
     x = x.reshape(1, -1)
 
-    # Get model vocabulary prediction with shape `(1, S, V)`.
-    pred_y = model.predict(x)
+    # Get model vocabulary log-probabilities with shape `(1, S, V)`.
+    log_pred_y = model.predict_log_probs(x)
 
     # Reshape into `(S)` for easier maniplation.
     x = x.squeeze(0)
 
     # Reshape into `(S, V)` for easier maniplation.
-    pred_y = pred_y.squeeze(0)
-
-    # Accumulate negative log-likelihood.
-    nll = torch.zeros(1).to(device)
+    log_pred_y = log_pred_y.squeeze(0)
 
-    # Iterate through each prediction.
-    for pos, token_id in enumerate(y):
-        probs = pred_y[pos, token_id]
-        nll = nll - torch.log(probs)
+    # Accumulate negative log-likelihood of each target token.
+    nll = -log_pred_y.gather(
+        1,
+        torch.LongTensor(y).to(device).unsqueeze(-1)
+    ).sum()
 
     # Normalized by length.
     nll = nll / x.size(0)
@@ -122,14 +173,68 @@ def perplexity_eval(
     return nll.exp().item()
 
 
+def _window_perplexity(
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        window_size: int,
+        x: torch.Tensor,
+        y: torch.Tensor
+) -> float:
+    r"""Calculate perplexity by feeding `x` in windows of `window_size`.
+
+    Args:
+        model:
+            Language model.
+        window_size:
+            Number of tokens fed to model in each call.
+        x:
+            Input token ids with shape `(S)`.
+        y:
+            Target token ids with shape `(S)`.
+
+    Returns:
+        Perplexity of predicting `y` from `x`.
+    """
+    nll = 0.0
+    state = None
+    for start in range(0, x.size(0), window_size):
+        # Window has shape `(1, W)`.
+        window = x[start:start + window_size].reshape(1, -1)
+
+        # Continue from hidden state after previous window. Logits have shape
+        # `(1, W, V)`.
+        logits, state = model.forward_step(window, state)
+
+        # Log-probabilities with shape `(W, V)`.
+        log_pred_y = torch.nn.functional.log_softmax(logits[0], dim=-1)
+
+        # Accumulate negative log-likelihood of each target token.
+        nll -= log_pred_y.gather(
+            1,
+            y[start:start + window_size].unsqueeze(-1)
+        ).sum().item()
+
+    # Normalized by length and take exponential to cancel logarithmic.
+    return math.exp(nll / x.size(0))
+
+
 def batch_perplexity_eval(
         dataset: Iterable[str],
         device: torch.device,
         model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
-        tokenizer: lmp.tokenizer.BaseTokenizer
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        batch_size: int = 32
 ) -> List[float]:
     r"""Helper function for calculating dataset perplexity.
 
+    Sequences are evaluated `batch_size` at a time. Every
+    `batch_size * 16` sequences are sorted by length before being split into
+    batches, so sequences in the same batch have similar lengths and little
+    padding. Each batch is evaluated by one forward pass, one `log_softmax`
+    and one `gather` of target log-probabilities, and padding positions are
+    skipped by model. Results are the same as calling `perplexity_eval` on
+    each sequence. Perplexity of a sequence which has no token after encoding
+    (for example only whitespaces) is `nan`.
+
     Args:
         dataset:
             Evaluating each sequence in the dataset. No sequences in dataset
@@ -140,40 +245,355 @@ def batch_perplexity_eval(
             Language model.
         tokenizer:
             Tokenizer for encoding sequence.
+        batch_size:
+            Number of sequences evaluated together. Must be bigger than or
+            equal to `1`.
 
     Raises:
         TypeError:
             When one of the arguments are not an instance of their type
             annotation respectively.
+        ValueError:
+            When `dataset` contains empty sequences or `batch_size < 1`.
 
     Return:
-        Perplexity of `dataset`.
+        Perplexity of each sequence in `dataset` in the same order.
     """
     # Type check.
     if not isinstance(dataset, Iterable):
         raise TypeError('`dataset` must be an instance of `Iterable[str]`.')
 
-    perplexties = []
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
 
-    try:
-        for sequence in tqdm(dataset, desc='Calculating perplexities'):
-            perplexity = perplexity_eval(
-                device=device,
-                model=model,
-                sequence=sequence,
-                tokenizer=tokenizer
-            )
-            perplexties.append(perplexity)
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    return [
+        math.exp(nll / num_tokens) if num_tokens else math.nan
+        for num_tokens, nll in _iter_nll(
+            batch_size=batch_size,
+            dataset=dataset,
+            device=device,
+            model=model,
+            tokenizer=tokenizer
+        )
+    ]
+
+
+def corpus_perplexity_eval(
+        dataset: Iterable[str],
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        batch_size: int = 32,
+        score_file: Optional[str] = None
+) -> Dict:
+    r"""Calculate corpus perplexity with bounded memory.
+
+    Sequences are evaluated the same way as `batch_perplexity_eval`, but only
+    running totals are kept, thus memory usage does not grow with dataset
+    size. Corpus perplexity is the exponential of negative log-likelihood
+    averaged over all predicted tokens, i.e. longer sequences weigh more.
+    Same as `perplexity_eval`, predicted tokens of each sequence exclude
+    `[bos]` and `[eos]`. Sequences which have no token after encoding (for
+    example only whitespaces) are counted in `num_sequences` only, and their
+    perplexities are `nan`.
+
+    Returned summary contains keys:
+
+    - `histogram`: List of `[length, count, perplexity]` sorted by length,
+      where `perplexity` is the token-weighted perplexity of sequences with
+      `length` predicted tokens.
+    - `nll`: Average negative log-likelihood per predicted token. `nan`
+      when no token is predicted.
+    - `num_sequences`: Number of evaluated sequences.
+    - `num_tokens`: Number of predicted tokens.
+    - `perplexity`: Corpus perplexity. `nan` when no token is predicted.
+
+    When `score_file` is given, perplexity of each sequence is written to it
+    in dataset order while evaluating. If `score_file` ends with `.csv`, each
+    row is `index,num_tokens,perplexity` after a header row. Otherwise
+    perplexities are written as little-endian `float32` values, which can be
+    read by `numpy.fromfile(score_file, dtype='<f4')`.
 
-        return perplexties
-    except TypeError as err:
-        if 'sequence' in err.args[0]:
+    Args:
+        dataset:
+            Evaluating each sequence in the dataset. No sequences in dataset
+            should be empty.
+        device:
+            Model running device.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding sequence.
+        batch_size:
+            Number of sequences evaluated together. Must be bigger than or
+            equal to `1`.
+        score_file:
+            Path of file to write perplexity of each sequence. Set to `None`
+            to skip writing.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `dataset` is empty, `dataset` contains empty sequences or
+            `batch_size < 1`.
+
+    Return:
+        Summary of corpus perplexity.
+    """
+    # Type check.
+    if not isinstance(dataset, Iterable):
+        raise TypeError('`dataset` must be an instance of `Iterable[str]`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if score_file is not None and not isinstance(score_file, str):
+        raise TypeError('`score_file` must be an instance of `Optional[str]`.')
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    nll_iter = _iter_nll(
+        batch_size=batch_size,
+        dataset=dataset,
+        device=device,
+        model=model,
+        tokenizer=tokenizer
+    )
+
+    # Running totals of each length: `[count, nll]`.
+    histogram = collections.defaultdict(lambda: [0, 0.0])
+
+    # Number of sequences which have no token after encoding.
+    num_empty = 0
+
+    if score_file is None:
+        for num_tokens, nll in nll_iter:
+            if num_tokens:
+                histogram[num_tokens][0] += 1
+                histogram[num_tokens][1] += nll
+            else:
+                num_empty += 1
+    elif score_file.endswith('.csv'):
+        with open(score_file, 'w', encoding='utf-8', newline='') as output:
+            writer = csv.writer(output)
+            writer.writerow(['index', 'num_tokens', 'perplexity'])
+            for index, (num_tokens, nll) in enumerate(nll_iter):
+                if num_tokens:
+                    histogram[num_tokens][0] += 1
+                    histogram[num_tokens][1] += nll
+                    perplexity = math.exp(nll / num_tokens)
+                else:
+                    num_empty += 1
+                    perplexity = math.nan
+                writer.writerow([index, num_tokens, f'{perplexity:.6f}'])
+    else:
+        with open(score_file, 'wb') as output:
+            for num_tokens, nll in nll_iter:
+                if num_tokens:
+                    histogram[num_tokens][0] += 1
+                    histogram[num_tokens][1] += nll
+                    perplexity = math.exp(nll / num_tokens)
+                else:
+                    num_empty += 1
+                    perplexity = math.nan
+                output.write(struct.pack('<f', perplexity))
+
+    # `dataset` may be a stream, thus emptiness is known only after
+    # evaluation.
+    if not histogram and not num_empty:
+        raise ValueError('`dataset` must not be empty.')
+
+    total_tokens = sum(
+        length * count
+        for length, (count, _) in histogram.items()
+    )
+    total_nll = sum(nll for _, nll in histogram.values())
+    mean_nll = total_nll / total_tokens if total_tokens else math.nan
+
+    return {
+        'histogram': [
+            [length, count, math.exp(nll / (length * count))]
+            for length, (count, nll) in sorted(histogram.items())
+        ],
+        'nll': mean_nll,
+        'num_sequences': num_empty + sum(
+            count
+            for count, _ in histogram.values()
+        ),
+        'num_tokens': total_tokens,
+        'perplexity': math.exp(mean_nll),
+    }
+
+
+def _iter_nll(
+        batch_size: int,
+        dataset: Iterable[str],
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> Iterator[Tuple[int, float]]:
+    r"""Evaluate `dataset` pool by pool.
+
+    Returns:
+        Iterator yields number of predicted tokens and summed negative
+        log-likelihood of each sequence in dataset order.
+    """
+    # Evalation mode.
+    model.eval()
+
+    pool = []
+    for sequence in tqdm(dataset, desc='Calculating perplexities'):
+        if not isinstance(sequence, str):
             raise TypeError(
                 '`dataset` must be an instance of `Iterable[str]`.'
             )
 
-        raise err
-    except ValueError as err:
-        raise ValueError(
-            '`dataset` must not contain empty sequences.'
+        if not sequence:
+            raise ValueError('`dataset` must not contain empty sequences.')
+
+        pool.append(tokenizer.encode(sequence, max_seq_len=-1))
+
+        if len(pool) == batch_size * _NUM_POOL_BATCHES:
+            yield from _pool_nll(
+                batch_size=batch_size,
+                device=device,
+                model=model,
+                pad_token_id=model.emb_layer.padding_idx,
+                pool=pool
+            )
+            pool = []
+
+    if pool:
+        yield from _pool_nll(
+            batch_size=batch_size,
+            device=device,
+            model=model,
+            pad_token_id=model.emb_layer.padding_idx,
+            pool=pool
+        )
+
+
+@torch.no_grad()
+def _pool_nll(
+        batch_size: int,
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        pad_token_id: int,
+        pool: List[List[int]]
+) -> List[Tuple[int, float]]:
+    r"""Calculate negative log-likelihood of each encoded sequence in `pool`.
+
+    Args:
+        batch_size:
+            Number of sequences evaluated together.
+        device:
+            Model running device.
+        model:
+            Language model.
+        pad_token_id:
+            Padding token id.
+        pool:
+            Encoded sequences including `[bos]` and `[eos]`.
+
+    Returns:
+        Number of predicted tokens and summed negative log-likelihood of each
+        sequence in `pool` in the same order.
+    """
+    # Sequences encoded into `[bos]` and `[eos]` only have nothing to
+    # predict, and are never fed into model.
+    results = [(0, 0.0)] * len(pool)
+
+    # Sort by length to limit padding in each batch.
+    order = sorted(
+        filter(lambda index: len(pool[index]) > 2, range(len(pool))),
+        key=lambda index: len(pool[index])
+    )
+
+    for start in range(0, len(order), batch_size):
+        batch_index = order[start:start + batch_size]
+
+        # Predict tokens include [bos] output but exclude [eos] input, thus
+        # each sequence has `S` input and target tokens.
+        batch_lengths = [len(pool[index]) - 2 for index in batch_index]
+        max_length = max(batch_lengths)
+
+        # Padded input with shape `(B, S)`.
+        x = torch.LongTensor([
+            pool[index][:-2] + [pad_token_id] * (max_length - length)
+            for index, length in zip(batch_index, batch_lengths)
+        ]).to(device)
+
+        # Non-padding targets ordered by sequence first then by position,
+        # with shape `(N)`.
+        y = torch.LongTensor([
+            token_id
+            for index in batch_index
+            for token_id in pool[index][1:-1]
+        ]).to(device)
+
+        # Padding tokens are skipped by model, thus only log-probabilities of
+        # non-padding tokens are calculated with shape `(N, V)`.
+        log_pred_y = torch.nn.functional.log_softmax(
+            model(x, batch_lengths=torch.LongTensor(batch_lengths)),
+            dim=-1
         )
+
+        # Negative log-likelihood of each target token with shape `(N)`.
+        token_nll = -log_pred_y.gather(1, y.unsqueeze(-1)).squeeze(-1)
+
+        # Negative log-likelihood of each sequence with shape `(B)`.
+        nll = [
+            seq_nll.sum().item()
+            for seq_nll in token_nll.split(batch_lengths)
+        ]
+
+        for index, length, seq_nll in zip(
+                batch_index,
+                batch_lengths,
+                nll
+        ):
+            results[index] = (length, seq_nll)
+
+    return results
@@ -0,0 +1,442 @@
+r"""Helper function for profiling dataset and tuning hyperparameters.
+
+Usage:
+    import lmp.util
+
+    profile = lmp.util.profile_dataset(...)
+    profile = lmp.util.profile_dataset_by_config(...)
+    lengths = lmp.util.cached_sequence_lengths(...)
+    max_seq_len = lmp.util.suggest_max_seq_len(...)
+    batch_size = lmp.util.suggest_batch_size(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import hashlib
+import json
+import math
+import os
+
+from typing import Dict
+from typing import List
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+import lmp.config
+import lmp.dataset
+import lmp.path
+import lmp.tokenizer
+
+from lmp.util._sequence_lengths import sequence_lengths
+
+# Percentiles recorded in profile.
+_PERCENTILES = (50, 90, 95, 99, 100)
+
+# Number of bytes of `torch.float32`.
+_FLOAT_SIZE = 4
+
+
+def _percentile(histogram: Dict[int, int], percentile: float) -> int:
+    r"""Smallest length which covers `percentile` percent of sequences."""
+    dataset_size = sum(histogram.values())
+    target = math.ceil(dataset_size * percentile / 100)
+    count = 0
+    for length in sorted(histogram):
+        count += histogram[length]
+        if count >= target:
+            return length
+
+    return 0
+
+
+def _fingerprint(
+        dataset: lmp.dataset.BaseDataset,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> str:
+    r"""Hash of dataset content and tokenizer settings and vocabulary.
+
+    Reading sequences is much cheaper than tokenizing them, so hashing the
+    whole dataset is still worth it for deciding whether cached lengths are
+    valid. Vocabulary captures tokenizer settings like `max_vocab` and
+    `min_count`.
+    """
+    sha1 = hashlib.sha1()
+    sha1.update(json.dumps(
+        {
+            'is_uncased': tokenizer.is_uncased,
+            'tokenizer_class': type(tokenizer).__name__,
+            'token_to_id': tokenizer.token_to_id,
+        },
+        ensure_ascii=False,
+        sort_keys=True
+    ).encode('utf-8'))
+
+    # Separate sequences by NUL so that boundaries are part of the hash.
+    for sequence in dataset:
+        sha1.update(sequence.encode('utf-8'))
+        sha1.update(b'\0')
+
+    return sha1.hexdigest()
+
+
+def profile_dataset(
+        dataset: lmp.dataset.BaseDataset,
+        experiment: str,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> Dict:
+    r"""Profile encoded sequence lengths of dataset.
+
+    Profile contains keys:
+
+    - `dataset_size`: Number of sequences.
+    - `fingerprint`: Hash of dataset content and tokenizer.
+    - `histogram`: List of `[length, count]` sorted by length.
+    - `max_length`: Longest encoded length.
+    - `mean_length`: Average encoded length.
+    - `percentiles`: Mapping from percentile (`'50'`, `'90'`, `'95'`, `'99'`
+      and `'100'`) to smallest length covering that percent of sequences.
+    - `tokenizer_class`: Class name of `tokenizer`.
+    - `total_tokens`: Number of tokens in the whole dataset.
+
+    Encoded lengths include `[bos]` and `[eos]`. Profile is saved as
+    `profile.json` in experiment folder and reused as long as `fingerprint`
+    is unchanged, i.e. the same sequences are tokenized by the same class of
+    tokenizer with the same `is_uncased` and vocabulary. Encoded length of
+    each sequence is saved as `lengths.npy` along with profile, see
+    `lmp.util.cached_sequence_lengths`.
+
+    Args:
+        dataset:
+            Dataset to be profiled.
+        experiment:
+            Name of the current experiment. Must not be empty.
+        tokenizer:
+            Tokenizer for tokenizing sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `experiment` is empty.
+
+    Returns:
+        Profile of `dataset`.
+    """
+    # Type check.
+    if not isinstance(dataset, lmp.dataset.BaseDataset):
+        raise TypeError(
+            '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+        )
+
+    if not isinstance(experiment, str):
+        raise TypeError('`experiment` must be an instance of `str`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    # Value check.
+    if not experiment:
+        raise ValueError('`experiment` must not be empty.')
+
+    file_dir = os.path.join(lmp.path.DATA_PATH, experiment)
+    file_path = os.path.join(file_dir, 'profile.json')
+    lengths_path = os.path.join(file_dir, 'lengths.npy')
+
+    fingerprint = _fingerprint(dataset=dataset, tokenizer=tokenizer)
+
+    # Reuse profile of the same dataset and tokenizer.
+    if os.path.exists(file_path) and os.path.exists(lengths_path):
+        with open(file_path, 'r', encoding='utf-8') as input_file:
+            profile = json.load(input_file)
+
+        if profile.get('fingerprint') == fingerprint:
+            return profile
+
+    lengths = sequence_lengths(dataset=dataset, tokenizer=tokenizer)
+    histogram = collections.Counter(lengths)
+    total_tokens = sum(lengths)
+
+    profile = {
+        'dataset_size': len(lengths),
+        'fingerprint': fingerprint,
+        'histogram': [
+            [length, histogram[length]]
+            for length in sorted(histogram)
+        ],
+        'max_length': max(lengths, default=0),
+        'mean_length': total_tokens / len(lengths) if lengths else 0.0,
+        'percentiles': {
+            str(percentile): _percentile(histogram, percentile)
+            for percentile in _PERCENTILES
+        },
+        'tokenizer_class': type(tokenizer).__name__,
+        'total_tokens': total_tokens,
+    }
+
+    if not os.path.exists(file_dir):
+        os.makedirs(file_dir)
+
+    # Save lengths first so that profile never refers to missing lengths.
+    np.save(lengths_path, np.array(lengths, dtype=np.int64))
+
+    with open(file_path, 'w', encoding='utf-8') as output_file:
+        json.dump(profile, output_file, ensure_ascii=False)
+
+    return profile
+
+
+def cached_sequence_lengths(
+        dataset: lmp.dataset.BaseDataset,
+        experiment: str,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> List[int]:
+    r"""Encoded length of each sequence in dataset, cached with profile.
+
+    Same as `lmp.util.sequence_lengths`, but lengths are only computed when
+    `lmp.util.profile_dataset` cannot reuse profile of experiment. Thus
+    resuming training does not tokenize the whole dataset again.
+
+    Args:
+        dataset:
+            Dataset to be measured.
+        experiment:
+            Name of the experiment where profile and lengths are saved.
+        tokenizer:
+            Tokenizer for tokenizing sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments is not an instance of its type
+            annotation.
+        ValueError:
+            When `experiment` is empty.
+
+    Returns:
+        Encoded length of each sequence, including `[bos]` and `[eos]`.
+    """
+    # Type and value check are done by `profile_dataset`.
+    profile_dataset(
+        dataset=dataset,
+        experiment=experiment,
+        tokenizer=tokenizer
+    )
+
+    return np.load(
+        os.path.join(lmp.path.DATA_PATH, experiment, 'lengths.npy')
+    ).tolist()
+
+
+def profile_dataset_by_config(
+        config: lmp.config.BaseConfig,
+        dataset: lmp.dataset.BaseDataset,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> Dict:
+    r"""Profile encoded sequence lengths of dataset.
+
+    Args:
+        config:
+            Configuration object with attribute `experiment`.
+        dataset:
+            Dataset to be profiled.
+        tokenizer:
+            Tokenizer for tokenizing sequences.
+
+    Raises:
+        TypeError:
+            When `config` is not an instance of `lmp.config.BaseConfig`.
+
+    Returns:
+        Same as `lmp.util.profile_dataset`.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return profile_dataset(
+        dataset=dataset,
+        experiment=config.experiment,
+        tokenizer=tokenizer
+    )
+
+
+def suggest_max_seq_len(
+        percentile: Union[float, int],
+        profile: Dict
+) -> int:
+    r"""Suggest `max_seq_len` which covers `percentile` percent of sequences.
+
+    Args:
+        percentile:
+            Percent of sequences which must not be truncated. Must be bigger
+            than `0` and smaller than or equal to `100`.
+        profile:
+            Dataset profile returned by `lmp.util.profile_dataset`.
+
+    Raises:
+        TypeError:
+            When `percentile` is not an instance of `Union[float, int]` or
+            `profile` is not an instance of `dict`.
+        ValueError:
+            When `percentile` is not in range `(0, 100]`.
+
+    Returns:
+        Smallest `max_seq_len` covering `percentile` percent of sequences.
+        Always bigger than `1`.
+    """
+    # Type check.
+    if not isinstance(percentile, (float, int)):
+        raise TypeError(
+            '`percentile` must be an instance of `Union[float, int]`.'
+        )
+
+    if not isinstance(profile, dict):
+        raise TypeError('`profile` must be an instance of `dict`.')
+
+    # Value check.
+    if not 0 < percentile <= 100:
+        raise ValueError('`percentile` must be in range `(0, 100]`.')
+
+    histogram = {length: count for length, count in profile['histogram']}
+
+    # `max_seq_len` must be bigger than `1`.
+    return max(2, _percentile(histogram, percentile))
+
+
+def suggest_batch_size(
+        d_emb: int,
+        d_hid: int,
+        max_seq_len: int,
+        memory_budget: int,
+        num_linear_layers: int,
+        num_rnn_layers: int,
+        vocab_size: int
+) -> int:
+    r"""Suggest largest `batch_size` fitting in memory budget.
+
+    Memory usage is a rough upper bound assuming `torch.float32` parameters
+    of LSTM layers trained by Adam. Parameters, gradients and two moment
+    estimations are kept for every parameter. Every token in a mini-batch
+    keeps embedding, hidden states, LSTM gates and three copies of vocabulary
+    sized logits (logits, softmax and its gradient) for backward pass.
+
+    Args:
+        d_emb:
+            Embedding dimension. Must be bigger than or equal to `1`.
+        d_hid:
+            Hidden dimension. Must be bigger than or equal to `1`.
+        max_seq_len:
+            Encoded length of each sequence. Must be bigger than `1`.
+        memory_budget:
+            Available memory in bytes. Must be bigger than or equal to `1`.
+        num_linear_layers:
+            Number of Linear layers. Must be bigger than or equal to `1`.
+        num_rnn_layers:
+            Number of RNN layers. Must be bigger than or equal to `1`.
+        vocab_size:
+            Vocabulary size. Must be bigger than or equal to `1`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of `int`.
+        ValueError:
+            When one of the arguments do not follow their constraints or
+            `memory_budget` cannot fit a single sequence.
+
+    Returns:
+        Largest batch size fitting in `memory_budget`.
+    """
+    # Type check.
+    if not isinstance(d_emb, int):
+        raise TypeError('`d_emb` must be an instance of `int`.')
+
+    if not isinstance(d_hid, int):
+        raise TypeError('`d_hid` must be an instance of `int`.')
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(memory_budget, int):
+        raise TypeError('`memory_budget` must be an instance of `int`.')
+
+    if not isinstance(num_linear_layers, int):
+        raise TypeError('`num_linear_layers` must be an instance of `int`.')
+
+    if not isinstance(num_rnn_layers, int):
+        raise TypeError('`num_rnn_layers` must be an instance of `int`.')
+
+    if not isinstance(vocab_size, int):
+        raise TypeError('`vocab_size` must be an instance of `int`.')
+
+    # Value check.
+    if d_emb < 1:
+        raise ValueError('`d_emb` must be bigger than or equal to `1`.')
+
+    if d_hid < 1:
+        raise ValueError('`d_hid` must be bigger than or equal to `1`.')
+
+    if max_seq_len <= 1:
+        raise ValueError('`max_seq_len` must be bigger than `1`.')
+
+    if memory_budget < 1:
+        raise ValueError(
+            '`memory_budget` must be bigger than or equal to `1`.'
+        )
+
+    if num_linear_layers < 1:
+        raise ValueError(
+            '`num_linear_layers` must be bigger than or equal to `1`.'
+        )
+
+    if num_rnn_layers < 1:
+        raise ValueError(
+            '`num_rnn_layers` must be bigger than or equal to `1`.'
+        )
+
+    if vocab_size < 1:
+        raise ValueError('`vocab_size` must be bigger than or equal to `1`.')
+
+    # Embedding, projections, LSTM layers and linear layers.
+    num_params = (
+        vocab_size * d_emb
+        + (d_emb + 1) * d_hid
+        + num_rnn_layers * 4 * (2 * d_hid + 2) * d_hid
+        + (num_linear_layers - 1) * (d_hid + 1) * d_hid
+        + (d_hid + 1) * d_emb
+    )
+
+    # Activations kept for backward pass of each token.
+    num_activations = (
+        3 * d_emb
+        + 2 * d_hid
+        + num_rnn_layers * 6 * d_hid
+        + (num_linear_layers - 1) * 2 * d_hid
+        + 3 * vocab_size
+    )
+
+    # Parameters, gradients and Adam's two moment estimations.
+    static_memory = 4 * num_params * _FLOAT_SIZE
+    sequence_memory = num_activations * max_seq_len * _FLOAT_SIZE
+    batch_size = (memory_budget - static_memory) // sequence_memory
+
+    if batch_size < 1:
+        raise ValueError(
+            '`memory_budget` is too small to fit a single sequence.'
+        )
+
+    return batch_size
@@ -0,0 +1,416 @@
+r"""Helper function for sequences generation by sampling.
+
+Usage:
+    import lmp.util
+
+    generated = lmp.util.sample_sequence(...)
+    generated = lmp.util.sample_sequence_by_config(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+
+from typing import List
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+import lmp.config
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._encode_prompts import encode_prompts
+
+
+@torch.no_grad()
+def sample_sequence(
+        begin_of_sequences: List[str],
+        device: torch.device,
+        generator: Optional[torch.Generator],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_samples: int,
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Sequences generation for multiple prompts by sampling.
+
+    Each prompt is sampled `num_samples` times. Prompts are packed and
+    encoded together only once by `lmp.util.encode_prompts`, resuming from
+    the longest cached prefix of each prompt when `prefix_cache` is given.
+    Then all unfinished samples of all prompts are advanced together by a
+    single model call in each step. Next token of each sample is drawn from
+    the model distribution divided by `temperature`, restricted to the
+    `top_k` most probable tokens and then to the smallest set of tokens whose
+    cumulative probability reaches `top_p` (nucleus sampling). A sample is
+    finished once it generates `[eos]` or reaches `max_seq_len`, and finished
+    samples are removed from the batch.
+    `[pad]` is never sampled.
+
+    Args:
+        begin_of_sequences:
+            Begining of sequences which model will auto-complete. Must not be
+            empty.
+        device:
+            Model running device.
+        generator:
+            Pseudo random number generator on `device` used for sampling. Use
+            `None` to use global random state.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        num_samples:
+            Number of sequences to sample for each prompt. Must be bigger
+            than or equal to `1`.
+        temperature:
+            Softmax temperature. Must be bigger than `0.0`. Lower temperature
+            makes sampling more greedy.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most probable tokens. Must be bigger than
+            or equal to `0`. Set to `0` to disable top-k filtering.
+        top_p:
+            Only sample from most probable tokens whose cumulative probability
+            reaches `top_p`. Must satisfy `0.0 < top_p <= 1.0`. Set to `1.0`
+            to disable nucleus filtering.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode all prompts from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Sampled sequences of each prompt.
+    """
+    # Type check.
+    if not isinstance(begin_of_sequences, list) or not all(map(
+            lambda sequence: isinstance(sequence, str),
+            begin_of_sequences
+    )):
+        raise TypeError(
+            '`begin_of_sequences` must be an instance of `List[str]`.'
+        )
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if generator is not None and not isinstance(generator, torch.Generator):
+        raise TypeError(
+            '`generator` must be an instance of '
+            '`Optional[torch.Generator]`.'
+        )
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(num_samples, int):
+        raise TypeError('`num_samples` must be an instance of `int`.')
+
+    if not isinstance(temperature, float):
+        raise TypeError('`temperature` must be an instance of `float`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if not isinstance(top_k, int):
+        raise TypeError('`top_k` must be an instance of `int`.')
+
+    if not isinstance(top_p, float):
+        raise TypeError('`top_p` must be an instance of `float`.')
+
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            lmp.model.PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.model.PrefixStateCache]`.'
+        )
+
+    # Value check.
+    if not begin_of_sequences:
+        raise ValueError('`begin_of_sequences` must not be empty.')
+
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    if num_samples < 1:
+        raise ValueError('`num_samples` must be bigger than or equal to `1`.')
+
+    if not temperature > 0.0 or math.isinf(temperature):
+        raise ValueError('`temperature` must be bigger than `0.0`.')
+
+    if top_k < 0:
+        raise ValueError('`top_k` must be bigger than or equal to `0`.')
+
+    if not 0.0 < top_p <= 1.0:
+        raise ValueError('`top_p` must satisfy `0.0 < top_p <= 1.0`.')
+
+    # Evaluation mode.
+    model.eval()
+
+    eos_token_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+    pad_token_id = model.emb_layer.padding_idx
+
+    # Encode sequences. Remove `[eos]` since we are using begin of sentence.
+    prompts = [
+        tokenizer.encode(sequence, max_seq_len=-1)[:-1]
+        for sequence in begin_of_sequences
+    ]
+
+    # Length of each prompt with shape (P).
+    prompt_lengths = torch.LongTensor([len(prompt) for prompt in prompts])
+
+    # Number of tokens each sample can generate with shape (P x K), where
+    # `K` is `num_samples`.
+    max_new_tokens = (max_seq_len - prompt_lengths).clamp(min=0)
+    max_new_tokens = max_new_tokens.repeat_interleave(num_samples).tolist()
+
+    # Generated tokens of each sample.
+    generated = [[] for _ in max_new_tokens]
+
+    # Samples which are still generating.
+    active = [
+        index
+        for index, num_tokens in enumerate(max_new_tokens)
+        if num_tokens > 0
+    ]
+
+    if active:
+        # Encode all prompts only once. Only last token's prediction of each
+        # prompt is needed, and is shared by all samples of the same prompt.
+        # Model prediction has shape (A, V), where `A` is number of active
+        # samples.
+        logits, state = encode_prompts(
+            device=device,
+            model=model,
+            prefix_cache=prefix_cache,
+            prompts=prompts
+        )
+        prompt_index = (torch.LongTensor(active) // num_samples).to(device)
+        logits = logits[prompt_index]
+        state = state[prompt_index]
+
+    while active:
+        # Sample next token of each active sample with shape (A).
+        token = _sample_token(
+            generator=generator,
+            logits=logits,
+            pad_token_id=pad_token_id,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p
+        ).tolist()
+
+        # Remove samples which generate `[eos]` or reach `max_seq_len`.
+        keep = []
+        for row, (index, token_id) in enumerate(zip(active, token)):
+            generated[index].append(token_id)
+            if (
+                    token_id != eos_token_id and
+                    len(generated[index]) < max_new_tokens[index]
+            ):
+                keep.append(row)
+
+        if not keep:
+            break
+
+        active = [active[row] for row in keep]
+        keep = torch.LongTensor(keep).to(device)
+        token = torch.LongTensor(token).to(device)
+
+        # Feed generated tokens of active samples only.
+        # Model prediction has shape (A, 1, V).
+        logits, state = model.forward_step(
+            token[keep].reshape(-1, 1),
+            state[keep]
+        )
+        logits = logits[:, -1]
+
+    batch_sequences = []
+    for prompt_index, prompt in enumerate(prompts):
+        start = prompt_index * num_samples
+        batch_sequences.append(tokenizer.batch_decode([
+            prompt + seq
+            for seq in generated[start:start + num_samples]
+        ]))
+
+    return batch_sequences
+
+
+def _sample_token(
+        generator: Optional[torch.Generator],
+        logits: torch.Tensor,
+        pad_token_id: int,
+        temperature: float,
+        top_k: int,
+        top_p: float
+) -> torch.Tensor:
+    r"""Sample one token for each row with temperature, top-k and top-p.
+
+    Args:
+        generator:
+            Pseudo random number generator.
+        logits:
+            Model prediction with shape `(A, V)`.
+        pad_token_id:
+            Padding token id which is never sampled.
+        temperature:
+            Softmax temperature.
+        top_k:
+            Number of most probable tokens to keep. `0` keeps all tokens.
+        top_p:
+            Cumulative probability of most probable tokens to keep.
+
+    Returns:
+        Sampled token ids with shape `(A)`.
+    """
+    logits = logits / temperature
+    logits[:, pad_token_id] = -math.inf
+
+    if 0 < top_k < logits.size(-1):
+        # Keep exactly `top_k` tokens even if some of them are tied.
+        top_logits, top_index = logits.topk(k=top_k, dim=-1)
+        logits = torch.full_like(logits, -math.inf).scatter(
+            1,
+            top_index,
+            top_logits
+        )
+
+    if top_p < 1.0:
+        sorted_logits, sorted_index = logits.sort(dim=-1, descending=True)
+        sorted_probs = torch.nn.functional.softmax(sorted_logits, dim=-1)
+
+        # Remove tokens once cumulative probability of more probable tokens
+        # reaches `top_p`. The most probable token is always kept.
+        is_removed = sorted_probs.cumsum(dim=-1) - sorted_probs >= top_p
+        is_removed[:, 0] = False
+        logits = logits.scatter(
+            1,
+            sorted_index,
+            sorted_logits.masked_fill(is_removed, -math.inf)
+        )
+
+    probs = torch.nn.functional.softmax(logits, dim=-1)
+
+    return torch.multinomial(
+        probs,
+        num_samples=1,
+        generator=generator
+    ).reshape(-1)
+
+
+def sample_sequence_by_config(
+        begin_of_sequences: List[str],
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_samples: int,
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> List[List[str]]:
+    r"""Helper function for sequences generation by sampling.
+
+    Sampling is reproducible since pseudo random number generator is seeded
+    with `config.seed`.
+
+    Args:
+        begin_of_sequences:
+            Begining of sequences which model will auto-complete. Must not be
+            empty.
+        config:
+            Configuration object with attributes `device` and `seed`.
+        max_seq_len:
+            Maximum of output sequences length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        num_samples:
+            Number of sequences to sample for each prompt. Must be bigger
+            than or equal to `1`.
+        temperature:
+            Softmax temperature. Must be bigger than `0.0`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most probable tokens. Must be bigger than
+            or equal to `0`.
+        top_p:
+            Only sample from most probable tokens whose cumulative probability
+            reaches `top_p`. Must satisfy `0.0 < top_p <= 1.0`.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode all prompts from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Sampled sequences of each prompt.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    generator = torch.Generator(device=config.device)
+    generator.manual_seed(config.seed)
+
+    return sample_sequence(
+        begin_of_sequences=begin_of_sequences,
+        device=config.device,
+        generator=generator,
+        max_seq_len=max_seq_len,
+        model=model,
+        num_samples=num_samples,
+        prefix_cache=prefix_cache,
+        temperature=temperature,
+        tokenizer=tokenizer,
+        top_k=top_k,
+        top_p=top_p
+    )
@@ -0,0 +1,229 @@
+r"""Helper function for scoring and pruning dataset by perplexity.
+
+Usage:
+    import lmp.util
+
+    scores = lmp.util.score_dataset(...)
+    indices = lmp.util.prune_by_scores(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+import torch.nn.functional
+
+from tqdm import tqdm
+
+# self-made modules
+
+import lmp.dataset
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._sequence_lengths import sequence_lengths
+
+
+@torch.no_grad()
+def score_dataset(
+        batch_size: int,
+        dataset: lmp.dataset.BaseDataset,
+        device: torch.device,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> np.ndarray:
+    r"""Calculate perplexity of each sequence in dataset.
+
+    Sequences are sorted by encoded length and evaluated in mini-batches
+    padded to their longest sequence. Padding tokens are excluded, so score of
+    each sequence is identical to evaluating it alone.
+
+    Args:
+        batch_size:
+            Number of sequences evaluated together. Must be bigger than or
+            equal to `1`.
+        dataset:
+            Dataset to be scored.
+        device:
+            Model running device.
+        max_seq_len:
+            Maximum encoded sequence length. Must be greater than `1` or equal
+            to `-1`.
+        model:
+            Language model.
+        tokenizer:
+            Tokenizer for encoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Perplexity of each sequence in `dataset` with numeric type `float32`.
+    """
+    # Type check.
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if not isinstance(dataset, lmp.dataset.BaseDataset):
+        raise TypeError(
+            '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+        )
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    # `max_seq_len` and `tokenizer` are checked by `create_collate_fn`.
+    collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+        tokenizer=tokenizer,
+        max_seq_len=max_seq_len,
+        is_dynamic_pad=True
+    )
+
+    # Sequences with similar lengths are evaluated together to reduce
+    # padding.
+    order = np.argsort(
+        sequence_lengths(dataset=dataset, tokenizer=tokenizer),
+        kind='stable'
+    )
+
+    model.eval()
+
+    pad_token_id = model.emb_layer.padding_idx
+    scores = np.zeros(len(dataset), dtype=np.float32)
+
+    for start in tqdm(
+            range(0, len(order), batch_size),
+            desc='Scoring sequences'
+    ):
+        batch_indices = order[start:start + batch_size]
+
+        # Padding tokens are skipped by model.
+        # x.size = (B, S)
+        # y.size = (N)
+        x, y = collate_fn([dataset[int(index)] for index in batch_indices])
+        mask = y != pad_token_id
+        batch_lengths = mask.sum(dim=1)
+        x = x.to(device)
+        y = y[mask].to(device)
+
+        # pred_y_logits.size = (N, V)
+        pred_y_logits = model(x, batch_lengths=batch_lengths)
+
+        # Sum negative log-likelihood of tokens in each sequence.
+        # nll.size = (B)
+        nll = torch.zeros(len(batch_indices), device=device).index_add_(
+            0,
+            torch.repeat_interleave(
+                torch.arange(len(batch_indices)),
+                batch_lengths
+            ).to(device),
+            torch.nn.functional.cross_entropy(
+                pred_y_logits,
+                y,
+                reduction='none'
+            )
+        )
+
+        scores[batch_indices] = (
+            (nll / batch_lengths.to(device)).exp().cpu().numpy()
+        )
+
+    return scores
+
+
+def prune_by_scores(
+        lower_percentile: float,
+        scores: np.ndarray,
+        upper_percentile: float
+) -> np.ndarray:
+    r"""Find indices of sequences with scores inside percentile range.
+
+    Sequences with scores lower than `lower_percentile`-th percentile (too
+    easy) or higher than `upper_percentile`-th percentile (likely garbage) are
+    pruned. Non-finite scores are always pruned.
+
+    Args:
+        lower_percentile:
+            Lower percentile threshold. Must range from `0.0` to `100.0`.
+        scores:
+            Score of each sequence, for example created by
+            `lmp.util.score_dataset`. Must be an 1-D array.
+        upper_percentile:
+            Upper percentile threshold. Must range from `lower_percentile` to
+            `100.0`.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Ascending indices of kept sequences with numeric type `int64`.
+    """
+    # Type check.
+    if not isinstance(lower_percentile, float):
+        raise TypeError('`lower_percentile` must be an instance of `float`.')
+
+    if not isinstance(scores, np.ndarray) or scores.ndim != 1:
+        raise TypeError('`scores` must be an 1-D instance of `np.ndarray`.')
+
+    if not isinstance(upper_percentile, float):
+        raise TypeError('`upper_percentile` must be an instance of `float`.')
+
+    # Value check.
+    if not 0.0 <= lower_percentile <= 100.0:
+        raise ValueError(
+            '`lower_percentile` must range from `0.0` to `100.0`.'
+        )
+
+    if not lower_percentile <= upper_percentile <= 100.0:
+        raise ValueError(
+            '`upper_percentile` must range from `lower_percentile` to '
+            '`100.0`.'
+        )
+
+    is_finite = np.isfinite(scores)
+    if not is_finite.any():
+        return np.zeros(0, dtype=np.int64)
+
+    lower, upper = np.percentile(
+        scores[is_finite],
+        [lower_percentile, upper_percentile]
+    )
+
+    return np.flatnonzero(
+        is_finite &
+        (scores >= lower) &
+        (scores <= upper)
+    ).astype(np.int64)
@@ -0,0 +1,67 @@
+r"""Helper function for calculating encoded sequence lengths.
+
+Usage:
+    import lmp.util
+
+    batch_lengths = lmp.util.sequence_lengths(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Iterable
+from typing import List
+
+# 3rd-party modules
+
+from tqdm import tqdm
+
+# self-made modules
+
+import lmp.tokenizer
+
+
+def sequence_lengths(
+        dataset: Iterable[str],
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> List[int]:
+    r"""Calculate encoded length of each sequence in dataset.
+
+    Encoded length include `[bos]` and `[eos]` and is not truncated. Only
+    tokenization is performed, no token is converted into id.
+
+    Args:
+        dataset:
+            Sequences to be measured.
+        tokenizer:
+            Tokenizer for tokenizing sequences.
+
+    Raises:
+        TypeError:
+            When `dataset` is not an instance of `Iterable[str]` or `tokenizer`
+            is not an instance of `lmp.tokenizer.BaseTokenizer`.
+
+    Returns:
+        Encoded length of each sequence in `dataset`.
+    """
+    # Type check.
+    if not isinstance(dataset, Iterable):
+        raise TypeError('`dataset` must be an instance of `Iterable[str]`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    try:
+        # `+ 2` for `[bos]` and `[eos]`.
+        return [
+            len(tokenizer.tokenize(sequence)) + 2
+            for sequence in tqdm(dataset, desc='Calculating lengths')
+        ]
+    except TypeError:
+        raise TypeError('`dataset` must be an instance of `Iterable[str]`.')
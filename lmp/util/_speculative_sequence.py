@@ -0,0 +1,297 @@
+r"""Helper function for greedy sequence generation by speculative decoding.
+
+Usage:
+    import lmp.util
+
+    generated = lmp.util.speculative_generate_sequence(...)
+    generated = lmp.util.speculative_generate_sequence_by_config(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._encode_prompts import encode_prompts
+
+
+@torch.no_grad()
+def speculative_generate_sequence(
+        begin_of_sequence: str,
+        device: torch.device,
+        draft_model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_draft_tokens: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> str:
+    r"""Greedy sequence generation accelerated by a draft model.
+
+    In each round, `draft_model` greedily proposes `num_draft_tokens` tokens
+    one by one. Then `model` verifies all proposals in a single call: the
+    last token followed by all proposals is fed as one row of
+    `num_draft_tokens + 1` tokens, so `model` prediction after each prefix of
+    proposals is obtained together. The longest prefix of proposals agreeing
+    with `model` predictions is accepted, followed by the prediction of
+    `model` after that prefix. When some proposals are rejected, only the
+    accepted tokens are fed again to get `model` hidden state after them.
+    Thus each round generates at least one token while `model` is fed at
+    most `2 * (num_draft_tokens + 1)` tokens, and the generated sequence is
+    identical to greedy decoding with `model` alone.
+
+    Generation stops once `[eos]` is generated or sequence reaches
+    `max_seq_len`. `draft_model` and `model` must share the same tokenizer.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        device:
+            Models running device.
+        draft_model:
+            Small language model which proposes tokens.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model whose greedy decoding is reproduced.
+        num_draft_tokens:
+            Number of tokens proposed by `draft_model` in each round. Must be
+            bigger than or equal to `1`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequence.
+    """
+    # Type check.
+    if not isinstance(begin_of_sequence, str):
+        raise TypeError('`begin_of_sequence` must be an instance of `str`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(draft_model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`draft_model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(num_draft_tokens, int):
+        raise TypeError('`num_draft_tokens` must be an instance of `int`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    # Value check.
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    if num_draft_tokens < 1:
+        raise ValueError(
+            '`num_draft_tokens` must be bigger than or equal to `1`.'
+        )
+
+    if (
+            draft_model.emb_layer.num_embeddings !=
+            model.emb_layer.num_embeddings or
+            draft_model.emb_layer.padding_idx != model.emb_layer.padding_idx
+    ):
+        raise ValueError(
+            '`draft_model` and `model` must share the same tokenizer.'
+        )
+
+    # Evaluation mode.
+    draft_model.eval()
+    model.eval()
+
+    eos_token_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+
+    # Encode sequence. Remove `[eos]` since we are using begin of sentence.
+    token_ids = tokenizer.encode(begin_of_sequence, max_seq_len=-1)[:-1]
+
+    if len(token_ids) >= max_seq_len:
+        return tokenizer.decode(token_ids)
+
+    # Hidden states of both models always cover all tokens but the last one,
+    # which is fed at the beginning of each round.
+    states = []
+    for rnn_model in [draft_model, model]:
+        if len(token_ids) > 1:
+            _, state = encode_prompts(
+                device=device,
+                model=rnn_model,
+                prefix_cache=None,
+                prompts=[token_ids[:-1]]
+            )
+        else:
+            state = rnn_model.init_state(batch_size=1)
+        states.append(state)
+
+    draft_state, state = states
+
+    while True:
+        # At most `max_seq_len` tokens including the token from `model`.
+        num_drafts = min(num_draft_tokens, max_seq_len - len(token_ids) - 1)
+
+        # Greedily propose tokens with draft model. Keep draft hidden state
+        # after each fed token for rolling back rejected proposals.
+        drafts = []
+        draft_states = []
+        token_id = token_ids[-1]
+        for _ in range(num_drafts):
+            # Draft model prediction has shape (1, 1, V).
+            draft_logits, draft_state = draft_model.forward_step(
+                torch.LongTensor([[token_id]]).to(device),
+                draft_state
+            )
+            draft_states.append(draft_state)
+            token_id = draft_logits[0, -1].argmax().item()
+            drafts.append(token_id)
+
+        # The last token followed by all proposals, with shape (1, R) where
+        # `R = num_drafts + 1`.
+        rows = [token_ids[-1]] + drafts
+
+        # Model prediction has shape (1, R, V). Prediction at position `r` is
+        # the one after first `r` proposals.
+        logits, row_state = model.forward_step(
+            torch.LongTensor([rows]).to(device),
+            state
+        )
+        predictions = logits[0].argmax(dim=-1).tolist()
+
+        # Accept the longest prefix of proposals agreeing with model.
+        num_accepted = 0
+        while (
+                num_accepted < num_drafts and
+                drafts[num_accepted] == predictions[num_accepted]
+        ):
+            num_accepted += 1
+
+        accepted = drafts[:num_accepted] + [predictions[num_accepted]]
+
+        # Stop right after `[eos]`.
+        if eos_token_id in accepted:
+            accepted = accepted[:accepted.index(eos_token_id) + 1]
+
+        token_ids.extend(accepted)
+
+        if token_ids[-1] == eos_token_id or len(token_ids) >= max_seq_len:
+            break
+
+        # Roll back hidden states to cover all accepted tokens but the last.
+        # Hidden state after the whole row is only valid when all proposals
+        # are accepted, otherwise accepted prefix is fed again.
+        if num_accepted < num_drafts:
+            _, state = model.forward_step(
+                torch.LongTensor([rows[:num_accepted + 1]]).to(device),
+                state
+            )
+            draft_state = draft_states[num_accepted]
+        else:
+            # The last proposal, or the last token when nothing is proposed,
+            # is not fed to draft model yet.
+            state = row_state
+            _, draft_state = draft_model.forward_step(
+                torch.LongTensor([[rows[-1]]]).to(device),
+                draft_state
+            )
+
+    return tokenizer.decode(token_ids)
+
+
+def speculative_generate_sequence_by_config(
+        begin_of_sequence: str,
+        config: lmp.config.BaseConfig,
+        draft_model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        num_draft_tokens: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> str:
+    r"""Helper function for greedy sequence generation by speculative decoding.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        config:
+            Configuration object with attribute `device`.
+        draft_model:
+            Small language model which proposes tokens.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model whose greedy decoding is reproduced.
+        num_draft_tokens:
+            Number of tokens proposed by `draft_model` in each round. Must be
+            bigger than or equal to `1`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Generated sequence.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    return speculative_generate_sequence(
+        begin_of_sequence=begin_of_sequence,
+        device=config.device,
+        draft_model=draft_model,
+        max_seq_len=max_seq_len,
+        model=model,
+        num_draft_tokens=num_draft_tokens,
+        tokenizer=tokenizer
+    )
@@ -0,0 +1,448 @@
+r"""Helper function for streaming sequence generation token by token.
+
+Usage:
+    import lmp.util
+
+    for token_id, sequence in lmp.util.stream_sequence(...):
+        ...
+
+    async for token_id, sequence in lmp.util.async_stream_sequence(...):
+        ...
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import concurrent.futures
+import math
+
+from typing import AsyncIterator
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._encode_prompts import encode_prompts
+from lmp.util._sample_sequence import _sample_token
+
+
+def stream_sequence(
+        begin_of_sequence: str,
+        device: torch.device,
+        generator: Optional[torch.Generator],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> Iterator[Tuple[int, str]]:
+    r"""Generate sequence token by token and yield each step.
+
+    Prompt is encoded by a single model call, then each next token is drawn
+    the same way as `lmp.util.sample_sequence` and yielded right away, thus
+    time to first token is a single forward pass. Each step only decodes the
+    new token with the few tokens before it instead of the whole sequence.
+    Generation stops once `[eos]` is generated (and yielded) or sequence
+    reaches `max_seq_len`. Set `top_k` to `1` for greedy decoding.
+
+    Arguments are checked when this function is called, while the model runs
+    lazily as the returned iterator is consumed. Stopping iteration early
+    stops generation.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        device:
+            Model running device.
+        generator:
+            Pseudo random number generator on `device` used for sampling. Use
+            `None` to use global random state.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        temperature:
+            Softmax temperature. Must be bigger than `0.0`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most probable tokens. Must be bigger than
+            or equal to `0`. Set to `0` to disable top-k filtering.
+        top_p:
+            Only sample from most probable tokens whose cumulative probability
+            reaches `top_p`. Must satisfy `0.0 < top_p <= 1.0`.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode prompt from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Iterator yields generated token id and decoded sequence so far
+        (including prompt) after each step. Decoded sequence of each step
+        extends the one of previous step.
+    """
+    # Type check.
+    if not isinstance(begin_of_sequence, str):
+        raise TypeError('`begin_of_sequence` must be an instance of `str`.')
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if generator is not None and not isinstance(generator, torch.Generator):
+        raise TypeError(
+            '`generator` must be an instance of '
+            '`Optional[torch.Generator]`.'
+        )
+
+    if not isinstance(max_seq_len, int):
+        raise TypeError('`max_seq_len` must be an instance of `int`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    if not isinstance(temperature, float):
+        raise TypeError('`temperature` must be an instance of `float`.')
+
+    if not isinstance(tokenizer, lmp.tokenizer.BaseTokenizer):
+        raise TypeError(
+            '`tokenizer` must be an instance of '
+            '`lmp.tokenizer.BaseTokenizer`.'
+        )
+
+    if not isinstance(top_k, int):
+        raise TypeError('`top_k` must be an instance of `int`.')
+
+    if not isinstance(top_p, float):
+        raise TypeError('`top_p` must be an instance of `float`.')
+
+    if prefix_cache is not None and not isinstance(
+            prefix_cache,
+            lmp.model.PrefixStateCache
+    ):
+        raise TypeError(
+            '`prefix_cache` must be an instance of '
+            '`Optional[lmp.model.PrefixStateCache]`.'
+        )
+
+    # Value check.
+    if max_seq_len < 2:
+        raise ValueError('`max_seq_len` must be bigger than or equal to `2`.')
+
+    if not temperature > 0.0 or math.isinf(temperature):
+        raise ValueError('`temperature` must be bigger than `0.0`.')
+
+    if top_k < 0:
+        raise ValueError('`top_k` must be bigger than or equal to `0`.')
+
+    if not 0.0 < top_p <= 1.0:
+        raise ValueError('`top_p` must satisfy `0.0 < top_p <= 1.0`.')
+
+    # Encode sequence. Remove `[eos]` since we are using begin of sentence.
+    prompt = tokenizer.encode(begin_of_sequence, max_seq_len=-1)[:-1]
+
+    return _stream(
+        device=device,
+        generator=generator,
+        max_new_tokens=max_seq_len - len(prompt),
+        model=model,
+        prefix_cache=prefix_cache,
+        prompt=prompt,
+        temperature=temperature,
+        tokenizer=tokenizer,
+        top_k=top_k,
+        top_p=top_p
+    )
+
+
+def _stream(
+        device: torch.device,
+        generator: Optional[torch.Generator],
+        max_new_tokens: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        prefix_cache: Optional[lmp.model.PrefixStateCache],
+        prompt: List[int],
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float
+) -> Iterator[Tuple[int, str]]:
+    r"""Generate tokens after `prompt` and yield each step.
+
+    Gradient is disabled only while model runs, so consumer code between
+    steps is not affected.
+    """
+    if max_new_tokens <= 0:
+        return
+
+    # Evaluation mode.
+    model.eval()
+
+    eos_token_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+    pad_token_id = model.emb_layer.padding_idx
+    token_ids = list(prompt)
+
+    # Decode incrementally. Tokens since `read_offset` have not produced
+    # text yet. They are decoded along with tokens since `prefix_offset`, so
+    # that separators and normalization between tokens are kept.
+    sequence = tokenizer.decode(token_ids)
+    prefix_offset = len(token_ids) - 1
+    read_offset = len(token_ids)
+
+    with torch.no_grad():
+        # Only last token's prediction of prompt is needed.
+        # Model prediction has shape (1, V).
+        logits, state = encode_prompts(
+            device=device,
+            model=model,
+            prefix_cache=prefix_cache,
+            prompts=[prompt]
+        )
+
+    for step in range(max_new_tokens):
+        with torch.no_grad():
+            # Sample next token with shape (1).
+            token = _sample_token(
+                generator=generator,
+                logits=logits,
+                pad_token_id=pad_token_id,
+                temperature=temperature,
+                top_k=top_k,
+                top_p=top_p
+            )
+
+        token_id = token.item()
+        token_ids.append(token_id)
+
+        prefix_text = tokenizer.decode(token_ids[prefix_offset:read_offset])
+        new_text = tokenizer.decode(token_ids[prefix_offset:])
+        if not new_text.startswith(prefix_text):
+            # New token changed earlier text, e.g. a combining character
+            # composed by normalization.
+            sequence = sequence[:len(sequence) - len(prefix_text)] + new_text
+            prefix_offset = read_offset
+            read_offset = len(token_ids)
+        elif len(new_text) > len(prefix_text):
+            sequence += new_text[len(prefix_text):]
+            prefix_offset = read_offset
+            read_offset = len(token_ids)
+
+        yield token_id, sequence
+
+        if token_id == eos_token_id or step + 1 == max_new_tokens:
+            return
+
+        with torch.no_grad():
+            # Model prediction has shape (1, 1, V).
+            logits, state = model.forward_step(token.reshape(1, 1), state)
+            logits = logits[:, -1]
+
+
+def stream_sequence_by_config(
+        begin_of_sequence: str,
+        config: lmp.config.BaseConfig,
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None
+) -> Iterator[Tuple[int, str]]:
+    r"""Helper function for streaming sequence generation.
+
+    Sampling is reproducible since pseudo random number generator is seeded
+    with `config.seed`.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        config:
+            Configuration object with attributes `device` and `seed`.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        temperature:
+            Softmax temperature. Must be bigger than `0.0`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most probable tokens. Must be bigger than
+            or equal to `0`.
+        top_p:
+            Only sample from most probable tokens whose cumulative probability
+            reaches `top_p`. Must satisfy `0.0 < top_p <= 1.0`.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode prompt from scratch.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Iterator yields generated token id and decoded sequence so far after
+        each step.
+    """
+    # Type check.
+    if not isinstance(config, lmp.config.BaseConfig):
+        raise TypeError(
+            '`config` must be an instance of `lmp.config.BaseConfig`.'
+        )
+
+    generator = torch.Generator(device=config.device)
+    generator.manual_seed(config.seed)
+
+    return stream_sequence(
+        begin_of_sequence=begin_of_sequence,
+        device=config.device,
+        generator=generator,
+        max_seq_len=max_seq_len,
+        model=model,
+        prefix_cache=prefix_cache,
+        temperature=temperature,
+        tokenizer=tokenizer,
+        top_k=top_k,
+        top_p=top_p
+    )
+
+
+def async_stream_sequence(
+        begin_of_sequence: str,
+        device: torch.device,
+        generator: Optional[torch.Generator],
+        max_seq_len: int,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        temperature: float,
+        tokenizer: lmp.tokenizer.BaseTokenizer,
+        top_k: int,
+        top_p: float,
+        prefix_cache: Optional[lmp.model.PrefixStateCache] = None,
+        executor: Optional[concurrent.futures.Executor] = None
+) -> AsyncIterator[Tuple[int, str]]:
+    r"""Asynchronous variant of `lmp.util.stream_sequence`.
+
+    Each generation step runs in `executor`, so the event loop keeps running
+    other tasks while model is running. Steps of the same sequence never run
+    concurrently.
+
+    Args:
+        begin_of_sequence:
+            Begining of sequence which model will auto-complete.
+        device:
+            Model running device.
+        generator:
+            Pseudo random number generator on `device` used for sampling. Use
+            `None` to use global random state.
+        max_seq_len:
+            Maximum of output sequence length. Must be bigger than or equal to
+            `2`.
+        model:
+            Language model.
+        temperature:
+            Softmax temperature. Must be bigger than `0.0`.
+        tokenizer:
+            Tokenizer for encoding and decoding sequences.
+        top_k:
+            Only sample from `top_k` most probable tokens. Must be bigger than
+            or equal to `0`.
+        top_p:
+            Only sample from most probable tokens whose cumulative probability
+            reaches `top_p`. Must satisfy `0.0 < top_p <= 1.0`.
+        prefix_cache:
+            Cache of hidden states after prompt prefixes. Set to `None` to
+            encode prompt from scratch.
+        executor:
+            Executor which runs generation steps. Use `None` to use default
+            executor of the event loop.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        Asynchronous iterator yields generated token id and decoded sequence
+        so far after each step.
+    """
+    # Type check.
+    if executor is not None and not isinstance(
+            executor,
+            concurrent.futures.Executor
+    ):
+        raise TypeError(
+            '`executor` must be an instance of '
+            '`Optional[concurrent.futures.Executor]`.'
+        )
+
+    return _async_iterate(
+        executor=executor,
+        iterator=stream_sequence(
+            begin_of_sequence=begin_of_sequence,
+            device=device,
+            generator=generator,
+            max_seq_len=max_seq_len,
+            model=model,
+            prefix_cache=prefix_cache,
+            temperature=temperature,
+            tokenizer=tokenizer,
+            top_k=top_k,
+            top_p=top_p
+        )
+    )
+
+
+async def _async_iterate(
+        executor: Optional[concurrent.futures.Executor],
+        iterator: Iterator[Tuple[int, str]]
+) -> AsyncIterator[Tuple[int, str]]:
+    r"""Advance `iterator` in `executor` and yield its items."""
+    loop = asyncio.get_running_loop()
+    end = object()
+
+    while True:
+        item = await loop.run_in_executor(executor, next, iterator, end)
+        if item is end:
+            return
+
+        yield item
@@ -14,9 +14,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import json
 import math
 import os
 
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # 3rd-party modules
@@ -37,6 +41,11 @@ import lmp.model
 import lmp.path
 import lmp.tokenizer
 
+from lmp.util._dataset import split_dataset
+from lmp.util._profile_dataset import cached_sequence_lengths
+from lmp.util._validate_model import encode_validation_batches
+from lmp.util._validate_model import validate_model
+
 
 def train_model(
         checkpoint: int,
@@ -48,11 +57,23 @@ def train_model(
         max_norm: float,
         model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
         optimizer: Union[torch.optim.SGD, torch.optim.Adam],
-        vocab_size: int
+        vocab_size: int,
+        val_batches: Optional[List[Tuple[torch.Tensor, torch.Tensor]]] = None
 ) -> None:
     r"""Helper function for training language model.
 
     Continue training from pre-trained checkpoint when `checkpoint != -1`.
+    When `data_loader` samples with `lmp.dataset.BaseBatchSampler`, sampling
+    position is saved as `sampler-{step}.json` along with each checkpoint, and
+    training resumes from exact same position without sampling any previous
+    mini-batch. Otherwise previous mini-batches are sampled and skipped.
+    When `val_batches` is given, validation perplexity is calculated at each
+    checkpoint (including the last one) and logged as `val_perplexity`.
+    When `data_loader` samples directly from `lmp.dataset.MixtureDataset`,
+    mixture offsets are drawn again on each epoch, unless mini-batches are
+    formed by `lmp.dataset.TokenBudgetBatchSampler` whose lengths depend on
+    the mapping from mixture indices to source sequences.
+    Padding tokens are skipped by model and excluded from loss.
 
     Args:
         checkpoint:
@@ -76,6 +97,10 @@ def train_model(
             Language model's optimizer.
         vocab_size:
             Number of classes to predict. Must be bigger than or equal to `1`.
+        val_batches:
+            Pre-encoded validation mini-batches created by
+            `lmp.util.encode_validation_batches`. No validation when set to
+            `None`. Must not be empty.
 
     Raises:
         TypeError:
@@ -128,6 +153,12 @@ def train_model(
     if not isinstance(vocab_size, int):
         raise TypeError('`vocab_size` must be an instance of `int`.')
 
+    if val_batches is not None and not isinstance(val_batches, list):
+        raise TypeError(
+            '`val_batches` must be an instance of '
+            '`List[Tuple[torch.Tensor, torch.Tensor]]`.'
+        )
+
     # Value check.
     if checkpoint < -1:
         raise ValueError('`checkpoint` must be bigger than or equal to `-1`.')
@@ -149,6 +180,9 @@ def train_model(
     if vocab_size < 1:
         raise ValueError('`vocab_size` must be bigger than or equal to `1`.')
 
+    if val_batches is not None and not val_batches:
+        raise ValueError('`val_batches` must not be empty.')
+
     # Set experiment output folder.
     file_dir = os.path.join(lmp.path.DATA_PATH, experiment)
     log_dir = os.path.join(lmp.path.DATA_PATH, 'log', experiment)
@@ -169,6 +203,42 @@ def train_model(
     # Every update must increment `step`.
     step = 0
 
+    # Epoch to start training from.
+    start_epoch = 0
+
+    # Sampling counters are recorded by mixture dataset even when only subset
+    # of it is used for training.
+    source_dataset = data_loader.dataset
+    while isinstance(source_dataset, lmp.dataset.SubsetDataset):
+        source_dataset = source_dataset.dataset
+
+    # Resumable batch sampler can skip directly to previous position.
+    batch_sampler = data_loader.batch_sampler
+    if not isinstance(batch_sampler, lmp.dataset.BaseBatchSampler):
+        batch_sampler = None
+
+    # Mixture dataset samples different sequences of down-weighted sources
+    # on each epoch. Offsets must stay fixed when held-out subset or token
+    # budget lengths are computed from mixture indices, otherwise held-out
+    # sequences come back into training and lengths belong to other
+    # sequences.
+    is_remix = (
+        isinstance(data_loader.dataset, lmp.dataset.MixtureDataset) and
+        not isinstance(batch_sampler, lmp.dataset.TokenBudgetBatchSampler)
+    )
+
+    sampler_path = os.path.join(file_dir, f'sampler-{checkpoint}.json')
+    if (
+            checkpoint != -1 and
+            batch_sampler is not None and
+            os.path.exists(sampler_path)
+    ):
+        with open(sampler_path, 'r', encoding='utf-8') as input_file:
+            batch_sampler.load_state_dict(json.load(input_file))
+
+        step = checkpoint
+        start_epoch = batch_sampler.epoch
+
     # Set model to train mode.
     model.train()
 
@@ -178,7 +248,19 @@ def train_model(
     # Initialize total loss.
     total_loss = 0.0
 
-    for cur_epoch in range(epoch):
+    for cur_epoch in range(start_epoch, epoch):
+        # Resumable batch sampler reshuffle mini-batches on each epoch. Resumed
+        # epoch must keep its sampling position.
+        if batch_sampler is not None and batch_sampler.epoch != cur_epoch:
+            batch_sampler.set_epoch(cur_epoch)
+
+        # Offsets follow sampler seed, so resumed epoch maps indices to the
+        # same sequences.
+        if is_remix:
+            source_dataset.set_epoch(
+                cur_epoch,
+                seed=None if batch_sampler is None else batch_sampler.seed
+            )
 
         epoch_iterator = tqdm(
             data_loader,
@@ -189,22 +271,33 @@ def train_model(
             # Increment step for each update.
             step += 1
 
-            # Continue training from previous checkpoint step.
+            # Continue training from previous checkpoint step. Only needed
+            # when sampling position cannot be restored.
             if step < checkpoint:
                 continue
 
-            # Put tensors on to specified device (CPU or GPU). Reshape `y` into
-            # shape (B x S) for cross-entropy.
+            # Padding tokens are only at the end of each sequence, thus number
+            # of non-padding target tokens is the length of each sequence.
+            # mask.size = (B, S)
+            # batch_lengths.size = (B)
+            mask = y != model.emb_layer.padding_idx
+            batch_lengths = mask.sum(dim=1)
+
+            # Log effective number of sequences and non-padding tokens in
+            # current mini-batch.
+            writer.add_scalar('batch_sequences', x.size(0), step)
+            writer.add_scalar('batch_tokens', int(batch_lengths.sum()), step)
+
+            # Put tensors on to specified device (CPU or GPU). Only targets of
+            # non-padding tokens are kept for cross-entropy.
             # x.size = (B, S)
-            # y.size = (B x S)
+            # y.size = (N)
             x = x.to(device)
-            y = y.reshape(-1).to(device)
-
-            # Forward pass.
-            # pred_y_logits.size = (B, S, V)
-            pred_y_logits = model(x)
+            y = y[mask].to(device)
 
-            # Reshape `pred_y_logits` into shape (B x S, V) for cross-entropy.
+            # Forward pass. Padding tokens are skipped by model.
+            # pred_y_logits.size = (N, V)
+            pred_y_logits = model(x, batch_lengths=batch_lengths)
             pred_y_logits = pred_y_logits.reshape(-1, vocab_size)
 
             # Perform cross-entropy.
@@ -232,19 +325,63 @@ def train_model(
 
             # Save checkpoint for each `checkpoint_step`.
             if step % checkpoint_step == 0:
-                torch.save(
-                    model.state_dict(),
-                    os.path.join(file_dir, f'model-{step}.pt')
-                )
-                torch.save(
-                    optimizer.state_dict(),
-                    os.path.join(file_dir, f'optimizer-{step}.pt')
+                _save_checkpoint(
+                    batch_sampler=batch_sampler,
+                    file_dir=file_dir,
+                    model=model,
+                    optimizer=optimizer,
+                    step=step
                 )
                 # Log average loss.
                 writer.add_scalar('loss', total_loss / checkpoint_step, step)
                 total_loss = 0.0
 
-    # Save last checkpoint.
+                # Log number of sampled sequences of each source.
+                if isinstance(source_dataset, lmp.dataset.MixtureDataset):
+                    for name, count in source_dataset.counters.items():
+                        writer.add_scalar(f'source/{name}', count, step)
+
+                # Log validation perplexity using current model.
+                if val_batches is not None:
+                    writer.add_scalar(
+                        'val_perplexity',
+                        validate_model(
+                            batches=val_batches,
+                            device=device,
+                            model=model
+                        ),
+                        step
+                    )
+
+    # Save last checkpoint. All epochs are finished, so resume from the start
+    # of next epoch.
+    if batch_sampler is not None:
+        batch_sampler.set_epoch(max(epoch, start_epoch))
+
+    _save_checkpoint(
+        batch_sampler=batch_sampler,
+        file_dir=file_dir,
+        model=model,
+        optimizer=optimizer,
+        step=step
+    )
+
+    if val_batches is not None and step % checkpoint_step != 0:
+        writer.add_scalar(
+            'val_perplexity',
+            validate_model(batches=val_batches, device=device, model=model),
+            step
+        )
+
+
+def _save_checkpoint(
+        batch_sampler: Optional[lmp.dataset.BaseBatchSampler],
+        file_dir: str,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel],
+        optimizer: Union[torch.optim.SGD, torch.optim.Adam],
+        step: int
+) -> None:
+    r"""Save model, optimizer and sampling position of `step`."""
     torch.save(
         model.state_dict(),
         os.path.join(file_dir, f'model-{step}.pt')
@@ -254,6 +391,14 @@ def train_model(
         os.path.join(file_dir, f'optimizer-{step}.pt')
     )
 
+    if batch_sampler is not None:
+        with open(
+                os.path.join(file_dir, f'sampler-{step}.json'),
+                'w',
+                encoding='utf-8'
+        ) as output_file:
+            json.dump(batch_sampler.state_dict(), output_file)
+
 
 def train_model_by_config(
         checkpoint: int,
@@ -266,6 +411,13 @@ def train_model_by_config(
     r"""Helper function for training language model.
 
     Continue training from pre-trained checkpoint when `checkpoint != -1`.
+    When `config.max_tokens != -1`, mini-batches are formed by
+    `lmp.dataset.TokenBudgetBatchSampler` and padded to the longest sequence
+    in each mini-batch. Sequence lengths are cached by
+    `lmp.util.cached_sequence_lengths`, so resuming does not tokenize the
+    whole dataset again. When `config.val_ratio != 0.0`, `dataset` is split by
+    `lmp.util.split_dataset` and the held-out subset is encoded once for
+    validation at each checkpoint.
 
     Args:
         checkpoint:
@@ -273,8 +425,8 @@ def train_model_by_config(
             `-1`.
         config:
             Configuration object with attributes `batch_size`,
-            `checkpoint_step`, `device`, `epoch`, `experiment`, `max_norm` and
-            `max_seq_len`.
+            `checkpoint_step`, `device`, `epoch`, `experiment`, `max_norm`,
+            `max_seq_len`, `max_tokens`, `seed` and `val_ratio`.
         dataset:
             Source of text samples to train on.
         model:
@@ -307,19 +459,75 @@ def train_model_by_config(
             '`tokenizer` must be an instance of `lmp.tokenizer.BaseTokenizer`.'
         )
 
-    # Create collate_fn for sampling.
-    collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
-        tokenizer=tokenizer,
-        max_seq_len=config.max_seq_len
-    )
+    # Lengths of the whole dataset are shared with dataset profile.
+    lengths = None
+    if config.max_tokens != -1:
+        lengths = cached_sequence_lengths(
+            dataset=dataset,
+            experiment=config.experiment,
+            tokenizer=tokenizer
+        )
 
-    # `torch` utility for sampling.
-    data_loader = torch.utils.data.DataLoader(
-        dataset,
-        batch_size=config.batch_size,
-        shuffle=True,
-        collate_fn=collate_fn
-    )
+    # Hold out validation set and encode it only once.
+    val_batches = None
+    if config.val_ratio != 0.0:
+        dataset, val_dataset = split_dataset(
+            dataset=dataset,
+            seed=config.seed,
+            val_ratio=config.val_ratio
+        )
+        if lengths is not None:
+            lengths = [lengths[index] for index in dataset.indices]
+        val_batches = encode_validation_batches(
+            batch_size=config.batch_size,
+            dataset=val_dataset,
+            max_seq_len=config.max_seq_len,
+            tokenizer=tokenizer
+        )
+
+    if config.max_tokens == -1:
+        # Create collate_fn for sampling.
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=config.max_seq_len
+        )
+
+        # Shuffle dataset with resumable sampling position.
+        batch_sampler = lmp.dataset.FixedSizeBatchSampler(
+            batch_size=config.batch_size,
+            dataset_size=len(dataset),
+            seed=config.seed
+        )
+
+        # `torch` utility for sampling.
+        data_loader = torch.utils.data.DataLoader(
+            dataset,
+            batch_sampler=batch_sampler,
+            collate_fn=collate_fn
+        )
+    else:
+        # Only pad to the longest sequence in each mini-batch, otherwise
+        # token budget is meaningless.
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=config.max_seq_len,
+            is_dynamic_pad=True
+        )
+
+        # Group sequences with similar lengths.
+        batch_sampler = lmp.dataset.TokenBudgetBatchSampler(
+            batch_lengths=lengths,
+            max_tokens=config.max_tokens,
+            max_seq_len=config.max_seq_len,
+            seed=config.seed
+        )
+
+        # `torch` utility for sampling.
+        data_loader = torch.utils.data.DataLoader(
+            dataset,
+            batch_sampler=batch_sampler,
+            collate_fn=collate_fn
+        )
 
     train_model(
         checkpoint=checkpoint,
@@ -331,5 +539,6 @@ def train_model_by_config(
         max_norm=config.max_norm,
         model=model,
         optimizer=optimizer,
+        val_batches=val_batches,
         vocab_size=tokenizer.vocab_size
     )
@@ -0,0 +1,198 @@
+r"""Helper function for evaluating model on held-out validation set.
+
+Usage:
+    import lmp.util
+
+    batches = lmp.util.encode_validation_batches(...)
+    perplexity = lmp.util.validate_model(...)
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+import torch.nn.functional
+
+# self-made modules
+
+import lmp.dataset
+import lmp.model
+import lmp.tokenizer
+
+from lmp.util._sequence_lengths import sequence_lengths
+
+
+def encode_validation_batches(
+        batch_size: int,
+        dataset: lmp.dataset.BaseDataset,
+        max_seq_len: int,
+        tokenizer: lmp.tokenizer.BaseTokenizer
+) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+    r"""Encode validation dataset into mini-batches once.
+
+    Sequences are sorted by encoded length before batching, and each mini-batch
+    is only padded to its longest sequence. Encoded mini-batches are kept on
+    CPU and reused by every call of `lmp.util.validate_model`, thus validation
+    set is tokenized only once during training.
+
+    Args:
+        batch_size:
+            Number of sequences in each mini-batch. Must be bigger than or
+            equal to `1`.
+        dataset:
+            Validation dataset.
+        max_seq_len:
+            Maximum encoded sequence length. Must be greater than `1` or equal
+            to `-1`.
+        tokenizer:
+            Tokenizer for encoding sequences.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When one of the arguments do not follow their constraints. See
+            docstring for arguments constraints.
+
+    Returns:
+        List of model input `x` and target `y` of each mini-batch.
+    """
+    # Type check.
+    if not isinstance(batch_size, int):
+        raise TypeError('`batch_size` must be an instance of `int`.')
+
+    if not isinstance(dataset, lmp.dataset.BaseDataset):
+        raise TypeError(
+            '`dataset` must be an instance of `lmp.dataset.BaseDataset`.'
+        )
+
+    # Value check.
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be bigger than or equal to `1`.')
+
+    # `max_seq_len` and `tokenizer` are checked by `create_collate_fn`.
+    collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+        tokenizer=tokenizer,
+        max_seq_len=max_seq_len,
+        is_dynamic_pad=True
+    )
+
+    # Stable sort keeps order of sequences with the same length.
+    order = np.argsort(
+        sequence_lengths(dataset=dataset, tokenizer=tokenizer),
+        kind='stable'
+    ).tolist()
+
+    return [
+        collate_fn([
+            dataset[index]
+            for index in order[start:start + batch_size]
+        ])
+        for start in range(0, len(order), batch_size)
+    ]
+
+
+@torch.no_grad()
+def validate_model(
+        batches: List[Tuple[torch.Tensor, torch.Tensor]],
+        device: torch.device,
+        model: Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]
+) -> float:
+    r"""Calculate perplexity of model on pre-encoded validation mini-batches.
+
+    Negative log-likelihood is summed over all non-padding target tokens and
+    normalized by the number of those tokens. Model mode (training or
+    evaluation) is restored after validation.
+
+    Args:
+        batches:
+            Mini-batches encoded by `lmp.util.encode_validation_batches`. Must
+            not be empty.
+        device:
+            Model running device.
+        model:
+            Language model.
+
+    Raises:
+        TypeError:
+            When one of the arguments are not an instance of their type
+            annotation respectively.
+        ValueError:
+            When `batches` is empty.
+
+    Returns:
+        Token level perplexity of validation set.
+    """
+    # Type check.
+    if not isinstance(batches, list) or not all(map(
+            lambda batch: (
+                isinstance(batch, tuple) and
+                len(batch) == 2 and
+                all(map(lambda t: isinstance(t, torch.Tensor), batch))
+            ),
+            batches
+    )):
+        raise TypeError(
+            '`batches` must be an instance of '
+            '`List[Tuple[torch.Tensor, torch.Tensor]]`.'
+        )
+
+    if not isinstance(device, torch.device):
+        raise TypeError('`device` must be an instance of `torch.device`.')
+
+    if not isinstance(model, (
+            lmp.model.BaseRNNModel,
+            lmp.model.BaseResRNNModel
+    )):
+        raise TypeError(
+            '`model` must be an instance of '
+            '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.'
+        )
+
+    # Value check.
+    if not batches:
+        raise ValueError('`batches` must not be empty.')
+
+    is_training = model.training
+    model.eval()
+
+    pad_token_id = model.emb_layer.padding_idx
+    total_nll = 0.0
+    total_tokens = 0
+
+    for x, y in batches:
+        # Padding tokens are skipped by model.
+        # x.size = (B, S)
+        # y.size = (N)
+        mask = y != pad_token_id
+        batch_lengths = mask.sum(dim=1)
+        x = x.to(device)
+        y = y[mask].to(device)
+
+        # pred_y_logits.size = (N, V)
+        pred_y_logits = model(x, batch_lengths=batch_lengths)
+
+        total_nll += torch.nn.functional.cross_entropy(
+            pred_y_logits,
+            y,
+            reduction='sum'
+        ).item()
+        total_tokens += y.size(0)
+
+    model.train(is_training)
+
+    return math.exp(total_nll / max(1, total_tokens))
@@ -0,0 +1,177 @@
+r"""Benchmark generation latency and throughput.
+
+Usage:
+    python run_benchmark.py ...
+
+Run 'python run_benchmark.py --help' for help.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import itertools
+import json
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp
+
+if __name__ == '__main__':
+    # Parse argument from standard input.
+    parser = argparse.ArgumentParser()
+
+    # Required arguments.
+    parser.add_argument(
+        '--experiment',
+        help='Experiment name whose configuration is benchmarked.',
+        required=True,
+        type=str,
+    )
+
+    # Optional arguments.
+    parser.add_argument(
+        '--batch_sizes',
+        default=[1, 8],
+        help='Numbers of prompts generated together.',
+        nargs='+',
+        type=int
+    )
+    parser.add_argument(
+        '--beam_widths',
+        default=[1, 4],
+        help='Beam widths to benchmark.',
+        nargs='+',
+        type=int
+    )
+    parser.add_argument(
+        '--checkpoint',
+        default=-1,
+        help=' '.join([
+            'Load specific checkpoint.',
+            'Use `-1` to benchmark randomly initialized model of experiment',
+            'configuration with a synthetic vocabulary of `--vocab_size`.',
+        ]),
+        type=int
+    )
+    parser.add_argument(
+        '--num_repeats',
+        default=10,
+        help='Number of measured runs of each setting.',
+        type=int
+    )
+    parser.add_argument(
+        '--num_threads',
+        default=[torch.get_num_threads()],
+        help='Numbers of CPU threads used by PyTorch.',
+        nargs='+',
+        type=int
+    )
+    parser.add_argument(
+        '--output_lens',
+        default=[16, 64],
+        help='Numbers of generated tokens of each prompt.',
+        nargs='+',
+        type=int
+    )
+    parser.add_argument(
+        '--prompt_lens',
+        default=[8, 32],
+        help='Numbers of tokens of each prompt excluding `[bos]`.',
+        nargs='+',
+        type=int
+    )
+    parser.add_argument(
+        '--vocab_size',
+        default=1000,
+        help='Vocabulary size of randomly initialized model.',
+        type=int
+    )
+
+    args = parser.parse_args()
+
+    # Load pre-trained hyperparameters.
+    config = lmp.config.BaseConfig.load(experiment=args.experiment)
+
+    if args.checkpoint == -1:
+        # Synthetic vocabulary of distinct characters.
+        tokenizer = lmp.util.load_tokenizer(
+            checkpoint=-1,
+            experiment=config.experiment,
+            is_uncased=False,
+            tokenizer_class='char_dict'
+        )
+        tokenizer.build_vocab(
+            [''.join(
+                chr(0x4e00 + index)
+                for index in range(args.vocab_size - tokenizer.vocab_size)
+            )],
+            min_count=1
+        )
+    else:
+        # Load pre-trained tokenizer.
+        tokenizer = lmp.util.load_tokenizer_by_config(
+            checkpoint=args.checkpoint,
+            config=config
+        )
+
+    # Load pre-trained or randomly initialized model.
+    model = lmp.util.load_model(
+        checkpoint=args.checkpoint,
+        d_emb=config.d_emb,
+        d_hid=config.d_hid,
+        device=config.device,
+        dropout=config.dropout,
+        experiment=config.experiment,
+        model_class=config.model_class,
+        num_linear_layers=config.num_linear_layers,
+        num_rnn_layers=config.num_rnn_layers,
+        pad_token_id=tokenizer.convert_token_to_id(tokenizer.pad_token),
+        vocab_size=tokenizer.vocab_size
+    )
+
+    # Output metrics of each setting as JSON lines.
+    for (
+            num_threads,
+            batch_size,
+            beam_width,
+            prompt_len,
+            output_len,
+    ) in itertools.product(
+            args.num_threads,
+            args.batch_sizes,
+            args.beam_widths,
+            args.prompt_lens,
+            args.output_lens,
+    ):
+        torch.set_num_threads(num_threads)
+
+        setting = {
+            'batch_size': batch_size,
+            'beam_width': beam_width,
+            'device': str(config.device),
+            'model_class': config.model_class,
+            'num_threads': num_threads,
+            'output_len': output_len,
+            'prompt_len': prompt_len,
+        }
+        setting.update(lmp.util.benchmark_generate_sequence(
+            batch_size=batch_size,
+            beam_width=beam_width,
+            device=config.device,
+            model=model,
+            num_repeats=args.num_repeats,
+            output_len=output_len,
+            prompt_len=prompt_len,
+            tokenizer=tokenizer
+        ))
+
+        print(json.dumps(setting), flush=True)
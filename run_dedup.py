@@ -0,0 +1,125 @@
+r"""Remove near-duplicate sequences from dataset.
+
+Kept indices are saved under `data/` and can be used for training by
+`--dataset <dataset>@<output>`.
+
+Usage:
+    python run_dedup.py ...
+
+Run 'python run_dedup.py --help' for help.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+import lmp
+
+if __name__ == '__main__':
+    # Parse argument from standard input.
+    parser = argparse.ArgumentParser()
+
+    # Required arguments.
+    parser.add_argument(
+        '--dataset',
+        help='Name of the dataset to deduplicate.',
+        required=True,
+        type=str
+    )
+
+    # Optional arguments.
+    parser.add_argument(
+        '--is_uncased',
+        action='store_true',
+        help='Whether to ignore cases when comparing sequences.'
+    )
+    parser.add_argument(
+        '--num_bands',
+        default=16,
+        help='Number of LSH bands.',
+        type=int
+    )
+    parser.add_argument(
+        '--num_perm',
+        default=128,
+        help='Length of MinHash signature.',
+        type=int
+    )
+    parser.add_argument(
+        '--num_workers',
+        default=os.cpu_count() or 1,
+        help='Number of processes computing signatures.',
+        type=int
+    )
+    parser.add_argument(
+        '--output',
+        default='',
+        help=(
+            'Index file name under `data/` with extension `.npy`. '
+            'Default to `<dataset>-dedup.npy`.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--seed',
+        default=1,
+        help='Random seed for hashing.',
+        type=int
+    )
+    parser.add_argument(
+        '--shingle_size',
+        default=5,
+        help='Number of characters in each shingle.',
+        type=int
+    )
+    parser.add_argument(
+        '--threshold',
+        default=0.8,
+        help='Minimum estimated Jaccard similarity of near-duplicates.',
+        type=float
+    )
+
+    args = parser.parse_args()
+
+    # Load data.
+    dataset = lmp.util.load_dataset(dataset=args.dataset, is_compact=True)
+
+    # Only `normalize` of tokenizer is used.
+    tokenizer = lmp.tokenizer.CharDictTokenizer(is_uncased=args.is_uncased)
+
+    indices = lmp.util.dedup_dataset(
+        dataset=dataset,
+        num_bands=args.num_bands,
+        num_perm=args.num_perm,
+        num_workers=args.num_workers,
+        seed=args.seed,
+        shingle_size=args.shingle_size,
+        threshold=args.threshold,
+        tokenizer=tokenizer
+    )
+
+    output = args.output or f'{args.dataset}-dedup'
+    if not output.endswith('.npy'):
+        output = f'{output}.npy'
+
+    np.save(
+        os.path.join(lmp.path.DATA_PATH, output),
+        np.array(indices, dtype=np.int64)
+    )
+
+    print(
+        f'Kept {len(indices)} of {len(dataset)} sequences. '
+        f'Use `--dataset {args.dataset}@{output}` to train on them.'
+    )
@@ -14,6 +14,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import argparse
+import json
 
 # self-made modules
 
@@ -24,10 +25,18 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
 
     # Required arguments.
-    parser.add_argument(
+    prompt_group = parser.add_mutually_exclusive_group(required=True)
+    prompt_group.add_argument(
         '--begin_of_sequence',
         help='Begining of sequence which model will auto-complete.',
-        required=True,
+        type=str
+    )
+    prompt_group.add_argument(
+        '--prompts_file',
+        help=' '.join([
+            'Path to text file with one begining of sequence per line.',
+            'Output one JSON object per line.',
+        ]),
         type=str
     )
     parser.add_argument(
@@ -50,15 +59,97 @@ if __name__ == '__main__':
         help='using for generating `beam_width` sentences',
         type=int
     )
+    parser.add_argument(
+        '--batch_size',
+        default=32,
+        help='Number of prompts generated together in `--prompts_file` mode.',
+        type=int
+    )
+    parser.add_argument(
+        '--decode_method',
+        choices=['beam_search', 'sample', 'speculative'],
+        default='beam_search',
+        help=' '.join([
+            'Use beam search, sampling or greedy speculative decoding.',
+            'Sampling is seeded with experiment `seed`.',
+            'Speculative decoding requires `--draft_experiment`.',
+        ]),
+        type=str
+    )
+    parser.add_argument(
+        '--draft_checkpoint',
+        help='Load specific checkpoint of draft model.',
+        type=int
+    )
+    parser.add_argument(
+        '--draft_experiment',
+        help=' '.join([
+            'Experiment name of draft model for speculative decoding.',
+            'Must share the same tokenizer with `--experiment`.',
+        ]),
+        type=str
+    )
     parser.add_argument(
         '--max_seq_len',
         default=64,
         help='Text sample max length.',
         type=int
     )
+    parser.add_argument(
+        '--num_draft_tokens',
+        default=4,
+        help='Number of tokens proposed by draft model in each round.',
+        type=int
+    )
+    parser.add_argument(
+        '--num_samples',
+        default=4,
+        help='Number of sampled sequences for each prompt.',
+        type=int
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help=' '.join([
+            'Print one sequence of `--begin_of_sequence` token by token.',
+            'Use greedy decoding unless `--decode_method sample` is given.',
+        ])
+    )
+    parser.add_argument(
+        '--temperature',
+        default=1.0,
+        help='Softmax temperature of sampling.',
+        type=float
+    )
+    parser.add_argument(
+        '--top_k',
+        default=0,
+        help='Sample from `top_k` most probable tokens. Set `0` to disable.',
+        type=int
+    )
+    parser.add_argument(
+        '--top_p',
+        default=1.0,
+        help=' '.join([
+            'Sample from most probable tokens whose cumulative probability',
+            'reaches `top_p`. Set `1.0` to disable.',
+        ]),
+        type=float
+    )
 
     args = parser.parse_args()
 
+    if args.stream and args.prompts_file is not None:
+        parser.error('`--stream` can only be used with `--begin_of_sequence`.')
+
+    if args.decode_method == 'speculative' and (
+            args.draft_experiment is None or args.draft_checkpoint is None
+    ):
+        parser.error(
+            'Speculative decoding requires `--draft_experiment` and '
+            '`--draft_checkpoint`.'
+        )
+
     # Load pre-trained hyperparameters.
     config = lmp.config.BaseConfig.load(experiment=args.experiment)
 
@@ -75,16 +166,110 @@ if __name__ == '__main__':
         tokenizer=tokenizer
     )
 
-    # Sequences generation.
-    generated_sequences = lmp.util.generate_sequence_by_config(
-        beam_width=args.beam_width,
-        begin_of_sequence=args.begin_of_sequence,
-        config=config,
-        max_seq_len=args.max_seq_len,
-        model=model,
-        tokenizer=tokenizer
-    )
+    if args.decode_method == 'speculative':
+        # Load draft model which shares the same tokenizer.
+        draft_config = lmp.config.BaseConfig.load(
+            experiment=args.draft_experiment
+        )
+        draft_tokenizer = lmp.util.load_tokenizer_by_config(
+            checkpoint=args.draft_checkpoint,
+            config=draft_config
+        )
+        if draft_tokenizer.token_to_id != tokenizer.token_to_id:
+            raise ValueError(
+                'Draft model and model must share the same tokenizer.'
+            )
+
+        draft_model = lmp.util.load_model_by_config(
+            checkpoint=args.draft_checkpoint,
+            config=draft_config,
+            tokenizer=tokenizer
+        ).to(config.device)
+
+    def generate(begin_of_sequences):
+        r"""Generate sequences of each prompt with selected method."""
+        if args.decode_method == 'speculative':
+            return [
+                [
+                    lmp.util.speculative_generate_sequence_by_config(
+                        begin_of_sequence=begin_of_sequence,
+                        config=config,
+                        draft_model=draft_model,
+                        max_seq_len=args.max_seq_len,
+                        model=model,
+                        num_draft_tokens=args.num_draft_tokens,
+                        tokenizer=tokenizer
+                    ),
+                ]
+                for begin_of_sequence in begin_of_sequences
+            ]
+
+        if args.decode_method == 'sample':
+            return lmp.util.sample_sequence_by_config(
+                begin_of_sequences=begin_of_sequences,
+                config=config,
+                max_seq_len=args.max_seq_len,
+                model=model,
+                num_samples=args.num_samples,
+                temperature=args.temperature,
+                tokenizer=tokenizer,
+                top_k=args.top_k,
+                top_p=args.top_p
+            )
+
+        return lmp.util.batch_generate_sequence_by_config(
+            beam_width=args.beam_width,
+            begin_of_sequences=begin_of_sequences,
+            config=config,
+            max_seq_len=args.max_seq_len,
+            model=model,
+            tokenizer=tokenizer
+        )
+
+    if args.prompts_file is not None:
+        with open(args.prompts_file, 'r', encoding='utf-8') as input_file:
+            prompts = [line.rstrip('\r\n') for line in input_file]
+
+        # Generate sequences of `batch_size` prompts at a time.
+        for start in range(0, len(prompts), args.batch_size):
+            begin_of_sequences = prompts[start:start + args.batch_size]
+            batch_generated_sequences = generate(begin_of_sequences)
+
+            # Output generated sequences as JSON lines.
+            for begin_of_sequence, generated_sequences in zip(
+                    begin_of_sequences,
+                    batch_generated_sequences
+            ):
+                print(json.dumps(
+                    {
+                        'begin_of_sequence': begin_of_sequence,
+                        'generated_sequences': generated_sequences,
+                    },
+                    ensure_ascii=False
+                ))
+    elif args.stream:
+        # Greedy decoding keeps only the most probable token.
+        is_sample = args.decode_method == 'sample'
+        printed = ''
+        for _, sequence in lmp.util.stream_sequence_by_config(
+                begin_of_sequence=args.begin_of_sequence,
+                config=config,
+                max_seq_len=args.max_seq_len,
+                model=model,
+                temperature=args.temperature if is_sample else 1.0,
+                tokenizer=tokenizer,
+                top_k=args.top_k if is_sample else 1,
+                top_p=args.top_p if is_sample else 1.0
+        ):
+            # Print newly decoded text only.
+            print(sequence[len(printed):], end='', flush=True)
+            printed = sequence
+
+        print()
+    else:
+        # Sequences generation.
+        generated_sequences = generate([args.begin_of_sequence])[0]
 
-    # Output generated sequences.
-    for sequence in generated_sequences:
-        print(sequence)
+        # Output generated sequences.
+        for sequence in generated_sequences:
+            print(sequence)
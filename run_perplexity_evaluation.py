@@ -13,6 +13,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import argparse
+import json
 
 # self-made modules
 
@@ -42,6 +43,34 @@ if __name__ == '__main__':
         type=str,
     )
 
+    # Optional arguments.
+    parser.add_argument(
+        '--batch_size',
+        default=32,
+        help='Number of sequences evaluated together.',
+        type=int
+    )
+    parser.add_argument(
+        '--score_file',
+        default=None,
+        help=(
+            'Write perplexity of each sequence to this file. Write CSV when '
+            'file name ends with `.csv`, otherwise write little-endian '
+            'float32 values.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--window_size',
+        default=-1,
+        help=(
+            'Feed each sequence to model in windows of this many tokens and '
+            'print perplexity of each sequence. Use -1 for evaluating whole '
+            'dataset in batches.'
+        ),
+        type=int
+    )
+
     args = parser.parse_args()
 
     # Load pre-trained hyperparameters.
@@ -66,14 +95,28 @@ if __name__ == '__main__':
         tokenizer=tokenizer
     )
 
-    # Calculating dataset perplexity.
-    perplexities = lmp.util.batch_perplexity_eval(
-        dataset=dataset,
-        device=config.device,
-        model=model,
-        tokenizer=tokenizer
-    )
-
-    # Print perplexity of each sequence.
-    for i, perplexity in enumerate(perplexities):
-        print(f'{perplexity:.6f}, {dataset[i]}')
+    # Calculating perplexity of each long sequence with constant memory.
+    if args.window_size != -1:
+        for sequence in dataset:
+            perplexity = lmp.util.perplexity_eval(
+                device=config.device,
+                model=model,
+                sequence=sequence,
+                tokenizer=tokenizer,
+                window_size=args.window_size
+            )
+            print(f'{perplexity:.6f}, {sequence}')
+    else:
+        # Calculating corpus perplexity without keeping per-sequence
+        # results.
+        summary = lmp.util.corpus_perplexity_eval(
+            batch_size=args.batch_size,
+            dataset=dataset,
+            device=config.device,
+            model=model,
+            score_file=args.score_file,
+            tokenizer=tokenizer
+        )
+
+        # Print corpus perplexity and per-length histogram.
+        print(json.dumps(summary))
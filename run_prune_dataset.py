@@ -0,0 +1,161 @@
+r"""Prune dataset by perplexity of pre-trained model.
+
+Per-sequence perplexities are saved under `data/` and reused when pruning
+again with different thresholds. Kept indices are saved under `data/` and can
+be used for training by `--dataset <dataset>@<output>`.
+
+Usage:
+    python run_prune_dataset.py ...
+
+Run 'python run_prune_dataset.py --help' for help.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+import lmp
+
+if __name__ == '__main__':
+    # Parse argument from standard input.
+    parser = argparse.ArgumentParser()
+
+    # Required arguments.
+    parser.add_argument(
+        '--checkpoint',
+        help='Load specific checkpoint.',
+        required=True,
+        type=int
+    )
+    parser.add_argument(
+        '--experiment',
+        help='Current experiment name.',
+        required=True,
+        type=str
+    )
+
+    # Optional arguments.
+    parser.add_argument(
+        '--batch_size',
+        default=32,
+        help='Number of sequences scored together.',
+        type=int
+    )
+    parser.add_argument(
+        '--dataset',
+        default='',
+        help=(
+            'Name of the dataset to prune. '
+            'Default to the dataset of the experiment.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--lower_percentile',
+        default=5.0,
+        help='Prune sequences with perplexity below this percentile.',
+        type=float
+    )
+    parser.add_argument(
+        '--output',
+        default='',
+        help=(
+            'Index file name under `data/` with extension `.npy`. '
+            'Default to `<experiment>-<checkpoint>-pruned.npy`.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--scores',
+        default='',
+        help=(
+            'Perplexity file name under `data/` with extension `.npy`. '
+            'Reused if exists. '
+            'Default to `<experiment>-<checkpoint>-scores.npy`.'
+        ),
+        type=str
+    )
+    parser.add_argument(
+        '--upper_percentile',
+        default=95.0,
+        help='Prune sequences with perplexity above this percentile.',
+        type=float
+    )
+
+    args = parser.parse_args()
+
+    # Load pre-trained hyperparameters.
+    config = lmp.config.BaseConfig.load(experiment=args.experiment)
+
+    # Overwrite pruning dataset.
+    if args.dataset:
+        config.dataset = args.dataset
+
+    # Load dataset.
+    dataset = lmp.util.load_dataset_by_config(config=config)
+
+    scores_file = args.scores or f'{args.experiment}-{args.checkpoint}-scores'
+    if not scores_file.endswith('.npy'):
+        scores_file = f'{scores_file}.npy'
+    scores_path = os.path.join(lmp.path.DATA_PATH, scores_file)
+
+    scores = None
+    if os.path.exists(scores_path):
+        scores = np.load(scores_path)
+
+        # Scores of other dataset cannot be reused.
+        if scores.shape != (len(dataset),):
+            scores = None
+
+    if scores is None:
+        # Load pre-trained tokenizer.
+        tokenizer = lmp.util.load_tokenizer_by_config(
+            checkpoint=args.checkpoint,
+            config=config
+        )
+
+        # Load pre-trained model.
+        model = lmp.util.load_model_by_config(
+            checkpoint=args.checkpoint,
+            config=config,
+            tokenizer=tokenizer
+        )
+
+        scores = lmp.util.score_dataset(
+            batch_size=args.batch_size,
+            dataset=dataset,
+            device=config.device,
+            max_seq_len=config.max_seq_len,
+            model=model,
+            tokenizer=tokenizer
+        )
+        np.save(scores_path, scores)
+
+    indices = lmp.util.prune_by_scores(
+        lower_percentile=args.lower_percentile,
+        scores=scores,
+        upper_percentile=args.upper_percentile
+    )
+
+    output = args.output or f'{args.experiment}-{args.checkpoint}-pruned'
+    if not output.endswith('.npy'):
+        output = f'{output}.npy'
+
+    np.save(os.path.join(lmp.path.DATA_PATH, output), indices)
+
+    print(
+        f'Kept {len(indices)} of {len(dataset)} sequences. '
+        f'Use `--dataset {config.dataset}@{output}` to train on them.'
+    )
@@ -0,0 +1,138 @@
+r"""Serve language model over HTTP with dynamic request batching.
+
+Usage:
+    python run_server.py ...
+
+Run 'python run_server.py --help' for help.
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import asyncio
+
+# self-made modules
+
+import lmp
+
+if __name__ == '__main__':
+    # Parse argument from standard input.
+    parser = argparse.ArgumentParser()
+
+    # Required arguments.
+    parser.add_argument(
+        '--checkpoint',
+        help='Load specific checkpoint.',
+        required=True,
+        type=int
+    )
+    parser.add_argument(
+        '--experiment',
+        help='Current experiment name.',
+        required=True,
+        type=str,
+    )
+
+    # Optional arguments.
+    parser.add_argument(
+        '--beam_width',
+        default=4,
+        help='Beam width of generation requests without `beam_width`.',
+        type=int
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='TCP host to listen on.',
+        type=str
+    )
+    parser.add_argument(
+        '--max_batch_size',
+        default=32,
+        help='Maximum number of requests in a batch.',
+        type=int
+    )
+    parser.add_argument(
+        '--max_seq_len',
+        default=64,
+        help='Text sample max length of requests without `max_seq_len`.',
+        type=int
+    )
+    parser.add_argument(
+        '--max_wait',
+        default=0.01,
+        help='Maximum seconds to wait for more requests in a batch.',
+        type=float
+    )
+    parser.add_argument(
+        '--prefix_cache_bytes',
+        default=0,
+        help=' '.join([
+            'Memory budget in bytes of cached hidden states after prompt',
+            'prefixes. Set `0` to disable caching.',
+        ]),
+        type=int
+    )
+    parser.add_argument(
+        '--port',
+        default=8000,
+        help='TCP port to listen on.',
+        type=int
+    )
+    parser.add_argument(
+        '--unix_socket',
+        default=None,
+        help='Listen on Unix socket path instead of TCP.',
+        type=str
+    )
+
+    args = parser.parse_args()
+
+    # Load pre-trained hyperparameters.
+    config = lmp.config.BaseConfig.load(experiment=args.experiment)
+
+    # Load pre-trained tokenizer.
+    tokenizer = lmp.util.load_tokenizer_by_config(
+        checkpoint=args.checkpoint,
+        config=config
+    )
+
+    # Load pre-trained model.
+    model = lmp.util.load_model_by_config(
+        checkpoint=args.checkpoint,
+        config=config,
+        tokenizer=tokenizer
+    )
+
+    # Cache hidden states after prompt prefixes shared by requests.
+    prefix_cache = None
+    if args.prefix_cache_bytes > 0:
+        prefix_cache = lmp.model.PrefixStateCache(
+            max_bytes=args.prefix_cache_bytes
+        )
+
+    server = lmp.server.InferenceServer(
+        default_beam_width=args.beam_width,
+        default_max_seq_len=args.max_seq_len,
+        device=config.device,
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait,
+        model=model,
+        prefix_cache=prefix_cache,
+        tokenizer=tokenizer
+    )
+
+    # Serve until interrupted.
+    try:
+        asyncio.run(server.serve(
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket
+        ))
+    except KeyboardInterrupt:
+        pass
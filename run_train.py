@@ -69,7 +69,10 @@ if __name__ == '__main__':
     parser.add_argument(
         '--dataset',
         default='news_collection_title',
-        help='Name of the dataset to perform experiment.',
+        help=(
+            'Name of the dataset to perform experiment. '
+            'Use `mix:<dataset>=<weight>,...` to mix multiple datasets.'
+        ),
         type=str
     )
     parser.add_argument(
@@ -84,6 +87,22 @@ if __name__ == '__main__':
         help='Number of training epochs.',
         type=int
     )
+    parser.add_argument(
+        '--is_auto_tune',
+        action='store_true',
+        help=(
+            'Whether to set `max_seq_len` and `batch_size` by dataset '
+            'profile when training from scratch.'
+        )
+    )
+    parser.add_argument(
+        '--is_compact',
+        action='store_true',
+        help=(
+            'Whether to store dataset sequences in compact format to save '
+            'memory.'
+        )
+    )
     parser.add_argument(
         '--is_uncased',
         action='store_true',
@@ -107,6 +126,24 @@ if __name__ == '__main__':
         help='Text sample max length.',
         type=int
     )
+    parser.add_argument(
+        '--max_tokens',
+        default=-1,
+        help=(
+            'Maximum number of tokens in each mini-batch. '
+            'Use `batch_size` when set to `-1`.'
+        ),
+        type=int
+    )
+    parser.add_argument(
+        '--memory_budget',
+        default=-1,
+        help=(
+            'Available memory in MiB for suggesting `batch_size`. '
+            'No suggestion when set to `-1`.'
+        ),
+        type=int
+    )
     parser.add_argument(
         '--min_count',
         default=1,
@@ -137,6 +174,12 @@ if __name__ == '__main__':
         help="Optimizer's class.",
         type=str
     )
+    parser.add_argument(
+        '--seq_len_percentile',
+        default=99.0,
+        help='Percent of sequences covered by suggested `max_seq_len`.',
+        type=float
+    )
     parser.add_argument(
         '--seed',
         default=7,
@@ -149,12 +192,20 @@ if __name__ == '__main__':
         help="Tokenizer's class.",
         type=str
     )
+    parser.add_argument(
+        '--val_ratio',
+        default=0.0,
+        help=(
+            'Ratio of dataset held out for validation perplexity at each '
+            'checkpoint. No validation when set to `0.0`.'
+        ),
+        type=float
+    )
 
     args = parser.parse_args()
 
     # Hyperparameters setup.
     config = lmp.util.load_config(args)
-    config.save()
 
     # Get model running device.
     device = config.device
@@ -184,6 +235,61 @@ if __name__ == '__main__':
         )
         tokenizer.save(experiment=config.experiment)
 
+    # Auto-tuning only makes sense when training from scratch.
+    is_auto_tune = args.is_auto_tune and args.checkpoint == -1
+
+    # Profile dataset only when tuning needs it, since profiling reads the
+    # whole dataset. Profile is cached in experiment folder.
+    if is_auto_tune or args.memory_budget != -1:
+        profile = lmp.util.profile_dataset_by_config(
+            config=config,
+            dataset=dataset,
+            tokenizer=tokenizer
+        )
+        max_seq_len = lmp.util.suggest_max_seq_len(
+            percentile=args.seq_len_percentile,
+            profile=profile
+        )
+        print(
+            f'Dataset profile: {profile["dataset_size"]} sequences, '
+            f'{profile["total_tokens"]} tokens, mean length '
+            f'{profile["mean_length"]:.2f}, max length '
+            f'{profile["max_length"]}, percentiles {profile["percentiles"]}.'
+        )
+        print(
+            f'Suggested `max_seq_len` covering {args.seq_len_percentile}% of '
+            f'sequences: {max_seq_len}.'
+        )
+
+        if is_auto_tune:
+            config.max_seq_len = max_seq_len
+
+    if args.memory_budget != -1:
+        # Without truncation, mini-batches are padded to the longest sequence.
+        padded_len = config.max_seq_len
+        if padded_len == -1:
+            padded_len = max(2, profile['max_length'])
+
+        batch_size = lmp.util.suggest_batch_size(
+            d_emb=config.d_emb,
+            d_hid=config.d_hid,
+            max_seq_len=padded_len,
+            memory_budget=args.memory_budget * 2 ** 20,
+            num_linear_layers=config.num_linear_layers,
+            num_rnn_layers=config.num_rnn_layers,
+            vocab_size=tokenizer.vocab_size
+        )
+        print(
+            f'Suggested `batch_size` fitting {args.memory_budget} MiB: '
+            f'{batch_size}.'
+        )
+
+        if is_auto_tune:
+            config.batch_size = batch_size
+
+    # Save tuned hyperparameters.
+    config.save()
+
     # Load model.
     model = lmp.util.load_model_by_config(
         checkpoint=args.checkpoint,
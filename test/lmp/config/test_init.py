@@ -84,6 +84,12 @@ class TestInit(unittest.TestCase):
                         annotation=str,
                         default=''
                     ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                     inspect.Parameter(
                         name='is_uncased',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -108,6 +114,12 @@ class TestInit(unittest.TestCase):
                         annotation=int,
                         default=60
                     ),
+                    inspect.Parameter(
+                        name='max_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
                     inspect.Parameter(
                         name='min_count',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -149,6 +161,12 @@ class TestInit(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default='char_dict'
+                    ),
+                    inspect.Parameter(
+                        name='val_ratio',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=0.0
                     )
                 ],
                 return_annotation=inspect.Signature.empty
@@ -420,6 +438,30 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    is_compact=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`is_compact` must be an instance of `bool`.',
+                msg=msg2
+            )
+
     def test_invalid_input_is_uncased(self):
         r"""Raise `TypeError` when input `is_uncased` is invalid."""
         msg1 = 'Must raise `TypeError` when input `is_uncased` is invalid.'
@@ -553,6 +595,44 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_max_tokens(self):
+        r"""Raise exception when input `max_tokens` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_tokens` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j, 1j,
+            '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    max_tokens=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be bigger than or equal to `1` or '
+                    'equal to `-1`.',
+                    msg=msg2
+                )
+
     def test_invalid_input_min_count(self):
         r"""Raise exception when input `min_count` is invalid."""
         msg1 = (
@@ -812,6 +892,44 @@ class TestInit(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_val_ratio(self):
+        r"""Raise exception when input `val_ratio` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `val_ratio` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, -0.1, 1.0, 1.1, math.nan, -math.nan,
+            math.inf, -math.inf, 0j, 1j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                BaseConfig(
+                    dataset='test',
+                    experiment='test',
+                    val_ratio=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_ratio` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_ratio` must range from `0.0` (inclusive) to `1.0` '
+                    '(exclusive).',
+                    msg=msg2
+                )
+
     def test_instance_attributes(self):
         r"""Declare required instance attributes."""
         msg1 = 'Missing instance attribute `{}`.'
@@ -828,10 +946,12 @@ class TestInit(unittest.TestCase):
                 ('dropout', 0.42069),
                 ('epoch', 555),
                 ('experiment', 'world'),
+                ('is_compact', True),
                 ('is_uncased', True),
                 ('learning_rate', 0.69420),
                 ('max_norm', 6.9),
                 ('max_seq_len', 666),
+                ('max_tokens', 1234),
                 ('min_count', 777),
                 ('model_class', 'HELLO'),
                 ('num_linear_layers', 888),
@@ -839,6 +959,7 @@ class TestInit(unittest.TestCase):
                 ('optimizer_class', 'WORLD'),
                 ('seed', 101010),
                 ('tokenizer_class', 'hello world'),
+                ('val_ratio', 0.1),
             ),
             (
                 ('batch_size', 101010),
@@ -849,10 +970,12 @@ class TestInit(unittest.TestCase):
                 ('dropout', 0.69420),
                 ('epoch', 666),
                 ('experiment', 'hello'),
+                ('is_compact', False),
                 ('is_uncased', True),
                 ('learning_rate', 0.42069),
                 ('max_norm', 4.20),
                 ('max_seq_len', 555),
+                ('max_tokens', 4321),
                 ('min_count', 444),
                 ('model_class', 'hello world'),
                 ('num_linear_layers', 333),
@@ -860,6 +983,7 @@ class TestInit(unittest.TestCase):
                 ('optimizer_class', 'WORLD'),
                 ('seed', 111),
                 ('tokenizer_class', 'HELLO'),
+                ('val_ratio', 0.2),
             ),
         )
 
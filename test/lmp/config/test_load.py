@@ -143,10 +143,12 @@ class TestLoad(unittest.TestCase):
                 'dropout': 0.42069,
                 'epoch': 555,
                 'experiment': 'world',
+                'is_compact': True,
                 'is_uncased': True,
                 'learning_rate': 0.69420,
                 'max_norm': 6.9,
                 'max_seq_len': 666,
+                'max_tokens': 1234,
                 'min_count': 777,
                 'model_class': 'HELLO',
                 'num_linear_layers': 888,
@@ -154,6 +156,7 @@ class TestLoad(unittest.TestCase):
                 'optimizer_class': 'WORLD',
                 'seed': 101010,
                 'tokenizer_class': 'hello world',
+                'val_ratio': 0.1,
             },
             {
                 'batch_size': 101010,
@@ -164,10 +167,12 @@ class TestLoad(unittest.TestCase):
                 'dropout': 0.69420,
                 'epoch': 666,
                 'experiment': 'hello',
+                'is_compact': False,
                 'is_uncased': True,
                 'learning_rate': 0.42069,
                 'max_norm': 4.20,
                 'max_seq_len': 555,
+                'max_tokens': 4321,
                 'min_count': 444,
                 'model_class': 'hello world',
                 'num_linear_layers': 333,
@@ -175,6 +180,7 @@ class TestLoad(unittest.TestCase):
                 'optimizer_class': 'WORLD',
                 'seed': 111,
                 'tokenizer_class': 'HELLO',
+                'val_ratio': 0.2,
             },
         )
 
@@ -1,4 +1,4 @@
-r"""Test `lmp.dataset.py`.
+r"""Test `lmp.dataset`.
 
 Usage:
     python -m unittest test.lmp.dataset.__init__
@@ -16,7 +16,7 @@ import unittest
 
 
 class TestDataset(unittest.TestCase):
-    r"""Test case for `lmp.dataset.py`."""
+    r"""Test case for `lmp.dataset`."""
 
     def test_signature(self):
         r"""Ensure signature consistency."""
@@ -42,7 +42,15 @@ class TestDataset(unittest.TestCase):
         msg1 = 'Missing module attribute `{}`.'
         msg2 = 'Module attribute `{}` must be a class.'
         msg3 = 'Inconsistent module signature.'
-        examples = ('BaseDataset',)
+        examples = (
+            'BaseBatchSampler',
+            'BaseDataset',
+            'FixedSizeBatchSampler',
+            'LineDataset',
+            'MixtureDataset',
+            'SubsetDataset',
+            'TokenBudgetBatchSampler',
+        )
 
         try:
             # pylint: disable=C0415
@@ -0,0 +1,127 @@
+r"""Test `lmp.dataset.BaseBatchSampler.state_dict` and `load_state_dict`.
+
+Usage:
+    python -m unittest test.lmp.dataset._base_batch_sampler.test_state_dict
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset import FixedSizeBatchSampler
+from lmp.dataset import TokenBudgetBatchSampler
+
+
+class TestStateDict(unittest.TestCase):
+    r"""Test case for `lmp.dataset.BaseBatchSampler` sampling position."""
+
+    def setUp(self):
+        r"""Setup batch samplers."""
+        self.batch_samplers = (
+            lambda: FixedSizeBatchSampler(batch_size=3, dataset_size=20),
+            lambda: TokenBudgetBatchSampler(
+                batch_lengths=[(i % 7) + 2 for i in range(20)],
+                max_tokens=16
+            ),
+        )
+
+    def tearDown(self):
+        r"""Delete batch samplers."""
+        del self.batch_samplers
+
+    def test_invalid_input_state_dict(self):
+        r"""Raise exception when input `state_dict` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `state_dict` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], set(), object(), lambda x: x, type, None, NotImplemented,
+            ..., {'cursor': 0.0, 'epoch': 0, 'seed': 1}, {},
+            {'cursor': 0, 'epoch': 0}, {'cursor': -1, 'epoch': 0, 'seed': 1},
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                self.batch_samplers[0]().load_state_dict(invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`state_dict` must be an instance of `Dict[str, int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`state_dict` must contain non-negative `cursor`, `epoch` '
+                    'and `seed`.',
+                    msg=msg2
+                )
+
+    def test_resume(self):
+        r"""Resume from exact same sampling position."""
+        msg = 'Must resume from exact same sampling position.'
+
+        for batch_sampler_cstr in self.batch_samplers:
+            batch_sampler = batch_sampler_cstr()
+            batch_sampler.set_epoch(3)
+            ans_batches = list(batch_sampler)
+
+            for cursor in range(len(ans_batches) + 1):
+                batch_sampler = batch_sampler_cstr()
+                batch_sampler.set_epoch(3)
+                batch_iterator = iter(batch_sampler)
+                for _ in range(cursor):
+                    next(batch_iterator)
+
+                state_dict = batch_sampler.state_dict()
+                self.assertEqual(
+                    state_dict,
+                    {'cursor': cursor, 'epoch': 3, 'seed': 1},
+                    msg=msg
+                )
+
+                resumed = batch_sampler_cstr()
+                resumed.load_state_dict(state_dict)
+                self.assertEqual(
+                    list(resumed),
+                    ans_batches[cursor:],
+                    msg=msg
+                )
+
+                # Same epoch can be iterated again after resumed.
+                self.assertEqual(list(resumed), ans_batches, msg=msg)
+
+    def test_set_epoch_reset_cursor(self):
+        r"""Start from first mini-batch after `set_epoch`."""
+        msg = 'Must start from first mini-batch after `set_epoch`.'
+
+        for batch_sampler_cstr in self.batch_samplers:
+            batch_sampler = batch_sampler_cstr()
+            next(iter(batch_sampler))
+            batch_sampler.set_epoch(1)
+
+            self.assertEqual(batch_sampler.cursor, 0, msg=msg)
+            self.assertEqual(
+                len(list(batch_sampler)),
+                len(batch_sampler),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
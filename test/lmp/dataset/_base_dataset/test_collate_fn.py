@@ -1,7 +1,7 @@
 r"""Test `lmp.dataset.BaseDataset.collate_fn`.
 
 Usage:
-    python -m unittest test.lmp.dataset.test_collate_fn
+    python -m unittest test.lmp.dataset._base_dataset.test_collate_fn
 """
 
 # built-in modules
@@ -231,6 +231,35 @@ class TestCollateFn(unittest.TestCase):
                 self.assertEqual(x.size(-1), max_seq_len - 1, msg=msg)
                 self.assertEqual(y.size(-1), max_seq_len - 1, msg=msg)
 
+    def test_dynamic_pad(self):
+        r"""Only pad to the longest sequence in mini-batch."""
+        msg = 'Must only pad to the longest sequence in mini-batch.'
+        tokenizer = CharDictTokenizer()
+        tokenizer.build_vocab(['abcdefg'])
+        examples = (
+            (['ab', 'abc'], 20, 4),
+            (['ab', 'abcdefg'], 20, 8),
+            (['ab', 'abcdefg'], 5, 4),
+            ([''], 20, 1),
+        )
+
+        for batch_sequences, max_seq_len, ans_seq_len in examples:
+            collate_fn = BaseDataset.create_collate_fn(
+                tokenizer=tokenizer,
+                max_seq_len=max_seq_len,
+                is_dynamic_pad=True
+            )
+            x, y = collate_fn(batch_sequences)
+            ans_x, ans_y = BaseDataset.create_collate_fn(
+                tokenizer=tokenizer,
+                max_seq_len=max_seq_len
+            )(batch_sequences)
+
+            self.assertEqual(x.size(-1), ans_seq_len, msg=msg)
+            self.assertEqual(y.size(-1), ans_seq_len, msg=msg)
+            self.assertTrue(torch.equal(x, ans_x[:, :ans_seq_len]), msg=msg)
+            self.assertTrue(torch.equal(y, ans_y[:, :ans_seq_len]), msg=msg)
+
 
 if __name__ == '__main__':
     unittest.main()
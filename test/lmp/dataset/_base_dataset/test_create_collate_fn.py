@@ -1,7 +1,7 @@
 r"""Test `lmp.dataset.BaseDataset.create_collate_fn`.
 
 Usage:
-    python -m unittest test.lmp.dataset.test_create_collate_fn
+    python -m unittest test.lmp.dataset._base_dataset.test_create_collate_fn
 """
 
 # built-in modules
@@ -56,6 +56,12 @@ class TestCreateCollateFn(unittest.TestCase):
                         annotation=int,
                         default=-1
                     ),
+                    inspect.Parameter(
+                        name='is_dynamic_pad',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=Callable[
                     [Iterable[str]],
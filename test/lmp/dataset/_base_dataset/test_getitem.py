@@ -1,7 +1,7 @@
 r"""Test `lmp.dataset.BaseDataset.__getitem__`.
 
 Usage:
-    python -m unittest test.lmp.dataset.test_getitem
+    python -m unittest test.lmp.dataset._base_dataset.test_getitem
 """
 
 # built-in modules
@@ -61,20 +61,21 @@ class TestGetItem(unittest.TestCase):
         )
 
         for invalid_input in examples:
-            with self.assertRaises(
-                    (IndexError, TypeError),
-                    msg=msg1
-            ) as ctx_man:
-                BaseDataset([])[invalid_input]
-
-            if isinstance(ctx_man.exception, TypeError):
-                self.assertEqual(
-                    ctx_man.exception.args[0],
-                    '`index` must be an instance of `int`.',
-                    msg=msg2
-                )
-            else:
-                self.assertIsInstance(ctx_man.exception, IndexError)
+            for is_compact in (False, True):
+                with self.assertRaises(
+                        (IndexError, TypeError),
+                        msg=msg1
+                ) as ctx_man:
+                    BaseDataset([], is_compact=is_compact)[invalid_input]
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        '`index` must be an instance of `int`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertIsInstance(ctx_man.exception, IndexError)
 
     def test_return_type(self):
         r"""Return `str`."""
@@ -115,14 +116,19 @@ class TestGetItem(unittest.TestCase):
                 'Luigi get TKO.',
                 'Toad and Toadette are fightting over mushroom (weed).',
             ],
+            ['今天天氣很好', '', 'café'],
             [''],
             [],
         )
 
         for batch_sequences in examples:
-            dataset = BaseDataset(batch_sequences=batch_sequences)
-            for i in range(len(dataset)):
-                self.assertEqual(dataset[i], batch_sequences[i], msg=msg)
+            for is_compact in (False, True):
+                dataset = BaseDataset(
+                    batch_sequences=batch_sequences,
+                    is_compact=is_compact
+                )
+                for i in range(-len(dataset), len(dataset)):
+                    self.assertEqual(dataset[i], batch_sequences[i], msg=msg)
 
 
 if __name__ == '__main__':
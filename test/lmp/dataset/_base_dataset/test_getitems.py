@@ -0,0 +1,96 @@
+r"""Test `lmp.dataset.BaseDataset.__getitems__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._base_dataset.test_getitems
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import List
+
+# 3rd-party modules
+
+import torch.utils.data
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+
+
+class TestGetItems(unittest.TestCase):
+    r"""Test case for `lmp.dataset.BaseDataset.__getitems__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(BaseDataset.__getitems__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='indices',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[int],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[str]
+            ),
+            msg=msg
+        )
+
+    def test_return_value(self):
+        r"""Sample batch of sequences using indices."""
+        msg = 'Must sample batch of sequences using indices.'
+        batch_sequences = ['Hello', '今天天氣很好', '', 'café', 'World']
+        examples = ([], [0], [4, 1, 1], [3, 2, 1, 0, 4], [-1, -5])
+
+        for is_compact in (False, True):
+            dataset = BaseDataset(
+                batch_sequences=batch_sequences,
+                is_compact=is_compact
+            )
+            for indices in examples:
+                self.assertEqual(
+                    dataset.__getitems__(indices),
+                    [batch_sequences[index] for index in indices],
+                    msg=msg
+                )
+
+    def test_data_loader(self):
+        r"""Work with `torch.utils.data.DataLoader`."""
+        msg = 'Must work with `torch.utils.data.DataLoader`.'
+        batch_sequences = ['Hello', '今天天氣很好', '', 'café', 'World']
+
+        for is_compact in (False, True):
+            data_loader = torch.utils.data.DataLoader(
+                BaseDataset(
+                    batch_sequences=batch_sequences,
+                    is_compact=is_compact
+                ),
+                batch_size=2,
+                collate_fn=list
+            )
+            self.assertEqual(
+                [sequence for batch in data_loader for sequence in batch],
+                batch_sequences,
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 r"""Test `lmp.dataset.BaseDataset.__init__`.
 
 Usage:
-    python -m unittest test.lmp.dataset.test_init
+    python -m unittest test.lmp.dataset._base_dataset.test_init
 """
 
 # built-in modules
@@ -15,6 +15,7 @@ import inspect
 import math
 import unittest
 
+from array import array
 from typing import Iterable
 
 # self-made modules
@@ -44,6 +45,12 @@ class TestInit(unittest.TestCase):
                         annotation=Iterable[str],
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=inspect.Signature.empty
             ),
@@ -70,13 +77,38 @@ class TestInit(unittest.TestCase):
             ['', NotImplemented], ['', ...],
         )
 
+        for invalid_input in examples:
+            for is_compact in (False, True):
+                with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                    BaseDataset(
+                        batch_sequences=invalid_input,
+                        is_compact=is_compact
+                    )
+
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_sequences` must be an instance of '
+                    '`Iterable[str]`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_is_compact(self):
+        r"""Raise `TypeError` when input `is_compact` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `is_compact` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf, 0j,
+            1j, '', b'', (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
         for invalid_input in examples:
             with self.assertRaises(TypeError, msg=msg1) as ctx_man:
-                BaseDataset(batch_sequences=invalid_input)
+                BaseDataset(batch_sequences=[], is_compact=invalid_input)
 
             self.assertEqual(
                 ctx_man.exception.args[0],
-                '`batch_sequences` must be an instance of `Iterable[str]`.',
+                '`is_compact` must be an instance of `bool`.',
                 msg=msg2
             )
 
@@ -84,10 +116,16 @@ class TestInit(unittest.TestCase):
         r"""Declare required instance attributes."""
         msg1 = 'Missing instance attribute `{}`.'
         msg2 = 'Instance attribute `{}` must be an instance of `{}`.'
-        examples = (('batch_sequences', list),)
+        examples = (
+            (False, 'batch_sequences', list),
+            (False, 'is_compact', bool),
+            (True, 'buffer', bytes),
+            (True, 'is_compact', bool),
+            (True, 'offsets', array),
+        )
 
-        for attr, attr_type in examples:
-            dataset = BaseDataset(batch_sequences=[])
+        for is_compact, attr, attr_type in examples:
+            dataset = BaseDataset(batch_sequences=[], is_compact=is_compact)
             self.assertTrue(
                 hasattr(dataset, attr),
                 msg=msg1.format(attr)
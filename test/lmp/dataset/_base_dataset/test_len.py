@@ -1,7 +1,7 @@
 r"""Test `lmp.dataset.BaseDataset.__len__`.
 
 Usage:
-    python -m unittest test.lmp.dataset.test_len
+    python -m unittest test.lmp.dataset._base_dataset.test_len
 """
 
 # built-in modules
@@ -0,0 +1,202 @@
+r"""Test `lmp.dataset.FixedSizeBatchSampler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._fixed_size_batch_sampler.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset import FixedSizeBatchSampler
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FixedSizeBatchSampler.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(FixedSizeBatchSampler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='is_shuffle',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=True
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                FixedSizeBatchSampler(
+                    batch_size=invalid_input,
+                    dataset_size=10
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_dataset_size(self):
+        r"""Raise exception when input `dataset_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`dataset_size` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                FixedSizeBatchSampler(
+                    batch_size=1,
+                    dataset_size=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`dataset_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`dataset_size` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                FixedSizeBatchSampler(
+                    batch_size=1,
+                    dataset_size=10,
+                    seed=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        examples = (
+            ('batch_size', 3),
+            ('cursor', 0),
+            ('dataset_size', 10),
+            ('epoch', 0),
+            ('is_shuffle', False),
+            ('seed', 5),
+        )
+        batch_sampler = FixedSizeBatchSampler(
+            batch_size=3,
+            dataset_size=10,
+            is_shuffle=False,
+            seed=5
+        )
+
+        for attr, attr_val in examples:
+            self.assertEqual(
+                getattr(batch_sampler, attr),
+                attr_val,
+                msg=msg.format(attr, attr_val)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
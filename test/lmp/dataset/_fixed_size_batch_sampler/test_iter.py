@@ -0,0 +1,83 @@
+r"""Test `lmp.dataset.FixedSizeBatchSampler.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._fixed_size_batch_sampler.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+
+# self-made modules
+
+from lmp.dataset import FixedSizeBatchSampler
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.FixedSizeBatchSampler.__iter__`."""
+
+    def test_cover_all_indices(self):
+        r"""Each index is sampled exactly once per epoch."""
+        msg = 'Each index must be sampled exactly once per epoch.'
+        examples = ((1, 0), (1, 5), (2, 5), (3, 9), (10, 3))
+
+        for batch_size, dataset_size in examples:
+            for is_shuffle in (False, True):
+                batch_sampler = FixedSizeBatchSampler(
+                    batch_size=batch_size,
+                    dataset_size=dataset_size,
+                    is_shuffle=is_shuffle
+                )
+                batches = list(batch_sampler)
+
+                self.assertEqual(len(batches), len(batch_sampler), msg=msg)
+                self.assertTrue(
+                    all(map(
+                        lambda batch: 1 <= len(batch) <= batch_size,
+                        batches
+                    )),
+                    msg=msg
+                )
+                self.assertEqual(
+                    sorted(index for batch in batches for index in batch),
+                    list(range(dataset_size)),
+                    msg=msg
+                )
+
+    def test_no_shuffle(self):
+        r"""Sample in dataset order when `is_shuffle=False`."""
+        msg = 'Must sample in dataset order when `is_shuffle=False`.'
+        batch_sampler = FixedSizeBatchSampler(
+            batch_size=2,
+            dataset_size=5,
+            is_shuffle=False
+        )
+
+        self.assertEqual(list(batch_sampler), [[0, 1], [2, 3], [4]], msg=msg)
+
+    def test_reproducible(self):
+        r"""Sampling order only depends on `seed` and `epoch`."""
+        msg = 'Sampling order must only depend on `seed` and `epoch`.'
+
+        batch_samplers = [
+            FixedSizeBatchSampler(batch_size=4, dataset_size=100, seed=42)
+            for _ in range(2)
+        ]
+        self.assertEqual(
+            list(batch_samplers[0]),
+            list(batch_samplers[1]),
+            msg=msg
+        )
+
+        first_epoch = list(batch_samplers[0])
+        batch_samplers[0].set_epoch(1)
+        self.assertNotEqual(first_epoch, list(batch_samplers[0]), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
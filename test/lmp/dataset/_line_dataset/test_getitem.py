@@ -0,0 +1,146 @@
+r"""Test `lmp.dataset.LineDataset.__getitem__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._line_dataset.test_getitem
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import math
+import os
+import pickle
+import tempfile
+import unittest
+
+# self-made modules
+
+from lmp.dataset import LineDataset
+
+
+class TestGetItem(unittest.TestCase):
+    r"""Test case for `lmp.dataset.LineDataset.__getitem__`."""
+
+    def setUp(self):
+        r"""Setup fake text and JSONL files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sequences = ['今天天氣', 'Hello World', '日日是好日']
+        self.txt_path = os.path.join(self.temp_dir.name, 'corpus.txt')
+        self.jsonl_path = os.path.join(self.temp_dir.name, 'corpus.jsonl')
+
+        with open(self.txt_path, 'w', encoding='utf-8') as output_file:
+            output_file.write('\n'.join(self.sequences) + '\n')
+
+        with open(self.jsonl_path, 'w', encoding='utf-8') as output_file:
+            output_file.write(json.dumps({'text': self.sequences[0]}) + '\n')
+            output_file.write(json.dumps(self.sequences[1]) + '\n\n')
+            output_file.write(json.dumps(
+                {'id': 3, 'text': self.sequences[2]},
+                ensure_ascii=False
+            ))
+
+    def tearDown(self):
+        r"""Delete fake files."""
+        self.temp_dir.cleanup()
+        del self.jsonl_path
+        del self.sequences
+        del self.temp_dir
+        del self.txt_path
+
+    def test_invalid_input_index(self):
+        r"""Raise `IndexError` or `TypeError` when input `index` is invalid."""
+        msg1 = (
+            'Must raise `IndexError` or `TypeError` when input `index` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            3, -4, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+        dataset = LineDataset(file_path=self.txt_path)
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (IndexError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                dataset[invalid_input]
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`index` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    'dataset index out of range',
+                    msg=msg2
+                )
+
+    def test_return_value(self):
+        r"""Return decoded line of text or JSONL file."""
+        msg = 'Must return decoded line of text or JSONL file.'
+
+        for dataset in (
+                LineDataset(file_path=self.txt_path),
+                LineDataset(file_path=self.jsonl_path, is_jsonl=True),
+        ):
+            self.assertEqual(len(dataset), len(self.sequences), msg=msg)
+            self.assertEqual(list(dataset), self.sequences, msg=msg)
+
+            for index, ans_sequence in enumerate(self.sequences):
+                self.assertEqual(dataset[index], ans_sequence, msg=msg)
+                self.assertEqual(
+                    dataset[index - len(self.sequences)],
+                    ans_sequence,
+                    msg=msg
+                )
+
+            self.assertEqual(
+                dataset.__getitems__([2, 0]),
+                [self.sequences[2], self.sequences[0]],
+                msg=msg
+            )
+
+    def test_invalid_jsonl(self):
+        r"""Raise `ValueError` when JSONL line has no text."""
+        msg = 'Must raise `ValueError` when JSONL line has no text.'
+
+        with open(self.jsonl_path, 'w', encoding='utf-8') as output_file:
+            output_file.write('{"title": "a"}\n1\n')
+
+        dataset = LineDataset(file_path=self.jsonl_path, is_jsonl=True)
+        for index in range(len(dataset)):
+            with self.assertRaises(ValueError, msg=msg) as ctx_man:
+                dataset[index]
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                f'Line {index} of {self.jsonl_path} must be a JSON string or '
+                'a JSON object with string field `text`.',
+                msg=msg
+            )
+
+    def test_pickle(self):
+        r"""Dataset can be pickled to `DataLoader` workers."""
+        msg = 'Dataset must be picklable after memory mapped.'
+        dataset = LineDataset(file_path=self.txt_path)
+        dataset[0]
+
+        self.assertEqual(
+            list(pickle.loads(pickle.dumps(dataset))),
+            self.sequences,
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
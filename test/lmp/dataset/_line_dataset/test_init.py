@@ -0,0 +1,210 @@
+r"""Test `lmp.dataset.LineDataset.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._line_dataset.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import os
+import tempfile
+import unittest
+
+from typing import Optional
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import LineDataset
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.LineDataset.__init__`."""
+
+    def setUp(self):
+        r"""Setup fake text file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'corpus.txt')
+        with open(self.file_path, 'wb') as output_file:
+            output_file.write('今天\n\nHello\r\nWorld'.encode('utf-8'))
+
+    def tearDown(self):
+        r"""Delete fake text file."""
+        self.temp_dir.cleanup()
+        del self.file_path
+        del self.temp_dir
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(LineDataset.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='file_path',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='is_jsonl',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
+                    inspect.Parameter(
+                        name='offsets',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[np.ndarray],
+                        default=None
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_file_path(self):
+        r"""Raise exception when input `file_path` is invalid."""
+        msg1 = (
+            'Must raise `FileNotFoundError` or `TypeError` when input '
+            '`file_path` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, b'', (),
+            [], {}, set(), object(), lambda x: x, type, None, NotImplemented,
+            ..., 'I-AM-NOT-EXIST.txt',
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (FileNotFoundError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                LineDataset(file_path=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`file_path` must be an instance of `str`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    f'File {invalid_input} does not exist.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_offsets(self):
+        r"""Raise exception when input `offsets` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `offsets` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, '', (), [], {}, object(), np.zeros(3),
+            np.zeros((3, 3)),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                LineDataset(file_path=self.file_path, offsets=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`offsets` must be an instance of `Optional[np.ndarray]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`offsets` must have shape `(N, 2)`.',
+                    msg=msg2
+                )
+
+    def test_build_index(self):
+        r"""Index non-empty lines without trailing newline."""
+        msg = 'Must index non-empty lines without trailing newline.'
+        examples = (
+            (b'', []),
+            (b'\n\n', []),
+            (b'a', [[0, 1]]),
+            (b'a\n', [[0, 1]]),
+            (b'a\n\nbc\n', [[0, 1], [3, 5]]),
+            (b'a\r\nbc', [[0, 2], [3, 5]]),
+            (b'\r\n\r\n', []),
+            (b'a\r\n\r\nb\r\n\r', [[0, 2], [5, 7]]),
+            (b'\r\nb\nc\r\n', [[2, 3], [4, 6]]),
+        )
+
+        for content, ans_offsets in examples:
+            with open(self.file_path, 'wb') as output_file:
+                output_file.write(content)
+
+            self.assertEqual(
+                LineDataset.build_index(self.file_path).tolist(),
+                ans_offsets,
+                msg=msg
+            )
+
+    def test_build_index_across_chunks(self):
+        r"""Chunk boundaries do not affect index."""
+        msg = 'Chunk boundaries must not affect index.'
+        ans_offsets = LineDataset.build_index(self.file_path).tolist()
+
+        try:
+            LineDataset.chunk_size = 3
+            self.assertEqual(
+                LineDataset.build_index(self.file_path).tolist(),
+                ans_offsets,
+                msg=msg
+            )
+        finally:
+            LineDataset.chunk_size = 1 << 26
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        dataset = LineDataset(file_path=self.file_path)
+
+        self.assertIsInstance(dataset, BaseDataset, msg=msg)
+        self.assertEqual(
+            dataset.file_path,
+            self.file_path,
+            msg=msg.format('file_path', self.file_path)
+        )
+        self.assertFalse(dataset.is_jsonl, msg=msg.format('is_jsonl', False))
+        self.assertEqual(
+            dataset.offsets.tolist(),
+            [[0, 6], [8, 14], [15, 20]],
+            msg=msg.format('offsets', [[0, 6], [8, 14], [15, 20]])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
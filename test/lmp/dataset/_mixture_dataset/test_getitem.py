@@ -0,0 +1,121 @@
+r"""Test `lmp.dataset.MixtureDataset.__getitem__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._mixture_dataset.test_getitem
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import MixtureDataset
+
+
+class TestGetItem(unittest.TestCase):
+    r"""Test case for `lmp.dataset.MixtureDataset.__getitem__`."""
+
+    def setUp(self):
+        r"""Setup fixed mixture dataset."""
+        self.dataset = MixtureDataset(
+            datasets={
+                'a': BaseDataset([f'a{i}' for i in range(10)]),
+                'b': BaseDataset([f'b{i}' for i in range(1000)]),
+            },
+            num_samples=100,
+            weights={'a': 0.5, 'b': 0.5}
+        )
+
+    def tearDown(self):
+        r"""Delete fixed mixture dataset."""
+        del self.dataset
+
+    def test_invalid_input_index(self):
+        r"""Raise `IndexError` or `TypeError` when input `index` is invalid."""
+        msg1 = (
+            'Must raise `IndexError` or `TypeError` when input `index` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            100, -101, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (IndexError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                self.dataset[invalid_input]
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`index` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    'dataset index out of range',
+                    msg=msg2
+                )
+
+    def test_mixture_ratio(self):
+        r"""Sample each source by its weight."""
+        msg = 'Must sample each source by its weight.'
+        sequences = [self.dataset[index] for index in range(100)]
+        counter = collections.Counter(sequences)
+
+        # Up-weighted source is repeated evenly.
+        self.assertEqual(
+            {sequence for sequence in counter if sequence[0] == 'a'},
+            {f'a{i}' for i in range(10)},
+            msg=msg
+        )
+        self.assertTrue(
+            all(map(
+                lambda sequence: counter[sequence] == 5,
+                [f'a{i}' for i in range(10)]
+            )),
+            msg=msg
+        )
+
+        # Down-weighted source is subsampled uniformly from an offset.
+        indices = [
+            int(sequence[1:])
+            for sequence in sequences
+            if sequence[0] == 'b'
+        ]
+        self.assertEqual(len(indices), 50, msg=msg)
+        self.assertEqual(
+            indices,
+            [(indices[0] + i) % 1000 for i in range(0, 1000, 20)],
+            msg=msg
+        )
+        self.assertEqual(self.dataset.counters, {'a': 50, 'b': 50}, msg=msg)
+
+    def test_iter_not_counted(self):
+        r"""Iteration is not counted in `counters`."""
+        msg = 'Iteration must not be counted in `counters`.'
+
+        self.assertEqual(
+            list(self.dataset),
+            [self.dataset[index] for index in range(100)],
+            msg=msg
+        )
+        self.assertEqual(self.dataset.counters, {'a': 50, 'b': 50}, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
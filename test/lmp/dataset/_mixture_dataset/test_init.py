@@ -0,0 +1,252 @@
+r"""Test `lmp.dataset.MixtureDataset.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._mixture_dataset.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Dict
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import MixtureDataset
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.MixtureDataset.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed source datasets."""
+        self.datasets = {
+            'a': BaseDataset(['a1', 'a2']),
+            'b': BaseDataset(['b1', 'b2', 'b3']),
+        }
+
+    def tearDown(self):
+        r"""Delete fixed source datasets."""
+        del self.datasets
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(MixtureDataset.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='datasets',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Dict[str, BaseDataset],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='weights',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Dict[str, float],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_datasets(self):
+        r"""Raise exception when input `datasets` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `datasets` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., {'a': ['a1']},
+            {0: BaseDataset(['a1'])}, {}, {'a': BaseDataset([])},
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                MixtureDataset(datasets=invalid_input, weights={'a': 1.0})
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`datasets` must be an instance of '
+                    '`Dict[str, lmp.dataset.BaseDataset]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`datasets` must not be empty and each dataset must not '
+                    'be empty.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_weights(self):
+        r"""Raise exception when input `weights` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `weights` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            {'a': '1', 'b': 1.0}, {'a': True, 'b': 1.0}, {'a': 1.0},
+            {'a': 1.0, 'b': 0.0}, {'a': 1.0, 'b': -1}, {'a': 1, 'c': 1},
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                MixtureDataset(datasets=self.datasets, weights=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`weights` must be an instance of `Dict[str, float]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`weights` must have the same keys as `datasets` and each '
+                    'weight must be bigger than `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_num_samples(self):
+        r"""Raise exception when input `num_samples` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `num_samples` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -2, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                MixtureDataset(
+                    datasets=self.datasets,
+                    num_samples=invalid_input,
+                    weights={'a': 1, 'b': 1}
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_samples` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`num_samples` must be bigger than or equal to `1` or '
+                    'equal to `-1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                MixtureDataset(
+                    datasets=self.datasets,
+                    seed=invalid_input,
+                    weights={'a': 1, 'b': 1}
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        dataset = MixtureDataset(
+            datasets=self.datasets,
+            weights={'a': 3, 'b': 1.0}
+        )
+        examples = (
+            ('counters', {'a': 0, 'b': 0}),
+            ('datasets', self.datasets),
+            ('epoch', 0),
+            ('names', ['a', 'b']),
+            ('num_samples', 5),
+            ('seed', 1),
+            ('weights', {'a': 0.75, 'b': 0.25}),
+        )
+
+        for attr, attr_val in examples:
+            self.assertEqual(
+                getattr(dataset, attr),
+                attr_val,
+                msg=msg.format(attr, attr_val)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+r"""Test `lmp.dataset.MixtureDataset.set_epoch`.
+
+Usage:
+    python -m unittest test.lmp.dataset._mixture_dataset.test_set_epoch
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import MixtureDataset
+
+
+class TestSetEpoch(unittest.TestCase):
+    r"""Test case for `lmp.dataset.MixtureDataset.set_epoch`."""
+
+    def setUp(self):
+        r"""Setup fixed mixture dataset."""
+        self.dataset = MixtureDataset(
+            datasets={
+                'a': BaseDataset([f'a{i}' for i in range(10)]),
+                'b': BaseDataset([f'b{i}' for i in range(1000)]),
+            },
+            num_samples=100,
+            weights={'a': 0.5, 'b': 0.5}
+        )
+
+    def tearDown(self):
+        r"""Delete fixed mixture dataset."""
+        del self.dataset
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                {'epoch': -1}, ValueError,
+                '`epoch` must be bigger than or equal to `0`.',
+            ),
+            (
+                {'epoch': 1.0}, TypeError,
+                '`epoch` must be an instance of `int`.',
+            ),
+            (
+                {'epoch': None}, TypeError,
+                '`epoch` must be an instance of `int`.',
+            ),
+            (
+                {'epoch': 1, 'seed': -1}, ValueError,
+                '`seed` must be bigger than or equal to `0`.',
+            ),
+            (
+                {'epoch': 1, 'seed': math.nan}, TypeError,
+                '`seed` must be an instance of `Optional[int]`.',
+            ),
+            (
+                {'epoch': 1, 'seed': ''}, TypeError,
+                '`seed` must be an instance of `Optional[int]`.',
+            ),
+        )
+
+        for kwargs, error, message in examples:
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                self.dataset.set_epoch(**kwargs)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def sampled(self):
+        r"""Sequences of down-weighted source in current epoch."""
+        return {
+            sequence
+            for sequence in self.dataset
+            if sequence[0] == 'b'
+        }
+
+    def test_coverage_changes_across_epochs(self):
+        r"""Sample different sequences of down-weighted source each epoch."""
+        msg = 'Must sample different sequences each epoch.'
+        covered = set()
+        epochs = []
+
+        for epoch in range(20):
+            self.dataset.set_epoch(epoch)
+            sampled = self.sampled()
+
+            # Each epoch still subsamples the same number of sequences.
+            self.assertEqual(len(sampled), 50, msg=msg)
+
+            epochs.append(sampled)
+            covered |= sampled
+
+        self.assertGreater(len(set(map(frozenset, epochs))), 1, msg=msg)
+        self.assertGreater(len(covered), 50 * 10, msg=msg)
+
+    def test_reproducible(self):
+        r"""Sampled sequences only depend on `seed` and `epoch`."""
+        msg = 'Sampled sequences must only depend on `seed` and `epoch`.'
+
+        self.dataset.set_epoch(3)
+        expected = list(self.dataset)
+
+        self.dataset.set_epoch(4)
+        self.dataset.set_epoch(3)
+        self.assertEqual(list(self.dataset), expected, msg=msg)
+
+        self.dataset.set_epoch(3, seed=2)
+        self.assertEqual(self.dataset.seed, 2, msg=msg)
+        self.assertNotEqual(list(self.dataset), expected, msg=msg)
+
+        self.dataset.set_epoch(3, seed=1)
+        self.assertEqual(list(self.dataset), expected, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
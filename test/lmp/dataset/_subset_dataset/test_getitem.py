@@ -0,0 +1,84 @@
+r"""Test `lmp.dataset.SubsetDataset.__getitem__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._subset_dataset.test_getitem
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import unittest
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import SubsetDataset
+
+
+class TestGetItem(unittest.TestCase):
+    r"""Test case for `lmp.dataset.SubsetDataset.__getitem__`."""
+
+    def setUp(self):
+        r"""Setup fixed subset dataset."""
+        self.dataset = SubsetDataset(
+            dataset=BaseDataset(['a', 'b', 'c', 'd']),
+            indices=[3, 1, 1]
+        )
+
+    def tearDown(self):
+        r"""Delete fixed subset dataset."""
+        del self.dataset
+
+    def test_invalid_input_index(self):
+        r"""Raise `IndexError` or `TypeError` when input `index` is invalid."""
+        msg1 = (
+            'Must raise `IndexError` or `TypeError` when input `index` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            3, -4, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (IndexError, TypeError),
+                    msg=msg1
+            ) as ctx_man:
+                self.dataset[invalid_input]
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`index` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    'dataset index out of range',
+                    msg=msg2
+                )
+
+    def test_select_by_indices(self):
+        r"""Sample sequences selected by `indices` in order."""
+        msg = 'Must sample sequences selected by `indices` in order.'
+
+        self.assertEqual(len(self.dataset), 3, msg=msg)
+        self.assertEqual(
+            [self.dataset[index] for index in range(3)],
+            ['d', 'b', 'b'],
+            msg=msg
+        )
+        self.assertEqual(self.dataset[-3], 'd', msg=msg)
+        self.assertEqual(list(self.dataset), ['d', 'b', 'b'], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+r"""Test `lmp.dataset.SubsetDataset.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._subset_dataset.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Iterable
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset import BaseDataset
+from lmp.dataset import SubsetDataset
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.SubsetDataset.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed source dataset."""
+        self.dataset = BaseDataset(['a', 'b', 'c'])
+
+    def tearDown(self):
+        r"""Delete fixed source dataset."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(SubsetDataset.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='indices',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[int],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., ['a'],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                SubsetDataset(dataset=invalid_input, indices=[0])
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `lmp.dataset.BaseDataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_indices(self):
+        r"""Raise exception when input `indices` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `indices` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, object(), lambda x: x, type, None,
+            NotImplemented, ..., 'ab', [0.0], [[0]], ['0'], [None],
+            np.array([[0, 1]]), [-1], [3], np.array([0, 5]),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                SubsetDataset(dataset=self.dataset, indices=invalid_input)
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`indices` must be an instance of `Iterable[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`indices` must be in range `[0, len(dataset))`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        dataset = SubsetDataset(dataset=self.dataset, indices=(2, 0))
+
+        self.assertIs(dataset.dataset, self.dataset, msg=msg.format(
+            'dataset',
+            self.dataset
+        ))
+        self.assertEqual(dataset.indices.dtype, np.int64, msg=msg.format(
+            'indices.dtype',
+            np.int64
+        ))
+        self.assertEqual(dataset.indices.tolist(), [2, 0], msg=msg.format(
+            'indices',
+            [2, 0]
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
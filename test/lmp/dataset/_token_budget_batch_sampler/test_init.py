@@ -0,0 +1,202 @@
+r"""Test `lmp.dataset.TokenBudgetBatchSampler.__init__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._token_budget_batch_sampler.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Iterable
+
+# self-made modules
+
+from lmp.dataset import TokenBudgetBatchSampler
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.dataset.TokenBudgetBatchSampler.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(TokenBudgetBatchSampler.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_lengths',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[int],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='is_shuffle',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=True
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_lengths(self):
+        r"""Raise exception when input `batch_lengths` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`batch_lengths` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, object(),
+            lambda x: x, type, None, NotImplemented, ..., [0.0], [''], [0],
+            [-1], [2, 0],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    batch_lengths=invalid_input,
+                    max_tokens=10
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_lengths` must be an instance of `Iterable[int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_lengths` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_tokens(self):
+        r"""Raise exception when input `max_tokens` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_tokens` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    batch_lengths=[2, 3],
+                    max_tokens=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_tokens` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_max_seq_len(self):
+        r"""Raise exception when input `max_seq_len` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `max_seq_len` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -2, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                TokenBudgetBatchSampler(
+                    batch_lengths=[2, 3],
+                    max_seq_len=invalid_input,
+                    max_tokens=10
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`max_seq_len` must be greater than `1` or equal to `-1`.',
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        batch_sampler = TokenBudgetBatchSampler(
+            batch_lengths=[2, 10, 5],
+            max_seq_len=6,
+            max_tokens=12
+        )
+
+        self.assertEqual(
+            batch_sampler.batch_lengths.tolist(),
+            [2, 6, 5],
+            msg=msg.format('batch_lengths', [2, 6, 5])
+        )
+        self.assertEqual(batch_sampler.epoch, 0, msg=msg.format('epoch', 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+r"""Test `lmp.dataset.TokenBudgetBatchSampler.__iter__`.
+
+Usage:
+    python -m unittest test.lmp.dataset._token_budget_batch_sampler.test_iter
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+from lmp.dataset import TokenBudgetBatchSampler
+
+
+class TestIter(unittest.TestCase):
+    r"""Test case for `lmp.dataset.TokenBudgetBatchSampler.__iter__`."""
+
+    def setUp(self):
+        r"""Setup random sequence lengths."""
+        self.batch_lengths = np.random.default_rng(0).integers(
+            2,
+            100,
+            size=1000
+        ).tolist()
+
+    def tearDown(self):
+        r"""Delete sequence lengths."""
+        del self.batch_lengths
+
+    def test_cover_all_indices(self):
+        r"""Each index is sampled exactly once per epoch."""
+        msg = 'Each index must be sampled exactly once per epoch.'
+
+        for is_shuffle in (False, True):
+            batch_sampler = TokenBudgetBatchSampler(
+                batch_lengths=self.batch_lengths,
+                is_shuffle=is_shuffle,
+                max_tokens=256
+            )
+            indices = [index for batch in batch_sampler for index in batch]
+            self.assertEqual(
+                sorted(indices),
+                list(range(len(self.batch_lengths))),
+                msg=msg
+            )
+            self.assertEqual(
+                len(list(batch_sampler)),
+                len(batch_sampler),
+                msg=msg
+            )
+
+    def test_token_budget(self):
+        r"""Padded mini-batch size is bounded by `max_tokens`."""
+        msg = 'Padded mini-batch size must be bounded by `max_tokens`.'
+        examples = ((256, -1), (256, 32), (1000, 50), (99, -1))
+
+        for max_tokens, max_seq_len in examples:
+            batch_sampler = TokenBudgetBatchSampler(
+                batch_lengths=self.batch_lengths,
+                max_seq_len=max_seq_len,
+                max_tokens=max_tokens
+            )
+            for batch in batch_sampler:
+                lengths = batch_sampler.batch_lengths[batch]
+                self.assertTrue(
+                    len(batch) == 1 or
+                    len(batch) * lengths.max() <= max_tokens,
+                    msg=msg
+                )
+
+    def test_oversized_sequence(self):
+        r"""Sequence longer than `max_tokens` form mini-batch by itself."""
+        msg = 'Sequence longer than `max_tokens` must be sampled alone.'
+        batch_sampler = TokenBudgetBatchSampler(
+            batch_lengths=[3, 50, 3],
+            is_shuffle=False,
+            max_tokens=10
+        )
+
+        self.assertEqual(list(batch_sampler), [[0, 2], [1]], msg=msg)
+
+    def test_reproducible(self):
+        r"""Sampling order only depends on `seed` and `epoch`."""
+        msg = 'Sampling order must only depend on `seed` and `epoch`.'
+
+        batch_samplers = [
+            TokenBudgetBatchSampler(
+                batch_lengths=self.batch_lengths,
+                max_tokens=256,
+                seed=42
+            )
+            for _ in range(2)
+        ]
+        self.assertEqual(
+            list(batch_samplers[0]),
+            list(batch_samplers[1]),
+            msg=msg
+        )
+
+        first_epoch = list(batch_samplers[0])
+        batch_samplers[0].set_epoch(1)
+        self.assertNotEqual(first_epoch, list(batch_samplers[0]), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -48,10 +48,12 @@ class TestModel(unittest.TestCase):
             'BaseRNNModel',
             'GRUModel',
             'LSTMModel',
+            'PrefixStateCache',
             'ResGRUBlock',
             'ResGRUModel',
             'ResLSTMBlock',
             'ResLSTMModel',
+            'RNNState',
         )
 
         try:
@@ -0,0 +1,178 @@
+r"""Test `lmp.model.BaseRNNModel.init_state`.
+
+Usage:
+    python -m unittest test.lmp.model._base_rnn_model.test_init_state
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import RNNState
+from lmp.model import BaseRNNModel
+
+
+class TestInitState(unittest.TestCase):
+    r"""Test case for `lmp.model.BaseRNNModel.init_state`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch_range = [1, 2]
+        cls.d_emb_range = [1, 10]
+        cls.d_hid_range = [1, 10]
+        cls.dropout_range = [0.0, 0.1, 0.5, 1.0]
+        cls.num_linear_layers_range = [1, 2]
+        cls.num_rnn_layers_range = [1, 2]
+        cls.pad_token_id_range = [0, 1, 2, 3]
+        cls.sequence_range = list(range(1, 5))
+        cls.vocab_size_range = [1, 5]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batch_range
+        del cls.d_emb_range
+        del cls.d_hid_range
+        del cls.dropout_range
+        del cls.num_linear_layers_range
+        del cls.num_rnn_layers_range
+        del cls.pad_token_id_range
+        del cls.sequence_range
+        del cls.vocab_size_range
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `BaseRNNModel`."""
+        self.model_objs = []
+        cls = self.__class__
+        for d_emb in cls.d_emb_range:
+            for d_hid in cls.d_hid_range:
+                for dropout in cls.dropout_range:
+                    for num_linear_layers in cls.num_linear_layers_range:
+                        for num_rnn_layers in cls.num_rnn_layers_range:
+                            for pad_token_id in cls.pad_token_id_range:
+                                for vocab_size in cls.vocab_size_range:
+                                    # skip invalid construct.
+                                    if vocab_size <= pad_token_id:
+                                        continue
+
+                                    model = BaseRNNModel(
+                                        d_emb=d_emb,
+                                        d_hid=d_hid,
+                                        dropout=dropout,
+                                        num_linear_layers=num_linear_layers,
+                                        num_rnn_layers=num_rnn_layers,
+                                        pad_token_id=pad_token_id,
+                                        vocab_size=vocab_size
+                                    )
+                                    self.model_objs.append({
+                                        'd_emb': d_emb,
+                                        'd_hid': d_hid,
+                                        'dropout': dropout,
+                                        'model': model,
+                                        'num_linear_layers': num_linear_layers,
+                                        'num_rnn_layers': num_rnn_layers,
+                                        'pad_token_id': pad_token_id,
+                                        'vocab_size': vocab_size,
+                                    })
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model_objs
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(BaseRNNModel.init_state),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=RNNState
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            model = self.model_objs[0]['model']
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                model.init_state(batch_size=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_return_value(self):
+        r"""Return zero hidden state with batch size `batch_size`."""
+        msg = 'Must return zero hidden state with batch size `batch_size`.'
+
+        for batch_size in self.__class__.batch_range:
+            for model_obj in self.model_objs:
+                state = model_obj['model'].init_state(batch_size=batch_size)
+
+                self.assertIsInstance(state, RNNState, msg=msg)
+                self.assertEqual(state.batch_size, batch_size, msg=msg)
+                for hidden in state.tensors():
+                    self.assertEqual(
+                        hidden.size(),
+                        torch.Size([
+                            hidden.size(0),
+                            batch_size,
+                            model_obj['d_hid']
+                        ]),
+                        msg=msg
+                    )
+                    self.assertTrue((hidden == 0).all(), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
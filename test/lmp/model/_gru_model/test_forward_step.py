@@ -0,0 +1,312 @@
+r"""Test `lmp.model.GRUModel.forward_step`.
+
+Usage:
+    python -m unittest test.lmp.model._gru_model.test_forward_step
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Optional
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import RNNState
+from lmp.model import GRUModel
+
+
+class TestForwardStep(unittest.TestCase):
+    r"""Test case for `lmp.model.GRUModel.forward_step`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch_range = [1, 2]
+        cls.d_emb_range = [1, 10]
+        cls.d_hid_range = [1, 10]
+        cls.dropout_range = [0.0, 0.1, 0.5, 1.0]
+        cls.num_linear_layers_range = [1, 2]
+        cls.num_rnn_layers_range = [1, 2]
+        cls.pad_token_id_range = [0, 1, 2, 3]
+        cls.sequence_range = list(range(1, 5))
+        cls.vocab_size_range = [1, 5]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batch_range
+        del cls.d_emb_range
+        del cls.d_hid_range
+        del cls.dropout_range
+        del cls.num_linear_layers_range
+        del cls.num_rnn_layers_range
+        del cls.pad_token_id_range
+        del cls.sequence_range
+        del cls.vocab_size_range
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `GRUModel`."""
+        self.model_objs = []
+        cls = self.__class__
+        for d_emb in cls.d_emb_range:
+            for d_hid in cls.d_hid_range:
+                for dropout in cls.dropout_range:
+                    for num_linear_layers in cls.num_linear_layers_range:
+                        for num_rnn_layers in cls.num_rnn_layers_range:
+                            for pad_token_id in cls.pad_token_id_range:
+                                for vocab_size in cls.vocab_size_range:
+                                    # skip invalid construct.
+                                    if vocab_size <= pad_token_id:
+                                        continue
+
+                                    model = GRUModel(
+                                        d_emb=d_emb,
+                                        d_hid=d_hid,
+                                        dropout=dropout,
+                                        num_linear_layers=num_linear_layers,
+                                        num_rnn_layers=num_rnn_layers,
+                                        pad_token_id=pad_token_id,
+                                        vocab_size=vocab_size
+                                    )
+                                    self.model_objs.append({
+                                        'd_emb': d_emb,
+                                        'd_hid': d_hid,
+                                        'dropout': dropout,
+                                        'model': model,
+                                        'num_linear_layers': num_linear_layers,
+                                        'num_rnn_layers': num_rnn_layers,
+                                        'pad_token_id': pad_token_id,
+                                        'vocab_size': vocab_size,
+                                    })
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model_objs
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(GRUModel.forward_step),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='state',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[RNNState],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='batch_lengths',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Tensor],
+                        default=None
+                    ),
+                ],
+                return_annotation=Tuple[torch.Tensor, RNNState]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise exception when input `batch_sequences` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`batch_sequences` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            torch.tensor([0, 1]), torch.zeros(1, 1, 1, dtype=torch.int64),
+        )
+
+        for invalid_input in examples:
+            model = self.model_objs[0]['model']
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                model.forward_step(batch_sequences=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_sequences` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_sequences` must have shape `(B, S)`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_state(self):
+        r"""Raise exception when input `state` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `state` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        model = self.model_objs[0]['model']
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, NotImplemented,
+            ..., torch.zeros(1, 2, 1), model.init_state(batch_size=3),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                model.forward_step(
+                    batch_sequences=torch.zeros(2, 1, dtype=torch.int64),
+                    state=invalid_input
+                )
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`state` must be an instance of `lmp.model.RNNState`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`state` must have the same batch size as '
+                    '`batch_sequences`.',
+                    msg=msg2
+                )
+
+    def test_return_size(self):
+        r"""Return logits with shape `(B, S, V)` and state with batch `B`."""
+        msg = 'Must return logits with shape `(B, S, V)` and state with `B`.'
+
+        for batch_size in self.__class__.batch_range:
+            for sequence_len in self.__class__.sequence_range:
+                for model_obj in self.model_objs:
+                    x = torch.randint(
+                        0,
+                        model_obj['vocab_size'],
+                        (batch_size, sequence_len)
+                    )
+                    logits, state = model_obj['model'].forward_step(x)
+
+                    self.assertEqual(
+                        logits.size(),
+                        torch.Size([
+                            batch_size,
+                            sequence_len,
+                            model_obj['vocab_size']
+                        ]),
+                        msg=msg
+                    )
+                    self.assertIsInstance(state, RNNState, msg=msg)
+                    self.assertEqual(state.batch_size, batch_size, msg=msg)
+
+    def test_continue_from_state(self):
+        r"""Step-by-step logits are the same as `forward`."""
+        msg = 'Step-by-step logits must be the same as `forward`.'
+
+        for model_obj in self.model_objs:
+            # Dropout makes outputs random.
+            if model_obj['dropout'] != 0.0:
+                continue
+
+            model = model_obj['model']
+            x = torch.randint(0, model_obj['vocab_size'], (3, 5))
+            ans_logits = model(x)
+
+            logits, state = model.forward_step(x[:, :2])
+            step_logits = [logits]
+            for i in range(2, 5):
+                # Reorder state back and forth along batch dimension.
+                state = RNNState.cat([state[2], state[:2]])
+                state = state[torch.tensor([1, 2, 0])]
+                logits, state = model.forward_step(x[:, i:i + 1], state)
+                step_logits.append(logits)
+
+            self.assertTrue(
+                torch.allclose(
+                    torch.cat(step_logits, dim=1),
+                    ans_logits,
+                    atol=1e-6
+                ),
+                msg=msg
+            )
+
+
+    def test_batch_lengths(self):
+        r"""Skip padding tokens and return state after last real token."""
+        msg = 'Must skip padding tokens and return state after last token.'
+        batch_lengths = torch.tensor([3, 1, 4])
+
+        for model_obj in self.model_objs:
+            # Dropout makes outputs random.
+            if model_obj['dropout'] != 0.0:
+                continue
+
+            model = model_obj['model']
+            x = torch.randint(0, model_obj['vocab_size'], (3, 4))
+            init_state = model.init_state(batch_size=3).apply(torch.rand_like)
+            logits, state = model.forward_step(
+                x,
+                init_state,
+                batch_lengths=batch_lengths
+            )
+
+            self.assertEqual(
+                logits.size(),
+                torch.Size([8, model_obj['vocab_size']]),
+                msg=msg
+            )
+
+            ans_logits = []
+            for i, length in enumerate(batch_lengths.tolist()):
+                seq_logits, seq_state = model.forward_step(
+                    x[i:i + 1, :length],
+                    init_state[i]
+                )
+                ans_logits.append(seq_logits[0])
+
+                for ans, hidden in zip(
+                        seq_state.tensors(),
+                        state[i].tensors()
+                ):
+                    self.assertTrue(
+                        torch.allclose(hidden, ans, atol=1e-6),
+                        msg=msg
+                    )
+
+            self.assertTrue(
+                torch.allclose(logits, torch.cat(ans_logits), atol=1e-6),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
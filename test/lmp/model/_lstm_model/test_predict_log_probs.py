@@ -0,0 +1,230 @@
+r"""Test `lmp.model.LSTMModel.predict_log_probs`.
+
+Usage:
+    python -m unittest test.lmp.model._lstm_model.test_predict_log_probs
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Optional
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import LSTMModel
+
+
+class TestPredictLogProbs(unittest.TestCase):
+    r"""Test case for `lmp.model.LSTMModel.predict_log_probs`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch_range = [1, 2]
+        cls.d_emb_range = [1, 10]
+        cls.d_hid_range = [1, 10]
+        cls.dropout_range = [0.0, 0.1, 0.5, 1.0]
+        cls.num_linear_layers_range = [1, 2]
+        cls.num_rnn_layers_range = [1, 2]
+        cls.pad_token_id_range = [0, 1, 2, 3]
+        cls.sequence_range = list(range(1, 5))
+        cls.vocab_size_range = [1, 5]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batch_range
+        del cls.d_emb_range
+        del cls.d_hid_range
+        del cls.dropout_range
+        del cls.num_linear_layers_range
+        del cls.num_rnn_layers_range
+        del cls.pad_token_id_range
+        del cls.sequence_range
+        del cls.vocab_size_range
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `LSTMModel`."""
+        self.model_objs = []
+        cls = self.__class__
+        for d_emb in cls.d_emb_range:
+            for d_hid in cls.d_hid_range:
+                for dropout in cls.dropout_range:
+                    for num_linear_layers in cls.num_linear_layers_range:
+                        for num_rnn_layers in cls.num_rnn_layers_range:
+                            for pad_token_id in cls.pad_token_id_range:
+                                for vocab_size in cls.vocab_size_range:
+                                    # skip invalid construct.
+                                    if vocab_size <= pad_token_id:
+                                        continue
+
+                                    model = LSTMModel(
+                                        d_emb=d_emb,
+                                        d_hid=d_hid,
+                                        dropout=dropout,
+                                        num_linear_layers=num_linear_layers,
+                                        num_rnn_layers=num_rnn_layers,
+                                        pad_token_id=pad_token_id,
+                                        vocab_size=vocab_size
+                                    )
+                                    self.model_objs.append({
+                                        'd_emb': d_emb,
+                                        'd_hid': d_hid,
+                                        'dropout': dropout,
+                                        'model': model,
+                                        'num_linear_layers': num_linear_layers,
+                                        'num_rnn_layers': num_rnn_layers,
+                                        'pad_token_id': pad_token_id,
+                                        'vocab_size': vocab_size,
+                                    })
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model_objs
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(LSTMModel.predict_log_probs),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.Tensor,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='positions',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Tensor],
+                        default=None
+                    ),
+                ],
+                return_annotation=torch.Tensor
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_sequences(self):
+        r"""Raise `TypeError` when input `batch_sequences` is invalid."""
+        msg = 'Must raise `TypeError` when input `batch_sequences` is invalid.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            model = self.model_objs[0]['model']
+            with self.assertRaises(TypeError, msg=msg):
+                model.predict_log_probs(batch_sequences=invalid_input)
+
+    def test_invalid_input_positions(self):
+        r"""Raise exception when input `positions` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `positions` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, NotImplemented,
+            ..., torch.tensor(0), torch.tensor([3]), torch.tensor([-4]),
+            torch.tensor([[0], [1], [2]]), torch.zeros(2, 1, 1).long(),
+        )
+
+        for invalid_input in examples:
+            model = self.model_objs[0]['model']
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                model.predict_log_probs(
+                    batch_sequences=torch.zeros(2, 3, dtype=torch.int64),
+                    positions=invalid_input
+                )
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`positions` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`positions` must have shape `(P)` or `(B, P)` and each '
+                    'position must range from `-S` to `S - 1`.',
+                    msg=msg2
+                )
+
+    def test_return_value(self):
+        r"""Return log of `predict` at selected positions."""
+        msg = 'Must return log of `predict` at selected positions.'
+
+        for batch_size in self.__class__.batch_range:
+            for sequence_len in self.__class__.sequence_range:
+                for model_obj in self.model_objs:
+                    # Dropout makes outputs random.
+                    if model_obj['dropout'] != 0.0:
+                        continue
+
+                    model = model_obj['model']
+                    x = torch.randint(
+                        0,
+                        model_obj['vocab_size'],
+                        (batch_size, sequence_len)
+                    )
+                    ans_log_probs = model.predict(x).log()
+                    positions = torch.randint(
+                        -sequence_len,
+                        sequence_len,
+                        (batch_size, 2)
+                    )
+                    examples = (
+                        (None, ans_log_probs),
+                        (torch.LongTensor([-1]), ans_log_probs[:, -1:]),
+                        (
+                            positions,
+                            ans_log_probs.gather(
+                                1,
+                                (positions % sequence_len)
+                                .unsqueeze(-1)
+                                .expand(-1, -1, model_obj['vocab_size'])
+                            )
+                        ),
+                    )
+
+                    for pos, ans in examples:
+                        log_probs = model.predict_log_probs(
+                            batch_sequences=x,
+                            positions=pos
+                        )
+                        self.assertEqual(log_probs.size(), ans.size(), msg=msg)
+                        self.assertTrue(
+                            torch.allclose(log_probs, ans, atol=1e-5),
+                            msg=msg
+                        )
+
+
+if __name__ == '__main__':
+    unittest.main()
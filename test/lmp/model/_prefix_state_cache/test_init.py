@@ -0,0 +1,120 @@
+r"""Test `lmp.model.PrefixStateCache.__init__`.
+
+Usage:
+    python -m unittest test.lmp.model._prefix_state_cache.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+# self-made modules
+
+from lmp.model import PrefixStateCache
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.model.PrefixStateCache.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(PrefixStateCache.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_bytes',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_entries',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
+                    inspect.Parameter(
+                        name='stride',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=16
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'max_bytes', 1.0, TypeError,
+                '`max_bytes` must be an instance of `int`.',
+            ),
+            (
+                'max_bytes', 0, ValueError,
+                '`max_bytes` must be bigger than or equal to `1`.',
+            ),
+            (
+                'max_entries', 1.0, TypeError,
+                '`max_entries` must be an instance of `int`.',
+            ),
+            (
+                'max_entries', 0, ValueError,
+                '`max_entries` must be bigger than or equal to `1` or equal '
+                'to `-1`.',
+            ),
+            (
+                'max_entries', -2, ValueError,
+                '`max_entries` must be bigger than or equal to `1` or equal '
+                'to `-1`.',
+            ),
+            (
+                'stride', 1.0, TypeError,
+                '`stride` must be an instance of `int`.',
+            ),
+            (
+                'stride', 0, ValueError,
+                '`stride` must be bigger than or equal to `1`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = {'max_bytes': 1}
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                PrefixStateCache(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Must declare required instance attributes.'
+        cache = PrefixStateCache(max_bytes=100, max_entries=3, stride=2)
+
+        self.assertEqual(cache.max_bytes, 100, msg=msg)
+        self.assertEqual(cache.max_entries, 3, msg=msg)
+        self.assertEqual(cache.stride, 2, msg=msg)
+        self.assertEqual(len(cache), 0, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
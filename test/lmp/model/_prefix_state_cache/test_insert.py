@@ -0,0 +1,229 @@
+r"""Test `lmp.model.PrefixStateCache.insert` and `lookup`.
+
+Usage:
+    python -m unittest test.lmp.model._prefix_state_cache.test_insert
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+import unittest.mock
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model._prefix_state_cache
+
+from lmp.model import PrefixStateCache
+from lmp.model import RNNState
+
+
+class TestInsert(unittest.TestCase):
+    r"""Test case for `lmp.model.PrefixStateCache.insert` and `lookup`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        # Each entry has `4 + 2 * 3` float32 elements, i.e. `40` bytes.
+        self.entry_bytes = 40
+
+    def create_entry(self, value):
+        r"""Create logits and hidden state filled with `value`."""
+        return (
+            torch.full((4,), float(value)),
+            RNNState([
+                torch.full((1, 1, 3), float(value)),
+                (
+                    torch.full((1, 1, 1), float(value)),
+                    torch.full((1, 1, 2), float(value)),
+                ),
+            ])
+        )
+
+    def insert(self, cache, token_ids, value):
+        r"""Insert entry filled with `value`."""
+        logits, state = self.create_entry(value)
+        cache.insert(token_ids=token_ids, logits=logits, state=state)
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        logits, state = self.create_entry(0)
+        examples = (
+            (
+                [1], None, state, TypeError,
+                '`logits` must be an instance of `Tensor`.',
+            ),
+            (
+                [1], logits, None, TypeError,
+                '`state` must be an instance of `lmp.model.RNNState`.',
+            ),
+            (
+                [], logits, state, ValueError,
+                '`token_ids` must not be empty.',
+            ),
+            (
+                [1], logits.reshape(1, -1), state, ValueError,
+                '`logits` must have shape `(V)`.',
+            ),
+            (
+                [1], logits, RNNState.cat([state, state]), ValueError,
+                '`state` must have batch size `1`.',
+            ),
+        )
+
+        for token_ids, logits, state, error, message in examples:
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                PrefixStateCache(max_bytes=1000).insert(
+                    token_ids=token_ids,
+                    logits=logits,
+                    state=state
+                )
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_longest_prefix(self):
+        r"""Find the longest cached prefix."""
+        msg = 'Must find the longest cached prefix.'
+        cache = PrefixStateCache(max_bytes=1000)
+        self.insert(cache, [1, 2], 12)
+        self.insert(cache, [1, 2, 3, 4], 1234)
+        self.insert(cache, [5], 5)
+
+        examples = (
+            ([1, 2, 3, 4, 5], 4, 1234),
+            ([1, 2, 3, 4], 4, 1234),
+            ([1, 2, 3], 2, 12),
+            ([1, 2, 4], 2, 12),
+            ([5, 1, 2], 1, 5),
+        )
+
+        for token_ids, length, value in examples:
+            found_length, entry = cache.lookup(token_ids)
+            self.assertEqual(found_length, length, msg=msg)
+            self.assertTrue(
+                torch.equal(entry[0], self.create_entry(value)[0]),
+                msg=msg
+            )
+            for tensor in entry[1].tensors():
+                self.assertTrue((tensor == value).all(), msg=msg)
+
+        for token_ids in ([], [1], [2, 1], [6]):
+            self.assertEqual(cache.lookup(token_ids), (0, None), msg=msg)
+
+    def test_copy(self):
+        r"""Cached tensors are not shared with inputs."""
+        msg = 'Cached tensors must not be shared with inputs.'
+        cache = PrefixStateCache(max_bytes=1000)
+        logits, state = self.create_entry(1)
+        cache.insert(token_ids=[1], logits=logits, state=state)
+
+        logits.fill_(0)
+        for tensor in state.tensors():
+            tensor.fill_(0)
+
+        _, (logits, state) = cache.lookup([1])
+        self.assertTrue((logits == 1).all(), msg=msg)
+        for tensor in state.tensors():
+            self.assertTrue((tensor == 1).all(), msg=msg)
+
+    def test_evict_by_bytes(self):
+        r"""Evict least recently used entries to fit `max_bytes`."""
+        msg = 'Must evict least recently used entries to fit `max_bytes`.'
+        cache = PrefixStateCache(max_bytes=3 * self.entry_bytes)
+        self.insert(cache, [1], 1)
+        self.insert(cache, [2], 2)
+        self.insert(cache, [3], 3)
+
+        # Mark `[1]` as recently used.
+        cache.lookup([1])
+        self.insert(cache, [4], 4)
+
+        self.assertEqual(len(cache), 3, msg=msg)
+        self.assertEqual(cache.lookup([2]), (0, None), msg=msg)
+        for token_id in [1, 3, 4]:
+            self.assertEqual(cache.lookup([token_id])[0], 1, msg=msg)
+
+        self.assertEqual(
+            cache.metrics()['num_bytes'],
+            3 * self.entry_bytes,
+            msg=msg
+        )
+        self.assertEqual(cache.metrics()['num_evictions'], 1, msg=msg)
+
+    def test_evict_by_entries(self):
+        r"""Evict least recently used entries to fit `max_entries`."""
+        msg = 'Must evict least recently used entries to fit `max_entries`.'
+        cache = PrefixStateCache(max_bytes=1000, max_entries=2)
+        self.insert(cache, [1, 2], 12)
+        self.insert(cache, [1], 1)
+        self.insert(cache, [1, 2, 3], 123)
+
+        self.assertEqual(len(cache), 2, msg=msg)
+        self.assertEqual(cache.lookup([1, 2])[0], 1, msg=msg)
+        self.assertEqual(cache.lookup([1, 2, 3])[0], 3, msg=msg)
+
+    def test_replace(self):
+        r"""Replace entry of the same prefix."""
+        msg = 'Must replace entry of the same prefix.'
+        cache = PrefixStateCache(max_bytes=1000)
+        self.insert(cache, [1], 1)
+        self.insert(cache, [1], 2)
+
+        self.assertEqual(len(cache), 1, msg=msg)
+        self.assertEqual(
+            cache.metrics()['num_bytes'],
+            self.entry_bytes,
+            msg=msg
+        )
+        self.assertTrue((cache.lookup([1])[1][0] == 2).all(), msg=msg)
+
+    def test_reuse_nodes(self):
+        r"""Create trie nodes only for new tokens."""
+        msg = 'Must create trie nodes only for new tokens.'
+        cache = PrefixStateCache(max_bytes=1000)
+        self.insert(cache, [1, 2], 12)
+
+        with unittest.mock.patch.object(
+                lmp.model._prefix_state_cache,
+                '_TrieNode',
+                wraps=lmp.model._prefix_state_cache._TrieNode
+        ) as mock_trie_node:
+            self.insert(cache, [1, 2], 21)
+            self.assertEqual(mock_trie_node.call_count, 0, msg=msg)
+
+            self.insert(cache, [1, 2, 3], 123)
+            self.assertEqual(mock_trie_node.call_count, 1, msg=msg)
+
+        self.assertEqual(cache.lookup([1, 2, 3])[0], 3, msg=msg)
+
+    def test_too_large(self):
+        r"""Do not cache entry larger than `max_bytes`."""
+        msg = 'Must not cache entry larger than `max_bytes`.'
+        cache = PrefixStateCache(max_bytes=self.entry_bytes - 1)
+        self.insert(cache, [1], 1)
+
+        self.assertEqual(len(cache), 0, msg=msg)
+        self.assertEqual(cache.lookup([1]), (0, None), msg=msg)
+
+    def test_clear(self):
+        r"""Remove all cached prefixes."""
+        msg = 'Must remove all cached prefixes.'
+        cache = PrefixStateCache(max_bytes=1000)
+        self.insert(cache, [1], 1)
+        cache.clear()
+
+        self.assertEqual(len(cache), 0, msg=msg)
+        self.assertEqual(cache.lookup([1]), (0, None), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+r"""Test `lmp.model.PrefixStateCache.metrics`.
+
+Usage:
+    python -m unittest test.lmp.model._prefix_state_cache.test_metrics
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import unittest
+
+from typing import Dict
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import PrefixStateCache
+from lmp.model import RNNState
+
+
+class TestMetrics(unittest.TestCase):
+    r"""Test case for `lmp.model.PrefixStateCache.metrics`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(PrefixStateCache.metrics),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Dict[str, float]
+            ),
+            msg=msg
+        )
+
+    def test_return_result(self):
+        r"""Return cache usage and hit rate metrics."""
+        msg = 'Must return cache usage and hit rate metrics.'
+        cache = PrefixStateCache(max_bytes=1000)
+
+        self.assertEqual(
+            cache.metrics(),
+            {
+                'num_entries': 0,
+                'num_bytes': 0,
+                'num_lookups': 0,
+                'num_hits': 0,
+                'num_evictions': 0,
+                'hit_rate': 0.0,
+                'token_hit_rate': 0.0,
+            },
+            msg=msg
+        )
+
+        cache.insert(
+            token_ids=[1, 2],
+            logits=torch.zeros(4),
+            state=RNNState([torch.zeros(1, 1, 6)])
+        )
+        cache.lookup([1, 2, 3, 4])
+        cache.lookup([2, 3, 4, 5])
+
+        self.assertEqual(
+            cache.metrics(),
+            {
+                'num_entries': 1,
+                'num_bytes': 40,
+                'num_lookups': 2,
+                'num_hits': 1,
+                'num_evictions': 0,
+                'hit_rate': 0.5,
+                'token_hit_rate': 0.25,
+            },
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+r"""Test `lmp.model.ResGRUBlock.init_state`.
+
+Usage:
+    python -m unittest test.lmp.model._res_gru_block.test_init_state
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+
+# self-made modules
+
+from lmp.model import ResGRUBlock
+
+
+class TestInitState(unittest.TestCase):
+    r"""Test case for `lmp.model.ResGRUBlock.init_state`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch_range = [1, 2]
+        cls.d_hid_range = [1, 10]
+        cls.dropout_range = [0.0, 0.1, 0.5, 1.0]
+        cls.sequence_range = list(range(1, 5))
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batch_range
+        del cls.d_hid_range
+        del cls.dropout_range
+        del cls.sequence_range
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `ResGRUBlock`."""
+        self.model_objs = []
+        cls = self.__class__
+        for d_hid in cls.d_hid_range:
+            for dropout in cls.dropout_range:
+                self.model_objs.append({
+                    'd_hid': d_hid,
+                    'dropout': dropout,
+                    'model': ResGRUBlock(
+                        d_hid=d_hid,
+                        dropout=dropout
+                    ),
+                })
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model_objs
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResGRUBlock.init_state),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Union[
+                    torch.Tensor,
+                    Tuple[torch.Tensor, torch.Tensor]
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            model = self.model_objs[0]['model']
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                model.init_state(batch_size=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_return_value(self):
+        r"""Return zero hidden state with shape `(1, B, H)`."""
+        msg = 'Must return zero hidden state with shape `(1, B, H)`.'
+
+        for batch_size in self.__class__.batch_range:
+            for model_obj in self.model_objs:
+                hidden = model_obj['model'].init_state(batch_size=batch_size)
+                if not isinstance(hidden, tuple):
+                    hidden = (hidden,)
+
+                for h in hidden:
+                    self.assertEqual(
+                        h.size(),
+                        torch.Size([1, batch_size, model_obj['d_hid']]),
+                        msg=msg
+                    )
+                    self.assertTrue((h == 0).all(), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,8 @@ import inspect
 import math
 import unittest
 
+from typing import Optional
+
 # 3rd-party modules
 
 import torch
@@ -113,6 +115,12 @@ class TestForward(unittest.TestCase):
                         annotation=torch.Tensor,
                         default=inspect.Parameter.empty
                     ),
+                    inspect.Parameter(
+                        name='batch_lengths',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Tensor],
+                        default=None
+                    ),
                 ],
                 return_annotation=torch.Tensor
             ),
@@ -180,6 +188,64 @@ class TestForward(unittest.TestCase):
                 self.assertEqual(s1, s2, msg=msg)
             self.assertEqual(logits.size(-1), vocab_size)
 
+    def test_invalid_input_batch_lengths(self):
+        r"""Raise exception when input `batch_lengths` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`batch_lengths` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        x = torch.zeros(2, 3, dtype=torch.int64)
+        examples = (
+            False, 0, 0.0, '', (), [2, 3], object(),
+            torch.tensor([0, 3]), torch.tensor([1, 4]), torch.tensor([1]),
+            torch.tensor([[1, 3]]),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                self.model_objs[0]['model'](x, batch_lengths=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_lengths` must be an instance of `Tensor`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`batch_lengths` must have shape `(B)` and each length '
+                    'must range from `1` to `S`.',
+                    msg=msg2
+                )
+
+    def test_skip_padding(self):
+        r"""Only calculate logits of non-padding tokens."""
+        msg = 'Must only calculate logits of non-padding tokens.'
+        batch_lengths = torch.tensor([3, 1, 4, 2])
+        mask = torch.arange(4)[None, :] < batch_lengths[:, None]
+
+        for model_obj in self.model_objs:
+            # Dropout makes outputs random.
+            if model_obj['dropout'] != 0.0:
+                continue
+
+            model = model_obj['model']
+            x = torch.randint(0, model_obj['vocab_size'], (4, 4))
+            x = x.masked_fill(~mask, model_obj['pad_token_id'])
+            logits = model(x, batch_lengths=batch_lengths)
+
+            self.assertEqual(
+                logits.size(),
+                torch.Size([10, model_obj['vocab_size']]),
+                msg=msg
+            )
+            self.assertTrue(
+                torch.allclose(logits, model(x)[mask], atol=1e-6),
+                msg=msg
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
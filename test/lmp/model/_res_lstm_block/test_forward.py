@@ -16,10 +16,13 @@ import inspect
 import math
 import unittest
 
+from typing import Union
+
 # 3rd-party modules
 
 import torch
 import torch.nn
+import torch.nn.utils.rnn
 
 # self-made modules
 
@@ -80,11 +83,17 @@ class TestForward(unittest.TestCase):
                     inspect.Parameter(
                         name='x',
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                        annotation=torch.Tensor,
+                        annotation=Union[
+                            torch.Tensor,
+                            torch.nn.utils.rnn.PackedSequence
+                        ],
                         default=inspect.Parameter.empty
                     ),
                 ],
-                return_annotation=torch.Tensor
+                return_annotation=Union[
+                    torch.Tensor,
+                    torch.nn.utils.rnn.PackedSequence
+                ]
             ),
             msg=msg
         )
@@ -139,6 +148,43 @@ class TestForward(unittest.TestCase):
             for s1, s2 in zip(x.size(), logits.size()):
                 self.assertEqual(s1, s2, msg=msg)
 
+    def test_packed_sequence(self):
+        r"""Apply residual connection on packed sequences."""
+        msg = 'Must apply residual connection on packed sequences.'
+        batch_lengths = torch.tensor([3, 1, 4])
+
+        for model_obj in self.model_objs:
+            # Dropout makes outputs random.
+            if model_obj['dropout'] != 0.0:
+                continue
+
+            model = model_obj['model']
+            x = torch.rand(3, 4, model_obj['d_hid'])
+            packed = torch.nn.utils.rnn.pack_padded_sequence(
+                x,
+                batch_lengths,
+                batch_first=True,
+                enforce_sorted=False
+            )
+            out = model(packed)
+
+            self.assertIsInstance(
+                out,
+                torch.nn.utils.rnn.PackedSequence,
+                msg=msg
+            )
+
+            out, _ = torch.nn.utils.rnn.pad_packed_sequence(
+                out,
+                batch_first=True
+            )
+            ans = model(x)
+            for i, length in enumerate(batch_lengths.tolist()):
+                self.assertTrue(
+                    torch.allclose(out[i, :length], ans[i, :length]),
+                    msg=msg
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,186 @@
+r"""Test `lmp.model.ResLSTMBlock.forward_step`.
+
+Usage:
+    python -m unittest test.lmp.model._res_lstm_block.test_forward_step
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import unittest
+
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+import torch.nn
+import torch.nn.utils.rnn
+
+# self-made modules
+
+from lmp.model import ResLSTMBlock
+
+
+class TestForwardStep(unittest.TestCase):
+    r"""Test case for `lmp.model.ResLSTMBlock.forward_step`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch_range = [1, 2]
+        cls.d_hid_range = [1, 10]
+        cls.dropout_range = [0.0, 0.1, 0.5, 1.0]
+        cls.sequence_range = list(range(1, 5))
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batch_range
+        del cls.d_hid_range
+        del cls.dropout_range
+        del cls.sequence_range
+        gc.collect()
+
+    def setUp(self):
+        r"""Setup hyperparameters and construct `ResGRUBlock`."""
+        self.model_objs = []
+        cls = self.__class__
+        for d_hid in cls.d_hid_range:
+            for dropout in cls.dropout_range:
+                self.model_objs.append({
+                    'd_hid': d_hid,
+                    'dropout': dropout,
+                    'model': ResLSTMBlock(
+                        d_hid=d_hid,
+                        dropout=dropout
+                    ),
+                })
+
+    def tearDown(self):
+        r"""Delete model instances."""
+        del self.model_objs
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(ResLSTMBlock.forward_step),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='x',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            torch.Tensor,
+                            torch.nn.utils.rnn.PackedSequence
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='hidden',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[Union[
+                            torch.Tensor,
+                            Tuple[torch.Tensor, torch.Tensor]
+                        ]],
+                        default=None
+                    ),
+                ],
+                return_annotation=Tuple[
+                    Union[torch.Tensor, torch.nn.utils.rnn.PackedSequence],
+                    Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_continue_from_hidden(self):
+        r"""Step-by-step output is the same as `forward`."""
+        msg = 'Step-by-step output must be the same as `forward`.'
+
+        for batch_size in self.__class__.batch_range:
+            for sequence_len in self.__class__.sequence_range:
+                for model_obj in self.model_objs:
+                    # Dropout makes outputs random.
+                    if model_obj['dropout'] != 0.0:
+                        continue
+
+                    model = model_obj['model']
+                    x = torch.rand(
+                        (batch_size, sequence_len, model_obj['d_hid'])
+                    )
+
+                    hidden = model.init_state(batch_size=batch_size)
+                    out = []
+                    for i in range(sequence_len):
+                        ht, hidden = model.forward_step(x[:, i:i + 1], hidden)
+                        out.append(ht)
+
+                    self.assertTrue(
+                        torch.allclose(
+                            torch.cat(out, dim=1),
+                            model(x),
+                            atol=1e-6
+                        ),
+                        msg=msg
+                    )
+
+
+    def test_packed_sequence(self):
+        r"""Hidden state after last non-padding token of packed input."""
+        msg = 'Must return hidden state after last non-padding token.'
+        lengths = torch.tensor([3, 1, 4])
+
+        for model_obj in self.model_objs:
+            # Dropout makes outputs random.
+            if model_obj['dropout'] != 0.0:
+                continue
+
+            model = model_obj['model']
+            x = torch.rand(3, 4, model_obj['d_hid'])
+            packed = torch.nn.utils.rnn.pack_padded_sequence(
+                x,
+                lengths,
+                batch_first=True,
+                enforce_sorted=False
+            )
+
+            out, hidden = model.forward_step(packed)
+
+            self.assertIsInstance(
+                out,
+                torch.nn.utils.rnn.PackedSequence,
+                msg=msg
+            )
+
+            if not isinstance(hidden, tuple):
+                hidden = (hidden,)
+
+            for i, length in enumerate(lengths.tolist()):
+                _, ans_hidden = model.forward_step(x[i:i + 1, :length])
+                if not isinstance(ans_hidden, tuple):
+                    ans_hidden = (ans_hidden,)
+
+                for h, ans_h in zip(hidden, ans_hidden):
+                    self.assertTrue(
+                        torch.allclose(h[:, i:i + 1], ans_h, atol=1e-6),
+                        msg=msg
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+r"""Test `lmp.model.RNNState.cat`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_cat
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import List
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import RNNState
+
+
+class TestCat(unittest.TestCase):
+    r"""Test case for `lmp.model.RNNState.cat`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(RNNState.cat),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='states',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List['RNNState'],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation='RNNState'
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_states(self):
+        r"""Raise exception when input `states` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `states` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., [None],
+            [torch.zeros(1, 2, 3)], [],
+            [
+                RNNState([torch.zeros(1, 2, 3)]),
+                RNNState([torch.zeros(2, 2, 3)]),
+            ],
+            [
+                RNNState([torch.zeros(1, 2, 3)]),
+                RNNState([(torch.zeros(1, 2, 3), torch.zeros(1, 2, 3))]),
+            ],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                RNNState.cat(states=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`states` must be an instance of `List[RNNState]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertIn(
+                    ctx.exception.args[0],
+                    [
+                        '`states` must not be empty.',
+                        '`states` must be created by the same model.',
+                    ],
+                    msg=msg2
+                )
+
+    def test_cat(self):
+        r"""Concatenate hidden states along batch dimension."""
+        msg = 'Must concatenate hidden states along batch dimension.'
+        h = torch.rand(2, 5, 3)
+        c = torch.rand(1, 5, 3)
+        state = RNNState([h, (c, c + 1)])
+
+        state = RNNState.cat([state[3:], state[:1], state[1:3]])
+
+        self.assertEqual(state.batch_size, 5, msg=msg)
+        self.assertTrue(
+            torch.equal(state.hidden[0], h[:, [3, 4, 0, 1, 2]]),
+            msg=msg
+        )
+        self.assertTrue(
+            torch.equal(state.hidden[1][0], c[:, [3, 4, 0, 1, 2]]),
+            msg=msg
+        )
+        self.assertTrue(
+            torch.equal(state.hidden[1][1], c[:, [3, 4, 0, 1, 2]] + 1),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
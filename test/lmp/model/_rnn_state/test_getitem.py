@@ -0,0 +1,92 @@
+r"""Test `lmp.model.RNNState.__getitem__`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_getitem
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import RNNState
+
+
+class TestGetItem(unittest.TestCase):
+    r"""Test case for `lmp.model.RNNState.__getitem__`."""
+
+    def setUp(self):
+        r"""Setup hidden state with batch size `4`."""
+        self.h = torch.rand(2, 4, 3)
+        self.c = torch.rand(1, 4, 3)
+        self.state = RNNState([self.h, (self.c, self.c + 1)])
+
+    def tearDown(self):
+        r"""Delete hidden state."""
+        del self.h
+        del self.c
+        del self.state
+
+    def test_invalid_input_index(self):
+        r"""Raise `TypeError` when input `index` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `index` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                self.state[invalid_input]
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`index` must be an instance of `Union[int, slice, Tensor]`.',
+                msg=msg2
+            )
+
+    def test_select(self):
+        r"""Select hidden state along batch dimension."""
+        msg = 'Must select hidden state along batch dimension.'
+        examples = (
+            (1, [1]),
+            (-1, [3]),
+            (slice(1, 3), [1, 2]),
+            (torch.tensor([3, 0, 0]), [3, 0, 0]),
+            (torch.tensor([True, False, False, True]), [0, 3]),
+        )
+
+        for index, ans_index in examples:
+            state = self.state[index]
+            ans_index = torch.tensor(ans_index)
+
+            self.assertIsInstance(state, RNNState, msg=msg)
+            self.assertEqual(state.batch_size, len(ans_index), msg=msg)
+            self.assertTrue(
+                torch.equal(state.hidden[0], self.h[:, ans_index]),
+                msg=msg
+            )
+            self.assertTrue(
+                torch.equal(state.hidden[1][0], self.c[:, ans_index]),
+                msg=msg
+            )
+            self.assertTrue(
+                torch.equal(state.hidden[1][1], self.c[:, ans_index] + 1),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
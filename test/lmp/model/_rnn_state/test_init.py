@@ -0,0 +1,123 @@
+r"""Test `lmp.model.RNNState.__init__`.
+
+Usage:
+    python -m unittest test.lmp.model._rnn_state.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+from lmp.model import RNNState
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.model.RNNState.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistenct method signature.'
+
+        self.assertEqual(
+            inspect.signature(RNNState.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='hidden',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[Union[
+                            torch.Tensor,
+                            Tuple[torch.Tensor, torch.Tensor]
+                        ]],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_hidden(self):
+        r"""Raise exception when input `hidden` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `hidden` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            torch.zeros(1, 2, 3), [None], [torch.zeros(2, 3)],
+            [(torch.zeros(1, 2, 3),)], [(torch.zeros(1, 2, 3), None)], [],
+            [torch.zeros(1, 2, 3), torch.zeros(1, 3, 3)],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises((TypeError, ValueError), msg=msg1) as ctx:
+                RNNState(hidden=invalid_input)
+
+            if isinstance(ctx.exception, TypeError):
+                self.assertEqual(
+                    ctx.exception.args[0],
+                    '`hidden` must be an instance of '
+                    '`List[Union[torch.Tensor, Tuple[torch.Tensor, '
+                    'torch.Tensor]]]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertIn(
+                    ctx.exception.args[0],
+                    [
+                        '`hidden` must not be empty.',
+                        'Batch sizes of hidden states in `hidden` must be '
+                        'the same.',
+                    ],
+                    msg=msg2
+                )
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Instance attribute `{}` must be `{}`.'
+        h = torch.rand(2, 3, 4)
+        c = torch.rand(1, 3, 4)
+        hidden = [h, (c, c)]
+        state = RNNState(hidden=hidden)
+
+        self.assertIs(state.hidden, hidden, msg=msg.format('hidden', hidden))
+        self.assertEqual(
+            state.batch_size,
+            3,
+            msg=msg.format('batch_size', 3)
+        )
+        self.assertEqual(len(state), 3, msg=msg.format('len', 3))
+        self.assertEqual(
+            state.structure(),
+            ((2,), (1, 1)),
+            msg=msg.format('structure', ((2,), (1, 1)))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
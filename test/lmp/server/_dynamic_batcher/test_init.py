@@ -0,0 +1,150 @@
+r"""Test `lmp.server.DynamicBatcher.__init__`.
+
+Usage:
+    python -m unittest test.lmp.server._dynamic_batcher.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import concurrent.futures
+import inspect
+import math
+import unittest
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+
+# self-made modules
+
+from lmp.server import DynamicBatcher
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.server.DynamicBatcher.__init__`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(DynamicBatcher.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='handler',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Callable[[List[Any]], List[Any]],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_wait',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='executor',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[concurrent.futures.Executor],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='num_latencies',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1000
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'handler', None, TypeError,
+                '`handler` must be an instance of '
+                '`Callable[[List[Any]], List[Any]]`.',
+            ),
+            (
+                'max_batch_size', 1.0, TypeError,
+                '`max_batch_size` must be an instance of `int`.',
+            ),
+            (
+                'max_batch_size', 0, ValueError,
+                '`max_batch_size` must be bigger than or equal to `1`.',
+            ),
+            (
+                'max_wait', 1, TypeError,
+                '`max_wait` must be an instance of `float`.',
+            ),
+            (
+                'max_wait', -1.0, ValueError,
+                '`max_wait` must be bigger than or equal to `0.0`.',
+            ),
+            (
+                'max_wait', math.nan, ValueError,
+                '`max_wait` must be bigger than or equal to `0.0`.',
+            ),
+            (
+                'executor', object(), TypeError,
+                '`executor` must be an instance of '
+                '`Optional[concurrent.futures.Executor]`.',
+            ),
+            (
+                'num_latencies', 1.0, TypeError,
+                '`num_latencies` must be an instance of `int`.',
+            ),
+            (
+                'num_latencies', 0, ValueError,
+                '`num_latencies` must be bigger than or equal to `1`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = {
+                'handler': list,
+                'max_batch_size': 1,
+                'max_wait': 0.0,
+            }
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                DynamicBatcher(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Must declare required instance attributes.'
+        batcher = DynamicBatcher(handler=list, max_batch_size=4, max_wait=0.5)
+
+        self.assertIs(batcher.handler, list, msg=msg)
+        self.assertEqual(batcher.max_batch_size, 4, msg=msg)
+        self.assertEqual(batcher.max_wait, 0.5, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+r"""Test `lmp.server.DynamicBatcher.metrics`.
+
+Usage:
+    python -m unittest test.lmp.server._dynamic_batcher.test_metrics
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import inspect
+import unittest
+
+from typing import Dict
+
+# self-made modules
+
+from lmp.server import DynamicBatcher
+
+
+class TestMetrics(unittest.TestCase):
+    r"""Test case for `lmp.server.DynamicBatcher.metrics`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(DynamicBatcher.metrics),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Dict[str, float]
+            ),
+            msg=msg
+        )
+
+    def test_return_result(self):
+        r"""Return queue depth, batch size and latency metrics."""
+        msg = 'Must return queue depth, batch size and latency metrics.'
+
+        async def run():
+            batcher = DynamicBatcher(
+                handler=list,
+                max_batch_size=3,
+                max_wait=1.0
+            )
+            empty_metrics = batcher.metrics()
+            batcher.start()
+            await asyncio.gather(*[
+                batcher.submit(request)
+                for request in range(6)
+            ])
+            metrics = batcher.metrics()
+            await batcher.stop()
+            return empty_metrics, metrics
+
+        empty_metrics, metrics = asyncio.run(run())
+
+        for key in [
+                'queue_depth',
+                'max_queue_depth',
+                'num_requests',
+                'num_batches',
+                'num_errors',
+                'mean_batch_size',
+                'latency_p50',
+                'latency_p95',
+                'latency_p99',
+        ]:
+            self.assertIn(key, empty_metrics, msg=msg)
+            self.assertIn(key, metrics, msg=msg)
+
+        self.assertEqual(empty_metrics['num_requests'], 0, msg=msg)
+        self.assertEqual(empty_metrics['latency_p50'], 0.0, msg=msg)
+        self.assertEqual(metrics['queue_depth'], 0, msg=msg)
+        self.assertEqual(metrics['max_queue_depth'], 6, msg=msg)
+        self.assertEqual(metrics['num_requests'], 6, msg=msg)
+        self.assertEqual(metrics['num_batches'], 2, msg=msg)
+        self.assertEqual(metrics['num_errors'], 0, msg=msg)
+        self.assertEqual(metrics['mean_batch_size'], 3.0, msg=msg)
+        self.assertGreater(metrics['latency_p50'], 0.0, msg=msg)
+        self.assertLessEqual(
+            metrics['latency_p50'],
+            metrics['latency_p95'],
+            msg=msg
+        )
+        self.assertLessEqual(
+            metrics['latency_p95'],
+            metrics['latency_p99'],
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+r"""Test `lmp.server.DynamicBatcher.submit`.
+
+Usage:
+    python -m unittest test.lmp.server._dynamic_batcher.test_submit
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import inspect
+import unittest
+
+from typing import Any
+
+# self-made modules
+
+from lmp.server import DynamicBatcher
+
+
+class TestSubmit(unittest.TestCase):
+    r"""Test case for `lmp.server.DynamicBatcher.submit`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.batches = []
+
+        def handler(requests):
+            self.batches.append(list(requests))
+            return [request * 2 for request in requests]
+
+        self.handler = handler
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.batches
+        del self.handler
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(DynamicBatcher.submit),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='request',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Any,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Any
+            ),
+            msg=msg
+        )
+
+    def test_not_started(self):
+        r"""Raise `RuntimeError` when batcher is not started."""
+        msg = 'Must raise `RuntimeError` when batcher is not started.'
+        batcher = DynamicBatcher(
+            handler=self.handler,
+            max_batch_size=1,
+            max_wait=0.0
+        )
+
+        with self.assertRaises(RuntimeError, msg=msg):
+            asyncio.run(batcher.submit(1))
+
+    def test_batching(self):
+        r"""Coalesce concurrent requests into batches."""
+        msg = 'Must coalesce concurrent requests into batches.'
+
+        async def run():
+            batcher = DynamicBatcher(
+                handler=self.handler,
+                max_batch_size=4,
+                max_wait=1.0
+            )
+            batcher.start()
+            results = await asyncio.gather(*[
+                batcher.submit(request)
+                for request in range(10)
+            ])
+            await batcher.stop()
+            return results
+
+        self.assertEqual(
+            asyncio.run(run()),
+            [request * 2 for request in range(10)],
+            msg=msg
+        )
+
+        # Full batches are run without waiting for `max_wait`.
+        self.assertEqual(
+            self.batches,
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+            msg=msg
+        )
+
+    def test_max_wait(self):
+        r"""Run partial batch after `max_wait` seconds."""
+        msg = 'Must run partial batch after `max_wait` seconds.'
+
+        async def run():
+            batcher = DynamicBatcher(
+                handler=self.handler,
+                max_batch_size=4,
+                max_wait=0.05
+            )
+            batcher.start()
+            first = asyncio.ensure_future(batcher.submit(1))
+            await asyncio.sleep(0.01)
+            second = asyncio.ensure_future(batcher.submit(2))
+            await asyncio.sleep(0.2)
+            third = await batcher.submit(3)
+            await batcher.stop()
+            return [await first, await second, third]
+
+        self.assertEqual(asyncio.run(run()), [2, 4, 6], msg=msg)
+        self.assertEqual(self.batches, [[1, 2], [3]], msg=msg)
+
+    def test_handler_error(self):
+        r"""Re-raise exception raised by handler."""
+        msg = 'Must re-raise exception raised by handler.'
+
+        def handler(requests):
+            raise ValueError('I-AM-TEST-ERROR')
+
+        async def run():
+            batcher = DynamicBatcher(
+                handler=handler,
+                max_batch_size=2,
+                max_wait=0.0
+            )
+            batcher.start()
+            try:
+                await batcher.submit(1)
+            finally:
+                self.assertEqual(batcher.metrics()['num_errors'], 1, msg=msg)
+                await batcher.stop()
+
+        with self.assertRaises(ValueError, msg=msg) as ctx_man:
+            asyncio.run(run())
+
+        self.assertEqual(ctx_man.exception.args[0], 'I-AM-TEST-ERROR', msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
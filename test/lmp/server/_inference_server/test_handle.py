@@ -0,0 +1,329 @@
+r"""Test `lmp.server.InferenceServer.handle`.
+
+Usage:
+    python -m unittest test.lmp.server._inference_server.test_handle
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import gc
+import json
+import math
+import unittest
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+from lmp.server import InferenceServer
+
+
+class TestHandle(unittest.TestCase):
+    r"""Test case for `lmp.server.InferenceServer.handle`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.server = InferenceServer(
+            device=torch.device('cpu'),
+            max_batch_size=4,
+            max_wait=0.05,
+            model=self.model,
+            tokenizer=self.tokenizer,
+            default_beam_width=2,
+            default_max_seq_len=8
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.server
+        del self.tokenizer
+        gc.collect()
+
+    def run_requests(self, requests):
+        r"""Send concurrent HTTP requests and return status and body."""
+        async def send(port, method, path, body):
+            reader, writer = await asyncio.open_connection(
+                '127.0.0.1',
+                port
+            )
+            data = b'' if body is None else json.dumps(body).encode('utf-8')
+            writer.write(
+                '{} {} HTTP/1.1\r\nContent-Length: {}\r\n\r\n'.format(
+                    method,
+                    path,
+                    len(data)
+                ).encode('ascii') + data
+            )
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+
+            head, _, body = response.partition(b'\r\n\r\n')
+            status = int(head.split(b' ')[1])
+            return status, json.loads(body.decode('utf-8'))
+
+        async def run():
+            server = await self.server.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await asyncio.gather(*[
+                    send(port, method, path, body)
+                    for method, path, body in requests
+                ])
+            finally:
+                server.close()
+                await server.wait_closed()
+                await self.server.stop()
+
+        return asyncio.run(run())
+
+    def test_generate(self):
+        r"""Return the same result as `lmp.util.generate_sequence`."""
+        msg = 'Must return the same result as `lmp.util.generate_sequence`.'
+        examples = [
+            {'begin_of_sequence': 'a'},
+            {'begin_of_sequence': 'abc', 'beam_width': 3},
+            {'begin_of_sequence': '', 'max_seq_len': 4},
+            {'begin_of_sequence': 'gg', 'beam_width': 1, 'max_seq_len': 5},
+            {'begin_of_sequence': 'bb'},
+        ]
+
+        responses = self.run_requests([
+            ('POST', '/generate', example)
+            for example in examples
+        ])
+
+        for example, (status, body) in zip(examples, responses):
+            self.assertEqual(status, 200, msg=msg)
+            self.assertEqual(
+                body['generated_sequences'],
+                lmp.util.generate_sequence(
+                    beam_width=example.get('beam_width', 2),
+                    begin_of_sequence=example['begin_of_sequence'],
+                    device=torch.device('cpu'),
+                    max_seq_len=example.get('max_seq_len', 8),
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                ),
+                msg=msg
+            )
+
+    def test_score(self):
+        r"""Return the same result as `lmp.util.perplexity_eval`."""
+        msg = 'Must return the same result as `lmp.util.perplexity_eval`.'
+        examples = ['a', 'abc', 'b', 'abcdefg', 'gfedcba']
+
+        responses = self.run_requests([
+            ('POST', '/score', {'sequence': sequence})
+            for sequence in examples
+        ])
+
+        for sequence, (status, body) in zip(examples, responses):
+            self.assertEqual(status, 200, msg=msg)
+            self.assertTrue(
+                math.isclose(
+                    body['perplexity'],
+                    lmp.util.perplexity_eval(
+                        device=torch.device('cpu'),
+                        model=self.model,
+                        sequence=sequence,
+                        tokenizer=self.tokenizer
+                    ),
+                    rel_tol=1e-4
+                ),
+                msg=msg
+            )
+
+    def test_score_with_empty_sequence(self):
+        r"""Sequence without tokens must not fail other requests."""
+        msg = 'Sequence without tokens must not fail other requests.'
+
+        responses = self.run_requests([
+            ('POST', '/score', {'sequence': 'abc'}),
+            ('POST', '/score', {'sequence': ' '}),
+            ('POST', '/score', {'sequence': 'gfe'}),
+        ])
+
+        self.assertEqual(
+            [status for status, _ in responses],
+            [200, 400, 200],
+            msg=msg
+        )
+        self.assertEqual(
+            responses[1][1]['error'],
+            '`sequence` must have at least one token.',
+            msg=msg
+        )
+
+        perplexities = self.server.batch_score(['abc', ' ', 'gfe'])
+
+        self.assertTrue(math.isnan(perplexities[1]), msg=msg)
+        for (_, body), perplexity in zip(
+                responses[::2],
+                perplexities[::2]
+        ):
+            self.assertTrue(
+                math.isclose(body['perplexity'], perplexity, rel_tol=1e-4),
+                msg=msg
+            )
+
+    def test_invalid_request(self):
+        r"""Return error status when request is invalid."""
+        msg = 'Must return error status when request is invalid.'
+        examples = [
+            ('POST', '/generate', {}, 400),
+            ('POST', '/generate', {'begin_of_sequence': 1}, 400),
+            (
+                'POST',
+                '/generate',
+                {'begin_of_sequence': 'a', 'beam_width': 0},
+                400,
+            ),
+            ('POST', '/generate', [], 400),
+            ('POST', '/score', {'sequence': None}, 400),
+            ('POST', '/score', {'sequence': ''}, 400),
+            ('POST', '/score', {'sequence': ' '}, 400),
+            ('GET', '/score', None, 405),
+            ('GET', '/I-AM-TEST-PATH', None, 404),
+        ]
+
+        responses = self.run_requests([
+            (method, path, body)
+            for method, path, body, _ in examples
+        ])
+
+        for (_, _, _, expected), (status, body) in zip(examples, responses):
+            self.assertEqual(status, expected, msg=msg)
+            self.assertIn('error', body, msg=msg)
+
+    def test_invalid_body(self):
+        r"""Return error status when body is malformed or too large."""
+        msg = 'Must return error status when body is malformed or too large.'
+        self.server.max_body_size = 16
+        examples = [
+            (b'Content-Length: abc\r\n\r\n', 400),
+            (b'Content-Length: -1\r\n\r\n', 400),
+            (b'Content-Length: 10\r\n\r\n{}', 400),
+            (b'Content-Length: 17\r\n\r\n', 413),
+            (b'Content-Length: 1000000000000\r\n\r\n', 413),
+        ]
+
+        async def send(port, data):
+            reader, writer = await asyncio.open_connection(
+                '127.0.0.1',
+                port
+            )
+            writer.write(b'POST /score HTTP/1.1\r\n' + data)
+            await writer.drain()
+
+            # Close write side so incomplete body is not waited forever.
+            writer.write_eof()
+            response = await reader.read()
+            writer.close()
+
+            head, _, body = response.partition(b'\r\n\r\n')
+            return int(head.split(b' ')[1]), json.loads(body.decode('utf-8'))
+
+        async def run():
+            server = await self.server.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await asyncio.gather(*[
+                    send(port, data)
+                    for data, _ in examples
+                ])
+            finally:
+                server.close()
+                await server.wait_closed()
+                await self.server.stop()
+
+        for (_, expected), (status, body) in zip(examples, asyncio.run(run())):
+            self.assertEqual(status, expected, msg=msg)
+            self.assertIn('error', body, msg=msg)
+
+    def test_metrics(self):
+        r"""Return metrics of each endpoint."""
+        msg = 'Must return metrics of each endpoint.'
+
+        responses = self.run_requests(
+            [('POST', '/generate', {'begin_of_sequence': 'a'})] * 4 +
+            [('POST', '/score', {'sequence': 'a'})] * 3
+        )
+        self.assertTrue(
+            all(status == 200 for status, _ in responses),
+            msg=msg
+        )
+
+        status, body = self.run_requests([('GET', '/metrics', None)])[0]
+
+        self.assertEqual(status, 200, msg=msg)
+        self.assertEqual(body['generate']['num_requests'], 4, msg=msg)
+        self.assertEqual(body['score']['num_requests'], 3, msg=msg)
+        self.assertLessEqual(body['generate']['num_batches'], 4, msg=msg)
+        self.assertIn('latency_p99', body['score'], msg=msg)
+        self.assertIn('queue_depth', body['score'], msg=msg)
+
+    def test_prefix_cache(self):
+        r"""Reuse cached prefix states and report cache metrics."""
+        msg = 'Must reuse cached prefix states and report cache metrics.'
+        self.server.prefix_cache = lmp.model.PrefixStateCache(
+            max_bytes=2 ** 20,
+            stride=2
+        )
+        examples = ['abcde', 'abcdd', 'abcde']
+
+        responses = []
+        for begin_of_sequence in examples:
+            responses.extend(self.run_requests([
+                ('POST', '/generate', {'begin_of_sequence': begin_of_sequence})
+            ]))
+
+        for begin_of_sequence, (status, body) in zip(examples, responses):
+            self.assertEqual(status, 200, msg=msg)
+            self.assertEqual(
+                body['generated_sequences'],
+                lmp.util.generate_sequence(
+                    beam_width=2,
+                    begin_of_sequence=begin_of_sequence,
+                    device=torch.device('cpu'),
+                    max_seq_len=8,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                ),
+                msg=msg
+            )
+
+        status, body = self.run_requests([('GET', '/metrics', None)])[0]
+
+        self.assertEqual(status, 200, msg=msg)
+        self.assertEqual(body['prefix_cache']['num_lookups'], 3, msg=msg)
+        self.assertEqual(body['prefix_cache']['num_hits'], 2, msg=msg)
+
+if __name__ == '__main__':
+    unittest.main()
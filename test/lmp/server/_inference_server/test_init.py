@@ -0,0 +1,234 @@
+r"""Test `lmp.server.InferenceServer.__init__`.
+
+Usage:
+    python -m unittest test.lmp.server._inference_server.test_init
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import unittest
+
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.server
+import lmp.tokenizer
+
+from lmp.server import InferenceServer
+
+
+class TestInit(unittest.TestCase):
+    r"""Test case for `lmp.server.InferenceServer.__init__`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.model = lmp.model.GRUModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'device': torch.device('cpu'),
+            'max_batch_size': 2,
+            'max_wait': 0.0,
+            'model': self.model,
+            'tokenizer': self.tokenizer,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(InferenceServer.__init__),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='self',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_wait',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='default_beam_width',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=4
+                    ),
+                    inspect.Parameter(
+                        name='default_max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=64
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='max_body_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1048576
+                    ),
+                ],
+                return_annotation=inspect.Signature.empty
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'device', 'cpu', TypeError,
+                '`device` must be an instance of `torch.device`.',
+            ),
+            (
+                'max_batch_size', 0, ValueError,
+                '`max_batch_size` must be bigger than or equal to `1`.',
+            ),
+            (
+                'max_wait', 0, TypeError,
+                '`max_wait` must be an instance of `float`.',
+            ),
+            (
+                'model', None, TypeError,
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+            ),
+            (
+                'tokenizer', None, TypeError,
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+            ),
+            (
+                'default_beam_width', 1.0, TypeError,
+                '`default_beam_width` must be an instance of `int`.',
+            ),
+            (
+                'default_beam_width', 0, ValueError,
+                '`default_beam_width` must be bigger than or equal to `1`.',
+            ),
+            (
+                'default_max_seq_len', 2.0, TypeError,
+                '`default_max_seq_len` must be an instance of `int`.',
+            ),
+            (
+                'default_max_seq_len', 1, ValueError,
+                '`default_max_seq_len` must be bigger than or equal to `2`.',
+            ),
+            (
+                'prefix_cache', {}, TypeError,
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.model.PrefixStateCache]`.',
+            ),
+            (
+                'max_body_size', 1.0, TypeError,
+                '`max_body_size` must be an instance of `int`.',
+            ),
+            (
+                'max_body_size', -1, ValueError,
+                '`max_body_size` must be bigger than or equal to `0`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = dict(self.parameters)
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                InferenceServer(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_instance_attributes(self):
+        r"""Declare required instance attributes."""
+        msg = 'Must declare required instance attributes.'
+        server = InferenceServer(**self.parameters)
+
+        self.assertEqual(server.default_beam_width, 4, msg=msg)
+        self.assertEqual(server.default_max_seq_len, 64, msg=msg)
+        self.assertEqual(server.device, torch.device('cpu'), msg=msg)
+        self.assertEqual(server.max_body_size, 1048576, msg=msg)
+        self.assertIs(server.model, self.model, msg=msg)
+        self.assertIsNone(server.prefix_cache, msg=msg)
+        self.assertIs(server.tokenizer, self.tokenizer, msg=msg)
+        self.assertIsInstance(
+            server.generate_batcher,
+            lmp.server.DynamicBatcher,
+            msg=msg
+        )
+        self.assertIsInstance(
+            server.score_batcher,
+            lmp.server.DynamicBatcher,
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
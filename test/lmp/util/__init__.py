@@ -40,7 +40,16 @@ class TestUtil(unittest.TestCase):
         msg2 = 'Module attribute `{}` must be a function.'
         msg3 = 'Inconsistent module signature.'
         examples = (
+            'async_stream_sequence',
+            'batch_generate_sequence',
+            'batch_generate_sequence_by_config',
             'batch_perplexity_eval',
+            'benchmark_generate_sequence',
+            'cached_sequence_lengths',
+            'corpus_perplexity_eval',
+            'dedup_dataset',
+            'encode_prompts',
+            'encode_validation_batches',
             'generate_sequence',
             'generate_sequence_by_config',
             'load_config',
@@ -53,12 +62,27 @@ class TestUtil(unittest.TestCase):
             'load_tokenizer',
             'load_tokenizer_by_config',
             'perplexity_eval',
+            'prune_by_scores',
+            'profile_dataset',
+            'profile_dataset_by_config',
+            'sample_sequence',
+            'sample_sequence_by_config',
+            'score_dataset',
             'set_seed',
             'set_seed_by_config',
+            'sequence_lengths',
+            'speculative_generate_sequence',
+            'speculative_generate_sequence_by_config',
+            'split_dataset',
+            'stream_sequence',
+            'stream_sequence_by_config',
+            'suggest_batch_size',
+            'suggest_max_seq_len',
             'train_model',
             'train_model_by_config',
             'train_tokenizer',
             'train_tokenizer_by_config',
+            'validate_model',
         )
 
         try:
@@ -0,0 +1,270 @@
+r"""Test `lmp.util.benchmark_generate_sequence.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._benchmark_generation.test_benchmark_generate_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import unittest
+import unittest.mock
+
+from typing import Dict
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestBenchmarkGenerateSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.benchmark_generate_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        self.model = lmp.model.GRUModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'batch_size': 2,
+            'beam_width': 2,
+            'device': torch.device('cpu'),
+            'model': self.model,
+            'num_repeats': 3,
+            'output_len': 4,
+            'prompt_len': 5,
+            'tokenizer': self.tokenizer,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.benchmark_generate_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='beam_width',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_repeats',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='output_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prompt_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Dict[str, float]
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'batch_size', 1.0, TypeError,
+                '`batch_size` must be an instance of `int`.',
+            ),
+            (
+                'batch_size', 0, ValueError,
+                '`batch_size` must be bigger than or equal to `1`.',
+            ),
+            (
+                'beam_width', 0, ValueError,
+                '`beam_width` must be bigger than or equal to `1`.',
+            ),
+            (
+                'num_repeats', 0, ValueError,
+                '`num_repeats` must be bigger than or equal to `1`.',
+            ),
+            (
+                'output_len', 0, ValueError,
+                '`output_len` must be bigger than or equal to `1`.',
+            ),
+            (
+                'prompt_len', -1, ValueError,
+                '`prompt_len` must be bigger than or equal to `0`.',
+            ),
+            (
+                'tokenizer', None, TypeError,
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = dict(self.parameters)
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                lmp.util.benchmark_generate_sequence(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_return_result(self):
+        r"""Return latency, time to first token and throughput metrics."""
+        msg = 'Must return latency, time to first token and throughput.'
+        metrics = lmp.util.benchmark_generate_sequence(**self.parameters)
+
+        self.assertEqual(
+            sorted(metrics),
+            [
+                'latency_p50', 'latency_p95', 'latency_p99',
+                'tokens_per_run', 'tokens_per_second',
+                'ttft_p50', 'ttft_p95', 'ttft_p99',
+            ],
+            msg=msg
+        )
+        for value in metrics.values():
+            self.assertIsInstance(value, float, msg=msg)
+            self.assertGreater(value, 0.0, msg=msg)
+
+        for name in ['latency', 'ttft']:
+            self.assertLessEqual(
+                metrics[f'{name}_p50'],
+                metrics[f'{name}_p95'],
+                msg=msg
+            )
+            self.assertLessEqual(
+                metrics[f'{name}_p95'],
+                metrics[f'{name}_p99'],
+                msg=msg
+            )
+
+    def test_generate_settings(self):
+        r"""Generate prompts with requested lengths."""
+        msg = 'Must generate prompts with requested lengths.'
+
+        with unittest.mock.patch(
+                'lmp.util._benchmark_generation._beam_search'
+        ) as mock_generate:
+            lmp.util.benchmark_generate_sequence(**self.parameters)
+
+        # Warm up, then `num_repeats` runs for each metric.
+        self.assertEqual(mock_generate.call_count, 7, msg=msg)
+
+        max_seq_lens = []
+        for _, kwargs in mock_generate.call_args_list:
+            self.assertEqual(kwargs['beam_width'], 2, msg=msg)
+            self.assertEqual(len(kwargs['prompts']), 2, msg=msg)
+            for prompt in kwargs['prompts']:
+                self.assertEqual(len(prompt), 6, msg=msg)
+            max_seq_lens.append(kwargs['max_seq_len'])
+
+        self.assertEqual(max_seq_lens, [10] + [7] * 3 + [10] * 3, msg=msg)
+
+    def test_count_generated_tokens(self):
+        r"""Count tokens actually generated when `[eos]` stops generation."""
+        msg = 'Must count tokens actually generated.'
+        eos_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.eos_token
+        )
+        forward_step = self.model.forward_step
+
+        def eos_forward_step(*args, **kwargs):
+            r"""Bias model toward `[eos]`."""
+            logits, state = forward_step(*args, **kwargs)
+            logits[..., eos_token_id] += 100.0
+            return logits, state
+
+        parameters = dict(self.parameters)
+        parameters['beam_width'] = 1
+        parameters['output_len'] = 64
+
+        with unittest.mock.patch.object(
+                self.model,
+                'forward_step',
+                side_effect=eos_forward_step
+        ) as mock_forward_step:
+            metrics = lmp.util.benchmark_generate_sequence(**parameters)
+
+        # Only `[eos]` is generated for each prompt in each run.
+        self.assertEqual(metrics['tokens_per_run'], 2.0, msg=msg)
+
+        # Generation stops right after prompts are encoded, so each run only
+        # calls model once.
+        self.assertEqual(mock_forward_step.call_count, 7, msg=msg)
+
+        metrics = lmp.util.benchmark_generate_sequence(**parameters)
+        self.assertLessEqual(metrics['tokens_per_run'], 128.0, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,10 +80,12 @@ class TestLoadConfig(unittest.TestCase):
         self.parser.add_argument('--dataset', type=str)
         self.parser.add_argument('--dropout', type=float)
         self.parser.add_argument('--epoch', type=int)
+        self.parser.add_argument('--is_compact', action='store_true')
         self.parser.add_argument('--is_uncased', action='store_true')
         self.parser.add_argument('--learning_rate', type=float)
         self.parser.add_argument('--max_norm', type=float)
         self.parser.add_argument('--max_seq_len', type=int)
+        self.parser.add_argument('--max_tokens', type=int)
         self.parser.add_argument('--min_count', type=int)
         self.parser.add_argument('--model_class', type=str)
         self.parser.add_argument('--num_linear_layers', type=int)
@@ -91,6 +93,7 @@ class TestLoadConfig(unittest.TestCase):
         self.parser.add_argument('--optimizer_class', type=str)
         self.parser.add_argument('--seed', type=int)
         self.parser.add_argument('--tokenizer_class', type=str)
+        self.parser.add_argument('--val_ratio', type=float)
 
     def tearDown(self):
         r"""Delete `self.parser`."""
@@ -154,6 +157,7 @@ class TestLoadConfig(unittest.TestCase):
                 '--learning_rate', str(1e-4),
                 '--max_norm', str(1.0),
                 '--max_seq_len', str(60),
+                '--max_tokens', str(-1),
                 '--min_count', str(1),
                 '--model_class', 'lstm',
                 '--num_linear_layers', str(1),
@@ -161,6 +165,7 @@ class TestLoadConfig(unittest.TestCase):
                 '--optimizer_class', 'adam',
                 '--seed', str(1),
                 '--tokenizer_class', 'char_dict',
+                '--val_ratio', str(0.1),
             ],
             [
                 '--batch_size', str(101010),
@@ -172,10 +177,12 @@ class TestLoadConfig(unittest.TestCase):
                 '--dropout', str(0.69420),
                 '--epoch', str(666),
                 '--experiment', 'test',
+                '--is_compact',
                 '--is_uncased',
                 '--learning_rate', str(0.42069),
                 '--max_norm', str(4.20),
                 '--max_seq_len', str(555),
+                '--max_tokens', str(4321),
                 '--min_count', str(444),
                 '--model_class', 'hello world',
                 '--num_linear_layers', str(333),
@@ -183,6 +190,7 @@ class TestLoadConfig(unittest.TestCase):
                 '--optimizer_class', 'WORLD',
                 '--seed', str(111),
                 '--tokenizer_class', 'HELLO',
+                '--val_ratio', str(0.2),
             ],
         )
 
@@ -209,9 +217,11 @@ class TestLoadConfig(unittest.TestCase):
                     '--dropout', str(cls.config.dropout),
                     '--epoch', str(cls.config.epoch),
                     '--experiment', cls.config.experiment,
+                    '--is_compact',
                     '--learning_rate', str(cls.config.learning_rate),
                     '--max_norm', str(cls.config.max_norm),
                     '--max_seq_len', str(cls.config.max_seq_len),
+                    '--max_tokens', str(cls.config.max_tokens),
                     '--min_count', str(cls.config.min_count),
                     '--model_class', cls.config.model_class,
                     '--num_linear_layers', str(cls.config.num_linear_layers),
@@ -219,6 +229,7 @@ class TestLoadConfig(unittest.TestCase):
                     '--optimizer_class', cls.config.optimizer_class,
                     '--seed', str(cls.config.seed),
                     '--tokenizer_class', cls.config.tokenizer_class,
+                    '--val_ratio', str(cls.config.val_ratio),
                 ],
                 {
                     'batch_size': cls.config.batch_size,
@@ -229,10 +240,12 @@ class TestLoadConfig(unittest.TestCase):
                     'dropout': cls.config.dropout,
                     'epoch': cls.config.epoch,
                     'experiment': cls.config.experiment,
+                    'is_compact': True,
                     'is_uncased': cls.config.is_uncased,
                     'learning_rate': cls.config.learning_rate,
                     'max_norm': cls.config.max_norm,
                     'max_seq_len': cls.config.max_seq_len,
+                    'max_tokens': cls.config.max_tokens,
                     'min_count': cls.config.min_count,
                     'model_class': cls.config.model_class,
                     'num_linear_layers': cls.config.num_linear_layers,
@@ -240,6 +253,7 @@ class TestLoadConfig(unittest.TestCase):
                     'optimizer_class': cls.config.optimizer_class,
                     'seed': cls.config.seed,
                     'tokenizer_class': cls.config.tokenizer_class,
+                    'val_ratio': cls.config.val_ratio,
                 },
             ),
             (
@@ -257,6 +271,7 @@ class TestLoadConfig(unittest.TestCase):
                     '--learning_rate', str(0.42069),
                     '--max_norm', str(4.20),
                     '--max_seq_len', str(555),
+                    '--max_tokens', str(4321),
                     '--min_count', str(444),
                     '--model_class', 'hello world',
                     '--num_linear_layers', str(333),
@@ -264,6 +279,7 @@ class TestLoadConfig(unittest.TestCase):
                     '--optimizer_class', 'WORLD',
                     '--seed', str(111),
                     '--tokenizer_class', 'HELLO',
+                    '--val_ratio', str(0.2),
                 ],
                 {
                     'batch_size': 101010,
@@ -274,10 +290,12 @@ class TestLoadConfig(unittest.TestCase):
                     'dropout': 0.69420,
                     'epoch': 666,
                     'experiment': 'test',
+                    'is_compact': False,
                     'is_uncased': True,
                     'learning_rate': 0.42069,
                     'max_norm': 4.20,
                     'max_seq_len': 555,
+                    'max_tokens': 4321,
                     'min_count': 444,
                     'model_class': 'hello world',
                     'num_linear_layers': 333,
@@ -285,6 +303,7 @@ class TestLoadConfig(unittest.TestCase):
                     'optimizer_class': 'WORLD',
                     'seed': 111,
                     'tokenizer_class': 'HELLO',
+                    'val_ratio': 0.2,
                 },
             ),
         )
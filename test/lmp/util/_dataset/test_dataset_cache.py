@@ -0,0 +1,272 @@
+r"""Test columnar cache used by `lmp.util.load_dataset`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_dataset_cache
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import glob
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+# 3rd-party modules
+
+import numpy as np
+import pandas as pd
+
+# self-made modules
+
+import lmp.dataset
+import lmp.path
+import lmp.util
+
+
+class TestDatasetCache(unittest.TestCase):
+    r"""Test case for columnar cache of `lmp.util.load_dataset`."""
+
+    def setUp(self):
+        r"""Setup fake data directory with small CSV file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.patcher = unittest.mock.patch.object(
+            lmp.path,
+            'DATA_PATH',
+            self.temp_dir.name
+        )
+        self.patcher.start()
+        self.file_path = os.path.join(
+            self.temp_dir.name,
+            'news_collection.csv'
+        )
+        pd.DataFrame({
+            'title': ['今天天氣', 'Hello World', '日日是好日'],
+            'desc': ['描述一', None, 'desc 3'],
+        }).to_csv(self.file_path, index=False)
+
+    def tearDown(self):
+        r"""Delete fake data directory."""
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+        del self.file_path
+        del self.patcher
+        del self.temp_dir
+
+    def test_build_cache(self):
+        r"""Create cache files on first load."""
+        msg = 'Must create cache files on first load.'
+
+        for dataset in ('news_collection_desc', 'news_collection_title'):
+            lmp.util.load_dataset(dataset)
+            cache_dir = os.path.join(self.temp_dir.name, 'cache', dataset)
+
+            for file_name in ('meta.json', 'offsets.npy', 'sequences.npy'):
+                self.assertTrue(
+                    os.path.exists(os.path.join(cache_dir, file_name)),
+                    msg=msg
+                )
+
+    def test_load_from_cache(self):
+        r"""Cached dataset is identical to parsed dataset without parsing."""
+        msg = 'Cached dataset must be identical to parsed dataset.'
+        examples = (
+            ('news_collection_desc', ['描述一', 'desc 3']),
+            ('news_collection_title', ['今天天氣', 'Hello World', '日日是好日']),
+        )
+
+        for dataset, ans_sequences in examples:
+            first = lmp.util.load_dataset(dataset)
+
+            with unittest.mock.patch.object(pd, 'read_csv') as mock_read_csv:
+                second = lmp.util.load_dataset(dataset)
+                mock_read_csv.assert_not_called()
+
+            self.assertIsInstance(second, lmp.dataset.BaseDataset, msg=msg)
+            self.assertEqual(list(first), ans_sequences, msg=msg)
+            self.assertEqual(list(second), ans_sequences, msg=msg)
+
+    def test_load_compact_from_cache(self):
+        r"""Load cached buffer directly in compact format."""
+        msg = 'Must load cached buffer directly in compact format.'
+        ans_sequences = ['今天天氣', 'Hello World', '日日是好日']
+
+        for _ in range(2):
+            dataset = lmp.util.load_dataset(
+                'news_collection_title',
+                is_compact=True
+            )
+            self.assertTrue(dataset.is_compact, msg=msg)
+            self.assertEqual(list(dataset), ans_sequences, msg=msg)
+            self.assertEqual(
+                dataset.buffer,
+                ''.join(ans_sequences).encode('utf-8'),
+                msg=msg
+            )
+
+        # Cached buffer is a view of memory mapped file instead of a copy.
+        self.assertIsInstance(dataset.buffer, memoryview, msg=msg)
+        self.assertIsInstance(dataset.buffer.obj, np.memmap, msg=msg)
+        self.assertEqual(dataset[1], 'Hello World', msg=msg)
+
+    def test_invalidate_cache(self):
+        r"""Rebuild cache when source file changes."""
+        msg = 'Must rebuild cache when source file changes.'
+
+        lmp.util.load_dataset('news_collection_title')
+
+        pd.DataFrame({
+            'title': ['新的標題'],
+            'desc': ['新的描述'],
+        }).to_csv(self.file_path, index=False)
+
+        self.assertEqual(
+            list(lmp.util.load_dataset('news_collection_title')),
+            ['新的標題'],
+            msg=msg
+        )
+
+    def test_line_file(self):
+        r"""Load text and JSONL files through cached line index."""
+        msg = 'Must load text and JSONL files through cached line index.'
+        ans_sequences = ['今天天氣', 'Hello World']
+
+        with open(
+                os.path.join(self.temp_dir.name, 'corpus.txt'),
+                'w',
+                encoding='utf-8'
+        ) as output_file:
+            output_file.write('\n'.join(ans_sequences))
+
+        with open(
+                os.path.join(self.temp_dir.name, 'corpus.jsonl'),
+                'w',
+                encoding='utf-8'
+        ) as output_file:
+            for sequence in ans_sequences:
+                output_file.write(json.dumps({'text': sequence}) + '\n')
+
+        for dataset in ('corpus.txt', 'corpus.jsonl'):
+            first = lmp.util.load_dataset(dataset)
+
+            with unittest.mock.patch.object(
+                    lmp.dataset.LineDataset,
+                    'build_index'
+            ) as mock_build_index:
+                second = lmp.util.load_dataset(dataset)
+                mock_build_index.assert_not_called()
+
+            for dataset_obj in (first, second):
+                self.assertIsInstance(
+                    dataset_obj,
+                    lmp.dataset.LineDataset,
+                    msg=msg
+                )
+                self.assertEqual(list(dataset_obj), ans_sequences, msg=msg)
+
+        with self.assertRaises(FileNotFoundError, msg=msg):
+            lmp.util.load_dataset('I-AM-NOT-EXIST.txt')
+
+    def test_line_file_crlf(self):
+        r"""Skip blank lines of CRLF files and rebuild stale line index."""
+        msg = 'Must skip blank lines of CRLF files and rebuild stale index.'
+
+        with open(
+                os.path.join(self.temp_dir.name, 'corpus.txt'),
+                'wb'
+        ) as output_file:
+            output_file.write(b'a\r\n\r\nbc\r\n\r\n')
+
+        self.assertEqual(
+            list(lmp.util.load_dataset('corpus.txt')),
+            ['a', 'bc'],
+            msg=msg
+        )
+
+        # Index built before lines with only `\r` were dropped has no
+        # version.
+        (meta_path,) = glob.glob(os.path.join(
+            self.temp_dir.name,
+            'cache',
+            'corpus.txt-*',
+            'meta.json'
+        ))
+        with open(meta_path, 'r', encoding='utf-8') as input_file:
+            meta = json.load(input_file)
+        meta.pop('version')
+        with open(meta_path, 'w', encoding='utf-8') as output_file:
+            json.dump(meta, output_file)
+
+        with unittest.mock.patch.object(
+                lmp.dataset.LineDataset,
+                'build_index',
+                wraps=lmp.dataset.LineDataset.build_index
+        ) as mock_build_index:
+            dataset = lmp.util.load_dataset('corpus.txt')
+            mock_build_index.assert_called_once()
+
+        self.assertEqual(list(dataset), ['a', 'bc'], msg=msg)
+
+    def test_mixture(self):
+        r"""Mix datasets by `mix:<dataset>=<weight>,...`."""
+        msg = 'Must mix datasets by `mix:<dataset>=<weight>,...`.'
+
+        dataset = lmp.util.load_dataset(
+            'mix:news_collection_title=3,news_collection_desc=1'
+        )
+
+        self.assertIsInstance(dataset, lmp.dataset.MixtureDataset, msg=msg)
+        self.assertEqual(
+            dataset.names,
+            ['news_collection_title', 'news_collection_desc'],
+            msg=msg
+        )
+        self.assertEqual(
+            dataset.weights,
+            {'news_collection_title': 0.75, 'news_collection_desc': 0.25},
+            msg=msg
+        )
+
+        for invalid_input in (
+                'mix:',
+                'mix:news_collection_title',
+                'mix:news_collection_title=a',
+                'mix:news_collection_title=1,news_collection_title=1',
+                'mix:mix:news_collection_title=1=1',
+        ):
+            with self.assertRaises(ValueError, msg=msg) as ctx_man:
+                lmp.util.load_dataset(invalid_input)
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                f'dataset `{invalid_input}` must be in format '
+                '`mix:<dataset>=<weight>,...` with distinct non-mixture '
+                'datasets.',
+                msg=msg
+            )
+
+    def test_subset(self):
+        r"""Select sequences by `<dataset>@<index>.npy`."""
+        msg = 'Must select sequences by `<dataset>@<index>.npy`.'
+
+        np.save(
+            os.path.join(self.temp_dir.name, 'index.npy'),
+            np.array([2, 0], dtype=np.int64)
+        )
+        dataset = lmp.util.load_dataset('news_collection_title@index.npy')
+
+        self.assertIsInstance(dataset, lmp.dataset.SubsetDataset, msg=msg)
+        self.assertEqual(list(dataset), ['日日是好日', '今天天氣'], msg=msg)
+
+        with self.assertRaises(FileNotFoundError, msg=msg):
+            lmp.util.load_dataset('news_collection_title@missing.npy')
+
+
+if __name__ == '__main__':
+    unittest.main()
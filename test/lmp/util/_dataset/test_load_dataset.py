@@ -37,7 +37,13 @@ class TestLoadDataset(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=str,
                         default=inspect.Parameter.empty
-                    )
+                    ),
+                    inspect.Parameter(
+                        name='is_compact',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=bool,
+                        default=False
+                    ),
                 ],
                 return_annotation=lmp.dataset.BaseDataset
             ),
@@ -79,6 +85,10 @@ class TestLoadDataset(unittest.TestCase):
                         [
                             'news_collection_desc',
                             'news_collection_title',
+                            '<file>.jsonl',
+                            '<file>.txt',
+                            'mix:<dataset>=<weight>,...',
+                            '<dataset>@<index>.npy',
                         ]
                     ))),
                     msg=msg2
@@ -14,6 +14,7 @@ from __future__ import unicode_literals
 import inspect
 import math
 import unittest
+import unittest.mock
 
 # self-made modules
 
@@ -84,6 +85,27 @@ class TestLoadDatasetByConfig(unittest.TestCase):
             dataset = lmp.util.load_dataset_by_config(config)
             self.assertIsInstance(dataset, lmp.dataset.BaseDataset, msg=msg)
 
+    def test_is_compact(self):
+        r"""Pass `config.is_compact` to `lmp.util.load_dataset`."""
+        msg = 'Must pass `config.is_compact` to `lmp.util.load_dataset`.'
+
+        for is_compact in [False, True]:
+            with unittest.mock.patch(
+                    'lmp.util._dataset.load_dataset'
+            ) as mock_load_dataset:
+                lmp.util.load_dataset_by_config(
+                    config=lmp.config.BaseConfig(
+                        dataset='news_collection_title',
+                        experiment='test',
+                        is_compact=is_compact
+                    )
+                )
+
+            mock_load_dataset.assert_called_once_with(
+                dataset='news_collection_title',
+                is_compact=is_compact
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,235 @@
+r"""Test `lmp.util.split_dataset`.
+
+Usage:
+    python -m unittest test.lmp.util._dataset.test_split_dataset
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Tuple
+
+# self-made modules
+
+import lmp.dataset
+import lmp.util
+
+
+class TestSplitDataset(unittest.TestCase):
+    r"""Test case for `lmp.util.split_dataset`."""
+
+    def setUp(self):
+        r"""Setup fixed dataset."""
+        self.dataset = lmp.dataset.BaseDataset([str(i) for i in range(10)])
+
+    def tearDown(self):
+        r"""Delete fixed dataset."""
+        del self.dataset
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.split_dataset),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='val_ratio',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[
+                    lmp.dataset.SubsetDataset,
+                    lmp.dataset.SubsetDataset
+                ]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise exception when input `dataset` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `dataset` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            lmp.dataset.BaseDataset([]), lmp.dataset.BaseDataset(['a']),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.split_dataset(
+                    dataset=invalid_input,
+                    seed=1,
+                    val_ratio=0.1
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`dataset` must be an instance of '
+                    '`lmp.dataset.BaseDataset`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`dataset` must contain at least `2` sequences.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_seed(self):
+        r"""Raise exception when input `seed` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `seed` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.split_dataset(
+                    dataset=self.dataset,
+                    seed=invalid_input,
+                    val_ratio=0.1
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`seed` must be bigger than or equal to `0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_val_ratio(self):
+        r"""Raise exception when input `val_ratio` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `val_ratio` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, 0.0, 1.0, -0.1, math.nan, math.inf, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.split_dataset(
+                    dataset=self.dataset,
+                    seed=1,
+                    val_ratio=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_ratio` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_ratio` must be in range `(0.0, 1.0)`.',
+                    msg=msg2
+                )
+
+    def test_split(self):
+        r"""Split dataset into disjoint subsets deterministically."""
+        msg = 'Must split dataset into disjoint subsets deterministically.'
+        examples = (
+            (0.2, 8, 2),
+            (0.01, 9, 1),
+            (0.99, 1, 9),
+        )
+
+        for val_ratio, train_size, val_size in examples:
+            train_dataset, val_dataset = lmp.util.split_dataset(
+                dataset=self.dataset,
+                seed=1,
+                val_ratio=val_ratio
+            )
+
+            self.assertIsInstance(
+                train_dataset,
+                lmp.dataset.SubsetDataset,
+                msg=msg
+            )
+            self.assertIsInstance(
+                val_dataset,
+                lmp.dataset.SubsetDataset,
+                msg=msg
+            )
+            self.assertEqual(len(train_dataset), train_size, msg=msg)
+            self.assertEqual(len(val_dataset), val_size, msg=msg)
+            self.assertEqual(
+                sorted(list(train_dataset) + list(val_dataset)),
+                list(self.dataset),
+                msg=msg
+            )
+            self.assertEqual(
+                train_dataset.indices.tolist(),
+                sorted(train_dataset.indices.tolist()),
+                msg=msg
+            )
+
+            # Same seed must hold out the same sequences.
+            _, same_val_dataset = lmp.util.split_dataset(
+                dataset=self.dataset,
+                seed=1,
+                val_ratio=val_ratio
+            )
+            self.assertEqual(
+                list(val_dataset),
+                list(same_val_dataset),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,311 @@
+r"""Test `lmp.util.dedup_dataset`.
+
+Usage:
+    python -m unittest test.lmp.util._dedup_dataset.test_dedup_dataset
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import List
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+import lmp.dataset
+import lmp.tokenizer
+import lmp.util
+
+
+class TestDedupDataset(unittest.TestCase):
+    r"""Test case for `lmp.util.dedup_dataset`."""
+
+    def setUp(self):
+        r"""Setup dataset with near-duplicate sequences."""
+        rng = np.random.default_rng(0)
+        alphabet = list('abcdefghijklmnopqrstuvwxyz ')
+        bases = [
+            ''.join(rng.choice(alphabet, size=200).tolist())
+            for _ in range(30)
+        ]
+
+        # Each base sequence is followed by two copies with small edits.
+        sequences = []
+        for base in bases:
+            sequences.append(base)
+            sequences.append(base[:100] + 'x' + base[101:])
+            sequences.append(base.upper()[:-2])
+
+        self.dataset = lmp.dataset.BaseDataset(sequences)
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer(is_uncased=True)
+
+    def tearDown(self):
+        r"""Delete dataset with near-duplicate sequences."""
+        del self.dataset
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.dedup_dataset),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_bands',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=16
+                    ),
+                    inspect.Parameter(
+                        name='num_perm',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=128
+                    ),
+                    inspect.Parameter(
+                        name='num_workers',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                    inspect.Parameter(
+                        name='seed',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=1
+                    ),
+                    inspect.Parameter(
+                        name='shingle_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=5
+                    ),
+                    inspect.Parameter(
+                        name='threshold',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=0.8
+                    ),
+                ],
+                return_annotation=List[int]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.dedup_dataset(
+                    dataset=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `lmp.dataset.BaseDataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.dedup_dataset(
+                    dataset=self.dataset,
+                    tokenizer=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_int(self):
+        r"""Raise exception when integer inputs are invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when integer inputs are '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            ('num_bands', 0, 1), ('num_perm', 0, 1),
+            ('num_workers', 0, 1), ('seed', -1, 0),
+            ('shingle_size', 0, 1),
+        )
+
+        for name, invalid_value, lower_bound in examples:
+            for invalid_input in (
+                    invalid_value, 0.0, 1.0, math.nan, '', b'', (), [],
+                    {}, set(), object(), lambda x: x, type, None, ...,
+            ):
+                with self.assertRaises(
+                        (TypeError, ValueError),
+                        msg=msg1
+                ) as ctx_man:
+                    lmp.util.dedup_dataset(
+                        dataset=self.dataset,
+                        tokenizer=self.tokenizer,
+                        **{name: invalid_input}
+                    )
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be an instance of `int`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be bigger than or equal to '
+                        f'`{lower_bound}`.',
+                        msg=msg2
+                    )
+
+        with self.assertRaises(ValueError, msg=msg1) as ctx_man:
+            lmp.util.dedup_dataset(
+                dataset=self.dataset,
+                num_bands=3,
+                num_perm=128,
+                tokenizer=self.tokenizer
+            )
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            '`num_perm` must be divisible by `num_bands`.',
+            msg=msg2
+        )
+
+    def test_invalid_input_threshold(self):
+        r"""Raise exception when input `threshold` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `threshold` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0.0, -1.0, 1.1, math.nan, math.inf, 0, 1, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.dedup_dataset(
+                    dataset=self.dataset,
+                    threshold=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`threshold` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`threshold` must be in range `(0.0, 1.0]`.',
+                    msg=msg2
+                )
+
+    def test_remove_near_duplicates(self):
+        r"""Keep only the first sequence of each near-duplicate cluster."""
+        msg = 'Must keep only the first sequence of each near-duplicate group.'
+
+        self.assertEqual(
+            lmp.util.dedup_dataset(
+                dataset=self.dataset,
+                tokenizer=self.tokenizer
+            ),
+            list(range(0, len(self.dataset), 3)),
+            msg=msg
+        )
+
+    def test_keep_distinct(self):
+        r"""Keep all sequences when there is no near-duplicate."""
+        msg = 'Must keep all sequences when there is no near-duplicate.'
+
+        self.assertEqual(
+            lmp.util.dedup_dataset(
+                dataset=lmp.dataset.BaseDataset(['abc', 'xyz', '']),
+                tokenizer=self.tokenizer
+            ),
+            [0, 1, 2],
+            msg=msg
+        )
+        self.assertEqual(
+            lmp.util.dedup_dataset(
+                dataset=lmp.dataset.BaseDataset([]),
+                tokenizer=self.tokenizer
+            ),
+            [],
+            msg=msg
+        )
+
+    def test_num_workers(self):
+        r"""Result does not depend on number of workers."""
+        msg = 'Result must not depend on number of workers.'
+
+        self.assertEqual(
+            lmp.util.dedup_dataset(
+                dataset=self.dataset,
+                num_workers=2,
+                tokenizer=self.tokenizer
+            ),
+            lmp.util.dedup_dataset(
+                dataset=self.dataset,
+                num_workers=1,
+                tokenizer=self.tokenizer
+            ),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+r"""Test `lmp.util.encode_prompts.`.
+
+Usage:
+    python -m unittest test.lmp.util._encode_prompts.test_encode_prompts
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestEncodePrompts(unittest.TestCase):
+    r"""Test case for `lmp.util.encode_prompts`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        self.model = lmp.model.ResLSTMModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.prompts = [
+            self.tokenizer.encode(sequence, max_seq_len=-1)[:-1]
+            for sequence in [
+                'abcdefgab', 'abcdefgba', '', 'abc', 'gfedcba', 'abcdefgab',
+            ]
+        ]
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.prompts
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.encode_prompts),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prompts',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[List[int]],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Tuple[torch.Tensor, lmp.model.RNNState]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_prefix_cache(self):
+        r"""Raise `TypeError` when input `prefix_cache` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `prefix_cache` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, NotImplemented,
+            ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.encode_prompts(
+                    device=torch.device('cpu'),
+                    model=self.model,
+                    prefix_cache=invalid_input,
+                    prompts=self.prompts
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.model.PrefixStateCache]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_prompts(self):
+        r"""Raise exception when input `prompts` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `prompts` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), {}, set(), object(), lambda x: x, type, None, NotImplemented,
+            ..., [None], [[1], 1], [[1.0]], [(1,)], [], [[1], []],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.encode_prompts(
+                    device=torch.device('cpu'),
+                    model=self.model,
+                    prefix_cache=None,
+                    prompts=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prompts` must be an instance of `List[List[int]]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`prompts` and each prompt must not be empty.',
+                    msg=msg2
+                )
+
+    def test_same_as_each_prompt(self):
+        r"""Return the same results as encoding each prompt alone."""
+        msg = 'Must return the same results as encoding each prompt alone.'
+        logits, state = lmp.util.encode_prompts(
+            device=torch.device('cpu'),
+            model=self.model,
+            prefix_cache=None,
+            prompts=self.prompts
+        )
+
+        self.assertEqual(logits.size(0), len(self.prompts), msg=msg)
+        self.assertEqual(state.batch_size, len(self.prompts), msg=msg)
+
+        for index, prompt in enumerate(self.prompts):
+            with torch.no_grad():
+                prompt_logits, prompt_state = self.model.forward_step(
+                    torch.LongTensor([prompt])
+                )
+
+            self.assertTrue(
+                torch.allclose(logits[index], prompt_logits[0, -1], atol=1e-6),
+                msg=msg
+            )
+            for tensor, prompt_tensor in zip(
+                    state[index].tensors(),
+                    prompt_state.tensors()
+            ):
+                self.assertTrue(
+                    torch.allclose(tensor, prompt_tensor, atol=1e-6),
+                    msg=msg
+                )
+
+    def test_prefix_cache(self):
+        r"""Return the same results with and without prefix cache."""
+        msg = 'Must return the same results with and without prefix cache.'
+        logits, state = lmp.util.encode_prompts(
+            device=torch.device('cpu'),
+            model=self.model,
+            prefix_cache=None,
+            prompts=self.prompts
+        )
+
+        for stride in [1, 3, 16]:
+            prefix_cache = lmp.model.PrefixStateCache(
+                max_bytes=2 ** 20,
+                stride=stride
+            )
+
+            # Second run resumes from cached prefixes.
+            for _ in range(2):
+                cache_logits, cache_state = lmp.util.encode_prompts(
+                    device=torch.device('cpu'),
+                    model=self.model,
+                    prefix_cache=prefix_cache,
+                    prompts=self.prompts
+                )
+
+                self.assertTrue(
+                    torch.allclose(logits, cache_logits, atol=1e-6),
+                    msg=msg
+                )
+                for tensor, cache_tensor in zip(
+                        state.tensors(),
+                        cache_state.tensors()
+                ):
+                    self.assertTrue(
+                        torch.allclose(tensor, cache_tensor, atol=1e-6),
+                        msg=msg
+                    )
+
+    def test_prefix_cache_hit(self):
+        r"""Reuse hidden states of shared prefixes."""
+        msg = 'Must reuse hidden states of shared prefixes.'
+        prefix_cache = lmp.model.PrefixStateCache(max_bytes=2 ** 20, stride=4)
+
+        lmp.util.encode_prompts(
+            device=torch.device('cpu'),
+            model=self.model,
+            prefix_cache=prefix_cache,
+            prompts=self.prompts[:1]
+        )
+
+        # `[bos]abcdefgab` is cached at `[bos]abc`, `[bos]abcdefg` and the
+        # whole prompt.
+        self.assertEqual(len(prefix_cache), 3, msg=msg)
+
+        lmp.util.encode_prompts(
+            device=torch.device('cpu'),
+            model=self.model,
+            prefix_cache=prefix_cache,
+            prompts=self.prompts
+        )
+
+        metrics = prefix_cache.metrics()
+        self.assertEqual(metrics['num_lookups'], 7, msg=msg)
+        # `[bos]abcdefgab` twice, `[bos]abcdefgba` and `[bos]abc`.
+        self.assertEqual(metrics['num_hits'], 4, msg=msg)
+
+    def test_generate_with_prefix_cache(self):
+        r"""Generate the same sequences with and without prefix cache."""
+        msg = 'Must generate the same sequences with and without prefix cache.'
+        begin_of_sequences = ['abcdefgab', 'abcdefgba', '', 'abc']
+        prefix_cache = lmp.model.PrefixStateCache(max_bytes=2 ** 20, stride=2)
+
+        for beam_width in [1, 3]:
+            self.assertEqual(
+                lmp.util.batch_generate_sequence(
+                    beam_width=beam_width,
+                    begin_of_sequences=begin_of_sequences,
+                    device=torch.device('cpu'),
+                    max_seq_len=16,
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    prefix_cache=prefix_cache
+                ),
+                lmp.util.batch_generate_sequence(
+                    beam_width=beam_width,
+                    begin_of_sequences=begin_of_sequences,
+                    device=torch.device('cpu'),
+                    max_seq_len=16,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                ),
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,6 +43,8 @@ class TestUtilGenerateSequence(unittest.TestCase):
         msg2 = 'Module attribute `{}` must be a function.'
         msg3 = 'Inconsistent module signature.'
         examples = (
+            'batch_generate_sequence',
+            'batch_generate_sequence_by_config',
             'generate_sequence',
             'generate_sequence_by_config',
         )
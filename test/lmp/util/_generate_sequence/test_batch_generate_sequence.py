@@ -0,0 +1,228 @@
+r"""Test `lmp.util.batch_generate_sequence.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._generate_sequence.test_batch_generate_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+import unittest.mock
+
+from typing import List
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestBatchGenerateSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.batch_generate_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.batch_generate_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='beam_width',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='begin_of_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_begin_of_sequences(self):
+        r"""Raise exception when input `begin_of_sequences` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`begin_of_sequences` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), {}, set(), object(), lambda x: x, type, None, NotImplemented,
+            ..., [None], ['a', 1], ('a',), [],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.batch_generate_sequence(
+                    beam_width=1,
+                    begin_of_sequences=invalid_input,
+                    device=torch.device('cpu'),
+                    max_seq_len=2,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`begin_of_sequences` must be an instance of `List[str]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`begin_of_sequences` must not be empty.',
+                    msg=msg2
+                )
+
+    def test_same_as_single_prompt(self):
+        r"""Return the same sequences as generating each prompt alone."""
+        msg = 'Must return the same sequences as generating each prompt alone.'
+        begin_of_sequences = ['ab', '', 'abcdefg', 'gg', 'abcdefgabcdefg']
+
+        for beam_width in [1, 2, 4]:
+            for max_seq_len in [2, 5, 12]:
+                batch_generated = lmp.util.batch_generate_sequence(
+                    beam_width=beam_width,
+                    begin_of_sequences=begin_of_sequences,
+                    device=torch.device('cpu'),
+                    max_seq_len=max_seq_len,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+                self.assertEqual(
+                    len(batch_generated),
+                    len(begin_of_sequences),
+                    msg=msg
+                )
+
+                for begin_of_sequence, generated in zip(
+                        begin_of_sequences,
+                        batch_generated
+                ):
+                    self.assertEqual(
+                        generated,
+                        lmp.util.generate_sequence(
+                            beam_width=beam_width,
+                            begin_of_sequence=begin_of_sequence,
+                            device=torch.device('cpu'),
+                            max_seq_len=max_seq_len,
+                            model=self.model,
+                            tokenizer=self.tokenizer
+                        ),
+                        msg=msg
+                    )
+
+    def test_single_model_call_per_step(self):
+        r"""Run beams of all prompts in one model call per step."""
+        msg = 'Must run beams of all prompts in one model call per step.'
+
+        with unittest.mock.patch.object(
+                self.model,
+                'forward_step',
+                wraps=self.model.forward_step
+        ) as mock_forward_step:
+            lmp.util.batch_generate_sequence(
+                beam_width=3,
+                begin_of_sequences=['a', 'abc', 'abcdef'],
+                device=torch.device('cpu'),
+                max_seq_len=10,
+                model=self.model,
+                tokenizer=self.tokenizer
+            )
+
+        calls = mock_forward_step.call_args_list
+
+        # One call for encoding prompts and at most one call for each
+        # generated token of the shortest prompt.
+        self.assertLessEqual(len(calls), 1 + 10 - 2 - 1, msg=msg)
+        self.assertEqual(calls[0][0][0].size(), torch.Size([3, 7]), msg=msg)
+        for args, _ in calls[1:]:
+            self.assertEqual(args[0].size(), torch.Size([9, 1]), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+r"""Test `lmp.util.batch_generate_sequence_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._generate_sequence.test_batch_generate_sequence_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Optional
+from typing import Union
+
+# self-made modules
+
+import lmp
+import lmp.config
+import lmp.util
+
+
+class TestBatchGenerateSequenceByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.batch_generate_sequence_by_config`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.config = lmp.config.BaseConfig(
+            experiment='I-AM-TEST-EXPERIMENT',
+            dataset='I-AM-TEST-DATASET',
+            model_class='rnn',
+            tokenizer_class='char_dict'
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abc'], min_count=1)
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.config
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.batch_generate_sequence_by_config),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='beam_width',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='begin_of_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.batch_generate_sequence_by_config(
+                    beam_width=1,
+                    begin_of_sequences=['a'],
+                    config=invalid_input,
+                    max_seq_len=2,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_return_result(self):
+        r"""Return the same result as `lmp.util.batch_generate_sequence`."""
+        msg = 'Must return the same result as `batch_generate_sequence`.'
+        begin_of_sequences = ['a', 'abc', '']
+
+        self.assertEqual(
+            lmp.util.batch_generate_sequence_by_config(
+                beam_width=2,
+                begin_of_sequences=begin_of_sequences,
+                config=self.config,
+                max_seq_len=8,
+                model=self.model,
+                tokenizer=self.tokenizer
+            ),
+            lmp.util.batch_generate_sequence(
+                beam_width=2,
+                begin_of_sequences=begin_of_sequences,
+                device=self.config.device,
+                max_seq_len=8,
+                model=self.model,
+                tokenizer=self.tokenizer
+            ),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
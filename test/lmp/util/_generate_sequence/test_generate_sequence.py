@@ -15,6 +15,7 @@ import gc
 import inspect
 import math
 import unittest
+import unittest.mock
 
 from typing import List
 from typing import Union
@@ -419,8 +420,11 @@ class TestGenerateSequence(unittest.TestCase):
                 self.assertIsInstance(sequence, str, msg=msg)
 
     def test_return_result(self):
-        r"""Return `beam_width` sequences with length `max_seq_len`."""
-        msg = 'Must return `beam_width` sequences with length `max_seq_len`.'
+        r"""Return `beam_width` sequences with length at most `max_seq_len`."""
+        msg = (
+            'Must return `beam_width` sequences with length at most '
+            '`max_seq_len`.'
+        )
         examples = (
             (
                 self.beam_width,
@@ -530,12 +534,110 @@ class TestGenerateSequence(unittest.TestCase):
             )
             self.assertEqual(len(generated_sequences), beam_width, msg=msg)
             for sequence in generated_sequences:
-                self.assertEqual(
+                self.assertLessEqual(
                     len(sequence),
                     len(tokenizer.detokenize(['[unk]'] * max_seq_len)),
                     msg=msg
                 )
 
 
+    def test_beam_search(self):
+        r"""Return sequences with lowest negative log-likelihood."""
+        msg = 'Must return sequences with lowest negative log-likelihood.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abc'], min_count=1)
+        vocab_size = tokenizer.vocab_size
+        eos_token_id = tokenizer.convert_token_to_id(tokenizer.eos_token)
+        pad_token_id = tokenizer.convert_token_to_id(tokenizer.pad_token)
+        prompt = tokenizer.encode('ab', max_seq_len=-1)[:-1]
+
+        for seed in range(3):
+            torch.manual_seed(seed)
+            model = lmp.model.GRUModel(
+                d_emb=4,
+                d_hid=8,
+                dropout=0.0,
+                num_linear_layers=1,
+                num_rnn_layers=1,
+                pad_token_id=pad_token_id,
+                vocab_size=vocab_size
+            )
+            model.eval()
+
+            # Enumerate all sequences with two generated tokens. Sequences
+            # finished with `[eos]` in the first step stop early.
+            candidates = []
+            for first in range(vocab_size):
+                for second in range(vocab_size):
+                    if first == eos_token_id and second != pad_token_id:
+                        continue
+
+                    log_probs = model.predict_log_probs(
+                        torch.LongTensor([prompt + [first, second]])
+                    )[0]
+                    nll = -log_probs[len(prompt) - 1, first].item()
+                    seq = prompt + [first]
+                    if first != eos_token_id:
+                        nll -= log_probs[len(prompt), second].item()
+                        seq.append(second)
+
+                    candidates.append((nll, seq))
+
+            candidates.sort(key=lambda candidate: candidate[0])
+
+            generated_sequences = lmp.util.generate_sequence(
+                beam_width=vocab_size * vocab_size,
+                begin_of_sequence='ab',
+                device=torch.device('cpu'),
+                max_seq_len=len(prompt) + 2,
+                model=model,
+                tokenizer=tokenizer
+            )
+
+            self.assertEqual(
+                generated_sequences[:3],
+                tokenizer.batch_decode([seq for _, seq in candidates[:3]]),
+                msg=msg
+            )
+
+
+    def test_cached_state(self):
+        r"""Encode prompt once and then feed one token per beam each step."""
+        msg = 'Must encode prompt once and then feed one token per step.'
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(['abc'], min_count=1)
+        model = lmp.model.LSTMModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=tokenizer.convert_token_to_id(tokenizer.pad_token),
+            vocab_size=tokenizer.vocab_size
+        )
+
+        with unittest.mock.patch.object(
+                model,
+                'forward_step',
+                wraps=model.forward_step
+        ) as mock_forward_step:
+            lmp.util.generate_sequence(
+                beam_width=2,
+                begin_of_sequence='abc',
+                device=torch.device('cpu'),
+                max_seq_len=10,
+                model=model,
+                tokenizer=tokenizer
+            )
+
+        calls = mock_forward_step.call_args_list
+
+        self.assertGreaterEqual(len(calls), 1, msg=msg)
+        self.assertEqual(calls[0][0][0].size(), torch.Size([1, 4]), msg=msg)
+        self.assertLessEqual(len(calls), 10 - 4, msg=msg)
+        for args, _ in calls[1:]:
+            self.assertEqual(args[0].size(-1), 1, msg=msg)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -45,6 +45,7 @@ class TestUtilPerplexityEval(unittest.TestCase):
         examples = (
             'perplexity_eval',
             'batch_perplexity_eval',
+            'corpus_perplexity_eval',
         )
 
         try:
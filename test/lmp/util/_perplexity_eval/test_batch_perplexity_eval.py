@@ -129,7 +129,13 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=lmp.tokenizer.BaseTokenizer,
                         default=inspect.Parameter.empty
-                    )
+                    ),
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=32
+                    ),
                 ],
                 return_annotation=List[float]
             ),
@@ -256,6 +262,132 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                 msg=msg2
             )
 
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.batch_perplexity_eval(
+                    dataset=self.dataset,
+                    device=self.device,
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    batch_size=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_same_as_perplexity_eval(self):
+        r"""Return the same perplexities as `perplexity_eval`."""
+        msg = 'Must return the same perplexities as `perplexity_eval`.'
+        tokenizer = lmp.tokenizer.WhitespaceDictTokenizer()
+        tokenizer.build_vocab(['a b c d e f g'], min_count=1)
+        dataset = [
+            ' '.join('abcdefgh'[:length])
+            for length in [3, 1, 8, 5, 2, 8, 4, 7, 1, 6]
+        ]
+        torch.manual_seed(0)
+        model = lmp.model.ResLSTMModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=2,
+            num_rnn_layers=2,
+            pad_token_id=tokenizer.convert_token_to_id(tokenizer.pad_token),
+            vocab_size=tokenizer.vocab_size
+        )
+
+        ppls = [
+            lmp.util.perplexity_eval(
+                device=self.device,
+                model=model,
+                sequence=sequence,
+                tokenizer=tokenizer
+            )
+            for sequence in dataset
+        ]
+
+        for batch_size in [1, 3, 32]:
+            batch_ppls = lmp.util.batch_perplexity_eval(
+                dataset=dataset,
+                device=self.device,
+                model=model,
+                tokenizer=tokenizer,
+                batch_size=batch_size
+            )
+
+            self.assertEqual(len(batch_ppls), len(ppls), msg=msg)
+            for batch_ppl, ppl in zip(batch_ppls, ppls):
+                self.assertTrue(
+                    math.isclose(batch_ppl, ppl, rel_tol=1e-5),
+                    msg=msg
+                )
+
+    def test_no_token_sequence(self):
+        r"""Return `nan` for sequences which have no token after encoding."""
+        msg = (
+            'Must return `nan` for sequences which have no token after '
+            'encoding.'
+        )
+
+        self.assertTrue(
+            math.isnan(lmp.util.batch_perplexity_eval(
+                dataset=['  '],
+                device=self.device,
+                model=self.model,
+                tokenizer=self.tokenizer
+            )[0]),
+            msg=msg
+        )
+
+        ppls = lmp.util.batch_perplexity_eval(
+            dataset=['abc', '  ', 'ab'],
+            device=self.device,
+            model=self.model,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertEqual(len(ppls), 3, msg=msg)
+        self.assertTrue(math.isnan(ppls[1]), msg=msg)
+        for ppl, sequence in zip(ppls[::2], ['abc', 'ab']):
+            self.assertTrue(
+                math.isclose(
+                    ppl,
+                    lmp.util.perplexity_eval(
+                        device=self.device,
+                        model=self.model,
+                        sequence=sequence,
+                        tokenizer=self.tokenizer
+                    ),
+                    rel_tol=1e-5
+                ),
+                msg=msg
+            )
+
     def test_return_type(self):
         r"""Return `List[float]`."""
         msg = 'Must return `List[float]`.'
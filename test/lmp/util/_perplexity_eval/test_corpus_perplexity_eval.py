@@ -0,0 +1,311 @@
+r"""Test `lmp.util.corpus_perplexity_eval.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._perplexity_eval.test_corpus_perplexity_eval
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import csv
+import gc
+import inspect
+import math
+import os
+import tempfile
+import unittest
+
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestCorpusPerplexityEval(unittest.TestCase):
+    r"""Test case for `lmp.util.corpus_perplexity_eval`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.WhitespaceDictTokenizer()
+        self.tokenizer.build_vocab(['a b c d e f g'], min_count=1)
+        self.dataset = [
+            ' '.join('abcdefgh'[:length])
+            for length in [3, 1, 8, 5, 2, 8, 4, 7, 1, 6]
+        ]
+        torch.manual_seed(0)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'batch_size': 3,
+            'dataset': self.dataset,
+            'device': torch.device('cpu'),
+            'model': self.model,
+            'tokenizer': self.tokenizer,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.dataset
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.corpus_perplexity_eval),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=32
+                    ),
+                    inspect.Parameter(
+                        name='score_file',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[str],
+                        default=None
+                    ),
+                ],
+                return_annotation=Dict
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'dataset', None, TypeError,
+                '`dataset` must be an instance of `Iterable[str]`.',
+            ),
+            (
+                'dataset', ['a', None], TypeError,
+                '`dataset` must be an instance of `Iterable[str]`.',
+            ),
+            (
+                'dataset', ['a', ''], ValueError,
+                '`dataset` must not contain empty sequences.',
+            ),
+            (
+                'dataset', [], ValueError,
+                '`dataset` must not be empty.',
+            ),
+            (
+                'batch_size', 0, ValueError,
+                '`batch_size` must be bigger than or equal to `1`.',
+            ),
+            (
+                'score_file', 1, TypeError,
+                '`score_file` must be an instance of `Optional[str]`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = dict(self.parameters)
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                lmp.util.corpus_perplexity_eval(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_return_result(self):
+        r"""Return token-weighted corpus perplexity and histogram."""
+        msg = 'Must return token-weighted corpus perplexity and histogram.'
+        ppls = lmp.util.batch_perplexity_eval(**self.parameters)
+
+        # Number of predicted tokens of each sequence.
+        lengths = [sequence.count(' ') + 1 for sequence in self.dataset]
+        total_nll = sum(
+            math.log(ppl) * length
+            for ppl, length in zip(ppls, lengths)
+        )
+
+        summary = lmp.util.corpus_perplexity_eval(**self.parameters)
+
+        self.assertEqual(summary['num_sequences'], 10, msg=msg)
+        self.assertEqual(summary['num_tokens'], sum(lengths), msg=msg)
+        self.assertAlmostEqual(
+            summary['nll'],
+            total_nll / sum(lengths),
+            places=5,
+            msg=msg
+        )
+        self.assertAlmostEqual(
+            summary['perplexity'],
+            math.exp(total_nll / sum(lengths)),
+            places=4,
+            msg=msg
+        )
+
+        self.assertEqual(
+            [length for length, _, _ in summary['histogram']],
+            [1, 2, 3, 4, 5, 6, 7, 8],
+            msg=msg
+        )
+        for length, count, ppl in summary['histogram']:
+            self.assertEqual(count, lengths.count(length), msg=msg)
+            self.assertAlmostEqual(
+                ppl,
+                math.exp(sum(
+                    math.log(seq_ppl)
+                    for seq_ppl, seq_length in zip(ppls, lengths)
+                    if seq_length == length
+                ) / count),
+                places=4,
+                msg=msg
+            )
+
+    def test_stream_dataset(self):
+        r"""Evaluate dataset given as an iterator."""
+        msg = 'Must evaluate dataset given as an iterator.'
+        parameters = dict(self.parameters)
+        parameters['dataset'] = iter(self.dataset)
+
+        self.assertEqual(
+            lmp.util.corpus_perplexity_eval(**parameters),
+            lmp.util.corpus_perplexity_eval(**self.parameters),
+            msg=msg
+        )
+
+    def test_score_file(self):
+        r"""Write perplexity of each sequence to `score_file`."""
+        msg = 'Must write perplexity of each sequence to `score_file`.'
+        ppls = lmp.util.batch_perplexity_eval(**self.parameters)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            parameters = dict(self.parameters)
+            parameters['score_file'] = os.path.join(dir_path, 'scores.csv')
+            lmp.util.corpus_perplexity_eval(**parameters)
+
+            with open(parameters['score_file'], 'r', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+
+            self.assertEqual(
+                rows[0],
+                ['index', 'num_tokens', 'perplexity'],
+                msg=msg
+            )
+            self.assertEqual(len(rows), len(self.dataset) + 1, msg=msg)
+            for index, (row, ppl, sequence) in enumerate(
+                    zip(rows[1:], ppls, self.dataset)
+            ):
+                self.assertEqual(int(row[0]), index, msg=msg)
+                self.assertEqual(
+                    int(row[1]),
+                    sequence.count(' ') + 1,
+                    msg=msg
+                )
+                self.assertAlmostEqual(float(row[2]), ppl, places=5, msg=msg)
+
+            parameters['score_file'] = os.path.join(dir_path, 'scores.bin')
+            lmp.util.corpus_perplexity_eval(**parameters)
+
+            self.assertTrue(
+                np.allclose(
+                    np.fromfile(parameters['score_file'], dtype='<f4'),
+                    ppls
+                ),
+                msg=msg
+            )
+
+    def test_no_token_sequence(self):
+        r"""Exclude sequences which have no token from token totals."""
+        msg = 'Must exclude sequences which have no token from token totals.'
+        summary = lmp.util.corpus_perplexity_eval(**self.parameters)
+
+        parameters = dict(self.parameters)
+        parameters['dataset'] = ['  '] + self.dataset + ['  ']
+        no_token_summary = lmp.util.corpus_perplexity_eval(**parameters)
+
+        self.assertEqual(no_token_summary['num_sequences'], 12, msg=msg)
+        for key in ['histogram', 'num_tokens']:
+            self.assertEqual(no_token_summary[key], summary[key], msg=msg)
+        for key in ['nll', 'perplexity']:
+            self.assertAlmostEqual(
+                no_token_summary[key],
+                summary[key],
+                places=5,
+                msg=msg
+            )
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            parameters['score_file'] = os.path.join(dir_path, 'scores.bin')
+            lmp.util.corpus_perplexity_eval(**parameters)
+            scores = np.fromfile(parameters['score_file'], dtype='<f4')
+
+            self.assertEqual(len(scores), 12, msg=msg)
+            self.assertTrue(np.isnan(scores[[0, -1]]).all(), msg=msg)
+            self.assertFalse(np.isnan(scores[1:-1]).any(), msg=msg)
+
+        parameters['dataset'] = ['  ']
+        parameters.pop('score_file')
+        no_token_summary = lmp.util.corpus_perplexity_eval(**parameters)
+
+        self.assertEqual(no_token_summary['num_sequences'], 1, msg=msg)
+        self.assertEqual(no_token_summary['num_tokens'], 0, msg=msg)
+        self.assertTrue(math.isnan(no_token_summary['perplexity']), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -127,7 +127,13 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=lmp.tokenizer.BaseTokenizer,
                         default=inspect.Parameter.empty
-                    )
+                    ),
+                    inspect.Parameter(
+                        name='window_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=-1
+                    ),
                 ],
                 return_annotation=float
             ),
@@ -249,6 +255,46 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                 msg=msg2
             )
 
+    def test_invalid_input_window_size(self):
+        r"""Raise exception when input `window_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `window_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -2, 0.0, 1.0, math.nan, -math.nan, math.inf, -math.inf,
+            0j, 1j, '', b'', (), [], {}, set(), object(), lambda x: x, type,
+            None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.perplexity_eval(
+                    device=self.device,
+                    model=self.model,
+                    sequence='hello',
+                    tokenizer=self.tokenizer,
+                    window_size=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`window_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`window_size` must be bigger than or equal to `1` or '
+                    'equal to `-1`.',
+                    msg=msg2
+                )
+
     def test_return_type(self):
         r"""Return `float`."""
         msg = 'Must return `float`.'
@@ -327,6 +373,20 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                 msg=msg
             )
 
+    def test_no_token_sequence(self):
+        r"""Return `nan` when sequence has no token after encoding."""
+        msg = 'Must return `nan` when sequence has no token after encoding.'
+
+        self.assertTrue(
+            math.isnan(lmp.util.perplexity_eval(
+                device=self.device,
+                model=self.model,
+                sequence='  ',
+                tokenizer=self.tokenizer
+            )),
+            msg=msg
+        )
+
     def test_pure_function(self):
         r"""Perplexity must be the same when given the same input."""
         msg = 'Perplexity must be the same when given the same input'
@@ -371,6 +431,55 @@ class TestLoadOptimizerByConfig(unittest.TestCase):
                 msg=msg
             )
 
+    def test_window_size(self):
+        r"""Windowed perplexity is the same as feeding whole sequence."""
+        msg = 'Windowed perplexity must be the same as feeding whole sequence.'
+        sequence = 'hello world ' * 10
+
+        for (
+                model_cstr,
+                tokenizer_cstr,
+        ) in product(
+            self.__class__.model_parameters['model_cstr'],
+            self.__class__.model_parameters['tokenizer_cstr'],
+        ):
+            tokenizer = tokenizer_cstr(is_uncased=False)
+            tokenizer.build_vocab([sequence], min_count=1)
+            torch.manual_seed(0)
+            model = model_cstr(
+                d_emb=4,
+                d_hid=8,
+                dropout=0.0,
+                num_linear_layers=2,
+                num_rnn_layers=2,
+                pad_token_id=tokenizer.convert_token_to_id(
+                    tokenizer.pad_token
+                ),
+                vocab_size=tokenizer.vocab_size
+            )
+            perplexity = lmp.util.perplexity_eval(
+                device=torch.device('cpu'),
+                model=model,
+                sequence=sequence,
+                tokenizer=tokenizer
+            )
+
+            for window_size in [1, 3, 7, 1000]:
+                self.assertTrue(
+                    math.isclose(
+                        lmp.util.perplexity_eval(
+                            device=torch.device('cpu'),
+                            model=model,
+                            sequence=sequence,
+                            tokenizer=tokenizer,
+                            window_size=window_size
+                        ),
+                        perplexity,
+                        rel_tol=1e-5
+                    ),
+                    msg=msg
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+r"""Test `lmp.util.cached_sequence_lengths`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._profile_dataset.test_cached_sequence_lengths
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from typing import List
+
+# self-made modules
+
+import lmp.dataset
+import lmp.path
+import lmp.tokenizer
+import lmp.util
+import lmp.util._profile_dataset
+
+
+class TestCachedSequenceLengths(unittest.TestCase):
+    r"""Test case for `lmp.util.cached_sequence_lengths`."""
+
+    def setUp(self):
+        r"""Setup fake data directory and fixed parameters."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.patcher = unittest.mock.patch.object(
+            lmp.path,
+            'DATA_PATH',
+            self.temp_dir.name
+        )
+        self.patcher.start()
+        self.dataset = lmp.dataset.BaseDataset(['a', 'ab', 'ab', 'abcd', ''])
+        self.experiment = 'I-AM-A-TEST-FOLDER'
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fake data directory and fixed parameters."""
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+        del self.dataset
+        del self.experiment
+        del self.patcher
+        del self.temp_dir
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.cached_sequence_lengths),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='experiment',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[int]
+            ),
+            msg=msg
+        )
+
+    def test_return_value(self):
+        r"""Return encoded length of each sequence."""
+        msg = 'Must return encoded length of each sequence.'
+
+        lengths = lmp.util.cached_sequence_lengths(
+            dataset=self.dataset,
+            experiment=self.experiment,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertEqual(lengths, [3, 4, 4, 6, 2], msg=msg)
+        self.assertTrue(
+            all(isinstance(length, int) for length in lengths),
+            msg=msg
+        )
+
+    def test_cache(self):
+        r"""Reuse lengths unless dataset or tokenizer changes."""
+        msg = 'Must reuse lengths unless dataset or tokenizer changes.'
+
+        lmp.util.cached_sequence_lengths(
+            dataset=self.dataset,
+            experiment=self.experiment,
+            tokenizer=self.tokenizer
+        )
+
+        with unittest.mock.patch.object(
+                lmp.util._profile_dataset,
+                'sequence_lengths',
+                wraps=lmp.util._profile_dataset.sequence_lengths
+        ) as mock_sequence_lengths:
+            lengths = lmp.util.cached_sequence_lengths(
+                dataset=self.dataset,
+                experiment=self.experiment,
+                tokenizer=self.tokenizer
+            )
+            mock_sequence_lengths.assert_not_called()
+            self.assertEqual(lengths, [3, 4, 4, 6, 2], msg=msg)
+
+            # Recompute when lengths are missing.
+            os.remove(os.path.join(
+                self.temp_dir.name,
+                self.experiment,
+                'lengths.npy'
+            ))
+            lengths = lmp.util.cached_sequence_lengths(
+                dataset=self.dataset,
+                experiment=self.experiment,
+                tokenizer=self.tokenizer
+            )
+            self.assertEqual(mock_sequence_lengths.call_count, 1, msg=msg)
+            self.assertEqual(lengths, [3, 4, 4, 6, 2], msg=msg)
+
+            lengths = lmp.util.cached_sequence_lengths(
+                dataset=lmp.dataset.BaseDataset(['a b c']),
+                experiment=self.experiment,
+                tokenizer=lmp.tokenizer.WhitespaceDictTokenizer()
+            )
+            self.assertEqual(mock_sequence_lengths.call_count, 2, msg=msg)
+            self.assertEqual(lengths, [5], msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
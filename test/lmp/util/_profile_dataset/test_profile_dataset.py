@@ -0,0 +1,243 @@
+r"""Test `lmp.util.profile_dataset`.
+
+Usage:
+    python -m unittest test.lmp.util._profile_dataset.test_profile_dataset
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import json
+import math
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from typing import Dict
+
+# self-made modules
+
+import lmp.dataset
+import lmp.path
+import lmp.tokenizer
+import lmp.util
+import lmp.util._profile_dataset
+
+
+class TestProfileDataset(unittest.TestCase):
+    r"""Test case for `lmp.util.profile_dataset`."""
+
+    def setUp(self):
+        r"""Setup fake data directory and fixed parameters."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.patcher = unittest.mock.patch.object(
+            lmp.path,
+            'DATA_PATH',
+            self.temp_dir.name
+        )
+        self.patcher.start()
+        self.dataset = lmp.dataset.BaseDataset(['a', 'ab', 'ab', 'abcd', ''])
+        self.experiment = 'I-AM-A-TEST-FOLDER'
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+
+    def tearDown(self):
+        r"""Delete fake data directory and fixed parameters."""
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+        del self.dataset
+        del self.experiment
+        del self.patcher
+        del self.temp_dir
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.profile_dataset),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='experiment',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=Dict
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_experiment(self):
+        r"""Raise exception when input `experiment` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `experiment` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.profile_dataset(
+                    dataset=self.dataset,
+                    experiment=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`experiment` must be an instance of `str`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`experiment` must not be empty.',
+                    msg=msg2
+                )
+
+    def test_profile(self):
+        r"""Profile encoded sequence lengths."""
+        msg = 'Must profile encoded sequence lengths.'
+
+        profile = lmp.util.profile_dataset(
+            dataset=self.dataset,
+            experiment=self.experiment,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertIsInstance(profile['fingerprint'], str, msg=msg)
+        self.assertEqual(
+            {
+                key: value
+                for key, value in profile.items()
+                if key != 'fingerprint'
+            },
+            {
+                'dataset_size': 5,
+                'histogram': [[2, 1], [3, 1], [4, 2], [6, 1]],
+                'max_length': 6,
+                'mean_length': 3.8,
+                'percentiles': {
+                    '50': 4,
+                    '90': 6,
+                    '95': 6,
+                    '99': 6,
+                    '100': 6,
+                },
+                'tokenizer_class': 'CharDictTokenizer',
+                'total_tokens': 19,
+            },
+            msg=msg
+        )
+
+        with open(
+                os.path.join(
+                    self.temp_dir.name,
+                    self.experiment,
+                    'profile.json'
+                ),
+                'r',
+                encoding='utf-8'
+        ) as input_file:
+            self.assertEqual(json.load(input_file), profile, msg=msg)
+
+    def test_cache(self):
+        r"""Reuse profile unless dataset or tokenizer changes."""
+        msg = 'Must reuse profile unless dataset or tokenizer changes.'
+
+        lmp.util.profile_dataset(
+            dataset=self.dataset,
+            experiment=self.experiment,
+            tokenizer=self.tokenizer
+        )
+
+        with unittest.mock.patch.object(
+                lmp.util._profile_dataset,
+                'sequence_lengths',
+                wraps=lmp.util._profile_dataset.sequence_lengths
+        ) as mock_sequence_lengths:
+            lmp.util.profile_dataset(
+                dataset=self.dataset,
+                experiment=self.experiment,
+                tokenizer=self.tokenizer
+            )
+            mock_sequence_lengths.assert_not_called()
+
+            profile = lmp.util.profile_dataset(
+                dataset=self.dataset,
+                experiment=self.experiment,
+                tokenizer=lmp.tokenizer.WhitespaceDictTokenizer()
+            )
+            self.assertEqual(mock_sequence_lengths.call_count, 1, msg=msg)
+            self.assertEqual(
+                profile['tokenizer_class'],
+                'WhitespaceDictTokenizer',
+                msg=msg
+            )
+
+            profile = lmp.util.profile_dataset(
+                dataset=lmp.dataset.BaseDataset(['a b']),
+                experiment=self.experiment,
+                tokenizer=lmp.tokenizer.WhitespaceDictTokenizer()
+            )
+            self.assertEqual(mock_sequence_lengths.call_count, 2, msg=msg)
+            self.assertEqual(profile['total_tokens'], 4, msg=msg)
+
+            # Same size but different sequences.
+            profile = lmp.util.profile_dataset(
+                dataset=lmp.dataset.BaseDataset(['a b c']),
+                experiment=self.experiment,
+                tokenizer=lmp.tokenizer.WhitespaceDictTokenizer()
+            )
+            self.assertEqual(mock_sequence_lengths.call_count, 3, msg=msg)
+            self.assertEqual(profile['total_tokens'], 5, msg=msg)
+
+            # Same tokenizer class but different settings.
+            for tokenizer in [
+                    lmp.tokenizer.WhitespaceDictTokenizer(is_uncased=True),
+                    lmp.tokenizer.WhitespaceDictTokenizer(),
+            ]:
+                if not tokenizer.is_uncased:
+                    tokenizer.build_vocab(['a b c'], min_count=1)
+
+                lmp.util.profile_dataset(
+                    dataset=lmp.dataset.BaseDataset(['a b c']),
+                    experiment=self.experiment,
+                    tokenizer=tokenizer
+                )
+
+            self.assertEqual(mock_sequence_lengths.call_count, 5, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+r"""Test `lmp.util.suggest_batch_size`.
+
+Usage:
+    python -m unittest test.lmp.util._profile_dataset.test_suggest_batch_size
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# self-made modules
+
+import lmp.util
+
+
+class TestSuggestBatchSize(unittest.TestCase):
+    r"""Test case for `lmp.util.suggest_batch_size`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.parameters = {
+            'd_emb': 100,
+            'd_hid': 300,
+            'max_seq_len': 64,
+            'memory_budget': 2 ** 30,
+            'num_linear_layers': 2,
+            'num_rnn_layers': 1,
+            'vocab_size': 10000,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.parameters
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.suggest_batch_size),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name=name,
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    )
+                    for name in self.parameters
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'', (), [], {}, set(),
+            object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for name in self.parameters:
+            for invalid_input in examples:
+                with self.assertRaises(
+                        (TypeError, ValueError),
+                        msg=msg1
+                ) as ctx_man:
+                    lmp.util.suggest_batch_size(**{
+                        **self.parameters,
+                        name: invalid_input,
+                    })
+
+                if isinstance(ctx_man.exception, TypeError):
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be an instance of `int`.',
+                        msg=msg2
+                    )
+                elif name == 'max_seq_len':
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        '`max_seq_len` must be bigger than `1`.',
+                        msg=msg2
+                    )
+                else:
+                    self.assertEqual(
+                        ctx_man.exception.args[0],
+                        f'`{name}` must be bigger than or equal to `1`.',
+                        msg=msg2
+                    )
+
+    def test_memory_budget(self):
+        r"""Larger budget and shorter sequences allow larger batch size."""
+        msg = 'Larger budget and shorter sequences must allow larger batch.'
+
+        batch_size = lmp.util.suggest_batch_size(**self.parameters)
+        self.assertGreaterEqual(batch_size, 1, msg=msg)
+        self.assertGreater(
+            lmp.util.suggest_batch_size(**{
+                **self.parameters,
+                'memory_budget': 2 ** 31,
+            }),
+            batch_size,
+            msg=msg
+        )
+        self.assertGreater(
+            lmp.util.suggest_batch_size(**{
+                **self.parameters,
+                'max_seq_len': 32,
+            }),
+            batch_size,
+            msg=msg
+        )
+
+    def test_too_small_budget(self):
+        r"""Raise `ValueError` when budget cannot fit a single sequence."""
+        msg = 'Must raise `ValueError` when budget is too small.'
+
+        with self.assertRaises(ValueError, msg=msg) as ctx_man:
+            lmp.util.suggest_batch_size(**{
+                **self.parameters,
+                'memory_budget': 1,
+            })
+
+        self.assertEqual(
+            ctx_man.exception.args[0],
+            '`memory_budget` is too small to fit a single sequence.',
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+r"""Test `lmp.util.suggest_max_seq_len`.
+
+Usage:
+    python -m unittest test.lmp.util._profile_dataset.test_suggest_max_seq_len
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Dict
+from typing import Union
+
+# self-made modules
+
+import lmp.util
+
+
+class TestSuggestMaxSeqLen(unittest.TestCase):
+    r"""Test case for `lmp.util.suggest_max_seq_len`."""
+
+    def setUp(self):
+        r"""Setup fixed profile."""
+        # 100 sequences with length from `1` to `100`.
+        self.profile = {
+            'histogram': [[length, 1] for length in range(1, 101)],
+        }
+
+    def tearDown(self):
+        r"""Delete fixed profile."""
+        del self.profile
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.suggest_max_seq_len),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='percentile',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[float, int],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='profile',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Dict,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=int
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_percentile(self):
+        r"""Raise exception when input `percentile` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `percentile` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 100.1, math.nan, math.inf, 0j, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.suggest_max_seq_len(
+                    percentile=invalid_input,
+                    profile=self.profile
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`percentile` must be an instance of `Union[float, int]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`percentile` must be in range `(0, 100]`.',
+                    msg=msg2
+                )
+
+    def test_cover_percentile(self):
+        r"""Return smallest length covering `percentile`."""
+        msg = 'Must return smallest length covering `percentile`.'
+        examples = ((0.5, 2), (50, 50), (90.5, 91), (99, 99), (100, 100))
+
+        for percentile, ans_max_seq_len in examples:
+            self.assertEqual(
+                lmp.util.suggest_max_seq_len(
+                    percentile=percentile,
+                    profile=self.profile
+                ),
+                ans_max_seq_len,
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,422 @@
+r"""Test `lmp.util.sample_sequence.`.
+
+Usage:
+    python -m unittest test.lmp.util._sample_sequence.test_sample_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import re
+import unittest
+import unittest.mock
+
+from typing import List
+from typing import Optional
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestSampleSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.sample_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'begin_of_sequences': ['ab', '', 'abcdefg'],
+            'device': torch.device('cpu'),
+            'generator': None,
+            'max_seq_len': 12,
+            'model': self.model,
+            'num_samples': 4,
+            'temperature': 1.0,
+            'tokenizer': self.tokenizer,
+            'top_k': 0,
+            'top_p': 1.0,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.sample_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequences',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='generator',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Generator],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_samples',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                ],
+                return_annotation=List[List[str]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input(self):
+        r"""Raise exception when sampling parameters are invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when sampling parameters '
+            'are invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'generator', 0, TypeError,
+                '`generator` must be an instance of '
+                '`Optional[torch.Generator]`.',
+            ),
+            (
+                'num_samples', 1.0, TypeError,
+                '`num_samples` must be an instance of `int`.',
+            ),
+            (
+                'num_samples', 0, ValueError,
+                '`num_samples` must be bigger than or equal to `1`.',
+            ),
+            (
+                'temperature', 1, TypeError,
+                '`temperature` must be an instance of `float`.',
+            ),
+            (
+                'temperature', 0.0, ValueError,
+                '`temperature` must be bigger than `0.0`.',
+            ),
+            (
+                'temperature', math.nan, ValueError,
+                '`temperature` must be bigger than `0.0`.',
+            ),
+            (
+                'temperature', math.inf, ValueError,
+                '`temperature` must be bigger than `0.0`.',
+            ),
+            (
+                'top_k', 1.0, TypeError,
+                '`top_k` must be an instance of `int`.',
+            ),
+            (
+                'top_k', -1, ValueError,
+                '`top_k` must be bigger than or equal to `0`.',
+            ),
+            (
+                'top_p', 1, TypeError,
+                '`top_p` must be an instance of `float`.',
+            ),
+            (
+                'top_p', 0.0, ValueError,
+                '`top_p` must satisfy `0.0 < top_p <= 1.0`.',
+            ),
+            (
+                'top_p', 1.5, ValueError,
+                '`top_p` must satisfy `0.0 < top_p <= 1.0`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = dict(self.parameters)
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                lmp.util.sample_sequence(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_return_type(self):
+        r"""Return `num_samples` sequences for each prompt."""
+        msg = 'Must return `num_samples` sequences for each prompt.'
+
+        batch_sampled = lmp.util.sample_sequence(**self.parameters)
+
+        self.assertIsInstance(batch_sampled, list, msg=msg)
+        self.assertEqual(len(batch_sampled), 3, msg=msg)
+
+        for begin_of_sequence, sampled in zip(
+                self.parameters['begin_of_sequences'],
+                batch_sampled
+        ):
+            self.assertIsInstance(sampled, list, msg=msg)
+            self.assertEqual(len(sampled), 4, msg=msg)
+
+            for sequence in sampled:
+                self.assertIsInstance(sequence, str, msg=msg)
+                self.assertTrue(
+                    sequence.startswith(
+                        self.tokenizer.bos_token + begin_of_sequence
+                    ),
+                    msg=msg
+                )
+
+    def test_stop_at_eos(self):
+        r"""Each sample stops at `[eos]` or `max_seq_len`."""
+        msg = 'Each sample must stop at `[eos]` or `max_seq_len`.'
+        eos_token = self.tokenizer.eos_token
+
+        for max_seq_len in [2, 5, 12]:
+            parameters = dict(self.parameters)
+            parameters['max_seq_len'] = max_seq_len
+            parameters['num_samples'] = 16
+
+            for begin_of_sequence, sampled in zip(
+                    self.parameters['begin_of_sequences'],
+                    lmp.util.sample_sequence(**parameters)
+            ):
+                prefix = self.tokenizer.bos_token + begin_of_sequence
+                for sequence in sampled:
+                    generated = sequence[len(prefix):]
+
+                    # Special tokens are wrapped in brackets and other
+                    # tokens are characters.
+                    tokens = re.findall(r'\[[a-z]+\]|.', generated)
+                    num_tokens = len(tokens)
+
+                    self.assertNotIn(
+                        self.tokenizer.pad_token,
+                        tokens,
+                        msg=msg
+                    )
+                    if eos_token in tokens:
+                        self.assertEqual(
+                            tokens.index(eos_token),
+                            num_tokens - 1,
+                            msg=msg
+                        )
+                    else:
+                        self.assertEqual(
+                            num_tokens,
+                            max(0, max_seq_len - len(begin_of_sequence) - 1),
+                            msg=msg
+                        )
+
+                    self.assertLessEqual(
+                        len(begin_of_sequence) + 1 + num_tokens,
+                        max(max_seq_len, len(begin_of_sequence) + 1),
+                        msg=msg
+                    )
+
+    def test_seeded_generator(self):
+        r"""Samples are reproducible with seeded generator."""
+        msg = 'Samples must be reproducible with seeded generator.'
+        sampled = []
+
+        for _ in range(2):
+            parameters = dict(self.parameters)
+            parameters['generator'] = torch.Generator().manual_seed(42)
+            sampled.append(lmp.util.sample_sequence(**parameters))
+
+        self.assertEqual(sampled[0], sampled[1], msg=msg)
+
+    def test_greedy(self):
+        r"""Sample most probable token when `top_k == 1` or `top_p` is tiny."""
+        msg = 'Must sample most probable token.'
+        pad_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.pad_token
+        )
+        eos_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.eos_token
+        )
+
+        # Tied most probable tokens make greedy decoding ambiguous, thus use
+        # fixed model parameters which have no ties.
+        torch.manual_seed(0)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=pad_token_id,
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.model.eval()
+        self.parameters['model'] = self.model
+
+        # Greedy decoding without `[pad]`.
+        expected = []
+        for begin_of_sequence in self.parameters['begin_of_sequences']:
+            seq = self.tokenizer.encode(begin_of_sequence, max_seq_len=-1)
+            seq = seq[:-1]
+
+            while len(seq) < self.parameters['max_seq_len']:
+                probs = self.model.predict(torch.LongTensor([seq]))[0, -1]
+                probs[pad_token_id] = -1.0
+                seq.append(int(probs.argmax()))
+
+                if seq[-1] == eos_token_id:
+                    break
+
+            expected.append([self.tokenizer.decode(seq)] * 4)
+
+        for top_k, top_p, temperature in [
+                (1, 1.0, 1.0),
+                (1, 0.5, 10.0),
+                (0, 1e-6, 1.0),
+                (3, 1e-6, 0.1),
+        ]:
+            parameters = dict(self.parameters)
+            parameters['top_k'] = top_k
+            parameters['top_p'] = top_p
+            parameters['temperature'] = temperature
+
+            self.assertEqual(
+                lmp.util.sample_sequence(**parameters),
+                expected,
+                msg=msg
+            )
+
+    def test_top_k(self):
+        r"""Only sample from `top_k` most probable tokens."""
+        msg = 'Must only sample from `top_k` most probable tokens.'
+        self.model.eval()
+
+        for begin_of_sequence in self.parameters['begin_of_sequences']:
+            seq = self.tokenizer.encode(begin_of_sequence, max_seq_len=-1)
+            seq = seq[:-1]
+
+            # Two most probable tokens except `[pad]`.
+            probs = self.model.predict(torch.LongTensor([seq]))[0, -1]
+            probs[self.model.emb_layer.padding_idx] = -1.0
+            top_tokens = self.tokenizer.convert_ids_to_tokens(
+                probs.topk(k=2)[1].tolist()
+            )
+
+            # Generate exactly one token.
+            parameters = dict(self.parameters)
+            parameters['begin_of_sequences'] = [begin_of_sequence]
+            parameters['max_seq_len'] = len(seq) + 1
+            parameters['num_samples'] = 32
+            parameters['top_k'] = 2
+
+            prefix = self.tokenizer.decode(seq)
+            for sequence in lmp.util.sample_sequence(**parameters)[0]:
+                self.assertIn(sequence[len(prefix):], top_tokens, msg=msg)
+
+    def test_single_model_call_per_step(self):
+        r"""Run all unfinished samples in one model call per step."""
+        msg = 'Must run all unfinished samples in one model call per step.'
+        parameters = dict(self.parameters)
+        parameters['max_seq_len'] = 10
+
+        with unittest.mock.patch.object(
+                self.model,
+                'forward_step',
+                wraps=self.model.forward_step
+        ) as mock_forward_step:
+            lmp.util.sample_sequence(**parameters)
+
+        calls = mock_forward_step.call_args_list
+
+        # One call for encoding prompts and at most one call for each
+        # generated token of the shortest prompt.
+        self.assertLessEqual(len(calls), 1 + 10 - 1 - 1, msg=msg)
+        self.assertEqual(calls[0][0][0].size(), torch.Size([3, 8]), msg=msg)
+
+        batch_size = 12
+        for args, _ in calls[1:]:
+            self.assertLessEqual(args[0].size(0), batch_size, msg=msg)
+            self.assertEqual(args[0].size(1), 1, msg=msg)
+            batch_size = args[0].size(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
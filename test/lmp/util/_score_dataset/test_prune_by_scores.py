@@ -0,0 +1,193 @@
+r"""Test `lmp.util.prune_by_scores`.
+
+Usage:
+    python -m unittest test.lmp.util._score_dataset.test_prune_by_scores
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+# 3rd-party modules
+
+import numpy as np
+
+# self-made modules
+
+import lmp.util
+
+
+class TestPruneByScores(unittest.TestCase):
+    r"""Test case for `lmp.util.prune_by_scores`."""
+
+    def setUp(self):
+        r"""Setup fixed scores."""
+        self.scores = np.array(
+            [5.0, 1.0, 9.0, 3.0, np.nan, 7.0, 2.0, np.inf, 10.0, 4.0, 6.0,
+             8.0],
+            dtype=np.float32
+        )
+
+    def tearDown(self):
+        r"""Delete fixed scores."""
+        del self.scores
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.prune_by_scores),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='lower_percentile',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='scores',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=np.ndarray,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='upper_percentile',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=np.ndarray
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_lower_percentile(self):
+        r"""Raise exception when input `lower_percentile` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`lower_percentile` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 1, -0.1, 100.1, math.nan, math.inf, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.prune_by_scores(
+                    lower_percentile=invalid_input,
+                    scores=self.scores,
+                    upper_percentile=100.0
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`lower_percentile` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`lower_percentile` must range from `0.0` to `100.0`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_scores(self):
+        r"""Raise `TypeError` when input `scores` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `scores` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [1.0], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+            np.zeros((2, 2)), np.float32(1.0),
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.prune_by_scores(
+                    lower_percentile=0.0,
+                    scores=invalid_input,
+                    upper_percentile=100.0
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`scores` must be an 1-D instance of `np.ndarray`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_upper_percentile(self):
+        r"""Raise exception when input `upper_percentile` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input '
+            '`upper_percentile` is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, 100, 9.9, 100.1, math.nan, math.inf, '', b'', (), [], {},
+            set(), object(), lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.prune_by_scores(
+                    lower_percentile=10.0,
+                    scores=self.scores,
+                    upper_percentile=invalid_input
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`upper_percentile` must be an instance of `float`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`upper_percentile` must range from `lower_percentile` '
+                    'to `100.0`.',
+                    msg=msg2
+                )
+
+    def test_prune(self):
+        r"""Keep sequences with finite scores inside percentile range."""
+        msg = 'Must keep sequences with finite scores inside percentile range.'
+        examples = (
+            (0.0, 100.0, [0, 1, 2, 3, 5, 6, 8, 9, 10, 11]),
+            (20.0, 80.0, [0, 3, 5, 9, 10, 11]),
+            (50.0, 50.0, []),
+            (0.0, 0.0, [1]),
+        )
+
+        for lower_percentile, upper_percentile, ans_indices in examples:
+            indices = lmp.util.prune_by_scores(
+                lower_percentile=lower_percentile,
+                scores=self.scores,
+                upper_percentile=upper_percentile
+            )
+
+            self.assertEqual(indices.dtype, np.int64, msg=msg)
+            self.assertEqual(indices.tolist(), ans_indices, msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
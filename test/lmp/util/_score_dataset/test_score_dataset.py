@@ -0,0 +1,238 @@
+r"""Test `lmp.util.score_dataset`.
+
+Usage:
+    python -m unittest test.lmp.util._score_dataset.test_score_dataset
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Union
+
+# 3rd-party modules
+
+import numpy as np
+import torch
+
+# self-made modules
+
+import lmp.dataset
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestScoreDataset(unittest.TestCase):
+    r"""Test case for `lmp.util.score_dataset`."""
+
+    def setUp(self):
+        r"""Setup fixed dataset, model and tokenizer."""
+        self.dataset = lmp.dataset.BaseDataset(['abc', 'a', 'abcd', 'ab', ''])
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(self.dataset)
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed dataset, model and tokenizer."""
+        del self.dataset
+        del self.model
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.score_dataset),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=np.ndarray
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 1.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.score_dataset(
+                    batch_size=invalid_input,
+                    dataset=self.dataset,
+                    device=torch.device('cpu'),
+                    max_seq_len=-1,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.score_dataset(
+                    batch_size=1,
+                    dataset=invalid_input,
+                    device=torch.device('cpu'),
+                    max_seq_len=-1,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `lmp.dataset.BaseDataset`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.score_dataset(
+                    batch_size=1,
+                    dataset=self.dataset,
+                    device=torch.device('cpu'),
+                    max_seq_len=-1,
+                    model=invalid_input,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_batch_independent(self):
+        r"""Score of each sequence does not depend on batching."""
+        msg = 'Score of each sequence must not depend on batching.'
+
+        ans_scores = lmp.util.score_dataset(
+            batch_size=1,
+            dataset=self.dataset,
+            device=torch.device('cpu'),
+            max_seq_len=-1,
+            model=self.model,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertEqual(ans_scores.dtype, np.float32, msg=msg)
+        self.assertEqual(ans_scores.shape, (len(self.dataset),), msg=msg)
+        self.assertTrue((ans_scores >= 1.0).all(), msg=msg)
+
+        for batch_size in (2, 3, 5, 8):
+            np.testing.assert_allclose(
+                lmp.util.score_dataset(
+                    batch_size=batch_size,
+                    dataset=self.dataset,
+                    device=torch.device('cpu'),
+                    max_seq_len=-1,
+                    model=self.model,
+                    tokenizer=self.tokenizer
+                ),
+                ans_scores,
+                rtol=1e-5,
+                err_msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
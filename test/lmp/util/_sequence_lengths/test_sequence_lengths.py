@@ -0,0 +1,131 @@
+r"""Test `lmp.util.sequence_lengths`.
+
+Usage:
+    python -m unittest test.lmp.util._sequence_lengths.test_sequence_lengths
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import Iterable
+from typing import List
+
+# self-made modules
+
+import lmp.tokenizer
+import lmp.util
+
+
+class TestSequenceLengths(unittest.TestCase):
+    r"""Test case for `lmp.util.sequence_lengths`."""
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.sequence_lengths),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Iterable[str],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[int]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, object(), lambda x: x, type, None,
+            NotImplemented, ..., [False], [0], [None], ['', 0],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sequence_lengths(
+                    dataset=invalid_input,
+                    tokenizer=lmp.tokenizer.CharDictTokenizer()
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `Iterable[str]`.',
+                msg=msg2
+            )
+
+    def test_invalid_input_tokenizer(self):
+        r"""Raise `TypeError` when input `tokenizer` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `tokenizer` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, -math.nan, math.inf,
+            -math.inf, 0j, 1j, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.sequence_lengths(
+                    dataset=['abc'],
+                    tokenizer=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`tokenizer` must be an instance of '
+                '`lmp.tokenizer.BaseTokenizer`.',
+                msg=msg2
+            )
+
+    def test_return_value(self):
+        r"""Return encoded length of each sequence."""
+        msg = 'Must return encoded length of each sequence.'
+        examples = (
+            ['abc', '', 'hello world'],
+            ['今天天氣很好', 'a'],
+            [],
+        )
+
+        for dataset in examples:
+            for tokenizer in (
+                    lmp.tokenizer.CharDictTokenizer(),
+                    lmp.tokenizer.WhitespaceListTokenizer(),
+            ):
+                self.assertEqual(
+                    lmp.util.sequence_lengths(
+                        dataset=dataset,
+                        tokenizer=tokenizer
+                    ),
+                    [
+                        len(tokenizer.encode(sequence, max_seq_len=-1))
+                        for sequence in dataset
+                    ],
+                    msg=msg
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
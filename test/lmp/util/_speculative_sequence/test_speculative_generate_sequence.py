@@ -0,0 +1,336 @@
+r"""Test `lmp.util.speculative_generate_sequence.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._speculative_sequence.test_speculative_generate_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import copy
+import gc
+import inspect
+import math
+import unittest
+import unittest.mock
+
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestSpeculativeGenerateSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.speculative_generate_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        pad_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.pad_token
+        )
+        torch.manual_seed(0)
+        self.model = lmp.model.ResLSTMModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=pad_token_id,
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.draft_model = lmp.model.GRUModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=pad_token_id,
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.draft_model
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.speculative_generate_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='draft_model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_draft_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=str
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'begin_of_sequence', None, TypeError,
+                '`begin_of_sequence` must be an instance of `str`.',
+            ),
+            (
+                'draft_model', None, TypeError,
+                '`draft_model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+            ),
+            (
+                'max_seq_len', 1, ValueError,
+                '`max_seq_len` must be bigger than or equal to `2`.',
+            ),
+            (
+                'num_draft_tokens', 1.0, TypeError,
+                '`num_draft_tokens` must be an instance of `int`.',
+            ),
+            (
+                'num_draft_tokens', 0, ValueError,
+                '`num_draft_tokens` must be bigger than or equal to `1`.',
+            ),
+            (
+                'draft_model',
+                lmp.model.GRUModel(
+                    d_emb=2,
+                    d_hid=2,
+                    dropout=0.0,
+                    num_linear_layers=1,
+                    num_rnn_layers=1,
+                    pad_token_id=0,
+                    vocab_size=self.tokenizer.vocab_size + 1
+                ),
+                ValueError,
+                '`draft_model` and `model` must share the same tokenizer.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = {
+                'begin_of_sequence': 'a',
+                'device': torch.device('cpu'),
+                'draft_model': self.draft_model,
+                'max_seq_len': 8,
+                'model': self.model,
+                'num_draft_tokens': 2,
+                'tokenizer': self.tokenizer,
+            }
+            parameters[name] = invalid_input
+
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                lmp.util.speculative_generate_sequence(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_same_as_greedy(self):
+        r"""Generate the same sequence as greedy decoding with `model`."""
+        msg = (
+            'Must generate the same sequence as greedy decoding with '
+            '`model`.'
+        )
+
+        for begin_of_sequence in ['', 'a', 'gfedcba', 'abcdefgabcdefg']:
+            for max_seq_len in [2, 5, 16]:
+                # Last yielded sequence of greedy streaming.
+                greedy = [begin_of_sequence]
+                greedy.extend(
+                    sequence
+                    for _, sequence in lmp.util.stream_sequence(
+                        begin_of_sequence=begin_of_sequence,
+                        device=torch.device('cpu'),
+                        generator=None,
+                        max_seq_len=max_seq_len,
+                        model=self.model,
+                        temperature=1.0,
+                        tokenizer=self.tokenizer,
+                        top_k=1,
+                        top_p=1.0
+                    )
+                )
+
+                for draft_model in [self.draft_model, self.model]:
+                    for num_draft_tokens in [1, 3, 20]:
+                        generated = lmp.util.speculative_generate_sequence(
+                            begin_of_sequence=begin_of_sequence,
+                            device=torch.device('cpu'),
+                            draft_model=draft_model,
+                            max_seq_len=max_seq_len,
+                            model=self.model,
+                            num_draft_tokens=num_draft_tokens,
+                            tokenizer=self.tokenizer
+                        )
+
+                        if len(greedy) > 1:
+                            self.assertEqual(generated, greedy[-1], msg=msg)
+                        else:
+                            self.assertEqual(
+                                generated,
+                                self.tokenizer.decode(
+                                    self.tokenizer.encode(
+                                        begin_of_sequence,
+                                        max_seq_len=-1
+                                    )[:-1]
+                                ),
+                                msg=msg
+                            )
+
+    def test_single_call_per_round(self):
+        r"""Verify proposals with a single call of `model` per round."""
+        msg = 'Must verify proposals with a single call of `model` per round.'
+
+        # Identical draft model proposes exactly greedy tokens, thus all
+        # proposals are accepted.
+        draft_model = copy.deepcopy(self.model)
+
+        for num_draft_tokens in [1, 2, 4]:
+            num_tokens = len(list(lmp.util.stream_sequence(
+                begin_of_sequence='',
+                device=torch.device('cpu'),
+                generator=None,
+                max_seq_len=32,
+                model=self.model,
+                temperature=1.0,
+                tokenizer=self.tokenizer,
+                top_k=1,
+                top_p=1.0
+            )))
+
+            with unittest.mock.patch.object(
+                    self.model,
+                    'forward_step',
+                    wraps=self.model.forward_step
+            ) as mock_forward_step:
+                lmp.util.speculative_generate_sequence(
+                    begin_of_sequence='',
+                    device=torch.device('cpu'),
+                    draft_model=draft_model,
+                    max_seq_len=32,
+                    model=self.model,
+                    num_draft_tokens=num_draft_tokens,
+                    tokenizer=self.tokenizer
+                )
+
+            # Each round generates `num_draft_tokens + 1` tokens.
+            self.assertEqual(
+                mock_forward_step.call_count,
+                math.ceil(num_tokens / (num_draft_tokens + 1)),
+                msg=msg
+            )
+
+
+    def test_linear_verification(self):
+        r"""Feed `model` each proposal at most twice per round."""
+        msg = 'Must feed `model` each proposal at most twice per round.'
+
+        for num_draft_tokens in [1, 3, 6]:
+            with unittest.mock.patch.object(
+                    self.model,
+                    'forward_step',
+                    wraps=self.model.forward_step
+            ) as mock_forward_step:
+                generated = lmp.util.speculative_generate_sequence(
+                    begin_of_sequence='a',
+                    device=torch.device('cpu'),
+                    draft_model=self.draft_model,
+                    max_seq_len=32,
+                    model=self.model,
+                    num_draft_tokens=num_draft_tokens,
+                    tokenizer=self.tokenizer
+                )
+
+            num_generated = len(
+                self.tokenizer.encode(generated, max_seq_len=-1)
+            ) - 3
+
+            # Each call feeds a single row of at most `num_draft_tokens + 1`
+            # tokens, and each round generates at least one token.
+            batch_rows = [
+                args[0]
+                for args, _ in mock_forward_step.call_args_list
+            ]
+            for rows in batch_rows:
+                self.assertEqual(rows.size(0), 1, msg=msg)
+                self.assertLessEqual(
+                    rows.size(1),
+                    num_draft_tokens + 1,
+                    msg=msg
+                )
+
+            self.assertLessEqual(
+                sum(rows.size(1) for rows in batch_rows),
+                2 * (num_draft_tokens + 1) * num_generated,
+                msg=msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
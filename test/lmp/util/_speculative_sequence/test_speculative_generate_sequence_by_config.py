@@ -0,0 +1,200 @@
+r"""Test `lmp.util.speculative_generate_sequence_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._speculative_sequence.\
+        test_speculative_generate_sequence_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestSpeculativeGenerateSequenceByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.speculative_generate_sequence_by_config`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.config = lmp.config.BaseConfig(
+            experiment='I-AM-TEST-EXPERIMENT',
+            dataset='I-AM-TEST-DATASET',
+            model_class='res_lstm',
+            tokenizer_class='char_dict'
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        pad_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.pad_token
+        )
+        torch.manual_seed(0)
+        self.model = lmp.model.ResLSTMModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=pad_token_id,
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.draft_model = lmp.model.GRUModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=pad_token_id,
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.config
+        del self.draft_model
+        del self.model
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(
+                lmp.util.speculative_generate_sequence_by_config
+            ),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='draft_model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='num_draft_tokens',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=str
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.speculative_generate_sequence_by_config(
+                    begin_of_sequence='a',
+                    config=invalid_input,
+                    draft_model=self.draft_model,
+                    max_seq_len=8,
+                    model=self.model,
+                    num_draft_tokens=2,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_return_result(self):
+        r"""Return the same result as `speculative_generate_sequence`."""
+        msg = 'Must return the same result as `speculative_generate_sequence`.'
+
+        self.assertEqual(
+            lmp.util.speculative_generate_sequence_by_config(
+                begin_of_sequence='ab',
+                config=self.config,
+                draft_model=self.draft_model,
+                max_seq_len=16,
+                model=self.model,
+                num_draft_tokens=3,
+                tokenizer=self.tokenizer
+            ),
+            lmp.util.speculative_generate_sequence(
+                begin_of_sequence='ab',
+                device=torch.device('cpu'),
+                draft_model=self.draft_model,
+                max_seq_len=16,
+                model=self.model,
+                num_draft_tokens=3,
+                tokenizer=self.tokenizer
+            ),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+r"""Test `lmp.util.async_stream_sequence.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._stream_sequence.test_async_stream_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import concurrent.futures
+import gc
+import inspect
+import math
+import unittest
+
+from typing import AsyncIterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestAsyncStreamSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.async_stream_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        torch.manual_seed(0)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'begin_of_sequence': 'ab',
+            'device': torch.device('cpu'),
+            'generator': None,
+            'max_seq_len': 12,
+            'model': self.model,
+            'temperature': 1.0,
+            'tokenizer': self.tokenizer,
+            'top_k': 0,
+            'top_p': 1.0,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.async_stream_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='generator',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Generator],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                    inspect.Parameter(
+                        name='executor',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[concurrent.futures.Executor],
+                        default=None
+                    ),
+                ],
+                return_annotation=AsyncIterator[Tuple[int, str]]
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input_executor(self):
+        r"""Raise `TypeError` when input `executor` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `executor` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, NotImplemented,
+            ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.async_stream_sequence(
+                    executor=invalid_input,
+                    **self.parameters
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`executor` must be an instance of '
+                '`Optional[concurrent.futures.Executor]`.',
+                msg=msg2
+            )
+
+    def test_same_as_stream_sequence(self):
+        r"""Yield the same steps as `lmp.util.stream_sequence`."""
+        msg = 'Must yield the same steps as `lmp.util.stream_sequence`.'
+
+        async def collect(executor):
+            parameters = dict(self.parameters)
+            parameters['generator'] = torch.Generator()
+            parameters['generator'].manual_seed(42)
+
+            return [
+                step
+                async for step in lmp.util.async_stream_sequence(
+                    executor=executor,
+                    **parameters
+                )
+            ]
+
+        parameters = dict(self.parameters)
+        parameters['generator'] = torch.Generator()
+        parameters['generator'].manual_seed(42)
+        steps = list(lmp.util.stream_sequence(**parameters))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            for test_executor in [None, executor]:
+                loop = asyncio.new_event_loop()
+                try:
+                    self.assertEqual(
+                        loop.run_until_complete(collect(test_executor)),
+                        steps,
+                        msg=msg
+                    )
+                finally:
+                    loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
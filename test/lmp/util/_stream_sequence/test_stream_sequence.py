@@ -0,0 +1,333 @@
+r"""Test `lmp.util.stream_sequence.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._stream_sequence.test_stream_sequence
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+import unittest.mock
+
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestStreamSequence(unittest.TestCase):
+    r"""Test case for `lmp.util.stream_sequence`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        torch.manual_seed(0)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'begin_of_sequence': 'ab',
+            'device': torch.device('cpu'),
+            'generator': None,
+            'max_seq_len': 12,
+            'model': self.model,
+            'temperature': 1.0,
+            'tokenizer': self.tokenizer,
+            'top_k': 0,
+            'top_p': 1.0,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.stream_sequence),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='generator',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[torch.Generator],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                ],
+                return_annotation=Iterator[Tuple[int, str]]
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input(self):
+        r"""Raise exception when input is invalid."""
+        msg1 = 'Must raise `TypeError` or `ValueError` when input is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            (
+                'begin_of_sequence', None, TypeError,
+                '`begin_of_sequence` must be an instance of `str`.',
+            ),
+            (
+                'generator', 0, TypeError,
+                '`generator` must be an instance of '
+                '`Optional[torch.Generator]`.',
+            ),
+            (
+                'max_seq_len', 1, ValueError,
+                '`max_seq_len` must be bigger than or equal to `2`.',
+            ),
+            (
+                'temperature', math.inf, ValueError,
+                '`temperature` must be bigger than `0.0`.',
+            ),
+            (
+                'top_k', -1, ValueError,
+                '`top_k` must be bigger than or equal to `0`.',
+            ),
+            (
+                'top_p', 0.0, ValueError,
+                '`top_p` must satisfy `0.0 < top_p <= 1.0`.',
+            ),
+            (
+                'prefix_cache', 0, TypeError,
+                '`prefix_cache` must be an instance of '
+                '`Optional[lmp.model.PrefixStateCache]`.',
+            ),
+        )
+
+        for name, invalid_input, error, message in examples:
+            parameters = dict(self.parameters)
+            parameters[name] = invalid_input
+
+            # Arguments must be checked before iteration starts.
+            with self.assertRaises(error, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence(**parameters)
+
+            self.assertEqual(ctx_man.exception.args[0], message, msg=msg2)
+
+    def test_same_as_sample_sequence(self):
+        r"""Yield the same sequence as `lmp.util.sample_sequence`."""
+        msg = 'Must yield the same sequence as `lmp.util.sample_sequence`.'
+
+        for begin_of_sequence in ['', 'a', 'gfedcba']:
+            for top_k, top_p in [(0, 1.0), (1, 1.0), (3, 0.8)]:
+                parameters = dict(self.parameters)
+                parameters['begin_of_sequence'] = begin_of_sequence
+                parameters['generator'] = torch.Generator()
+                parameters['generator'].manual_seed(42)
+                parameters['top_k'] = top_k
+                parameters['top_p'] = top_p
+                steps = list(lmp.util.stream_sequence(**parameters))
+
+                parameters = dict(self.parameters)
+                del parameters['begin_of_sequence']
+                parameters['begin_of_sequences'] = [begin_of_sequence]
+                parameters['generator'] = torch.Generator()
+                parameters['generator'].manual_seed(42)
+                parameters['num_samples'] = 1
+                parameters['top_k'] = top_k
+                parameters['top_p'] = top_p
+                sampled = lmp.util.sample_sequence(**parameters)[0][0]
+
+                self.assertTrue(steps, msg=msg)
+                self.assertEqual(steps[-1][1], sampled, msg=msg)
+
+    def test_yield_each_step(self):
+        r"""Yield generated token id and sequence so far in each step."""
+        msg = 'Must yield generated token id and sequence so far in each step.'
+        eos_token_id = self.tokenizer.convert_token_to_id(
+            self.tokenizer.eos_token
+        )
+        prompt = self.tokenizer.encode('ab', max_seq_len=-1)[:-1]
+
+        for seed in range(10):
+            generator = torch.Generator()
+            generator.manual_seed(seed)
+            parameters = dict(self.parameters)
+            parameters['generator'] = generator
+            token_ids = list(prompt)
+            previous = self.tokenizer.decode(token_ids)
+
+            for token_id, sequence in lmp.util.stream_sequence(**parameters):
+                token_ids.append(token_id)
+                self.assertEqual(
+                    sequence,
+                    self.tokenizer.decode(token_ids),
+                    msg=msg
+                )
+                self.assertTrue(sequence.startswith(previous), msg=msg)
+                previous = sequence
+
+            # Stop right after `[eos]` or at `max_seq_len`.
+            self.assertLessEqual(len(token_ids), 12, msg=msg)
+            self.assertTrue(
+                token_ids[-1] == eos_token_id or len(token_ids) == 12,
+                msg=msg
+            )
+            self.assertNotIn(eos_token_id, token_ids[:-1], msg=msg)
+
+    def test_prompt_too_long(self):
+        r"""Yield nothing when prompt reaches `max_seq_len`."""
+        msg = 'Must yield nothing when prompt reaches `max_seq_len`.'
+        parameters = dict(self.parameters)
+        parameters['begin_of_sequence'] = 'abcdefgabcdefg'
+
+        self.assertEqual(
+            list(lmp.util.stream_sequence(**parameters)),
+            [],
+            msg=msg
+        )
+
+    def test_first_token_single_forward(self):
+        r"""Yield the first token after a single forward pass."""
+        msg = 'Must yield the first token after a single forward pass.'
+        parameters = dict(self.parameters)
+        parameters['begin_of_sequence'] = 'abcdefg'
+
+        with unittest.mock.patch.object(
+                self.model,
+                'forward_step',
+                wraps=self.model.forward_step
+        ) as mock_forward_step:
+            iterator = lmp.util.stream_sequence(**parameters)
+            self.assertEqual(mock_forward_step.call_count, 0, msg=msg)
+
+            next(iterator)
+            self.assertEqual(mock_forward_step.call_count, 1, msg=msg)
+
+            try:
+                next(iterator)
+                self.assertEqual(mock_forward_step.call_count, 2, msg=msg)
+            except StopIteration:
+                pass
+
+    def test_decode_incrementally(self):
+        r"""Decode only new tokens in each step."""
+        msg = 'Must decode only new tokens in each step.'
+        parameters = dict(self.parameters)
+        parameters['begin_of_sequence'] = 'abcdefg'
+        parameters['max_seq_len'] = 24
+        decode = self.tokenizer.decode
+        num_token_ids = []
+
+        def record_decode(token_ids):
+            num_token_ids.append(len(token_ids))
+            return decode(token_ids)
+
+        with unittest.mock.patch.object(
+                self.tokenizer,
+                'decode',
+                side_effect=record_decode
+        ):
+            steps = list(lmp.util.stream_sequence(**parameters))
+
+        self.assertTrue(steps, msg=msg)
+
+        # Prompt is decoded once, then each step decodes at most the new
+        # token with the token before it.
+        self.assertEqual(num_token_ids[0], 8, msg=msg)
+        for num in num_token_ids[1:]:
+            self.assertLessEqual(num, 2, msg=msg)
+
+    def test_grad_mode(self):
+        r"""Do not disable gradient between steps."""
+        msg = 'Must not disable gradient between steps.'
+
+        for _ in lmp.util.stream_sequence(**self.parameters):
+            self.assertTrue(torch.is_grad_enabled(), msg=msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+r"""Test `lmp.util.stream_sequence_by_config.`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._stream_sequence.test_stream_sequence_by_config
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import math
+import unittest
+
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.config
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestStreamSequenceByConfig(unittest.TestCase):
+    r"""Test case for `lmp.util.stream_sequence_by_config`."""
+
+    def setUp(self):
+        r"""Setup fixed parameters."""
+        self.config = lmp.config.BaseConfig(
+            experiment='I-AM-TEST-EXPERIMENT',
+            dataset='I-AM-TEST-DATASET',
+            model_class='res_gru',
+            seed=42,
+            tokenizer_class='char_dict'
+        )
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(['abcdefg'], min_count=1)
+        torch.manual_seed(0)
+        self.model = lmp.model.ResGRUModel(
+            d_emb=4,
+            d_hid=8,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=2,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+        self.parameters = {
+            'begin_of_sequence': 'ab',
+            'max_seq_len': 12,
+            'model': self.model,
+            'temperature': 1.0,
+            'tokenizer': self.tokenizer,
+            'top_k': 0,
+            'top_p': 1.0,
+        }
+
+    def tearDown(self):
+        r"""Delete fixed parameters."""
+        del self.config
+        del self.model
+        del self.parameters
+        del self.tokenizer
+        gc.collect()
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.stream_sequence_by_config),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='begin_of_sequence',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=str,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='config',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.config.BaseConfig,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='temperature',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_k',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='top_p',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=float,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='prefix_cache',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[lmp.model.PrefixStateCache],
+                        default=None
+                    ),
+                ],
+                return_annotation=Iterator[Tuple[int, str]]
+            ),
+            msg=msg
+        )
+
+
+    def test_invalid_input_config(self):
+        r"""Raise `TypeError` when input `config` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `config` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, True, 0, 1, -1, 0.0, 1.0, math.nan, math.inf, 0j, '', b'',
+            (), [], {}, set(), object(), lambda x: x, type, None,
+            NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.stream_sequence_by_config(
+                    config=invalid_input,
+                    **self.parameters
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`config` must be an instance of `lmp.config.BaseConfig`.',
+                msg=msg2
+            )
+
+    def test_reproducible(self):
+        r"""Yield the same sequence with the same `config.seed`."""
+        msg = 'Must yield the same sequence with the same `config.seed`.'
+
+        self.assertEqual(
+            list(lmp.util.stream_sequence_by_config(
+                config=self.config,
+                **self.parameters
+            )),
+            list(lmp.util.stream_sequence_by_config(
+                config=self.config,
+                **self.parameters
+            )),
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,8 +16,12 @@ import inspect
 import math
 import os
 import unittest
+import unittest.mock
 
 from itertools import product
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # 3rd-party modules
@@ -210,6 +214,14 @@ class TestTrainModel(unittest.TestCase):
                         kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=int,
                         default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='val_batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Optional[
+                            List[Tuple[torch.Tensor, torch.Tensor]]
+                        ],
+                        default=None
                     )
                 ],
                 return_annotation=None
@@ -608,6 +620,51 @@ class TestTrainModel(unittest.TestCase):
                     msg=msg2
                 )
 
+    def test_invalid_input_val_batches(self):
+        r"""Raise exception when input `val_batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `val_batches` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, -1, 0.0, 1.0, math.nan, 0j, '', b'', (), {}, set(),
+            object(), lambda x: x, type, NotImplemented, ..., [],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.train_model(
+                    checkpoint=self.checkpoint,
+                    checkpoint_step=self.checkpoint_step,
+                    data_loader=self.data_loader,
+                    device=self.device,
+                    epoch=self.epoch,
+                    experiment=self.__class__.experiment,
+                    max_norm=self.max_norm,
+                    model=self.model,
+                    optimizer=self.optimizer,
+                    val_batches=invalid_input,
+                    vocab_size=self.vocab_size
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_batches` must be an instance of '
+                    '`List[Tuple[torch.Tensor, torch.Tensor]]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`val_batches` must not be empty.',
+                    msg=msg2
+                )
+
     def test_save_checkpoint(self):
         r"""Save checkpoint at each `checkpoint_step`."""
         msg = 'Must save checkpoint at each `checkpoint_step`.'
@@ -828,5 +885,310 @@ class TestTrainModel(unittest.TestCase):
                     os.remove(os.path.join(self.__class__.test_log_dir, log))
 
 
+    def test_resume_sampling_position(self):
+        r"""Resume from exact sampling position of `checkpoint`."""
+        msg = 'Must resume from exact sampling position of `checkpoint`.'
+        dataset = lmp.dataset.BaseDataset([str(i) for i in range(6)])
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1
+        )
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        optimizer = torch.optim.SGD(params=model.parameters(), lr=1e-4)
+
+        def train(checkpoint: int):
+            records = []
+            data_loader = torch.utils.data.DataLoader(
+                dataset,
+                batch_sampler=lmp.dataset.FixedSizeBatchSampler(
+                    batch_size=1,
+                    dataset_size=len(dataset)
+                ),
+                collate_fn=lambda batch: (
+                    records.append(batch),
+                    collate_fn(batch)
+                )[1]
+            )
+            lmp.util.train_model(
+                checkpoint=checkpoint,
+                checkpoint_step=1,
+                data_loader=data_loader,
+                device=torch.device('cpu'),
+                epoch=2,
+                experiment=self.__class__.experiment,
+                max_norm=1.0,
+                model=model,
+                optimizer=optimizer,
+                vocab_size=tokenizer.vocab_size
+            )
+            return records
+
+        try:
+            ans_records = train(checkpoint=-1)
+            self.assertEqual(len(ans_records), 12, msg=msg)
+
+            for checkpoint in (1, 5, 6, 7, 12):
+                self.assertTrue(
+                    os.path.exists(os.path.join(
+                        self.__class__.test_dir,
+                        f'sampler-{checkpoint}.json'
+                    )),
+                    msg=msg
+                )
+                self.assertEqual(
+                    train(checkpoint=checkpoint),
+                    ans_records[checkpoint:],
+                    msg=msg
+                )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_mixture_epoch(self):
+        r"""Sample different sequences of mixture sources each epoch."""
+        msg = 'Must sample different sequences of mixture sources each epoch.'
+        dataset = lmp.dataset.MixtureDataset(
+            datasets={
+                'a': lmp.dataset.BaseDataset(['a0', 'a1']),
+                'b': lmp.dataset.BaseDataset([f'b{i}' for i in range(100)]),
+            },
+            num_samples=4,
+            weights={'a': 1, 'b': 1}
+        )
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1
+        )
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        optimizer = torch.optim.SGD(params=model.parameters(), lr=1e-4)
+
+        def train(checkpoint: int):
+            records = []
+            data_loader = torch.utils.data.DataLoader(
+                dataset,
+                batch_sampler=lmp.dataset.FixedSizeBatchSampler(
+                    batch_size=1,
+                    dataset_size=len(dataset)
+                ),
+                collate_fn=lambda batch: (
+                    records.extend(batch),
+                    collate_fn(batch)
+                )[1]
+            )
+            lmp.util.train_model(
+                checkpoint=checkpoint,
+                checkpoint_step=1,
+                data_loader=data_loader,
+                device=torch.device('cpu'),
+                epoch=3,
+                experiment=self.__class__.experiment,
+                max_norm=1.0,
+                model=model,
+                optimizer=optimizer,
+                vocab_size=tokenizer.vocab_size
+            )
+            return records
+
+        try:
+            ans_records = train(checkpoint=-1)
+            self.assertEqual(len(ans_records), 12, msg=msg)
+
+            sampled = [
+                frozenset(
+                    sequence
+                    for sequence in ans_records[4 * epoch:4 * (epoch + 1)]
+                    if sequence[0] == 'b'
+                )
+                for epoch in range(3)
+            ]
+            self.assertGreater(len(set(sampled)), 1, msg=msg)
+
+            # Resumed epoch samples the same sequences.
+            self.assertEqual(train(checkpoint=6), ans_records[6:], msg=msg)
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_mixture_fixed_epoch(self):
+        r"""Keep mixture offsets when lengths or held-out split use indices."""
+        msg = (
+            'Must keep mixture offsets when lengths or held-out split use '
+            'indices.'
+        )
+        dataset = lmp.dataset.MixtureDataset(
+            datasets={
+                'a': lmp.dataset.BaseDataset(['a0', 'a1']),
+                'b': lmp.dataset.BaseDataset([f'b{i}' for i in range(100)]),
+            },
+            num_samples=4,
+            weights={'a': 1, 'b': 1}
+        )
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        collate_fn = lmp.dataset.BaseDataset.create_collate_fn(
+            tokenizer=tokenizer,
+            max_seq_len=-1,
+            is_dynamic_pad=True
+        )
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        optimizer = torch.optim.SGD(params=model.parameters(), lr=1e-4)
+        subset, _ = lmp.util.split_dataset(
+            dataset=dataset,
+            seed=1,
+            val_ratio=0.5
+        )
+
+        for data, batch_sampler in (
+                (
+                    subset,
+                    lmp.dataset.FixedSizeBatchSampler(
+                        batch_size=1,
+                        dataset_size=len(subset)
+                    ),
+                ),
+                (
+                    dataset,
+                    lmp.dataset.TokenBudgetBatchSampler(
+                        batch_lengths=lmp.util.sequence_lengths(
+                            dataset=dataset,
+                            tokenizer=tokenizer
+                        ),
+                        max_tokens=4
+                    ),
+                ),
+        ):
+            ans_sequences = set(data)
+            records = []
+            data_loader = torch.utils.data.DataLoader(
+                data,
+                batch_sampler=batch_sampler,
+                collate_fn=lambda batch: (
+                    records.extend(batch),
+                    collate_fn(batch)
+                )[1]
+            )
+
+            try:
+                lmp.util.train_model(
+                    checkpoint=-1,
+                    checkpoint_step=1,
+                    data_loader=data_loader,
+                    device=torch.device('cpu'),
+                    epoch=3,
+                    experiment=self.__class__.experiment,
+                    max_norm=1.0,
+                    model=model,
+                    optimizer=optimizer,
+                    vocab_size=tokenizer.vocab_size
+                )
+
+                self.assertEqual(dataset.epoch, 0, msg=msg)
+                self.assertEqual(len(records), 3 * len(data), msg=msg)
+                self.assertEqual(set(records), ans_sequences, msg=msg)
+            finally:
+                # Clean up test file.
+                for ckpt in os.listdir(self.__class__.test_dir):
+                    os.remove(os.path.join(self.__class__.test_dir, ckpt))
+                for log in os.listdir(self.__class__.test_log_dir):
+                    os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_validate_at_checkpoint(self):
+        r"""Validate with the same model at each checkpoint."""
+        msg = 'Must validate with the same model at each checkpoint.'
+        dataset = lmp.dataset.BaseDataset([str(i) for i in range(5)])
+        tokenizer = lmp.tokenizer.CharDictTokenizer()
+        tokenizer.build_vocab(dataset)
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=0,
+            vocab_size=tokenizer.vocab_size
+        )
+        val_batches = lmp.util.encode_validation_batches(
+            batch_size=2,
+            dataset=dataset,
+            max_seq_len=-1,
+            tokenizer=tokenizer
+        )
+
+        try:
+            with unittest.mock.patch(
+                    'lmp.util._train_model.validate_model',
+                    wraps=lmp.util.validate_model
+            ) as mock_validate_model:
+                lmp.util.train_model(
+                    checkpoint=-1,
+                    checkpoint_step=2,
+                    data_loader=torch.utils.data.DataLoader(
+                        dataset,
+                        batch_size=1,
+                        collate_fn=lmp.dataset.BaseDataset.create_collate_fn(
+                            tokenizer=tokenizer,
+                            max_seq_len=-1
+                        )
+                    ),
+                    device=torch.device('cpu'),
+                    epoch=1,
+                    experiment=self.__class__.experiment,
+                    max_norm=1.0,
+                    model=model,
+                    optimizer=torch.optim.SGD(
+                        params=model.parameters(),
+                        lr=1e-4
+                    ),
+                    val_batches=val_batches,
+                    vocab_size=tokenizer.vocab_size
+                )
+
+            # Checkpoint at step 2, 4 and the last step 5.
+            self.assertEqual(mock_validate_model.call_count, 3, msg=msg)
+            for _, kwargs in mock_validate_model.call_args_list:
+                self.assertIs(kwargs['batches'], val_batches, msg=msg)
+                self.assertIs(kwargs['model'], model, msg=msg)
+
+            # Model is still in training mode after validation.
+            self.assertTrue(model.training, msg=msg)
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+
 if __name__ == '__main__':
     unittest.main()
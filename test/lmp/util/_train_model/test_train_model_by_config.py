@@ -16,6 +16,7 @@ import inspect
 import math
 import os
 import unittest
+import unittest.mock
 
 from itertools import product
 from typing import Union
@@ -30,6 +31,7 @@ import lmp.config
 import lmp.model
 import lmp.tokenizer
 import lmp.util
+import lmp.util._profile_dataset
 
 
 class TestTrainModelByConfig(unittest.TestCase):
@@ -443,6 +445,125 @@ class TestTrainModelByConfig(unittest.TestCase):
                 for log in os.listdir(self.__class__.test_log_dir):
                     os.remove(os.path.join(self.__class__.test_log_dir, log))
 
+    def test_token_budget(self):
+        r"""Train with token budget mini-batches."""
+        msg = 'Must train with token budget mini-batches.'
+        config = lmp.config.BaseConfig(
+            checkpoint_step=1,
+            dataset=self.__class__.dataset,
+            epoch=2,
+            experiment=self.__class__.experiment,
+            max_seq_len=-1,
+            max_tokens=8
+        )
+        self.tokenizer.build_vocab(['abcdef'])
+        dataset = lmp.dataset.BaseDataset(['a', 'ab', 'abcdef', 'abc'])
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=self.tokenizer.vocab_size
+        ).to(config.device)
+
+        try:
+            lmp.util.train_model_by_config(
+                checkpoint=-1,
+                config=config,
+                dataset=dataset,
+                model=model,
+                optimizer=torch.optim.SGD(params=model.parameters(), lr=1e-4),
+                tokenizer=self.tokenizer
+            )
+
+            # Lengths are [3, 4, 5, 8], so each epoch has 3 mini-batches.
+            self.assertTrue(
+                os.path.exists(os.path.join(
+                    self.__class__.test_dir,
+                    'model-6.pt'
+                )),
+                msg=msg
+            )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
+    def test_token_budget_cached_lengths(self):
+        r"""Reuse cached lengths for token budget mini-batches."""
+        msg = 'Must not tokenize the whole dataset again when training again.'
+        config = lmp.config.BaseConfig(
+            checkpoint_step=1,
+            dataset=self.__class__.dataset,
+            experiment=self.__class__.experiment,
+            max_seq_len=-1,
+            max_tokens=8,
+            val_ratio=0.5
+        )
+        self.tokenizer.build_vocab(['abcdef'])
+        dataset = lmp.dataset.BaseDataset(['a', 'ab', 'abcdef', 'abc'])
+        model = lmp.model.BaseRNNModel(
+            d_emb=1,
+            d_hid=1,
+            dropout=0.0,
+            num_linear_layers=1,
+            num_rnn_layers=1,
+            pad_token_id=0,
+            vocab_size=self.tokenizer.vocab_size
+        ).to(config.device)
+
+        try:
+            with unittest.mock.patch.object(
+                    lmp.util._profile_dataset,
+                    'sequence_lengths',
+                    wraps=lmp.util._profile_dataset.sequence_lengths
+            ) as mock_sequence_lengths, unittest.mock.patch.object(
+                    lmp.dataset,
+                    'TokenBudgetBatchSampler',
+                    wraps=lmp.dataset.TokenBudgetBatchSampler
+            ) as mock_sampler:
+                for _ in range(2):
+                    lmp.util.train_model_by_config(
+                        checkpoint=-1,
+                        config=config,
+                        dataset=dataset,
+                        model=model,
+                        optimizer=torch.optim.SGD(
+                            params=model.parameters(),
+                            lr=1e-4
+                        ),
+                        tokenizer=self.tokenizer
+                    )
+
+                self.assertEqual(mock_sequence_lengths.call_count, 1, msg=msg)
+
+                # Only lengths of training subset are used.
+                train_dataset, _ = lmp.util.split_dataset(
+                    dataset=dataset,
+                    seed=config.seed,
+                    val_ratio=config.val_ratio
+                )
+                self.assertEqual(mock_sampler.call_count, 2, msg=msg)
+                for _, kwargs in mock_sampler.call_args_list:
+                    self.assertEqual(
+                        kwargs['batch_lengths'],
+                        lmp.util.sequence_lengths(
+                            dataset=train_dataset,
+                            tokenizer=self.tokenizer
+                        ),
+                        msg=msg
+                    )
+        finally:
+            # Clean up test file.
+            for ckpt in os.listdir(self.__class__.test_dir):
+                os.remove(os.path.join(self.__class__.test_dir, ckpt))
+            for log in os.listdir(self.__class__.test_log_dir):
+                os.remove(os.path.join(self.__class__.test_log_dir, log))
+
     def test_log_loss(self):
         r"""Log loss."""
         msg = 'Must log loss.'
@@ -0,0 +1,187 @@
+r"""Test `lmp.util.encode_validation_batches`.
+
+Usage:
+    python -m unittest \
+        test.lmp.util._validate_model.test_encode_validation_batches
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Tuple
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.dataset
+import lmp.tokenizer
+import lmp.util
+
+
+class TestEncodeValidationBatches(unittest.TestCase):
+    r"""Test case for `lmp.util.encode_validation_batches`."""
+
+    def setUp(self):
+        r"""Setup fixed dataset and tokenizer."""
+        self.dataset = lmp.dataset.BaseDataset(['abc', 'a', 'ab', 'abcd'])
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(self.dataset)
+
+    def tearDown(self):
+        r"""Delete fixed dataset and tokenizer."""
+        del self.dataset
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.encode_validation_batches),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batch_size',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='dataset',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.dataset.BaseDataset,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='max_seq_len',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=int,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='tokenizer',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=lmp.tokenizer.BaseTokenizer,
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=List[Tuple[torch.Tensor, torch.Tensor]]
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batch_size(self):
+        r"""Raise exception when input `batch_size` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batch_size` '
+            'is invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            0, -1, 0.0, 1.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.encode_validation_batches(
+                    batch_size=invalid_input,
+                    dataset=self.dataset,
+                    max_seq_len=-1,
+                    tokenizer=self.tokenizer
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be an instance of `int`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batch_size` must be bigger than or equal to `1`.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_dataset(self):
+        r"""Raise `TypeError` when input `dataset` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `dataset` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.encode_validation_batches(
+                    batch_size=1,
+                    dataset=invalid_input,
+                    max_seq_len=-1,
+                    tokenizer=self.tokenizer
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`dataset` must be an instance of `lmp.dataset.BaseDataset`.',
+                msg=msg2
+            )
+
+    def test_sorted_batches(self):
+        r"""Encode sequences sorted by length with dynamic padding."""
+        msg = 'Must encode sequences sorted by length with dynamic padding.'
+
+        batches = lmp.util.encode_validation_batches(
+            batch_size=3,
+            dataset=self.dataset,
+            max_seq_len=-1,
+            tokenizer=self.tokenizer
+        )
+
+        self.assertEqual(len(batches), 2, msg=msg)
+        self.assertEqual(
+            [tuple(x.size()) for x, _ in batches],
+            [(3, 4), (1, 5)],
+            msg=msg
+        )
+        self.assertEqual(
+            batches[0][0].tolist(),
+            [
+                token_ids[:-1]
+                for token_ids in self.tokenizer.batch_encode(
+                    ['a', 'ab', 'abc'],
+                    max_seq_len=-1
+                )
+            ],
+            msg=msg
+        )
+        self.assertEqual(
+            lmp.util.encode_validation_batches(
+                batch_size=3,
+                dataset=lmp.dataset.BaseDataset([]),
+                max_seq_len=-1,
+                tokenizer=self.tokenizer
+            ),
+            [],
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
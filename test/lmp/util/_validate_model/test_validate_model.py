@@ -0,0 +1,198 @@
+r"""Test `lmp.util.validate_model`.
+
+Usage:
+    python -m unittest test.lmp.util._validate_model.test_validate_model
+"""
+
+# built-in modules
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import math
+import unittest
+
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# 3rd-party modules
+
+import torch
+
+# self-made modules
+
+import lmp.dataset
+import lmp.model
+import lmp.tokenizer
+import lmp.util
+
+
+class TestValidateModel(unittest.TestCase):
+    r"""Test case for `lmp.util.validate_model`."""
+
+    def setUp(self):
+        r"""Setup fixed model and validation mini-batches."""
+        dataset = lmp.dataset.BaseDataset(['abc', 'a', 'ab', 'abcd'])
+        self.tokenizer = lmp.tokenizer.CharDictTokenizer()
+        self.tokenizer.build_vocab(dataset)
+        self.batches = lmp.util.encode_validation_batches(
+            batch_size=3,
+            dataset=dataset,
+            max_seq_len=-1,
+            tokenizer=self.tokenizer
+        )
+        self.model = lmp.model.BaseRNNModel(
+            d_emb=2,
+            d_hid=2,
+            dropout=0.0,
+            num_rnn_layers=1,
+            num_linear_layers=1,
+            pad_token_id=self.tokenizer.convert_token_to_id(
+                self.tokenizer.pad_token
+            ),
+            vocab_size=self.tokenizer.vocab_size
+        )
+
+    def tearDown(self):
+        r"""Delete fixed model and validation mini-batches."""
+        del self.batches
+        del self.model
+        del self.tokenizer
+
+    def test_signature(self):
+        r"""Ensure signature consistency."""
+        msg = 'Inconsistent method signature.'
+
+        self.assertEqual(
+            inspect.signature(lmp.util.validate_model),
+            inspect.Signature(
+                parameters=[
+                    inspect.Parameter(
+                        name='batches',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=List[Tuple[torch.Tensor, torch.Tensor]],
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='device',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=torch.device,
+                        default=inspect.Parameter.empty
+                    ),
+                    inspect.Parameter(
+                        name='model',
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=Union[
+                            lmp.model.BaseRNNModel,
+                            lmp.model.BaseResRNNModel
+                        ],
+                        default=inspect.Parameter.empty
+                    ),
+                ],
+                return_annotation=float
+            ),
+            msg=msg
+        )
+
+    def test_invalid_input_batches(self):
+        r"""Raise exception when input `batches` is invalid."""
+        msg1 = (
+            'Must raise `TypeError` or `ValueError` when input `batches` is '
+            'invalid.'
+        )
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ..., [()], [(1, 2)],
+            [torch.zeros(1)], [],
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(
+                    (TypeError, ValueError),
+                    msg=msg1
+            ) as ctx_man:
+                lmp.util.validate_model(
+                    batches=invalid_input,
+                    device=torch.device('cpu'),
+                    model=self.model
+                )
+
+            if isinstance(ctx_man.exception, TypeError):
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batches` must be an instance of '
+                    '`List[Tuple[torch.Tensor, torch.Tensor]]`.',
+                    msg=msg2
+                )
+            else:
+                self.assertEqual(
+                    ctx_man.exception.args[0],
+                    '`batches` must not be empty.',
+                    msg=msg2
+                )
+
+    def test_invalid_input_model(self):
+        r"""Raise `TypeError` when input `model` is invalid."""
+        msg1 = 'Must raise `TypeError` when input `model` is invalid.'
+        msg2 = 'Inconsistent error message.'
+        examples = (
+            False, 0, 0.0, math.nan, '', b'', (), [], {}, set(), object(),
+            lambda x: x, type, None, NotImplemented, ...,
+        )
+
+        for invalid_input in examples:
+            with self.assertRaises(TypeError, msg=msg1) as ctx_man:
+                lmp.util.validate_model(
+                    batches=self.batches,
+                    device=torch.device('cpu'),
+                    model=invalid_input
+                )
+
+            self.assertEqual(
+                ctx_man.exception.args[0],
+                '`model` must be an instance of '
+                '`Union[lmp.model.BaseRNNModel, lmp.model.BaseResRNNModel]`.',
+                msg=msg2
+            )
+
+    def test_perplexity(self):
+        r"""Calculate token level perplexity without padding."""
+        msg = 'Must exclude padding tokens from perplexity.'
+        self.model.train()
+
+        perplexity = lmp.util.validate_model(
+            batches=self.batches,
+            device=torch.device('cpu'),
+            model=self.model
+        )
+
+        # Model mode is restored.
+        self.assertTrue(self.model.training, msg=msg)
+
+        # Sum negative log-likelihood of each sequence without padding.
+        total_nll = 0.0
+        total_tokens = 0
+        for sequence in ['abc', 'a', 'ab', 'abcd']:
+            token_ids = self.tokenizer.encode(sequence, max_seq_len=-1)
+            log_probs = self.model.predict(
+                torch.LongTensor([token_ids[:-1]])
+            )[0].log()
+            for pos, token_id in enumerate(token_ids[1:]):
+                total_nll -= log_probs[pos, token_id].item()
+            total_tokens += len(token_ids) - 1
+
+        self.assertAlmostEqual(
+            perplexity,
+            math.exp(total_nll / total_tokens),
+            places=4,
+            msg=msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()